@@ -0,0 +1,54 @@
+"""
+Compares classifying documents one request at a time with the batch endpoint.
+
+Trains a model through the API, then classifies the same documents with one
+``/classify`` request each and with ``/classify/batch`` requests of
+``--batch-size`` documents, and reports documents per second for both.
+
+Usage:
+    python benchmarks/bench_batch.py [--documents 5000] [--batch-size 1000]
+"""
+import argparse
+import random
+import time
+
+from fastapi.testclient import TestClient
+
+from simplebayes.api.app import create_app
+
+WORDS = [f"word{index}" for index in range(2000)]
+
+
+def _documents(rng: random.Random, count: int) -> list:
+    return [" ".join(rng.choice(WORDS) for _ in range(30)) for _ in range(count)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark batch classification over HTTP.")
+    parser.add_argument("--documents", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    client = TestClient(create_app(max_batch_size=args.batch_size))
+    for index, text in enumerate(_documents(rng, 200)):
+        client.post(f"/train/category{index % 10}", content=text)
+    documents = _documents(rng, args.documents)
+
+    started = time.perf_counter()
+    for text in documents:
+        client.post("/classify", content=text)
+    single_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for start in range(0, len(documents), args.batch_size):
+        client.post("/classify/batch", json=documents[start:start + args.batch_size])
+    batch_seconds = time.perf_counter() - started
+
+    print(f"{'endpoint':<16} {'docs/s':>10}")
+    print(f"{'/classify':<16} {len(documents) / single_seconds:>10.0f}")
+    print(f"{'/classify/batch':<16} {len(documents) / batch_seconds:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
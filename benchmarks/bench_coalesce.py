@@ -0,0 +1,71 @@
+"""
+Measures ``/classify`` throughput and latency under concurrency with and
+without request coalescing (``create_app(classify_batch_window=...)``).
+
+Requests are sent in-process through ``httpx.ASGITransport`` by
+``--concurrency`` clients at once, so the numbers cover the app and the
+classifier without network overhead.
+
+Usage:
+    python benchmarks/bench_coalesce.py [--requests 5000] [--concurrency 64] [--words 30]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+import httpx
+
+from simplebayes.api.app import create_app
+
+WORDS = [f"word{index}" for index in range(2000)]
+
+
+def _documents(rng: random.Random, count: int, words: int) -> list:
+    return [" ".join(rng.choice(WORDS) for _ in range(words)) for _ in range(count)]
+
+
+async def _run(window: float, training: list, documents: list, concurrency: int) -> tuple:
+    app = create_app(classify_batch_window=window)
+    for index, text in enumerate(training):
+        app.state.classifier.train(f"category{index % 10}", text)
+    latencies = []
+    queue = list(documents)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def worker() -> None:
+            while queue:
+                text = queue.pop()
+                started = time.perf_counter()
+                await client.post("/classify", content=text)
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return len(documents) / elapsed, statistics.median(latencies), latencies[int(len(latencies) * 0.99)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark /classify request coalescing.")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--words", type=int, default=30)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    training = _documents(rng, 200, 30)
+    documents = _documents(rng, args.requests, args.words)
+
+    print(f"{'window':<10} {'requests/s':>12} {'p50 ms':>10} {'p99 ms':>10}")
+    for window in (0.0, 0.001, 0.002):
+        rate, median, slowest = asyncio.run(_run(window, training, documents, args.concurrency))
+        label = "off" if not window else f"{window * 1000:g} ms"
+        print(f"{label:<10} {rate:>12.0f} {median * 1000:>10.2f} {slowest * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
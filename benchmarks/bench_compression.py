@@ -0,0 +1,73 @@
+"""
+Reports the size/time tradeoff of each model compression codec.
+
+For one synthetic model, saves and loads it uncompressed and with gzip,
+lzma, and zlib at several levels, in both JSON and binary formats.
+
+Usage:
+    python benchmarks/bench_compression.py [--vocabulary 100000] [--categories 4] [--levels 1 6 9]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from simplebayes import SimpleBayes
+from simplebayes.compression import COMPRESSION_GZIP, COMPRESSION_LZMA, COMPRESSION_NONE, COMPRESSION_ZLIB
+from simplebayes.persistence import MODEL_FORMAT_BINARY, MODEL_FORMAT_JSON
+
+
+def _model(vocabulary_size: int, category_count: int, seed: int = 7) -> SimpleBayes:
+    rng = random.Random(seed)
+    classifier = SimpleBayes(tokenizer=str.split)
+    vocabulary = [f"term{i}" for i in range(vocabulary_size)]
+    for index in range(category_count):
+        classifier.train(f"category{index}", " ".join(rng.choices(vocabulary, k=vocabulary_size)))
+    return classifier
+
+
+def _elapsed_ms(action, *args, **kwargs) -> float:
+    started = time.perf_counter()
+    action(*args, **kwargs)
+    return (time.perf_counter() - started) * 1000.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark compressed model persistence.")
+    parser.add_argument("--vocabulary", type=int, default=100000)
+    parser.add_argument("--categories", type=int, default=4)
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 6, 9])
+    args = parser.parse_args()
+
+    classifier = _model(args.vocabulary, args.categories)
+    cases = [(COMPRESSION_NONE, None)] + [
+        (compression, level)
+        for compression in (COMPRESSION_GZIP, COMPRESSION_LZMA, COMPRESSION_ZLIB)
+        for level in args.levels
+    ]
+
+    print(f"{'format':<7} {'codec':<6} {'level':>5} {'save ms':>9} {'load ms':>9} {'bytes':>13} {'ratio':>7}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for model_format in (MODEL_FORMAT_JSON, MODEL_FORMAT_BINARY):
+            baseline = 0
+            for compression, level in cases:
+                path = os.path.join(temp_dir, f"model-{model_format}-{compression}-{level}")
+                save_ms = _elapsed_ms(
+                    classifier.save_to_file,
+                    path,
+                    model_format,
+                    compression=compression,
+                    compression_level=level,
+                )
+                load_ms = _elapsed_ms(SimpleBayes(tokenizer=str.split).load_from_file, path)
+                size = os.path.getsize(path)
+                baseline = baseline or size
+                print(
+                    f"{model_format:<7} {compression:<6} {level if level is not None else '-':>5} "
+                    f"{save_ms:>9.1f} {load_ms:>9.1f} {size:>13,} {baseline / size:>6.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Measures cold-start cost of ``import simplebayes`` in a fresh interpreter.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 20]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+# Modules that only specific model formats need; importing simplebayes must not load them
+DEFERRED_MODULES = (
+    "sqlite3",
+    "gzip",
+    "lzma",
+    "mmap",
+    "simplebayes.binary_model",
+    "simplebayes.lazy_model",
+    "simplebayes.metrics",
+    "simplebayes.wal",
+)
+
+
+def _importtime_us(module: str) -> int:
+    """Return the cumulative import time reported by ``-X importtime`` in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in reversed(result.stderr.splitlines()):
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    return 0
+
+
+def _wall_time_ms(code: str) -> float:
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True)
+    return (time.perf_counter() - started) * 1000.0
+
+
+def _loaded_deferred_modules() -> list:
+    code = (
+        "import sys; before = set(sys.modules); import simplebayes; "
+        f"print(*set({DEFERRED_MODULES!r}) & (set(sys.modules) - before))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark simplebayes import time.")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    cases = {
+        "python -c pass": "pass",
+        "import simplebayes": "import simplebayes",
+        "SimpleBayes()": "from simplebayes import SimpleBayes; SimpleBayes()",
+        "SimpleBayes(remove_stop_words=True)": (
+            "from simplebayes import SimpleBayes; SimpleBayes(remove_stop_words=True)"
+        ),
+    }
+
+    print(f"{'case':<40} {'median ms':>10} {'min ms':>10}")
+    for label, code in cases.items():
+        samples = [_wall_time_ms(code) for _ in range(args.runs)]
+        print(f"{label:<40} {statistics.median(samples):>10.1f} {min(samples):>10.1f}")
+
+    loaded = _loaded_deferred_modules()
+    assert not loaded, f"import simplebayes loaded {', '.join(loaded)}"
+
+    importtimes = [_importtime_us("simplebayes") for _ in range(args.runs)]
+    print(f"\n-X importtime simplebayes (cumulative): {statistics.median(importtimes) / 1000.0:.1f} ms median")
+
+
+if __name__ == "__main__":
+    main()
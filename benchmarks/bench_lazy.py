@@ -0,0 +1,66 @@
+"""
+Compares full and lazy loading of a binary model with many categories.
+
+Reports the time to open the model, the time of a first classification
+against a few categories, and the Python memory held afterwards, for a full
+``load_from_file`` and for ``SimpleBayes(max_loaded_tokens=...)``.
+
+Usage:
+    python benchmarks/bench_lazy.py [--categories 10000] [--tokens 200] [--scored 10] [--budget 100000]
+"""
+import argparse
+import gc
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from simplebayes import SimpleBayes
+
+
+def _save_model(path: str, category_count: int, tokens_per_category: int) -> None:
+    rng = random.Random(7)
+    classifier = SimpleBayes(tokenizer=str.split)
+    for index in range(category_count):
+        terms = (f"term{rng.randrange(tokens_per_category * 20)}" for _ in range(tokens_per_category))
+        classifier.train(f"category{index}", " ".join(terms))
+    classifier.save_to_file(path)
+
+
+def _measure(path: str, scored: list, max_loaded_tokens: int) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    classifier = SimpleBayes(tokenizer=str.split, max_loaded_tokens=max_loaded_tokens)
+    classifier.load_from_file(path)
+    open_ms = (time.perf_counter() - started) * 1000.0
+
+    started = time.perf_counter()
+    classifier.classify("term1 term2 term3 term4", categories=scored)
+    classify_ms = (time.perf_counter() - started) * 1000.0
+    held_mb = tracemalloc.get_traced_memory()[0] / 1e6
+    tracemalloc.stop()
+    return open_ms, classify_ms, held_mb
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark lazy per-category model loading.")
+    parser.add_argument("--categories", type=int, default=10000)
+    parser.add_argument("--tokens", type=int, default=200)
+    parser.add_argument("--scored", type=int, default=10)
+    parser.add_argument("--budget", type=int, default=100000)
+    args = parser.parse_args()
+
+    scored = [f"category{index}" for index in range(args.scored)]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "model.sbm")
+        _save_model(path, args.categories, args.tokens)
+        print(f"{'load':<5} {'open ms':>9} {'first classify ms':>18} {'held MB':>9}")
+        for name, budget in (("full", 0), ("lazy", args.budget)):
+            open_ms, classify_ms, held_mb = _measure(path, scored, budget)
+            print(f"{name:<5} {open_ms:>9.1f} {classify_ms:>18.1f} {held_mb:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
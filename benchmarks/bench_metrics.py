@@ -0,0 +1,68 @@
+"""
+Measures what metrics cost: classifications per second with and without
+``attach_metrics``, and ``/classify`` requests per second with metrics on and
+off (``create_app(metrics=False)``).
+
+Usage:
+    python benchmarks/bench_metrics.py [--documents 20000] [--requests 3000]
+"""
+import argparse
+import random
+import time
+
+from fastapi.testclient import TestClient
+
+from simplebayes import SimpleBayes
+from simplebayes.api.app import create_app
+from simplebayes.metrics import ClassifierMetrics
+
+WORDS = [f"word{index}" for index in range(2000)]
+
+
+def _documents(rng: random.Random, count: int) -> list:
+    return [" ".join(rng.choice(WORDS) for _ in range(30)) for _ in range(count)]
+
+
+def _classify_rate(classifier: SimpleBayes, documents: list) -> float:
+    started = time.perf_counter()
+    for text in documents:
+        classifier.classify_result(text)
+    return len(documents) / (time.perf_counter() - started)
+
+
+def _request_rate(metrics: bool, training: list, documents: list) -> float:
+    client = TestClient(create_app(metrics=metrics))
+    for index, text in enumerate(training):
+        client.post(f"/train/category{index % 10}", content=text)
+    started = time.perf_counter()
+    for text in documents:
+        client.post("/classify", content=text)
+    return len(documents) / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the overhead of metrics.")
+    parser.add_argument("--documents", type=int, default=20000)
+    parser.add_argument("--requests", type=int, default=3000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    training = _documents(rng, 200)
+    plain = SimpleBayes()
+    measured = SimpleBayes()
+    measured.attach_metrics(ClassifierMetrics())
+    for index, text in enumerate(training):
+        plain.train(f"category{index % 10}", text)
+        measured.train(f"category{index % 10}", text)
+    documents = _documents(rng, args.documents)
+
+    print(f"{'':<24} {'off':>10} {'on':>10}")
+    print(f"{'classify_result/s':<24} {_classify_rate(plain, documents):>10.0f} "
+          f"{_classify_rate(measured, documents):>10.0f}")
+    requests = documents[:args.requests]
+    print(f"{'/classify requests/s':<24} {_request_rate(False, training, requests):>10.0f} "
+          f"{_request_rate(True, training, requests):>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Compares unigram-only tokenization with word n-gram modes.
+
+Reports tokenizer throughput (input words/sec and emitted features/sec) and
+the trained model size (distinct features and persisted JSON bytes).
+
+Usage:
+    python benchmarks/bench_ngrams.py [--documents 2000] [--words 60]
+"""
+import argparse
+import io
+import random
+import time
+
+from simplebayes import SimpleBayes
+from simplebayes.tokenization import create_tokenizer
+
+MODES = (
+    ("unigrams", {"ngrams": 1}),
+    ("bigrams", {"ngrams": 2}),
+    ("bigrams hashed 2^18", {"ngrams": 2, "ngram_hash_buckets": 1 << 18}),
+    ("trigrams", {"ngrams": 3}),
+    ("trigrams hashed 2^18", {"ngrams": 3, "ngram_hash_buckets": 1 << 18}),
+)
+
+
+def _corpus(documents: int, words: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    vocabulary = [f"term{i}" for i in range(20000)]
+    weights = [1.0 / (rank + 1) for rank in range(len(vocabulary))]
+    return [
+        " ".join(rng.choices(vocabulary, weights=weights, k=words))
+        for _ in range(documents)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark word n-gram tokenization.")
+    parser.add_argument("--documents", type=int, default=2000)
+    parser.add_argument("--words", type=int, default=60)
+    args = parser.parse_args()
+
+    corpus = _corpus(args.documents, args.words)
+    total_words = args.documents * args.words
+
+    print(f"{'mode':<22} {'words/s':>12} {'features/s':>12} {'features':>10} {'model bytes':>12}")
+    for label, options in MODES:
+        tokenize = create_tokenizer(**options)
+        started = time.perf_counter()
+        emitted = sum(len(tokenize(document)) for document in corpus)
+        elapsed = time.perf_counter() - started
+
+        classifier = SimpleBayes(tokenizer=tokenize)
+        for index, document in enumerate(corpus):
+            classifier.train("spam" if index % 2 else "ham", document)
+        features = len({
+            token
+            for category in classifier.categories.get_categories().values()
+            for token in category.tokens
+        })
+        destination = io.StringIO()
+        classifier.save(destination)
+
+        print(
+            f"{label:<22} {total_words / elapsed:>12,.0f} {emitted / elapsed:>12,.0f} "
+            f"{features:>10,} {len(destination.getvalue()):>12,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
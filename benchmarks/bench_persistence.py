@@ -0,0 +1,71 @@
+"""
+Compares JSON, SQLite, and binary model persistence.
+
+Reports save time, load time (including validation), and file size for
+synthetic models of increasing vocabulary size. The "mmap" row opens the
+binary file as a read-only MappedModel instead of loading it.
+
+Usage:
+    python benchmarks/bench_persistence.py [--sizes 1000 10000 100000] [--categories 4] [--runs 3]
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from simplebayes import SimpleBayes
+from simplebayes.mapped_model import MappedModel
+from simplebayes.persistence import MODEL_FORMAT_BINARY, MODEL_FORMAT_JSON, MODEL_FORMAT_SQLITE
+
+
+def _model(vocabulary_size: int, category_count: int, seed: int = 7) -> SimpleBayes:
+    rng = random.Random(seed)
+    classifier = SimpleBayes(tokenizer=str.split)
+    vocabulary = [f"term{i}" for i in range(vocabulary_size)]
+    for index in range(category_count):
+        classifier.train(f"category{index}", " ".join(rng.sample(vocabulary, vocabulary_size // 2)))
+        classifier.train(f"category{index}", " ".join(rng.choices(vocabulary, k=vocabulary_size)))
+    return classifier
+
+
+def _median_ms(runs: int, action, *args) -> float:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        action(*args)
+        samples.append((time.perf_counter() - started) * 1000.0)
+    return statistics.median(samples)
+
+
+def _open_mapped(path: str) -> None:
+    MappedModel(path, tokenizer=str.split).close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark JSON, SQLite, and binary model persistence.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--categories", type=int, default=4)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'vocabulary':>10} {'format':<7} {'save ms':>9} {'load ms':>9} {'bytes':>13}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in args.sizes:
+            classifier = _model(size, args.categories)
+            # Binary last: the mmap row reopens its file
+            for model_format in (MODEL_FORMAT_JSON, MODEL_FORMAT_SQLITE, MODEL_FORMAT_BINARY):
+                path = os.path.join(temp_dir, f"model-{size}.{model_format}")
+                save_ms = _median_ms(args.runs, classifier.save_to_file, path, model_format)
+                load_ms = _median_ms(args.runs, SimpleBayes(tokenizer=str.split).load_from_file, path)
+                print(
+                    f"{size:>10,} {model_format:<7} {save_ms:>9.1f} {load_ms:>9.1f} "
+                    f"{os.path.getsize(path):>13,}"
+                )
+            open_ms = _median_ms(args.runs, _open_mapped, path)
+            print(f"{size:>10,} {'mmap':<7} {'':>9} {open_ms:>9.1f} {os.path.getsize(path):>13,}")
+
+
+if __name__ == "__main__":
+    main()
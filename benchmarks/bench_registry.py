@@ -0,0 +1,71 @@
+"""
+Measures serving many named models from one process: ``/classify`` requests
+per second on the default model, on one loaded named model, and spread over
+``--models`` named models while ``--max-model-tokens`` lets only some of them
+stay loaded (so requests also load and evict models).
+
+Usage:
+    python benchmarks/bench_registry.py [--models 300] [--requests 3000] [--max-model-tokens 20000]
+"""
+import argparse
+import random
+import tempfile
+import time
+
+from fastapi.testclient import TestClient
+
+from simplebayes.api.app import create_app
+from simplebayes.runtime.registry import ModelRegistry
+
+WORDS = [f"word{index}" for index in range(2000)]
+
+
+def _documents(rng: random.Random, count: int) -> list:
+    return [" ".join(rng.choice(WORDS) for _ in range(30)) for _ in range(count)]
+
+
+def _write_models(directory: str, rng: random.Random, count: int) -> None:
+    registry = ModelRegistry(directory)
+    for index in range(count):
+        with registry.use(f"tenant{index}") as classifier:
+            for document_index, text in enumerate(_documents(rng, 20)):
+                classifier.train(f"category{document_index % 5}", text)
+    registry.save_all()
+
+
+def _request_rate(client: TestClient, paths: list, documents: list) -> float:
+    started = time.perf_counter()
+    for path, text in zip(paths, documents):
+        client.post(path, content=text)
+    return len(documents) / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark named model serving.")
+    parser.add_argument("--models", type=int, default=300)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--max-model-tokens", type=int, default=20000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    documents = _documents(rng, args.requests)
+    with tempfile.TemporaryDirectory() as directory:
+        _write_models(directory, rng, args.models)
+        app = create_app(model_directory=directory, max_model_tokens=args.max_model_tokens)
+        with TestClient(app) as client:
+            for index, text in enumerate(_documents(rng, 20)):
+                app.state.classifier.train(f"category{index % 5}", text)
+            single = _request_rate(client, ["/classify"] * args.requests, documents)
+            named = _request_rate(client, ["/models/tenant0/classify"] * args.requests, documents)
+            spread = [f"/models/tenant{rng.randrange(args.models)}/classify" for _ in documents]
+            churn = _request_rate(client, spread, documents)
+            loaded = len(app.state.models.loaded())
+
+    print(f"{'/classify (default model)':<40} {single:>10.0f} requests/s")
+    print(f"{'/models/{name}/classify (one model)':<40} {named:>10.0f} requests/s")
+    print(f"{f'/models/{{name}}/classify ({args.models} models)':<40} {churn:>10.0f} requests/s, "
+          f"{loaded} loaded at the end")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Measures how long a save stalls classification.
+
+Times a full ``save_to_file`` of a synthetic model while another thread
+classifies in a loop, and reports the slowest classification seen during
+the save next to the save itself.
+
+Usage:
+    python benchmarks/bench_snapshot.py [--vocabulary 200000] [--categories 4]
+"""
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+
+from simplebayes import SimpleBayes
+
+
+def _model(vocabulary_size: int, category_count: int) -> SimpleBayes:
+    rng = random.Random(7)
+    classifier = SimpleBayes(tokenizer=str.split)
+    for index in range(category_count):
+        document = " ".join(f"term{rng.randrange(vocabulary_size)}" for _ in range(vocabulary_size))
+        classifier.train(f"category{index}", document)
+    return classifier
+
+
+def _slowest_classify_ms(classifier: SimpleBayes, stop: threading.Event, results: list) -> None:
+    slowest = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        classifier.classify("term1 term2 term3")
+        slowest = max(slowest, time.perf_counter() - started)
+    results.append(slowest * 1000.0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark classification stalls during saves.")
+    parser.add_argument("--vocabulary", type=int, default=200000)
+    parser.add_argument("--categories", type=int, default=4)
+    args = parser.parse_args()
+
+    classifier = _model(args.vocabulary, args.categories)
+    print(f"{'format':<7} {'save ms':>9} {'worst classify ms':>18}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name in ("model.json", "model.sbm"):
+            stop = threading.Event()
+            results: list = []
+            reader = threading.Thread(target=_slowest_classify_ms, args=(classifier, stop, results))
+            reader.start()
+            started = time.perf_counter()
+            classifier.save_to_file(os.path.join(temp_dir, name))
+            save_ms = (time.perf_counter() - started) * 1000.0
+            stop.set()
+            reader.join()
+            print(f"{name.split('.')[1]:<7} {save_ms:>9.1f} {results[0]:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,62 @@
 # coding: utf-8
 __version__ = '3.2.0'
 
+import io
 import threading
+import time
 from collections import Counter
-from typing import Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple
 
 from simplebayes.categories import BayesCategories
-from simplebayes.constants import CATEGORY_PATTERN
+from simplebayes.constants import CATEGORY_PATTERN, WAL_FLUSH, WAL_TRAIN, WAL_UNTRAIN
 from simplebayes.errors import InvalidCategoryError
-from simplebayes.models import CategorySummary, ClassificationResult
+from simplebayes.models import CategorySummary, ClassificationResult, ModelSize, TokenLimits
 from simplebayes.persistence import (
     PERSISTED_MODEL_VERSION,
+    build_model_categories,
     dump_model_state,
+    dump_model_state_to_stream,
+    is_binary_model_file,
+    load_model_categories_from_file,
     load_model_state,
-    load_model_state_from_file,
+    load_model_state_from_stream,
+    resolve_model_path,
     save_model_state_to_file,
-    validate_model_state,
 )
-from simplebayes.tokenization import create_tokenizer, default_tokenize_text
+from simplebayes.tokenization import (
+    DEFAULT_STREAM_CHUNK_SIZE,
+    TextSource,
+    count_stream_tokens,
+    default_tokenize_text,
+    get_tokenizer,
+    limit_tokens,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from simplebayes.metrics import ClassifierMetrics
+
+# Change published to a change feed when a whole new model is swapped in
+CHANGE_LOAD = "load"
 
 __all__ = ['SimpleBayes']
 
 
-class SimpleBayes:
+class SimpleBayes:  # pylint: disable=too-many-instance-attributes
     """A memory-based, optional-persistence naïve bayesian text classifier."""
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         tokenizer: Optional[Callable[[str], List[str]]] = None,
         alpha: float = 0.0,
         language: str = "english",
         remove_stop_words: bool = False,
+        *,
+        ngrams: int = 1,
+        ngram_hash_buckets: int = 0,
+        max_tokens_per_document: int = 0,
+        max_token_length: int = 0,
+        max_new_tokens_per_train: int = 0,
+        max_loaded_tokens: int = 0,
     ) -> None:
         """
         :param tokenizer: A tokenizer override. When None, uses built-in tokenizer.
@@ -40,15 +66,59 @@ class SimpleBayes:
         :param language: Language code for stemmer and stop words (e.g. "english",
             "spanish"). Default "english".
         :param remove_stop_words: If True, filter stop words. Default False (backwards compatible).
-        """
+        :param ngrams: Largest word n-gram added to unigrams by the built-in tokenizer (1-3).
+            Default 1 (unigrams only).
+        :param ngram_hash_buckets: When > 0, hash n-grams into this many buckets to bound
+            vocabulary growth. Default 0 (no hashing).
+        :param max_tokens_per_document: Only the first N tokens of a document are trained or
+            scored (unigrams, for the built-in tokenizer). Default 0 (no limit).
+        :param max_token_length: Tokens longer than this many characters are ignored.
+            Default 0 (no limit).
+        :param max_new_tokens_per_train: At most N tokens not yet in the category are added
+            per train call; further new tokens are skipped. Default 0 (no limit).
+        :param max_loaded_tokens: When > 0, ``load_from_file`` opens binary models lazily:
+            category tallies are read at once and each category's tokens when first
+            used, keeping about N tokens of unchanged categories in memory (least
+            recently used are dropped). Other formats load fully. Default 0 (load fully).
+        """
+        if min(max_tokens_per_document, max_token_length, max_new_tokens_per_train) < 0:
+            raise ValueError("token limits must be >= 0")
+        if max_loaded_tokens < 0:
+            raise ValueError("max_loaded_tokens must be >= 0")
+
         self.categories = BayesCategories()
         self.tokenizer = (
             tokenizer
-            or create_tokenizer(language=language, remove_stop_words=remove_stop_words)
+            or get_tokenizer(
+                language=language,
+                remove_stop_words=remove_stop_words,
+                ngrams=ngrams,
+                ngram_hash_buckets=ngram_hash_buckets,
+                max_tokens=max_tokens_per_document,
+                max_token_length=max_token_length,
+            )
+        )
+        # Built-in tokenizers enforce the per-document limits themselves
+        self._limit_tokenizer_output = tokenizer is not None
+        self.limits = TokenLimits(
+            max_tokens_per_document=max_tokens_per_document,
+            max_token_length=max_token_length,
+            max_new_tokens_per_train=max_new_tokens_per_train,
         )
         self.alpha = alpha
+        self.max_loaded_tokens = max_loaded_tokens
         self.probabilities = {}
+        # Optional WriteAheadLog that records every train, untrain, and flush
+        self.journal = None
+        # Incremented by every change to the model, so savers can skip unchanged models
+        self.revision = 0
+        # Optional ClassifierMetrics recording timings (see attach_metrics)
+        self.metrics: Optional["ClassifierMetrics"] = None
+        # Optional simplebayes.runtime.replication.ChangeFeed told of every change, in order
+        self.change_feed = None
         self._lock = threading.RLock()
+        # Orders concurrent saves so an older snapshot never replaces a newer one
+        self._save_lock = threading.Lock()
 
     @classmethod
     def tokenize_text(cls, text: str) -> List[str]:
@@ -74,6 +144,28 @@ class SimpleBayes:
         """
         return dict(Counter(words))
 
+    def _tokenize(self, text: str) -> List[str]:
+        started = time.perf_counter() if self.metrics is not None else 0.0
+        tokens = self.tokenizer(text)
+        if self._limit_tokenizer_output:
+            tokens = limit_tokens(
+                tokens,
+                self.limits.max_tokens_per_document,
+                self.limits.max_token_length,
+            )
+        if self.metrics is not None:
+            self.metrics.tokenize_seconds.observe(time.perf_counter() - started)
+        return tokens
+
+    def _count_stream_tokens(self, source: TextSource, chunk_size: int) -> Dict[str, int]:
+        return count_stream_tokens(
+            self.tokenizer,
+            source,
+            chunk_size,
+            max_tokens=self.limits.max_tokens_per_document,
+            max_token_length=self.limits.max_token_length,
+        )
+
     def flush(self) -> None:
         """
         Deletes all tokens & categories
@@ -81,6 +173,73 @@ class SimpleBayes:
         with self._lock:
             self.categories = BayesCategories()
             self.probabilities = {}
+            sequence = self._journal(WAL_FLUSH)
+        self._commit_journal(sequence)
+
+    def _journal(self, operation: str, category: str = "", counts: Optional[Dict[str, int]] = None) -> int:
+        # Called under the lock right after a change is applied, so log order matches apply order
+        self.revision += 1
+        if self.change_feed is not None:
+            self.change_feed.publish(self.revision, operation, category, counts)
+        if self.journal is None:
+            return 0
+        sequence = self.journal.append(operation, category, counts)
+        self.categories.sequence = sequence
+        return sequence
+
+    def _commit_journal(self, sequence: int) -> None:
+        # Called after releasing the lock so concurrent writers share one fsync
+        if sequence:
+            self.journal.commit(sequence)
+
+    def attach_journal(self, journal) -> int:
+        """
+        Replays journal records newer than the current model (see the
+        ``sequence`` stored in snapshots), then records every later train,
+        untrain, and flush in the journal.
+
+        :param journal: a ``simplebayes.wal.WriteAheadLog``
+        :return: number of records replayed
+        :rtype: int
+        """
+        with self._lock:
+            replayed = 0
+            for sequence, operation, category, counts in journal.read_records(self.categories.sequence):
+                self.apply_change(operation, category, counts)
+                self.categories.sequence = sequence
+                replayed += 1
+            journal.advance(self.categories.sequence)
+            self.journal = journal
+            return replayed
+
+    def apply_change(self, operation: str, category: str = "", counts: Optional[Dict[str, int]] = None) -> None:
+        """
+        Applies one recorded change, as logged to a journal or published to a
+        change feed, e.g. to keep a replica in step with another classifier.
+
+        :param operation: ``WAL_TRAIN``, ``WAL_UNTRAIN``, or ``WAL_FLUSH``
+        :param category: category name (unused for flush)
+        :param counts: token counts to train or untrain (unused for flush)
+        """
+        if operation == WAL_FLUSH:
+            self.flush()
+        elif operation == WAL_TRAIN:
+            self._commit_journal(self._train_counts(category, counts))
+        else:
+            self._commit_journal(self._untrain_counts(category, counts))
+
+    def attach_metrics(self, metrics: "ClassifierMetrics") -> None:
+        """
+        Records tokenizing and scoring times, classifier lock wait and hold
+        times, and batch token cache hits into ``metrics`` from now on.
+
+        :param metrics: where the measurements go
+        """
+        with self._lock:
+            lock = getattr(self._lock, "lock", self._lock)
+            # Threads already holding the lock release the same underlying lock
+            self._lock = metrics.timed_lock(lock)
+            self.metrics = metrics
 
     def calculate_category_probability(self) -> None:
         """
@@ -122,20 +281,80 @@ class SimpleBayes:
         :type text: str
         """
         category = self.normalize_category(category)
+        with self._lock:
+            tokens = self._tokenize(str(text))
+            sequence = self._train_counts(category, self.count_token_occurrences(tokens))
+        self._commit_journal(sequence)
+
+    def train_stream(
+        self, category: str, source: TextSource, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE
+    ) -> None:
+        """
+        Trains a category from a text stream or an iterable of text chunks.
+        Tokens are counted incrementally outside the classifier lock, so peak
+        memory is bounded by the chunk size rather than the document size.
+
+        :param category: the name of the category we want to train
+        :type category: str
+        :param source: readable text stream, iterable of str chunks, or str
+        :param chunk_size: characters read per call on text streams
+        :type chunk_size: int
+        """
+        category = self.normalize_category(category)
+        occurrence_counts = self._count_stream_tokens(source, chunk_size)
+        with self._lock:
+            sequence = self._train_counts(category, occurrence_counts)
+        self._commit_journal(sequence)
+
+    def train_batch(self, examples: Iterable[Tuple[str, str]]) -> None:
+        """
+        Trains many samples of text in one pass. Texts are tokenized and every
+        category name is checked before anything changes; the samples are then
+        applied under one lock acquisition and the category probabilities are
+        recalculated once. Each sample counts as one ``train`` call for
+        ``max_new_tokens_per_train`` and the journal.
+
+        :param examples: ``(category, text)`` pairs
+        :raises InvalidCategoryError: when a category name is invalid; nothing is trained
+        """
+        documents = [
+            (self.normalize_category(category), self.count_token_occurrences(self._tokenize(str(text))))
+            for category, text in examples
+        ]
+        with self._lock:
+            sequence = 0
+            for category, occurrence_counts in documents:
+                sequence = self._train_counts(category, occurrence_counts, recalculate=False)
+            self.calculate_category_probability()
+        self._commit_journal(sequence)
+
+    def _train_counts(self, category: str, occurrence_counts: Dict[str, int], *, recalculate: bool = True) -> int:
         with self._lock:
             try:
                 bayes_category = self.categories.get_category(category)
             except KeyError:
                 bayes_category = self.categories.add_category(category)
 
-            tokens = self.tokenizer(str(text))
-            occurrence_counts = self.count_token_occurrences(tokens)
-
+            if self.limits.max_new_tokens_per_train:
+                occurrence_counts = self._within_new_token_budget(bayes_category, occurrence_counts)
             for word, count in occurrence_counts.items():
                 bayes_category.train_token(word, count)
 
             # Updating our per-category overall probabilities
-            self.calculate_category_probability()
+            if recalculate:
+                self.calculate_category_probability()
+            return self._journal(WAL_TRAIN, category, occurrence_counts)
+
+    def _within_new_token_budget(self, bayes_category, occurrence_counts: Dict[str, int]) -> Dict[str, int]:
+        new_token_budget = self.limits.max_new_tokens_per_train
+        accepted = {}
+        for word, count in occurrence_counts.items():
+            if word not in bayes_category.tokens:
+                if not new_token_budget:
+                    continue
+                new_token_budget -= 1
+            accepted[word] = count
+        return accepted
 
     def untrain(self, category: str, text: str) -> None:
         """
@@ -147,14 +366,35 @@ class SimpleBayes:
         :type text: str
         """
         category = self.normalize_category(category)
+        with self._lock:
+            tokens = self._tokenize(str(text))
+            sequence = self._untrain_counts(category, self.count_token_occurrences(tokens))
+        self._commit_journal(sequence)
+
+    def untrain_stream(
+        self, category: str, source: TextSource, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE
+    ) -> None:
+        """
+        Untrains a category from a text stream or an iterable of text chunks.
+
+        :param category: the name of the category we want to untrain
+        :type category: str
+        :param source: readable text stream, iterable of str chunks, or str
+        :param chunk_size: characters read per call on text streams
+        :type chunk_size: int
+        """
+        category = self.normalize_category(category)
+        occurrence_counts = self._count_stream_tokens(source, chunk_size)
+        with self._lock:
+            sequence = self._untrain_counts(category, occurrence_counts)
+        self._commit_journal(sequence)
+
+    def _untrain_counts(self, category: str, occurrence_counts: Dict[str, int]) -> int:
         with self._lock:
             try:
                 bayes_category = self.categories.get_category(category)
             except KeyError:
-                return
-
-            tokens = self.tokenizer(str(text))
-            occurrence_counts = self.count_token_occurrences(tokens)
+                return 0
 
             for word, count in occurrence_counts.items():
                 bayes_category.untrain_token(word, count)
@@ -164,27 +404,33 @@ class SimpleBayes:
 
             # Updating our per-category overall probabilities
             self.calculate_category_probability()
+            return self._journal(WAL_UNTRAIN, category, occurrence_counts)
 
-    def classify(self, text: str) -> Optional[str]:
+    def classify(self, text: str, *, categories: Optional[Iterable[str]] = None) -> Optional[str]:
         """
         Chooses the highest scoring category for a sample of text
 
         :param text: sample text to classify
         :type text: str
+        :param categories: only choose among these categories (see ``score``)
         :return: the "winning" category
         :rtype: str
         """
         with self._lock:
-            score = self.score(text)
+            score = self.score(text, categories=categories)
             highest_category, _ = self._find_highest_category(score)
             return highest_category
 
-    def classify_result(self, text: str) -> ClassificationResult:
+    def classify_result(
+        self, text: str, *, categories: Optional[Iterable[str]] = None
+    ) -> ClassificationResult:
         """
         Returns structured classification output including score.
+
+        :param categories: only choose among these categories (see ``score``)
         """
         with self._lock:
-            scores = self.score(text)
+            scores = self.score(text, categories=categories)
             highest_category, highest_score = self._find_highest_category(scores)
             return ClassificationResult(category=highest_category or None, score=highest_score)
 
@@ -203,48 +449,132 @@ class SimpleBayes:
 
         return highest_category, highest_score
 
-    def score(self, text: str) -> Dict[str, float]:
+    def score(self, text: str, *, categories: Optional[Iterable[str]] = None) -> Dict[str, float]:
         """
         Scores a sample of text
 
         :param text: sample text to score
         :type text: str
+        :param categories: only score these categories; token probabilities are
+            computed among them, and unknown names are ignored. Default None (all).
+            Lazily loaded models only read the token counts of the scored categories.
         :return: dict of scores per category
         :rtype: dict
         """
         with self._lock:
-            occurs = self.count_token_occurrences(self.tokenizer(text))
+            return self._score_counts(self.count_token_occurrences(self._tokenize(text)), categories)
+
+    def score_stream(
+        self,
+        source: TextSource,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        *,
+        categories: Optional[Iterable[str]] = None,
+    ) -> Dict[str, float]:
+        """
+        Scores a text stream or an iterable of text chunks. Tokens are counted
+        incrementally outside the classifier lock.
+
+        :param source: readable text stream, iterable of str chunks, or str
+        :param chunk_size: characters read per call on text streams
+        :type chunk_size: int
+        :param categories: only score these categories (see ``score``)
+        :return: dict of scores per category
+        :rtype: dict
+        """
+        occurs = self._count_stream_tokens(source, chunk_size)
+        with self._lock:
+            return self._score_counts(occurs, categories)
+
+    def classify_result_stream(
+        self,
+        source: TextSource,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        *,
+        categories: Optional[Iterable[str]] = None,
+    ) -> ClassificationResult:
+        """
+        Returns structured classification output for a text stream or an
+        iterable of text chunks.
+        """
+        scores = self.score_stream(source, chunk_size, categories=categories)
+        highest_category, highest_score = self._find_highest_category(scores)
+        return ClassificationResult(category=highest_category or None, score=highest_score)
+
+    def score_batch(
+        self, texts: Iterable[str], *, categories: Optional[Iterable[str]] = None
+    ) -> List[Dict[str, float]]:
+        """
+        Scores many samples of text in one pass. Texts are tokenized outside
+        the classifier lock, which is then taken once for the whole batch, and
+        each distinct token's probabilities are computed once and reused.
+
+        :param texts: samples of text to score
+        :param categories: only score these categories (see ``score``)
+        :return: one dict of scores per text, in order
+        :rtype: list
+        """
+        documents = [self.count_token_occurrences(self._tokenize(text)) for text in texts]
+        with self._lock:
+            started = time.perf_counter()
+            scored = self._scored_categories(categories)
+            token_probabilities: Dict[str, list] = {}
+            results = []
+            for occurs in documents:
+                scores = dict.fromkeys((name for name, _ in scored), 0)
+                for word, count in occurs.items():
+                    probabilities = token_probabilities.get(word)
+                    if probabilities is None:
+                        probabilities = self._token_probabilities(word, scored)
+                        token_probabilities[word] = probabilities
+                    for category, probability in probabilities:
+                        scores[category] += count * probability
+                results.append({category: score for category, score in scores.items() if score > 0})
+            if self.metrics is not None:
+                self.metrics.score_seconds.observe(time.perf_counter() - started)
+                self.metrics.token_cache_hits.inc(sum(map(len, documents)) - len(token_probabilities))
+                self.metrics.token_cache_misses.inc(len(token_probabilities))
+            return results
+
+    def classify_result_batch(
+        self, texts: Iterable[str], *, categories: Optional[Iterable[str]] = None
+    ) -> List[ClassificationResult]:
+        """
+        Returns structured classification output for many samples of text,
+        scored in one pass (see ``score_batch``).
+
+        :param categories: only choose among these categories (see ``score``)
+        """
+        results = []
+        for scores in self.score_batch(texts, categories=categories):
+            highest_category, highest_score = self._find_highest_category(scores)
+            results.append(ClassificationResult(category=highest_category or None, score=highest_score))
+        return results
+
+    def _scored_categories(self, selected: Optional[Iterable[str]]) -> list:
+        categories = list(self.categories.get_categories().items())
+        if selected is not None:
+            wanted = set(selected)
+            categories = [(name, category) for name, category in categories if name in wanted]
+        return self.categories.hold_tokens(categories)
+
+    def _score_counts(
+        self, occurs: Dict[str, int], selected: Optional[Iterable[str]] = None
+    ) -> Dict[str, float]:
+        with self._lock:
+            started = time.perf_counter()
             scores = {}
             for category in self.categories.get_categories():
                 scores[category] = 0
 
-            categories = self.categories.get_categories().items()
+            categories = self._scored_categories(selected)
+            if selected is not None:
+                scores = {name: 0 for name, _ in categories}
 
             for word, count in occurs.items():
-                token_scores = {}
-
-                # Adding up individual token scores
-                for category, bayes_category in categories:
-                    token_scores[category] = \
-                        float(bayes_category.get_token_count(word))
-
-                # We use this to get token-in-category probabilities
-                token_tally = sum(token_scores.values())
-
-                # If this token isn't found anywhere its probability is 0
-                if token_tally == 0.0:
-                    continue
-
-                # Calculating bayes probability for this token
-                # http://en.wikipedia.org/wiki/Naive_Bayes_spam_filtering
-                for category, token_score in token_scores.items():
+                for category, probability in self._token_probabilities(word, categories):
                     # Bayes probability * the number of occurrences of this token
-                    scores[category] += count * \
-                        self.calculate_bayesian_probability(
-                            category,
-                            token_score,
-                            token_tally
-                        )
+                    scores[category] += count * probability
 
             # Removing empty categories from the results
             final_scores = {}
@@ -252,8 +582,34 @@ class SimpleBayes:
                 if score > 0:
                     final_scores[category] = score
 
+            if self.metrics is not None:
+                self.metrics.score_seconds.observe(time.perf_counter() - started)
             return final_scores
 
+    def _token_probabilities(self, word: str, categories) -> List[tuple]:
+        # Adding up individual token scores
+        token_scores = self._token_scores(word, categories)
+
+        # We use this to get token-in-category probabilities
+        token_tally = sum(token_scores.values())
+
+        # If this token isn't found anywhere its probability is 0
+        if token_tally == 0.0:
+            return []
+
+        # Calculating bayes probability for this token
+        # http://en.wikipedia.org/wiki/Naive_Bayes_spam_filtering
+        return [
+            (category, self.calculate_bayesian_probability(category, token_score, token_tally))
+            for category, token_score in token_scores.items()
+        ]
+
+    def _token_scores(self, word: str, categories) -> Dict[str, float]:
+        token_scores = {}
+        for category, bayes_category in categories:
+            token_scores[category] = float(bayes_category.get_token_count(word))
+        return token_scores
+
     def calculate_bayesian_probability(
         self, cat: str, token_score: float, token_tally: float
     ) -> float:
@@ -308,15 +664,20 @@ class SimpleBayes:
 
             return bayes_category.get_tally()
 
-    def get_summaries(self) -> Dict[str, CategorySummary]:
+    def get_summaries(self, *, categories: Optional[Iterable[str]] = None) -> Dict[str, CategorySummary]:
         """
         Returns per-category summary details.
+
+        :param categories: only summarize these categories; unknown names are
+            ignored. Default None (all).
         """
         with self._lock:
             summaries: Dict[str, CategorySummary] = {}
-            categories = self.categories.get_categories()
+            selected = self.categories.get_categories()
+            if categories is not None:
+                selected = {name: selected[name] for name in categories if name in selected}
 
-            for category_name, category in categories.items():
+            for category_name, category in selected.items():
                 category_probability = self.probabilities.get(
                     category_name,
                     {'prc': 0.0, 'prnc': 0.0},
@@ -329,37 +690,111 @@ class SimpleBayes:
 
             return summaries
 
-    def save(self, destination) -> None:
+    def model_size(self) -> ModelSize:
         """
-        Saves classifier state to a text stream.
+        Counts categories, distinct tokens, and trained tokens. The first call
+        walks the vocabulary; after that the categories keep the distinct token
+        count current (see ``BayesCategories.count_vocabulary``), so a call
+        only sums the category tallies. Models opened from a binary file
+        (lazily or mapped) report the file's vocabulary instead of decoding it.
+
+        :return: the model's size
+        :rtype: ModelSize
         """
         with self._lock:
-            dump_model_state(destination, self._export_model_state())
+            members = self.categories.get_categories().values()
+            return ModelSize(
+                categories=len(members),
+                vocabulary=self.categories.count_vocabulary(),
+                tally=sum(category.get_tally() for category in members),
+            )
+
+    def save(
+        self,
+        destination,
+        *,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+    ) -> None:
+        """
+        Saves classifier state to a text stream as JSON. With ``compression``,
+        ``destination`` must be a binary stream and the JSON is compressed as it
+        is written.
+
+        :param destination: writable text stream, or binary stream when compressing
+        :param compression: "gzip", "lzma", or "zlib". Default None (plain JSON text).
+        :param compression_level: 0-9. Default None (level 6).
+        """
+        with self._save_lock:
+            if compression is None:
+                dump_model_state(destination, self._export_model_state())
+            else:
+                dump_model_state_to_stream(
+                    destination,
+                    self._export_model_state(),
+                    compression=compression,
+                    compression_level=compression_level,
+                )
 
     def load(self, source) -> None:
         """
-        Loads classifier state from a text stream.
+        Loads classifier state from a text stream, or from a binary stream
+        holding a JSON or binary model that may be gzip, lzma, or zlib
+        compressed (detected from its leading bytes). The new model is parsed,
+        validated, and built without holding the classifier lock, then swapped
+        in at once; on error the current model is left untouched.
         """
-        with self._lock:
+        if isinstance(source, (io.RawIOBase, io.BufferedIOBase)):
+            state = load_model_state_from_stream(source)
+        else:
             state = load_model_state(source)
-            validate_model_state(state)
-            self._apply_model_state(state)
+        self._swap_categories(build_model_categories(state))
 
-    def save_to_file(self, absolute_path: str = "") -> None:
-        """
-        Saves classifier state to file using atomic replacement.
+    def save_to_file(  # pylint: disable=too-many-arguments
+        self,
+        absolute_path: str = "",
+        model_format: Optional[str] = None,
+        *,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+    ) -> None:
         """
-        with self._lock:
-            save_model_state_to_file(absolute_path, self._export_model_state())
+        Saves classifier state to file using atomic replacement. Only capturing
+        the snapshot holds the classifier lock; serialization and ``fsync`` run
+        while other threads keep classifying and training.
+
+        :param absolute_path: Destination path. Empty uses the default model path.
+        :param model_format: "json" or "binary". When None, ".sbm"/".bin" paths use
+            the binary format and everything else uses JSON.
+        :param compression: "gzip", "lzma", "zlib", or "none". When None, ".gz",
+            ".xz", and ".zz" paths are compressed with gzip, lzma, and zlib.
+        :param compression_level: 0-9. Default None (level 6).
+        """
+        with self._save_lock:
+            save_model_state_to_file(
+                absolute_path,
+                self._export_model_state(),
+                model_format,
+                compression=compression,
+                compression_level=compression_level,
+            )
 
     def load_from_file(self, absolute_path: str = "") -> None:
         """
-        Loads classifier state from a persisted model file.
+        Loads classifier state from a persisted JSON or binary model file,
+        optionally compressed. Format and codec are detected from the file contents. Like ``load``, the new
+        model is built off to the side and swapped in at once; uncompressed binary models skip the per-token
+        checks that their CRC32 and stored tallies already cover. With ``max_loaded_tokens``, uncompressed
+        binary models are opened lazily instead (see ``simplebayes.lazy_model``).
         """
-        with self._lock:
-            state = load_model_state_from_file(absolute_path)
-            validate_model_state(state)
-            self._apply_model_state(state)
+        if self.max_loaded_tokens and is_binary_model_file(absolute_path):
+            # Imported here so that only lazily loaded models pay for mmap and the binary codec
+            from simplebayes.lazy_model import LazyCategories  # pylint: disable=import-outside-toplevel
+
+            categories = LazyCategories(resolve_model_path(absolute_path), self.max_loaded_tokens)
+        else:
+            categories = load_model_categories_from_file(absolute_path)
+        self._swap_categories(categories)
 
     @classmethod
     def normalize_category(cls, category: str | None) -> str:
@@ -378,29 +813,45 @@ class SimpleBayes:
         return normalized
 
     def _export_model_state(self) -> Dict:
-        categories = {}
-        for category_name, category in self.categories.get_categories().items():
-            category_tokens = {
-                token: int(count)
-                for token, count in category.tokens.items()
-                if count > 0
-            }
-            categories[category_name] = {
-                "tally": int(category.get_tally()),
-                "tokens": category_tokens,
+        return self.export_state()[1]
+
+    def export_state(self) -> Tuple[int, Dict]:
+        """
+        Captures the model state, as written by ``save``, together with the
+        revision it reflects. The lock is held only while each category's
+        token dict is shared (copy-on-write); later changes copy before writing.
+
+        :return: ``(revision, state)``; the state must not be changed
+        :rtype: tuple
+        """
+        with self._lock:
+            revision = self.revision
+            categories = {
+                category_name: {
+                    "tally": int(category.get_tally()),
+                    "tokens": category.share_tokens(),
+                }
+                for category_name, category in self.categories.get_categories().items()
             }
+            sequence = self.categories.sequence
 
-        return {
+        state = {
             "version": PERSISTED_MODEL_VERSION,
             "categories": categories,
         }
+        if sequence:
+            state["sequence"] = sequence
+        return revision, state
 
-    def _apply_model_state(self, state: Dict) -> None:
-        self.categories = BayesCategories()
-        categories = state.get("categories", {})
-        for category_name, category_state in categories.items():
-            category = self.categories.add_category(category_name)
-            for token, count in category_state["tokens"].items():
-                category.train_token(token, count)
-
-        self.calculate_category_probability()
+    def _swap_categories(self, categories: BayesCategories) -> None:
+        with self._lock:
+            if self.journal is not None:
+                # The loaded model supersedes every record logged so far
+                categories.sequence = self.journal.last_sequence
+            previous, self.categories = self.categories, categories
+            self.revision += 1
+            self.calculate_category_probability()
+            if self.change_feed is not None:
+                self.change_feed.publish(self.revision, CHANGE_LOAD)
+            # Readers use the categories only while holding the lock, so none is left
+            previous.close()
@@ -1,13 +1,68 @@
-import sys
+import os
+import signal
+import threading
 from contextlib import asynccontextmanager
+from typing import Dict, Optional
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
 
 from simplebayes import SimpleBayes
-from simplebayes.api.routes import WWW_AUTH_HEADER, create_router
-from simplebayes.errors import UnauthorizedError
+from simplebayes.api.coalesce import DEFAULT_CLASSIFY_BATCH_MAX, ClassifyCoalescer
+from simplebayes.api.limits import MAX_REQUEST_BODY_BYTES, BodyLimitMiddleware
+from simplebayes.api.metrics import MetricsMiddleware, ServerMetrics
+from simplebayes.api.replication import ForwardWritesMiddleware, RevisionHeaderMiddleware
+from simplebayes.api.routes import (
+    DEFAULT_MAX_BATCH_SIZE,
+    SUMMARY_MODES,
+    WWW_AUTH_HEADER,
+    create_model_router,
+    create_router,
+)
+from simplebayes.api.verbose import VerboseLoggingMiddleware
+from simplebayes.errors import InvalidModelNameError, ReadOnlyModelError, UnauthorizedError
+from simplebayes.mapped_model import MappedModel
+from simplebayes.persistence import resolve_model_path
+from simplebayes.runtime.log_queue import QueuedLog
 from simplebayes.runtime.readiness import ReadinessState
+from simplebayes.runtime.registry import ModelRegistry
+from simplebayes.runtime.reload import ModelReloader
+from simplebayes.runtime.replication import ChangeFeed, ReplicaFollower
+from simplebayes.runtime.snapshots import BackgroundSnapshotter
+from simplebayes.sqlite_store import SQLiteModelStore
+from simplebayes.wal import WriteAheadLog
+
+# Seconds a worker waits for its first copy of the primary's model before failing to start
+REPLICA_STARTUP_SECONDS = 30.0
+
+
+def _restore_model(  # pylint: disable=too-many-arguments
+    classifier: SimpleBayes,
+    *,
+    snapshot_path: str,
+    wal_path: str,
+    wal_commit_interval: float,
+    sqlite_path: str,
+):
+    """Loads persisted state into the classifier and attaches the configured journal, if any."""
+    if wal_path and sqlite_path:
+        raise ValueError("wal_path and sqlite_path cannot be combined")
+
+    if sqlite_path:
+        if os.path.exists(resolve_model_path(sqlite_path)):
+            classifier.load_from_file(sqlite_path)
+        store = SQLiteModelStore(sqlite_path)
+        classifier.attach_journal(store)
+        return store
+
+    if snapshot_path and os.path.exists(resolve_model_path(snapshot_path)):
+        classifier.load_from_file(snapshot_path)
+    if wal_path:
+        wal = WriteAheadLog(wal_path, commit_interval=wal_commit_interval)
+        classifier.attach_journal(wal)
+        return wal
+    return None
 
 
 def create_app(
@@ -15,54 +70,196 @@ def create_app(
     language: str = "english",
     remove_stop_words: bool = False,
     verbose: bool = False,
+    *,
+    ngrams: int = 1,
+    ngram_hash_buckets: int = 0,
+    max_tokens_per_document: int = 0,
+    max_token_length: int = 0,
+    max_new_tokens_per_train: int = 0,
+    max_loaded_tokens: int = 0,
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    max_body_bytes: int = MAX_REQUEST_BODY_BYTES,
+    body_limits: Optional[Dict[str, int]] = None,
+    mutation_summaries: str = "all",
+    metrics: bool = True,
+    classify_batch_window: float = 0.0,
+    classify_batch_max: int = DEFAULT_CLASSIFY_BATCH_MAX,
+    change_feed: bool = False,
+    primary_socket: str = "",
+    model_directory: str = "",
+    max_model_tokens: int = 0,
+    model_idle_seconds: float = 0.0,
+    mapped_model_path: str = "",
+    snapshot_path: str = "",
+    snapshot_interval: float = 0.0,
+    wal_path: str = "",
+    wal_commit_interval: float = 0.0,
+    sqlite_path: str = "",
+    reload_path: str = "",
+    reload_watch_interval: float = 0.0,
 ) -> FastAPI:
-    classifier = SimpleBayes(language=language, remove_stop_words=remove_stop_words)
+    classifier_options = {
+        "language": language,
+        "remove_stop_words": remove_stop_words,
+        "ngrams": ngrams,
+        "ngram_hash_buckets": ngram_hash_buckets,
+        "max_tokens_per_document": max_tokens_per_document,
+        "max_token_length": max_token_length,
+        "max_new_tokens_per_train": max_new_tokens_per_train,
+        "max_loaded_tokens": max_loaded_tokens,
+    }
+
+    if max_batch_size < 0:
+        raise ValueError("max_batch_size must be >= 0")
+    if mutation_summaries not in SUMMARY_MODES:
+        raise ValueError(f"mutation_summaries must be one of {', '.join(SUMMARY_MODES)}")
+    if max_body_bytes < 0 or any(limit < 0 for limit in (body_limits or {}).values()):
+        raise ValueError("body limits must be >= 0")
+    if snapshot_interval and not snapshot_path:
+        raise ValueError("snapshot_interval requires snapshot_path")
+    if reload_path and wal_path and not snapshot_path:
+        raise ValueError("reloading with a write-ahead log requires snapshot_path")
+    if (max_model_tokens or model_idle_seconds) and not model_directory:
+        raise ValueError("max_model_tokens and model_idle_seconds require model_directory")
+    if primary_socket and (change_feed or snapshot_path or wal_path or sqlite_path or reload_path or model_directory):
+        raise ValueError("a replica of primary_socket keeps no model of its own; configure the primary instead")
+    if mapped_model_path and (
+        max_loaded_tokens or change_feed or primary_socket or snapshot_path or wal_path or sqlite_path or reload_path
+    ):
+        raise ValueError("a mapped model is read-only; it cannot be persisted, reloaded, replicated, or loaded lazily")
 
+    if mapped_model_path:
+        mapped_options = {name: value for name, value in classifier_options.items() if name != "max_loaded_tokens"}
+        classifier = MappedModel(mapped_model_path, **mapped_options)
+    else:
+        classifier = SimpleBayes(**classifier_options)
+
+    journal = _restore_model(
+        classifier,
+        snapshot_path=snapshot_path,
+        wal_path=wal_path,
+        wal_commit_interval=wal_commit_interval,
+        sqlite_path=sqlite_path,
+    )
+
+    snapshotter = None
+    if snapshot_interval:
+        # The SQLite store is always current; only a write-ahead log needs compacting
+        snapshotter = BackgroundSnapshotter(
+            classifier, snapshot_path, snapshot_interval, journal=journal if wal_path else None,
+        )
+
+    reloader = None
+    if reload_path:
+        reloader = ModelReloader(
+            classifier,
+            reload_path,
+            watch_interval=reload_watch_interval,
+            journal=journal,
+            snapshot_path=snapshot_path,
+        )
+
+    feed = ChangeFeed(classifier) if change_feed else None
+    follower = ReplicaFollower(classifier, primary_socket, auth_token) if primary_socket else None
+
+    coalescer = None
+    if classify_batch_window:
+        coalescer = ClassifyCoalescer(classifier, classify_batch_window, classify_batch_max)
     readiness = ReadinessState()
+    verbose_log = QueuedLog()
+    server_metrics = None
+    if metrics:
+        server_metrics = ServerMetrics()
+        classifier.attach_metrics(server_metrics.classifier)
+
+    registry = None
+    if model_directory:
+        def create_model_classifier() -> SimpleBayes:
+            model = SimpleBayes(**classifier_options)
+            if server_metrics is not None:
+                model.attach_metrics(server_metrics.classifier)
+            return model
+
+        registry = ModelRegistry(
+            model_directory, create_model_classifier, max_tokens=max_model_tokens, idle_seconds=model_idle_seconds,
+        )
 
     @asynccontextmanager
     async def lifespan(_app: FastAPI):
+        # Signal handlers can only be installed from the main thread
+        handle_sighup = (
+            reloader is not None
+            and hasattr(signal, "SIGHUP")
+            and threading.current_thread() is threading.main_thread()
+        )
+        if snapshotter is not None:
+            snapshotter.start()
+        if reloader is not None:
+            reloader.start()
+            if handle_sighup:
+                reloader.install_signal_handler()
+        if registry is not None:
+            registry.start()
+        if follower is not None:
+            follower.start()
+            if not await run_in_threadpool(follower.wait_for, 0, REPLICA_STARTUP_SECONDS):
+                follower.stop()
+                raise RuntimeError(f"no model received from the primary at {primary_socket}")
         readiness.mark_ready()
         yield
         readiness.mark_not_ready()
+        if follower is not None:
+            follower.stop()
+        if registry is not None:
+            registry.stop()
+        if reloader is not None:
+            reloader.restore_signal_handler()
+            reloader.stop()
+        if snapshotter is not None:
+            snapshotter.stop()
+        if journal is not None:
+            if snapshot_path:
+                journal.compact(classifier, snapshot_path)
+            journal.close()
+        elif snapshot_path:
+            classifier.save_to_file(snapshot_path)
+        if mapped_model_path:
+            classifier.close()
+        verbose_log.close()
 
     app = FastAPI(title="simplebayes", lifespan=lifespan)
     app.state.classifier = classifier
     app.state.readiness = readiness
     app.state.verbose = verbose
-    app.include_router(create_router(auth_token=auth_token, verbose=verbose))
-
-    @app.middleware("http")
-    async def verbose_middleware(request: Request, call_next):
-        if not request.app.state.verbose:
-            return await call_next(request)
-        method = request.method
-        path = request.url.path
-        content_length = request.headers.get("content-length", "")
-        parts = [f"[simplebayes] {method} {path}"]
-        if content_length:
-            parts.append(f" (Content-Length: {content_length})")
-        print("".join(parts), file=sys.stderr)
-        try:
-            response = await call_next(request)
-        except Exception:
-            print("[simplebayes] -> (exception)", file=sys.stderr)
-            raise
-        body = b""
-        async for chunk in response.body_iterator:
-            body += chunk
-        preview_len = 500
-        if len(body) > preview_len:
-            body_preview = body[:preview_len].decode("utf-8", errors="replace") + "..."
-        else:
-            body_preview = body.decode("utf-8", errors="replace") if body else ""
-        print(f"[simplebayes] -> {response.status_code} {body_preview!r}", file=sys.stderr)
-        return Response(
-            content=body,
-            status_code=response.status_code,
-            headers=dict(response.headers),
-            media_type=response.media_type,
-        )
+    app.state.verbose_log = verbose_log
+    app.state.journal = journal
+    app.state.reloader = reloader
+    app.state.metrics = server_metrics
+    app.state.classify_coalescer = coalescer
+    app.state.change_feed = feed
+    app.state.models = registry
+    router = create_router(
+        auth_token=auth_token,
+        verbose=verbose,
+        max_batch_size=max_batch_size,
+        mutation_summaries=mutation_summaries,
+    )
+    app.include_router(router)
+    if registry is not None:
+        app.include_router(create_model_router(router), prefix="/models/{model}")
+
+    # Each add_middleware wraps the previous ones: writes are forwarded (workers) or
+    # tagged with the revision (primary) inside the body limits, which run before any
+    # body is read; verbose logging also sees the requests they reject, and metrics,
+    # outermost, time all of it
+    if follower is not None:
+        app.add_middleware(ForwardWritesMiddleware, follower=follower)
+    if feed is not None:
+        app.add_middleware(RevisionHeaderMiddleware, classifier=classifier)
+    app.add_middleware(BodyLimitMiddleware, max_body_bytes=max_body_bytes, body_limits=body_limits)
+    app.add_middleware(VerboseLoggingMiddleware, log=verbose_log)
+    if server_metrics is not None:
+        app.add_middleware(MetricsMiddleware, metrics=server_metrics)
 
     @app.exception_handler(UnauthorizedError)
     def unauthorized_handler(_request: Request, _exc: UnauthorizedError) -> JSONResponse:
@@ -72,6 +269,14 @@ def create_app(
             headers=WWW_AUTH_HEADER,
         )
 
+    @app.exception_handler(ReadOnlyModelError)
+    def read_only_model_handler(_request: Request, exc: ReadOnlyModelError) -> JSONResponse:
+        return JSONResponse(status_code=409, content={"error": str(exc)})
+
+    @app.exception_handler(InvalidModelNameError)
+    def invalid_model_name_handler(_request: Request, exc: InvalidModelNameError) -> JSONResponse:
+        return JSONResponse(status_code=400, content={"error": str(exc)})
+
     return app
 
 
@@ -0,0 +1,88 @@
+"""
+Coalesces concurrent ``/classify`` requests into batches.
+
+Each request waits up to a short window for others to arrive; the whole
+group is then scored with one ``classify_result_batch`` call, which takes the
+classifier lock once and computes each distinct token's probabilities once,
+instead of once per request. A full batch is scored at once without waiting
+out the window.
+"""
+import asyncio
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+
+from simplebayes import SimpleBayes
+from simplebayes.models import ClassificationResult
+
+DEFAULT_CLASSIFY_BATCH_MAX = 64
+
+_Pending = Tuple[str, Optional[FrozenSet[str]], "asyncio.Future[ClassificationResult]"]
+
+
+class ClassifyCoalescer:
+    """Scores concurrent classifications in batches, on the running event loop."""
+
+    def __init__(self, classifier: SimpleBayes, window: float, max_batch: int = DEFAULT_CLASSIFY_BATCH_MAX) -> None:
+        """
+        :param classifier: the classifier to score with
+        :param window: seconds the first request of a batch waits for more
+        :param max_batch: requests scored together at most
+        """
+        if window < 0:
+            raise ValueError("window must be >= 0")
+        if max_batch < 1:
+            raise ValueError("max_batch must be >= 1")
+
+        self.classifier = classifier
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: List[_Pending] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Keeps scoring tasks referenced until they finish
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def classify(self, text: str, categories: Optional[Iterable[str]] = None) -> ClassificationResult:
+        """
+        Classifies ``text`` together with the requests around it.
+
+        :param categories: only choose among these categories (see ``SimpleBayes.score``)
+        """
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[ClassificationResult]" = loop.create_future()
+        self._pending.append((text, None if categories is None else frozenset(categories), future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._score(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _score(self, batch: List[_Pending]) -> None:
+        groups: Dict[Optional[FrozenSet[str]], List[_Pending]] = {}
+        for pending in batch:
+            groups.setdefault(pending[1], []).append(pending)
+
+        for categories, group in groups.items():
+            try:
+                results = await run_in_threadpool(
+                    self.classifier.classify_result_batch, [text for text, _, _ in group], categories=categories,
+                )
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                # Each waiting request fails as it would have on its own
+                for _, _, future in group:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            for (_, _, future), result in zip(group, results):
+                # Requests whose client left have been cancelled
+                if not future.done():
+                    future.set_result(result)
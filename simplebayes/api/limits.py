@@ -0,0 +1,148 @@
+"""
+Request body size limits enforced before the body is buffered.
+
+``BodyLimitMiddleware`` answers ``413`` straight from the ``Content-Length``
+header when it is over the endpoint's limit, without reading the body. A
+body without a length (chunked uploads) is counted while the endpoint reads
+it, and the request is cut off as soon as it crosses the limit. Either way,
+an oversized upload never sits in memory.
+"""
+import json
+import re
+from typing import Dict, Iterable, Optional
+
+MAX_REQUEST_BODY_BYTES = 1024 * 1024
+MAX_BATCH_REQUEST_BODY_BYTES = 16 * 1024 * 1024
+
+# Limits that differ from the server-wide default; 0 means no limit
+DEFAULT_BODY_LIMITS = {
+    "/classify/batch": MAX_BATCH_REQUEST_BODY_BYTES,
+    "/score/batch": MAX_BATCH_REQUEST_BODY_BYTES,
+    "/train/batch": MAX_BATCH_REQUEST_BODY_BYTES,
+    # Read line by line with a per-line limit instead
+    "/classify/stream": 0,
+}
+
+# Named model routes (/models/{name}/...) share the limits of the routes they mirror
+_NAMED_MODEL_PREFIX = re.compile(r"/models/[^/]+(?=/)")
+
+_TOO_LARGE_BODY = json.dumps({"error": "request body too large"}).encode("utf-8")
+
+
+def parse_body_limits(specs: Iterable[str]) -> Dict[str, int]:
+    """
+    Parses ``PATH=BYTES`` limits, e.g. ``/train/batch=67108864``. A path
+    ending in ``*`` matches every path with that prefix, e.g. ``/train/*``.
+
+    :param specs: limit strings; several may also be given comma-separated in one string
+    :return: bytes per path
+    :rtype: dict
+    """
+    limits = {}
+    for spec in specs:
+        for item in spec.split(","):
+            if not item.strip():
+                continue
+            path, separator, size = item.strip().partition("=")
+            if not separator or not path.startswith("/") or not size.strip().isdigit():
+                raise ValueError(f"body limit must look like /path=BYTES: {item.strip()!r}")
+            limits[path] = int(size)
+    return limits
+
+
+class _BodyTooLarge(Exception):
+    pass
+
+
+class BodyLimitMiddleware:
+    """ASGI middleware rejecting request bodies larger than their endpoint's limit."""
+
+    def __init__(self, app, max_body_bytes: int = MAX_REQUEST_BODY_BYTES,
+                 body_limits: Optional[Dict[str, int]] = None) -> None:
+        """
+        :param app: the ASGI application to wrap
+        :param max_body_bytes: limit for endpoints without their own. 0 disables it.
+        :param body_limits: bytes per path (see ``parse_body_limits``), on top of ``DEFAULT_BODY_LIMITS``
+        """
+        limits = dict(DEFAULT_BODY_LIMITS)
+        limits.update(body_limits or {})
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+        self._exact = {path: limit for path, limit in limits.items() if not path.endswith("*")}
+        # Longest prefix first, so the most specific pattern wins
+        self._prefixes = sorted(
+            ((path[:-1], limit) for path, limit in limits.items() if path.endswith("*")),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+
+    def limit_for(self, path: str) -> int:
+        """
+        :return: the body limit in bytes for a request path, 0 for none
+        :rtype: int
+        """
+        named_model = _NAMED_MODEL_PREFIX.match(path)
+        if named_model:
+            path = path[named_model.end():]
+        if path in self._exact:
+            return self._exact[path]
+        for prefix, limit in self._prefixes:
+            if path.startswith(prefix):
+                return limit
+        return self.max_body_bytes
+
+    async def __call__(self, scope, receive, send) -> None:
+        limit = self.limit_for(scope.get("path", "")) if scope["type"] == "http" else 0
+        if not limit:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length", b"")
+        if content_length.isdigit() and int(content_length) > limit:
+            await _send_too_large(send)
+            return
+
+        received = 0
+        exceeded = False
+        started = False
+
+        async def limited_receive():
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    exceeded = True
+                    raise _BodyTooLarge()
+            return message
+
+        async def guarded_send(message) -> None:
+            nonlocal started
+            # The endpoint's own answer to the interrupted read is replaced by the 413
+            if exceeded:
+                return
+            started = started or message["type"] == "http.response.start"
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Middleware and task groups between here and the read may wrap _BodyTooLarge
+            if not exceeded:
+                raise
+        if exceeded and not started:
+            await _send_too_large(send)
+
+
+async def _send_too_large(send) -> None:
+    await send({
+        "type": "http.response.start",
+        "status": 413,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(_TOO_LARGE_BODY)).encode("ascii")),
+            # The rest of the body is never read
+            (b"connection", b"close"),
+        ],
+    })
+    await send({"type": "http.response.body", "body": _TOO_LARGE_BODY})
@@ -0,0 +1,113 @@
+"""
+Server metrics for ``GET /metrics``.
+
+``MetricsMiddleware`` counts requests and times them per route template
+(``/train/{category}``, not every category), so the number of series stays
+fixed. The classifier's own timings come from ``SimpleBayes.attach_metrics``;
+model size and lazy-load cache counts are read when the metrics are scraped.
+"""
+import time
+from typing import List, Optional, Tuple
+
+from simplebayes import SimpleBayes
+from simplebayes.metrics import ClassifierMetrics, Counter, Histogram, render_gauges
+
+# Upper bounds in seconds for whole requests
+REQUEST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Route label of requests answered before routing, e.g. over their body limit, and of unknown paths
+UNROUTED = "unrouted"
+
+
+class ServerMetrics:
+    """Request metrics plus the classifier's, rendered together."""
+
+    def __init__(self) -> None:
+        self.requests = Counter("simplebayes_requests_total", "HTTP requests by route, method, and status.")
+        self.request_seconds = Histogram(
+            "simplebayes_request_duration_seconds",
+            "Time from receiving a request to sending the end of its response.",
+            REQUEST_BUCKETS,
+        )
+        self.classifier = ClassifierMetrics()
+        # (revision, lines) of the last model size read, recounted only after the model changes
+        self._model_size: Tuple[int, List[str]] = (-1, [])
+
+    def render(self, classifier: SimpleBayes) -> str:
+        """
+        :param classifier: the served classifier, for model size and cache gauges
+        :return: every metric in the Prometheus text exposition format
+        """
+        lines = self.requests.render() + self.request_seconds.render() + self.classifier.render()
+        lines.extend(self._model_lines(classifier))
+        lines.extend(_category_cache_lines(classifier))
+        return "\n".join(lines) + "\n"
+
+    def _model_lines(self, classifier: SimpleBayes) -> List[str]:
+        revision = classifier.revision
+        cached_revision, lines = self._model_size
+        if revision != cached_revision:
+            size = classifier.model_size()
+            lines = (
+                render_gauges("simplebayes_model_categories", "Trained categories.", [((), size.categories)])
+                + render_gauges(
+                    "simplebayes_model_vocabulary_tokens", "Distinct tokens across categories.",
+                    [((), size.vocabulary)],
+                )
+                + render_gauges(
+                    "simplebayes_model_tally_tokens", "Trained tokens across categories.", [((), size.tally)],
+                )
+            )
+            self._model_size = (revision, lines)
+        return lines
+
+
+def _category_cache_lines(classifier: SimpleBayes) -> List[str]:
+    categories = classifier.categories
+    hits = getattr(categories, "cache_hits", None)
+    if hits is None:
+        return []
+    # Plain counts of the lazily loaded model; they start over when another model is loaded
+    return [
+        "# HELP simplebayes_category_cache_hits_total Lazily loaded category token maps found decoded.",
+        "# TYPE simplebayes_category_cache_hits_total counter",
+        f"simplebayes_category_cache_hits_total {hits}",
+        "# HELP simplebayes_category_cache_misses_total Lazily loaded category token maps decoded on use.",
+        "# TYPE simplebayes_category_cache_misses_total counter",
+        f"simplebayes_category_cache_misses_total {categories.cache_misses}",
+    ]
+
+
+class MetricsMiddleware:
+    """ASGI middleware counting and timing every HTTP request."""
+
+    def __init__(self, app, metrics: ServerMetrics) -> None:
+        """
+        :param app: the ASGI application to wrap
+        :param metrics: where the measurements go
+        """
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status: Optional[int] = None
+
+        async def status_send(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, status_send)
+        finally:
+            # The router records the matched route in the scope
+            route = getattr(scope.get("route"), "path", UNROUTED)
+            labels = (("route", route), ("method", scope["method"]))
+            self.metrics.request_seconds.observe(time.perf_counter() - started, labels)
+            self.metrics.requests.inc(labels=labels + (("status", str(status or 500)),))
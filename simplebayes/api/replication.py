@@ -0,0 +1,153 @@
+"""
+API pieces for serving one model from several worker processes.
+
+The primary app (``create_app(change_feed=True)``) owns the model and its
+persistence. It streams its changes from ``GET /replication/changes`` and
+tags every response with the model revision it reflects. Worker apps
+(``create_app(primary_socket=...)``) answer reads from their own replica and
+pass every write to the primary with ``ForwardWritesMiddleware``, answering
+only once their replica has caught up with it, so a client always reads its
+own writes from the worker it wrote through.
+"""
+import json
+from typing import AsyncIterator
+
+from fastapi.concurrency import run_in_threadpool
+
+from simplebayes import CHANGE_LOAD
+from simplebayes.runtime.replication import FEED_HEARTBEAT_SECONDS, REVISION_HEADER, ChangeFeed, ReplicaFollower
+
+# Requests that change the model; a worker forwards them to the primary
+FORWARDED_PATHS = ("/flush", "/reload")
+FORWARDED_PREFIXES = ("/train/", "/untrain/")
+# Named models are only kept by the primary, so every request for them is forwarded
+MODELS_PATH = "/models"
+FORWARDED_HEADERS = (b"authorization", b"content-type")
+RETURNED_HEADERS = ("content-type", "www-authenticate")
+# A write is answered after at most this long even if the replica has not caught up
+READ_YOUR_WRITES_SECONDS = 5.0
+
+_PRIMARY_UNAVAILABLE = json.dumps({"error": "primary unavailable"}).encode("utf-8")
+
+
+def _model_lines(feed: ChangeFeed) -> tuple[int, str]:
+    revision, state = feed.classifier.export_state()
+    header = json.dumps({"revision": revision, "operation": CHANGE_LOAD})
+    return revision, header + "\n" + json.dumps(state) + "\n"
+
+
+async def change_lines(feed: ChangeFeed, after: int) -> AsyncIterator[str]:
+    """
+    Streams NDJSON changes newer than revision ``after``: a ``load`` line
+    followed by the whole model when the follower is new (``after`` < 0) or
+    cannot be caught up change by change, otherwise one line per change. A
+    blank line is sent when nothing changed for ``FEED_HEARTBEAT_SECONDS``.
+    """
+    revision = after
+    changes = None if after < 0 else []
+    follower = feed.add_follower(after)
+    try:
+        while True:
+            if changes is None:
+                revision, lines = await run_in_threadpool(_model_lines, feed)
+                yield lines
+            elif not changes:
+                yield "\n"
+            else:
+                yield "".join(
+                    json.dumps({"revision": change, "operation": operation, "category": category, "counts": counts})
+                    + "\n"
+                    for change, operation, category, counts in changes
+                )
+                revision = changes[-1][0]
+            changes = await run_in_threadpool(feed.changes_after, revision, FEED_HEARTBEAT_SECONDS, follower)
+    finally:
+        feed.remove_follower(follower)
+
+
+class RevisionHeaderMiddleware:
+    """ASGI middleware for the primary adding the model revision to every response."""
+
+    def __init__(self, app, classifier) -> None:
+        """
+        :param app: the ASGI application to wrap
+        :param classifier: the primary classifier
+        """
+        self.app = app
+        self.classifier = classifier
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def tagging_send(message) -> None:
+            if message["type"] == "http.response.start":
+                # Read once the endpoint is done, so it covers the request's own change
+                revision = str(self.classifier.revision).encode("ascii")
+                headers = list(message.get("headers", [])) + [(REVISION_HEADER.encode("ascii"), revision)]
+                message = dict(message, headers=headers)
+            await send(message)
+
+        await self.app(scope, receive, tagging_send)
+
+
+def _is_forwarded(scope) -> bool:
+    path = scope["path"]
+    if path == MODELS_PATH or path.startswith(MODELS_PATH + "/"):
+        return True
+    return scope["method"] == "POST" and (path in FORWARDED_PATHS or path.startswith(FORWARDED_PREFIXES))
+
+
+class ForwardWritesMiddleware:
+    """ASGI middleware for workers sending model changes, and named model requests, to the primary."""
+
+    def __init__(self, app, follower: ReplicaFollower) -> None:
+        """
+        :param app: the ASGI application to wrap
+        :param follower: the worker's connection to the primary
+        """
+        self.app = app
+        self.follower = follower
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or not _is_forwarded(scope):
+            await self.app(scope, receive, send)
+            return
+
+        body = bytearray()
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            body.extend(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+
+        target = scope["path"]
+        if scope.get("query_string"):
+            target += "?" + scope["query_string"].decode("latin-1")
+        headers = {
+            name.decode("latin-1"): value.decode("latin-1")
+            for name, value in scope["headers"]
+            if name.lower() in FORWARDED_HEADERS
+        }
+        try:
+            status, response_headers, content = await run_in_threadpool(
+                self.follower.forward, scope["method"], target, headers, bytes(body),
+            )
+        except OSError:
+            status, response_headers, content = 503, [("content-type", "application/json")], _PRIMARY_UNAVAILABLE
+        else:
+            revision = dict((name.lower(), value) for name, value in response_headers).get(REVISION_HEADER)
+            if revision is not None:
+                await run_in_threadpool(self.follower.wait_for, int(revision), READ_YOUR_WRITES_SECONDS)
+
+        returned = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in response_headers
+            if name.lower() in RETURNED_HEADERS
+        ]
+        returned.append((b"content-length", str(len(content)).encode("ascii")))
+        await send({"type": "http.response.start", "status": status, "headers": returned})
+        await send({"type": "http.response.body", "body": content})
@@ -1,26 +1,44 @@
-import sys
+import json
 import secrets
-from typing import Dict
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, Body, Depends, Path, Request
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Body, Depends, Path, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from simplebayes import SimpleBayes
-from simplebayes.errors import UnauthorizedError
+from simplebayes.errors import InvalidCategoryError, SimpleBayesError, UnauthorizedError
 from simplebayes.runtime.readiness import ReadinessState
+from simplebayes.api.limits import MAX_REQUEST_BODY_BYTES
+from simplebayes.api.metrics import METRICS_MEDIA_TYPE
+from simplebayes.api.replication import change_lines
 from simplebayes.api.schemas import (
     CategorySummaryResponse,
     ClassificationResponse,
     InfoResponse,
+    ModelsResponse,
     MutationResponse,
 )
 
 CATEGORY_REGEX = r"^[-_A-Za-z0-9]{1,64}$"
 
 
-def _get_classifier(request: Request) -> SimpleBayes:
-    return request.app.state.classifier
+async def _get_classifier(request: Request) -> AsyncIterator[SimpleBayes]:
+    name = request.path_params.get("model")
+    if name is None:
+        yield request.app.state.classifier
+        return
+
+    # A named model (see create_model_router) is leased for the whole request
+    registry = request.app.state.models
+    classifier = registry.acquire_loaded(name)
+    if classifier is None:
+        classifier = await run_in_threadpool(registry.acquire, name)
+    try:
+        yield classifier
+    finally:
+        registry.release(name)
 
 
 def _get_readiness(request: Request) -> ReadinessState:
@@ -28,9 +46,9 @@ def _get_readiness(request: Request) -> ReadinessState:
 
 
 def _log_verbose(request: Request, *parts: str) -> None:
-    """Log to stderr when verbose mode is enabled."""
+    """Queue a line for stderr when verbose mode is enabled."""
     if getattr(request.app.state, "verbose", False):
-        print("[simplebayes]", *parts, file=sys.stderr)
+        request.app.state.verbose_log.log(*parts)
 
 
 def _format_tokens(tokens: list) -> str:
@@ -41,12 +59,30 @@ def _format_tokens(tokens: list) -> str:
     return str(tokens[:max_show]) + "..."
 
 
-MAX_REQUEST_BODY_BYTES = 1024 * 1024
+MAX_STREAM_LINE_BYTES = MAX_REQUEST_BODY_BYTES
+DEFAULT_MAX_BATCH_SIZE = 1000
+SUMMARY_MODES = ("all", "touched", "none")
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
 WWW_AUTH_HEADER = {"WWW-Authenticate": 'Bearer realm="simplebayes"'}
+# Routes also served for each named model, under /models/{model}
+MODEL_ROUTE_PATHS = (
+    "/info",
+    "/train/batch",
+    "/train/{category}",
+    "/untrain/{category}",
+    "/classify",
+    "/score",
+    "/classify/batch",
+    "/classify/stream",
+    "/score/batch",
+    "/flush",
+)
 
 
-def _map_summaries(classifier: SimpleBayes) -> Dict[str, CategorySummaryResponse]:
-    summaries = classifier.get_summaries()
+def _map_summaries(
+    classifier: SimpleBayes, categories: Optional[List[str]] = None
+) -> Dict[str, CategorySummaryResponse]:
+    summaries = classifier.get_summaries(categories=categories)
     return {
         category: CategorySummaryResponse(
             tokenTally=summary.token_tally,
@@ -57,6 +93,24 @@ def _map_summaries(classifier: SimpleBayes) -> Dict[str, CategorySummaryResponse
     }
 
 
+def _mutation_response(classifier: SimpleBayes, summaries: str, touched: List[str]) -> MutationResponse:
+    """
+    Builds a mutation response with every category's summary (``all``), only
+    the changed categories' (``touched``), or none (``none``). The last two
+    keep the cost of a write independent of the number of categories.
+    """
+    if summaries == "none":
+        return MutationResponse(success=True)
+    return MutationResponse(
+        success=True,
+        categories=_map_summaries(classifier, None if summaries == "all" else touched),
+    )
+
+
+def _log_summaries(response: MutationResponse) -> str:
+    return str({k: v.tokenTally for k, v in (response.categories or {}).items()})
+
+
 def _create_auth_dependency(auth_token: str):
     """Returns a FastAPI dependency for Bearer auth. When auth_token is empty, no auth."""
     bearer = HTTPBearer(auto_error=False)
@@ -74,13 +128,14 @@ def _create_auth_dependency(auth_token: str):
     return verify
 
 
-def _parse_payload(payload: bytes) -> tuple[str, JSONResponse | None]:
-    if len(payload) > MAX_REQUEST_BODY_BYTES:
-        return "", JSONResponse(
-            status_code=413,
-            content={"error": "request body too large"},
-        )
+def _parse_categories(categories: str) -> Optional[List[str]]:
+    """Splits a comma-separated ``categories`` query value; empty means every category."""
+    names = [name.strip() for name in categories.split(",") if name.strip()]
+    return names or None
 
+
+def _parse_payload(payload: bytes) -> tuple[str, JSONResponse | None]:
+    # Body size limits are enforced by BodyLimitMiddleware before the body is read
     try:
         return payload.decode("utf-8"), None
     except UnicodeDecodeError:
@@ -90,10 +145,190 @@ def _parse_payload(payload: bytes) -> tuple[str, JSONResponse | None]:
         )
 
 
-def create_router(auth_token: str = "", verbose: bool = False) -> APIRouter:
+def _is_ndjson(request: Request) -> bool:
+    return request.headers.get("content-type", "").split(";")[0].strip().lower() == NDJSON_MEDIA_TYPE
+
+
+def _decode_batch(request: Request, payload: bytes) -> tuple[object, JSONResponse | None]:
+    """
+    Decodes a batch body: NDJSON (with content type application/x-ndjson) as
+    the list of its non-blank lines, anything else as one JSON document. The
+    value is None when the body is not valid JSON.
+    """
+    text, payload_response = _parse_payload(payload)
+    if payload_response is not None:
+        return None, payload_response
+
+    try:
+        if _is_ndjson(request):
+            return [json.loads(line) for line in text.splitlines() if line.strip()], None
+        return json.loads(text), None
+    except ValueError:
+        return None, None
+
+
+def _batch_error(items: list, max_batch_size: int, expected: str) -> JSONResponse | None:
+    if items is None:
+        return JSONResponse(status_code=400, content={"error": f"expected {expected}"})
+    if max_batch_size and len(items) > max_batch_size:
+        return JSONResponse(
+            status_code=413,
+            content={"error": f"batch larger than {max_batch_size} documents"},
+        )
+    return None
+
+
+def _parse_batch(request: Request, payload: bytes, max_batch_size: int) -> tuple[List[str], JSONResponse | None]:
+    """
+    Reads a batch of texts sent as a JSON array of strings, or as NDJSON
+    (one JSON string per line) when the content type is application/x-ndjson.
+    """
+    texts, payload_response = _decode_batch(request, payload)
+    if payload_response is not None:
+        return [], payload_response
+
+    if not isinstance(texts, list) or not all(isinstance(item, str) for item in texts):
+        texts = None
+    error = _batch_error(texts, max_batch_size, "a JSON array of strings or NDJSON strings")
+    return ([], error) if error is not None else (texts, None)
+
+
+def _training_pairs(document: object) -> Optional[List[Tuple[str, str]]]:
+    """
+    Accepts ``[{"category": ..., "text": ...}, ...]`` or ``{category: [text, ...]}``.
+    """
+    if isinstance(document, dict):
+        if not all(isinstance(texts, list) for texts in document.values()):
+            return None
+        pairs = [(category, text) for category, texts in document.items() for text in texts]
+    elif isinstance(document, list) and all(isinstance(item, dict) for item in document):
+        pairs = [(item.get("category"), item.get("text")) for item in document]
+    else:
+        return None
+    if not all(isinstance(category, str) and isinstance(text, str) for category, text in pairs):
+        return None
+    return pairs
+
+
+def _parse_training_batch(
+    request: Request, payload: bytes, max_batch_size: int
+) -> tuple[List[Tuple[str, str]], JSONResponse | None]:
+    """
+    Reads training samples sent as category and text pairs (a JSON array or
+    NDJSON objects), or as a JSON object of per-category arrays of texts.
+    """
+    document, payload_response = _decode_batch(request, payload)
+    if payload_response is not None:
+        return [], payload_response
+
+    pairs = _training_pairs(document)
+    error = _batch_error(
+        pairs, max_batch_size, '{"category": ..., "text": ...} pairs or an object of per-category text arrays',
+    )
+    return ([], error) if error is not None else (pairs, None)
+
+
+def _batch_response(request: Request, results: list) -> Response:
+    """Answers in the request's format: NDJSON for NDJSON, otherwise a JSON array."""
+    if _is_ndjson(request):
+        lines = "".join(json.dumps(result) + "\n" for result in results)
+        return Response(content=lines, media_type=NDJSON_MEDIA_TYPE)
+    return JSONResponse(content=results)
+
+
+class _DuplexStreamingResponse(StreamingResponse):
+    """
+    Streams a response while its body iterator is still reading the request.
+    StreamingResponse otherwise watches ``receive`` for a disconnect, which
+    would consume the request body out from under the iterator; here the
+    iterator's ``request.stream()`` sees the disconnect instead.
+
+    The status is only sent with the first chunk, so a request that fails
+    before any output (e.g. over its body limit) can still be answered with
+    an error status.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        started = False
+        async for chunk in self.body_iterator:
+            if not started:
+                await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+                started = True
+            await send({"type": "http.response.body", "body": chunk.encode(self.charset), "more_body": True})
+        if not started:
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+async def _read_line_batches(
+    chunks: AsyncIterator[bytes], max_line_bytes: int = MAX_STREAM_LINE_BYTES
+) -> AsyncIterator[List[Optional[bytes]]]:
+    """
+    Splits a streamed body into lines, yielding the complete lines of each
+    chunk as they arrive. At most one partial line is held between chunks; a
+    line longer than ``max_line_bytes`` is dropped as it is read and yielded
+    as None.
+    """
+    pending = b""
+    skipping = False
+    async for chunk in chunks:
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        batch: List[Optional[bytes]] = []
+        for line in lines:
+            if skipping or len(line) > max_line_bytes:
+                skipping = False
+                batch.append(None)
+            else:
+                batch.append(line)
+        if len(pending) > max_line_bytes:
+            skipping = True
+            pending = b""
+        if batch:
+            yield batch
+    if skipping:
+        yield [None]
+    elif pending:
+        yield [pending]
+
+
+def _decode_stream_line(line: Optional[bytes], ndjson: bool) -> tuple[Optional[str], Optional[str]]:
+    """Returns ``(text, None)`` for a document, ``(None, error)`` for a bad line, or ``(None, None)`` to skip."""
+    if line is None:
+        return None, "line too long"
+    try:
+        text = line.decode("utf-8").rstrip("\r")
+    except UnicodeDecodeError:
+        return None, "invalid utf-8 payload"
+    if not text.strip():
+        return None, None
+    if not ndjson:
+        return text, None
+    try:
+        text = json.loads(text)
+    except ValueError:
+        text = None
+    if not isinstance(text, str):
+        return None, "expected a JSON string"
+    return text, None
+
+
+def create_router(
+    auth_token: str = "",
+    verbose: bool = False,
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    mutation_summaries: str = "all",
+) -> APIRouter:
     router = APIRouter()
     verify_auth = _create_auth_dependency(auth_token)
 
+    def summaries_query():
+        return Query(
+            mutation_summaries,
+            pattern="^(all|touched|none)$",
+            description="Category summaries in the response: all, touched (changed categories only), or none.",
+        )
+
     @router.get("/info", response_model=InfoResponse)
     def info(
         request: Request,
@@ -109,13 +344,43 @@ def create_router(auth_token: str = "", verbose: bool = False) -> APIRouter:
         )
         return result
 
-    @router.post("/train/{category}", response_model=MutationResponse)
+    # Registered before /train/{category}, which "batch" would otherwise match
+    @router.post("/train/batch", response_model=MutationResponse, response_model_exclude_none=True)
+    async def train_batch(
+        request: Request,
+        _auth: None = Depends(verify_auth),
+        classifier: SimpleBayes = Depends(_get_classifier),
+        summaries: str = summaries_query(),
+    ):
+        pairs, payload_response = _parse_training_batch(request, await request.body(), max_batch_size)
+        if payload_response is not None:
+            return payload_response
+
+        try:
+            await run_in_threadpool(classifier.train_batch, pairs)
+        except InvalidCategoryError as error:
+            return JSONResponse(status_code=400, content={"error": str(error)})
+        # Names as the classifier stores them, so padded duplicates share one summary
+        touched = list(dict.fromkeys(classifier.normalize_category(category) for category, _ in pairs))
+        response = _mutation_response(classifier, summaries, touched)
+        _log_verbose(
+            request,
+            "train batch:",
+            "documents=",
+            str(len(pairs)),
+            "summaries=",
+            _log_summaries(response),
+        )
+        return response
+
+    @router.post("/train/{category}", response_model=MutationResponse, response_model_exclude_none=True)
     def train(
         request: Request,
         _auth: None = Depends(verify_auth),
         classifier: SimpleBayes = Depends(_get_classifier),
         category: str = Path(..., pattern=CATEGORY_REGEX),
         payload: bytes = Body(b"", media_type="text/plain"),
+        summaries: str = summaries_query(),
     ):
         text, payload_response = _parse_payload(payload)
         if payload_response is not None:
@@ -123,7 +388,7 @@ def create_router(auth_token: str = "", verbose: bool = False) -> APIRouter:
 
         tokens = classifier.tokenizer(text)
         classifier.train(category, text)
-        summaries = _map_summaries(classifier)
+        response = _mutation_response(classifier, summaries, [category])
         _log_verbose(
             request,
             "train:",
@@ -132,17 +397,18 @@ def create_router(auth_token: str = "", verbose: bool = False) -> APIRouter:
             "tokens=",
             _format_tokens(tokens),
             "summaries=",
-            str({k: v.tokenTally for k, v in summaries.items()}),
+            _log_summaries(response),
         )
-        return MutationResponse(success=True, categories=summaries)
+        return response
 
-    @router.post("/untrain/{category}", response_model=MutationResponse)
+    @router.post("/untrain/{category}", response_model=MutationResponse, response_model_exclude_none=True)
     def untrain(
         request: Request,
         _auth: None = Depends(verify_auth),
         classifier: SimpleBayes = Depends(_get_classifier),
         category: str = Path(..., pattern=CATEGORY_REGEX),
         payload: bytes = Body(b"", media_type="text/plain"),
+        summaries: str = summaries_query(),
     ):
         text, payload_response = _parse_payload(payload)
         if payload_response is not None:
@@ -150,7 +416,7 @@ def create_router(auth_token: str = "", verbose: bool = False) -> APIRouter:
 
         tokens = classifier.tokenizer(text)
         classifier.untrain(category, text)
-        summaries = _map_summaries(classifier)
+        response = _mutation_response(classifier, summaries, [category])
         _log_verbose(
             request,
             "untrain:",
@@ -159,33 +425,40 @@ def create_router(auth_token: str = "", verbose: bool = False) -> APIRouter:
             "tokens=",
             _format_tokens(tokens),
             "summaries=",
-            str({k: v.tokenTally for k, v in summaries.items()}),
+            _log_summaries(response),
         )
-        return MutationResponse(success=True, categories=summaries)
+        return response
 
     @router.post("/classify", response_model=ClassificationResponse)
-    def classify(
+    async def classify(
         request: Request,
         _auth: None = Depends(verify_auth),
         classifier: SimpleBayes = Depends(_get_classifier),
         payload: bytes = Body(b"", media_type="text/plain"),
+        categories: str = Query("", description="Comma-separated categories to choose among. Default all."),
     ):
         text, payload_response = _parse_payload(payload)
         if payload_response is not None:
             return payload_response
 
-        tokens = classifier.tokenizer(text)
-        result = classifier.classify_result(text)
-        _log_verbose(
-            request,
-            "classify:",
-            "tokens=",
-            _format_tokens(tokens),
-            "category=",
-            str(result.category),
-            "score=",
-            str(result.score),
-        )
+        selected = _parse_categories(categories)
+        coalescer = request.app.state.classify_coalescer
+        if coalescer is None or coalescer.classifier is not classifier:
+            result = await run_in_threadpool(classifier.classify_result, text, categories=selected)
+        else:
+            result = await coalescer.classify(text, selected)
+        if getattr(request.app.state, "verbose", False):
+            tokens = await run_in_threadpool(classifier.tokenizer, text)
+            _log_verbose(
+                request,
+                "classify:",
+                "tokens=",
+                _format_tokens(tokens),
+                "category=",
+                str(result.category),
+                "score=",
+                str(result.score),
+            )
         return ClassificationResponse(category=result.category, score=result.score)
 
     @router.post("/score")
@@ -194,13 +467,14 @@ def create_router(auth_token: str = "", verbose: bool = False) -> APIRouter:
         _auth: None = Depends(verify_auth),
         classifier: SimpleBayes = Depends(_get_classifier),
         payload: bytes = Body(b"", media_type="text/plain"),
+        categories: str = Query("", description="Comma-separated categories to score. Default all."),
     ):
         text, payload_response = _parse_payload(payload)
         if payload_response is not None:
             return payload_response
 
         tokens = classifier.tokenizer(text)
-        scores = classifier.score(text)
+        scores = classifier.score(text, categories=_parse_categories(categories))
         _log_verbose(
             request,
             "score:",
@@ -211,12 +485,79 @@ def create_router(auth_token: str = "", verbose: bool = False) -> APIRouter:
         )
         return scores
 
-    @router.post("/flush", response_model=MutationResponse)
+    @router.post("/classify/batch", response_model=List[ClassificationResponse])
+    async def classify_batch(
+        request: Request,
+        _auth: None = Depends(verify_auth),
+        classifier: SimpleBayes = Depends(_get_classifier),
+        categories: str = Query("", description="Comma-separated categories to choose among. Default all."),
+    ):
+        texts, payload_response = _parse_batch(request, await request.body(), max_batch_size)
+        if payload_response is not None:
+            return payload_response
+
+        results = await run_in_threadpool(
+            classifier.classify_result_batch, texts, categories=_parse_categories(categories),
+        )
+        _log_verbose(request, "classify batch:", "documents=", str(len(texts)))
+        return _batch_response(
+            request, [{"category": result.category, "score": result.score} for result in results],
+        )
+
+    @router.post("/classify/stream")
+    async def classify_stream(
+        request: Request,
+        _auth: None = Depends(verify_auth),
+        classifier: SimpleBayes = Depends(_get_classifier),
+        categories: str = Query("", description="Comma-separated categories to choose among. Default all."),
+    ):
+        ndjson = _is_ndjson(request)
+        selected = _parse_categories(categories)
+
+        async def results() -> AsyncIterator[str]:
+            documents = errors = 0
+            async for lines in _read_line_batches(request.stream()):
+                decoded = [_decode_stream_line(line, ndjson) for line in lines]
+                texts = [text for text, _ in decoded if text is not None]
+                classified = iter(
+                    await run_in_threadpool(classifier.classify_result_batch, texts, categories=selected)
+                )
+                output = []
+                for text, error in decoded:
+                    if error is not None:
+                        output.append(json.dumps({"error": error}) + "\n")
+                    elif text is not None:
+                        result = next(classified)
+                        output.append(json.dumps({"category": result.category, "score": result.score}) + "\n")
+                documents += len(texts)
+                errors += len(output) - len(texts)
+                yield "".join(output)
+            _log_verbose(request, "classify stream:", "documents=", str(documents), "errors=", str(errors))
+
+        return _DuplexStreamingResponse(results(), media_type=NDJSON_MEDIA_TYPE)
+
+    @router.post("/score/batch")
+    async def score_batch(
+        request: Request,
+        _auth: None = Depends(verify_auth),
+        classifier: SimpleBayes = Depends(_get_classifier),
+        categories: str = Query("", description="Comma-separated categories to score. Default all."),
+    ):
+        texts, payload_response = _parse_batch(request, await request.body(), max_batch_size)
+        if payload_response is not None:
+            return payload_response
+
+        results = await run_in_threadpool(classifier.score_batch, texts, categories=_parse_categories(categories))
+        _log_verbose(request, "score batch:", "documents=", str(len(texts)))
+        return _batch_response(request, results)
+
+    @router.post("/flush", response_model=MutationResponse, response_model_exclude_none=True)
     def flush(
         request: Request,
         _auth: None = Depends(verify_auth),
         classifier: SimpleBayes = Depends(_get_classifier),
         payload: bytes = Body(b"", media_type="text/plain"),
+        summaries: str = summaries_query(),
     ):
         _, payload_response = _parse_payload(payload)
         if payload_response is not None:
@@ -224,8 +565,58 @@ def create_router(auth_token: str = "", verbose: bool = False) -> APIRouter:
 
         classifier.flush()
         _log_verbose(request, "flush: Flushed all categories")
+        return _mutation_response(classifier, summaries, [])
+
+    @router.post("/reload", response_model=MutationResponse)
+    def reload(
+        request: Request,
+        _auth: None = Depends(verify_auth),
+        classifier: SimpleBayes = Depends(_get_classifier),
+    ):
+        reloader = request.app.state.reloader
+        if reloader is None:
+            return JSONResponse(status_code=404, content={"error": "model reload is not configured"})
+
+        try:
+            reloader.reload()
+        except (OSError, SimpleBayesError) as error:
+            _log_verbose(request, "reload: failed", str(error))
+            return JSONResponse(status_code=400, content={"error": "unable to reload model"})
+        _log_verbose(request, "reload: Loaded", reloader.path)
         return MutationResponse(success=True, categories=_map_summaries(classifier))
 
+    @router.get("/metrics")
+    def metrics(
+        request: Request,
+        _auth: None = Depends(verify_auth),
+        classifier: SimpleBayes = Depends(_get_classifier),
+    ):
+        server_metrics = request.app.state.metrics
+        if server_metrics is None:
+            return JSONResponse(status_code=404, content={"error": "metrics are disabled"})
+        return Response(content=server_metrics.render(classifier), media_type=METRICS_MEDIA_TYPE)
+
+    @router.get("/models", response_model=ModelsResponse)
+    def models(
+        request: Request,
+        _auth: None = Depends(verify_auth),
+    ):
+        registry = request.app.state.models
+        if registry is None:
+            return JSONResponse(status_code=404, content={"error": "named models are not configured"})
+        return ModelsResponse(loaded=sorted(registry.loaded()), stored=registry.stored())
+
+    @router.get("/replication/changes")
+    def replication_changes(
+        request: Request,
+        _auth: None = Depends(verify_auth),
+        after: int = Query(-1, description="Last revision the follower has; below 0 sends the whole model first."),
+    ):
+        feed = request.app.state.change_feed
+        if feed is None:
+            return JSONResponse(status_code=404, content={"error": "replication is not configured"})
+        return StreamingResponse(change_lines(feed, after), media_type=NDJSON_MEDIA_TYPE)
+
     @router.get("/healthz")
     def healthz() -> Dict[str, str]:
         return {"status": "ok"}
@@ -237,3 +628,14 @@ def create_router(auth_token: str = "", verbose: bool = False) -> APIRouter:
         return JSONResponse(status_code=503, content={"status": "not ready"})
 
     return router
+
+
+def create_model_router(router: APIRouter) -> APIRouter:
+    """
+    :param router: a router from ``create_router``
+    :return: its routes that act on one classifier, to be included with the
+        prefix ``/models/{model}`` so they act on that named model instead
+    """
+    model_router = APIRouter()
+    model_router.routes.extend(route for route in router.routes if getattr(route, "path", None) in MODEL_ROUTE_PATHS)
+    return model_router
@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel
 
@@ -15,9 +15,15 @@ class InfoResponse(BaseModel):
 
 class MutationResponse(BaseModel):
     success: bool
-    categories: Dict[str, CategorySummaryResponse]
+    # Omitted from lightweight (summaries=none) responses
+    categories: Optional[Dict[str, CategorySummaryResponse]] = None
 
 
 class ClassificationResponse(BaseModel):
     category: Optional[str]
     score: float
+
+
+class ModelsResponse(BaseModel):
+    loaded: List[str]
+    stored: List[str]
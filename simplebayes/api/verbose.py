@@ -0,0 +1,62 @@
+"""
+Verbose request logging that does not buffer responses.
+
+``VerboseLoggingMiddleware`` passes every response chunk through as it is
+sent and keeps only the first ``PREVIEW_BYTES`` of the body for the log, so
+streamed responses still stream and memory does not grow with the response.
+Lines go through the app's ``QueuedLog``, never straight to stderr.
+"""
+from simplebayes.runtime.log_queue import QueuedLog
+
+PREVIEW_BYTES = 500
+
+
+def _format_preview(preview: bytes, body_length: int) -> str:
+    text = preview.decode("utf-8", errors="replace")
+    return text + "..." if body_length > len(preview) else text
+
+
+class VerboseLoggingMiddleware:
+    """ASGI middleware logging each request and a preview of its response while ``app.state.verbose`` is set."""
+
+    def __init__(self, app, log: QueuedLog) -> None:
+        """
+        :param app: the ASGI application to wrap
+        :param log: where the lines are written
+        """
+        self.app = app
+        self.log = log
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or not getattr(scope["app"].state, "verbose", False):
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length", b"").decode("latin-1")
+        request_line = f"{scope['method']} {scope['path']}"
+        if content_length:
+            request_line += f" (Content-Length: {content_length})"
+        self.log.log(request_line)
+
+        status = 0
+        preview = bytearray()
+        body_length = 0
+
+        async def teeing_send(message) -> None:
+            nonlocal status, body_length
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                body = message.get("body", b"")
+                body_length += len(body)
+                if len(preview) < PREVIEW_BYTES:
+                    preview.extend(body[:PREVIEW_BYTES - len(preview)])
+                if not message.get("more_body", False):
+                    self.log.log(f"-> {status} {_format_preview(bytes(preview), body_length)!r}")
+            await send(message)
+
+        try:
+            await self.app(scope, receive, teeing_send)
+        except Exception:
+            self.log.log("-> (exception)")
+            raise
@@ -0,0 +1,96 @@
+"""
+Multi-process serving: ``simplebayes-server --workers N``.
+
+The supervisor process serves the primary app (the model, its persistence,
+and every write) on a private unix socket, then starts N uvicorn workers on
+the public port. Each worker keeps a replica fed from the primary's change
+feed, answers reads itself, and forwards writes to the primary (see
+``simplebayes.api.replication``), so reads scale across cores while one
+process applies every change in order.
+
+A read-only ``mapped_model_path`` needs no primary: every worker maps the
+same file, so they share one page-cache copy of the model.
+"""
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Dict
+
+import uvicorn
+from fastapi import FastAPI
+
+from simplebayes.api.app import create_app
+
+WORKER_OPTIONS_ENV = "SIMPLEBAYES_WORKER_OPTIONS"
+# create_app options that only the primary uses
+PRIMARY_OPTIONS = (
+    "max_loaded_tokens",
+    "snapshot_path",
+    "snapshot_interval",
+    "wal_path",
+    "wal_commit_interval",
+    "sqlite_path",
+    "reload_path",
+    "reload_watch_interval",
+    "model_directory",
+    "max_model_tokens",
+    "model_idle_seconds",
+)
+# Change feeds stream until their follower leaves, so the primary stops waiting for them after this long
+PRIMARY_SHUTDOWN_SECONDS = 5
+
+
+def create_worker_app() -> FastAPI:
+    """
+    App factory run in each worker process, with the options ``serve_workers``
+    passes through the environment.
+    """
+    return create_app(**json.loads(os.environ[WORKER_OPTIONS_ENV]))
+
+
+def serve_workers(options: Dict, *, host: str, port: int, workers: int) -> None:
+    """
+    Serves the primary app on a private unix socket from a background thread
+    and ``workers`` replica processes on ``host``:``port``, until the workers
+    are stopped (e.g. by SIGINT or SIGTERM). The primary shuts down last,
+    saving the model as configured.
+
+    :param options: ``create_app`` keyword arguments
+    """
+    if options.get("mapped_model_path"):
+        if options.get("model_directory"):
+            raise ValueError("named models are kept by a primary, which workers serving a mapped model do not have")
+        _run_workers(options, host=host, port=port, workers=workers)
+        return
+
+    socket_directory = tempfile.mkdtemp(prefix="simplebayes-")
+    socket_path = os.path.join(socket_directory, "primary.sock")
+    primary = uvicorn.Server(uvicorn.Config(
+        create_app(change_feed=True, **options),
+        uds=socket_path,
+        log_level="warning",
+        timeout_graceful_shutdown=PRIMARY_SHUTDOWN_SECONDS,
+    ))
+    thread = threading.Thread(target=primary.run, name="simplebayes-primary", daemon=True)
+    thread.start()
+    try:
+        while not primary.started:
+            if not thread.is_alive():
+                raise RuntimeError("the primary failed to start")
+            time.sleep(0.05)
+
+        worker_options = {name: value for name, value in options.items() if name not in PRIMARY_OPTIONS}
+        _run_workers(dict(worker_options, primary_socket=socket_path), host=host, port=port, workers=workers)
+    finally:
+        primary.should_exit = True
+        thread.join()
+        shutil.rmtree(socket_directory, ignore_errors=True)
+
+
+def _run_workers(options: Dict, *, host: str, port: int, workers: int) -> None:
+    # Worker processes are spawned, so they read their options from the inherited environment
+    os.environ[WORKER_OPTIONS_ENV] = json.dumps(options)
+    uvicorn.run("simplebayes.api.workers:create_worker_app", factory=True, host=host, port=port, workers=workers)
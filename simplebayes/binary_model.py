@@ -0,0 +1,345 @@
+"""
+Versioned binary model format.
+
+Layout (all integers little-endian, every section 8-byte aligned):
+
+- header: magic, format version, flags, category count, vocabulary size,
+  section positions, and the write-ahead log sequence the model includes
+- vocabulary offsets: ``vocab_size + 1`` u64 byte offsets into the blob
+- vocabulary blob: sorted tokens as UTF-8, NUL separated
+- category names blob
+- category table: one fixed-size record per category (name position and
+  length, tally, token count, ids position, counts position)
+- per category: sorted u32 vocabulary ids and u32 (or u64) counts
+- trailer: CRC32 of every preceding byte
+
+Tokens are stored once no matter how many categories use them, and each
+section can be decoded with bulk ``array.frombytes`` calls.
+"""
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+from typing import BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
+
+from simplebayes.constants import BINARY_MODEL_MAGIC, PERSISTED_MODEL_VERSION
+from simplebayes.errors import InvalidModelStateError, UnsupportedModelVersionError
+
+BINARY_MODEL_VERSION = 1
+
+_FLAG_WIDE_COUNTS = 0x1
+_U32_MAX = 0xFFFFFFFF
+_ALIGNMENT = 8
+
+# magic, version, flags, category count, vocabulary size,
+# vocab offsets pos, vocab blob pos, vocab blob length, category table pos,
+# write-ahead log sequence
+_HEADER = struct.Struct("<8sHHIQQQQQQ")
+# name pos, name length, tally, token count, ids pos, counts pos
+_CATEGORY_RECORD = struct.Struct("<QQQQQQ")
+_TRAILER = struct.Struct("<I")
+
+
+def _padding(length: int) -> bytes:
+    return b"\x00" * (-length % _ALIGNMENT)
+
+
+def _array_bytes(values: array) -> bytes:
+    if sys.byteorder == "big":  # pragma: no cover - exercised only on big-endian hosts
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _read_array(typecode: str, buffer, position: int, length: int) -> array:
+    values = array(typecode)
+    end = position + length * values.itemsize
+    if end > len(buffer):
+        raise InvalidModelStateError("truncated binary model")
+    values.frombytes(buffer[position:end])
+    if sys.byteorder == "big":  # pragma: no cover - exercised only on big-endian hosts
+        values.byteswap()
+    return values
+
+
+class _ChecksumWriter:
+    """Writes to a binary stream while tracking the CRC32 of everything written."""
+
+    def __init__(self, stream: BinaryIO) -> None:
+        self.stream = stream
+        self.checksum = 0
+
+    def write(self, data: bytes) -> None:
+        self.stream.write(data)
+        self.checksum = zlib.crc32(data, self.checksum)
+
+    def write_aligned(self, data: bytes) -> None:
+        self.write(data)
+        self.write(_padding(len(data)))
+
+
+def _encode_vocabulary(categories: Dict) -> tuple:
+    """Returns (sorted vocabulary, u64 offsets, NUL-separated blob) for every token in the model."""
+    vocabulary = sorted({token for category in categories.values() for token in category["tokens"]})
+    if any("\x00" in token for token in vocabulary):
+        raise InvalidModelStateError("tokens containing NUL cannot be stored in the binary model format")
+    encoded_tokens = [token.encode("utf-8") for token in vocabulary]
+    offsets = array("Q")
+    offset = 0
+    for encoded in encoded_tokens:
+        offsets.append(offset)
+        offset += len(encoded) + 1
+    offsets.append(offset)
+    return vocabulary, offsets, b"\x00".join(encoded_tokens)
+
+
+def _encode_postings(categories: Dict, vocabulary: List[str]) -> tuple:
+    """Returns ([(tally, ids, counts)], count_typecode) with ids sorted ascending."""
+    token_ids = {token: index for index, token in enumerate(vocabulary)}
+    postings = []
+    max_count = 0
+    for category in categories.values():
+        items = sorted(category["tokens"].items())
+        ids = array("I", [token_ids[token] for token, _ in items])
+        counts = [count for _, count in items]
+        if counts:
+            max_count = max(max_count, *counts)
+        postings.append((int(category["tally"]), ids, counts))
+
+    count_typecode = "Q" if max_count > _U32_MAX else "I"
+    return [
+        (tally, ids, array(count_typecode, counts))
+        for tally, ids, counts in postings
+    ], count_typecode
+
+
+def _aligned_size(length: int) -> int:
+    return length + len(_padding(length))
+
+
+def _layout_category_records(names: List[bytes], postings: List[tuple], names_pos: int, categories_pos: int) -> list:
+    """Packs one category table record per category, placing postings after the table."""
+    records = []
+    position = categories_pos + len(names) * _CATEGORY_RECORD.size
+    for name, (tally, ids, counts) in zip(names, postings):
+        counts_pos = position + _aligned_size(len(ids) * ids.itemsize)
+        records.append(_CATEGORY_RECORD.pack(names_pos, len(name), tally, len(ids), position, counts_pos))
+        position = counts_pos + _aligned_size(len(counts) * counts.itemsize)
+        names_pos += len(name)
+    return records
+
+
+def dump_binary_model_state(stream: BinaryIO, model_state: Dict) -> None:
+    """
+    Writes a model state dict in the binary format.
+
+    :param stream: Writable binary stream.
+    :param model_state: State dict as produced by ``SimpleBayes._export_model_state``.
+    """
+    if stream is None:
+        raise InvalidModelStateError("destination stream is required")
+
+    categories = model_state.get("categories", {})
+    vocabulary, vocab_offsets, vocab_blob = _encode_vocabulary(categories)
+    postings, count_typecode = _encode_postings(categories, vocabulary)
+    names = [name.encode("utf-8") for name in categories]
+
+    vocab_blob_pos = _aligned_size(_HEADER.size) + len(vocab_offsets) * 8
+    names_pos = vocab_blob_pos + _aligned_size(len(vocab_blob))
+    categories_pos = names_pos + _aligned_size(sum(len(name) for name in names))
+    records = _layout_category_records(names, postings, names_pos, categories_pos)
+
+    writer = _ChecksumWriter(stream)
+    writer.write_aligned(_HEADER.pack(
+        BINARY_MODEL_MAGIC,
+        BINARY_MODEL_VERSION,
+        _FLAG_WIDE_COUNTS if count_typecode == "Q" else 0,
+        len(categories),
+        len(vocabulary),
+        _aligned_size(_HEADER.size),
+        vocab_blob_pos,
+        len(vocab_blob),
+        categories_pos,
+        int(model_state.get("sequence", 0)),
+    ))
+    writer.write(_array_bytes(vocab_offsets))
+    writer.write_aligned(vocab_blob)
+    writer.write_aligned(b"".join(names))
+    writer.write(b"".join(records))
+    for posting in postings:
+        writer.write_aligned(_array_bytes(posting[1]))
+        writer.write_aligned(_array_bytes(posting[2]))
+    stream.write(_TRAILER.pack(writer.checksum))
+
+
+class BinaryModelHeader:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """Parsed header of a binary model buffer."""
+
+    def __init__(self, buffer, verify_checksum: bool = True) -> None:
+        """
+        :param buffer: bytes-like object holding the whole model (bytes or mmap).
+        :param verify_checksum: Compare the trailer CRC32 with the contents.
+        """
+        if len(buffer) < _HEADER.size + _TRAILER.size:
+            raise InvalidModelStateError("truncated binary model")
+
+        (
+            magic,
+            version,
+            flags,
+            self.category_count,
+            self.vocab_size,
+            self.vocab_offsets_pos,
+            self.vocab_blob_pos,
+            self.vocab_blob_length,
+            self.categories_pos,
+            self.sequence,
+        ) = _HEADER.unpack_from(buffer, 0)
+        if magic != BINARY_MODEL_MAGIC:
+            raise InvalidModelStateError("not a binary simplebayes model")
+        if version != BINARY_MODEL_VERSION:
+            raise UnsupportedModelVersionError(f"unsupported binary model version: {version}")
+
+        if verify_checksum:
+            (expected,) = _TRAILER.unpack_from(buffer, len(buffer) - _TRAILER.size)
+            if zlib.crc32(memoryview(buffer)[:len(buffer) - _TRAILER.size]) != expected:
+                raise InvalidModelStateError("binary model checksum mismatch")
+
+        self.count_typecode = "Q" if flags & _FLAG_WIDE_COUNTS else "I"
+
+    def read_vocabulary(self, buffer) -> List[str]:
+        if not self.vocab_size:
+            return []
+        end = self.vocab_blob_pos + self.vocab_blob_length
+        vocabulary = bytes(buffer[self.vocab_blob_pos:end]).decode("utf-8").split("\x00")
+        if len(vocabulary) != self.vocab_size:
+            raise InvalidModelStateError("binary model vocabulary size mismatch")
+        return vocabulary
+
+    def read_category(self, buffer, record: tuple) -> tuple:
+        """Returns (name, tally, ids, counts) for one category table record."""
+        name_pos, name_length, tally, token_count, ids_pos, counts_pos = record
+        name = bytes(buffer[name_pos:name_pos + name_length]).decode("utf-8")
+        ids = _read_array("I", buffer, ids_pos, token_count)
+        counts = _read_array(self.count_typecode, buffer, counts_pos, token_count)
+        return name, tally, ids, counts
+
+    def iter_categories(self, buffer) -> Iterator[Tuple[str, int, array, Dict[str, int]]]:
+        """Decodes every category in table order, yielding (name, tally, counts, tokens)."""
+        vocabulary = self.read_vocabulary(buffer)
+        names: Set[str] = set()
+        for record in self.read_category_records(buffer):
+            name, tally, ids, counts = self.read_category(buffer, record)
+            check_new_category_name(names, name)
+            try:
+                tokens = dict(zip(map(vocabulary.__getitem__, ids), counts))
+            except IndexError as exc:
+                raise InvalidModelStateError("invalid token id in binary model") from exc
+            check_unique_token_ids(tokens, ids)
+            yield name, tally, counts, tokens
+
+    def read_category_records(self, buffer) -> List[tuple]:
+        end = self.categories_pos + self.category_count * _CATEGORY_RECORD.size
+        if end > len(buffer):
+            raise InvalidModelStateError("truncated binary model")
+        return [
+            _CATEGORY_RECORD.unpack_from(buffer, self.categories_pos + index * _CATEGORY_RECORD.size)
+            for index in range(self.category_count)
+        ]
+
+
+def check_new_category_name(names: Set[str], name: str) -> None:
+    """
+    Adds a category name read from a category table to ``names``.
+
+    :raises InvalidModelStateError: when the table already named that category
+    """
+    if name in names:
+        raise InvalidModelStateError("duplicate category name in binary model")
+    names.add(name)
+
+
+def check_unique_token_ids(tokens: Dict[str, int], ids) -> None:
+    """
+    :param tokens: a category's decoded token counts
+    :param ids: the vocabulary ids they were decoded from
+    :raises InvalidModelStateError: when an id appeared twice, so a count was lost
+    """
+    if len(tokens) != len(ids):
+        raise InvalidModelStateError("duplicate token id in binary model")
+
+
+def map_binary_model_file(path: str) -> mmap.mmap:
+    """
+    Maps a model file read-only, so sections are paged in only when read.
+
+    :param path: absolute path of a binary model file.
+    """
+    with open(path, "rb") as source_file:
+        try:
+            return mmap.mmap(source_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as exc:
+            raise InvalidModelStateError("truncated binary model") from exc
+
+
+class MappedVocabulary:
+    """Sorted token table read in place from a binary model buffer (usually an mmap)."""
+
+    def __init__(self, buffer, header: BinaryModelHeader, offsets) -> None:
+        self._buffer = buffer
+        self._blob_pos = header.vocab_blob_pos
+        self._offsets = offsets
+        self.size = header.vocab_size
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _token_bytes(self, token_id: int) -> bytes:
+        start = self._blob_pos + self._offsets[token_id]
+        return self._buffer[start:self._blob_pos + self._offsets[token_id + 1] - 1]
+
+    def __getitem__(self, token_id: int) -> str:
+        return self._token_bytes(token_id).decode("utf-8")
+
+    def find(self, token: str) -> Optional[int]:
+        """
+        Returns the vocabulary id of a token, or None when the model has never seen it.
+
+        :param token: the token to look up
+        :type token: str
+        """
+        encoded = token.encode("utf-8", "surrogatepass")
+        low, high = 0, self.size
+        while low < high:
+            middle = (low + high) // 2
+            if self._token_bytes(middle) < encoded:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.size and self._token_bytes(low) == encoded:
+            return low
+        return None
+
+
+def load_binary_model_state(stream: BinaryIO) -> Dict:
+    """
+    Reads a binary model into the same state dict shape used by JSON persistence.
+
+    :param stream: Readable binary stream positioned at the magic bytes.
+    :return: model state dict
+    """
+    if stream is None:
+        raise InvalidModelStateError("source stream is required")
+
+    buffer = stream.read()
+    header = BinaryModelHeader(buffer)
+    categories = {
+        name: {"tally": tally, "tokens": tokens}
+        for name, tally, _, tokens in header.iter_categories(buffer)
+    }
+
+    state = {"version": PERSISTED_MODEL_VERSION, "categories": categories}
+    if header.sequence:
+        state["sequence"] = header.sequence
+    return state
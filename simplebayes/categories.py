@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
 from simplebayes.category import BayesCategory
 
@@ -8,6 +8,10 @@ class BayesCategories:
 
     def __init__(self):
         self.categories: Dict[str, BayesCategory] = {}
+        # Last write-ahead log sequence reflected in these categories
+        self.sequence: int = 0
+        # Number of categories holding each token; None until count_vocabulary is first called
+        self._vocabulary_counts: Optional[Dict[str, int]] = None
 
     def add_category(self, name: str) -> BayesCategory:
         """
@@ -19,6 +23,7 @@ class BayesCategories:
         :rtype: BayesCategory
         """
         category = BayesCategory(name)
+        category.vocabulary_counts = self._vocabulary_counts
         self.categories[name] = category
         return category
 
@@ -47,4 +52,42 @@ class BayesCategories:
         :param name: name of the category
         :type name: str
         """
-        self.categories.pop(name, None)
+        category = self.categories.pop(name, None)
+        if category is not None:
+            category.release_vocabulary()
+
+    def hold_tokens(self, categories: List[Tuple[str, BayesCategory]]) -> List[Tuple[str, BayesCategory]]:
+        """
+        Prepares categories for one scoring call. Token counts are already in
+        memory here, so the categories are returned as they are; containers
+        that load tokens on demand fetch them once per call instead.
+
+        :param categories: ``(name, category)`` pairs of this container
+        :return: pairs to score with
+        :rtype: list
+        """
+        return categories
+
+    def close(self) -> None:
+        """
+        Releases what the container holds besides its categories. In-memory
+        categories hold nothing else; file-backed containers override this.
+        """
+
+    def count_vocabulary(self) -> int:
+        """
+        Counts the distinct tokens across categories. The first call walks
+        every category; from then on the categories keep the count current as
+        they gain and lose tokens, so later calls take constant time.
+
+        :return: number of distinct tokens
+        :rtype: int
+        """
+        if self._vocabulary_counts is None:
+            vocabulary: Dict[str, int] = {}
+            for category in self.categories.values():
+                for word in category.tokens:
+                    vocabulary[word] = vocabulary.get(word, 0) + 1
+                category.vocabulary_counts = vocabulary
+            self._vocabulary_counts = vocabulary
+        return len(self._vocabulary_counts)
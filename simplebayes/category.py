@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Optional
 
 
 class BayesCategory:
@@ -14,6 +14,22 @@ class BayesCategory:
         self.name: str = name
         self.tokens: Dict[str, int] = {}
         self.tally: int = 0
+        # Set while a snapshot may be reading self.tokens; the next change copies them first
+        self._tokens_shared: bool = False
+        # Categories holding each token, shared by the container once it counts its vocabulary
+        self.vocabulary_counts: Optional[Dict[str, int]] = None
+
+    def share_tokens(self) -> Dict[str, int]:
+        """
+        Hands the token counts to a snapshot without copying them. The next
+        train or untrain copies the dict before changing it, so the returned
+        mapping stays as it was when shared.
+
+        :return: token counts that will not change
+        :rtype: dict
+        """
+        self._tokens_shared = True
+        return self.tokens
 
     def train_token(self, word: str, count: int) -> None:
         """
@@ -24,8 +40,13 @@ class BayesCategory:
         :param count: the number of occurrences in the sample
         :type count: int
         """
+        if self._tokens_shared:
+            self.tokens = dict(self.tokens)
+            self._tokens_shared = False
         if word not in self.tokens:
             self.tokens[word] = 0
+            if self.vocabulary_counts is not None:
+                self.vocabulary_counts[word] = self.vocabulary_counts.get(word, 0) + 1
 
         self.tokens[word] += count
         self.tally += count
@@ -41,6 +62,9 @@ class BayesCategory:
         """
         if word not in self.tokens:
             return
+        if self._tokens_shared:
+            self.tokens = dict(self.tokens)
+            self._tokens_shared = False
 
         # If we're trying to untrain more tokens than we have, we end at 0
         count = min(count, self.tokens[word])
@@ -49,6 +73,25 @@ class BayesCategory:
         self.tally -= count
         if self.tokens[word] <= 0:
             del self.tokens[word]
+            if self.vocabulary_counts is not None:
+                self._forget_word(word)
+
+    def release_vocabulary(self) -> None:
+        """
+        Takes this category's tokens out of the shared vocabulary count, e.g.
+        when the category is deleted.
+        """
+        if self.vocabulary_counts is not None:
+            for word in self.tokens:
+                self._forget_word(word)
+            self.vocabulary_counts = None
+
+    def _forget_word(self, word: str) -> None:
+        holders = self.vocabulary_counts[word] - 1
+        if holders:
+            self.vocabulary_counts[word] = holders
+        else:
+            del self.vocabulary_counts[word]
 
     def get_token_count(self, word: str) -> int:
         """
@@ -1,10 +1,14 @@
 import argparse
 import os
-from typing import Sequence
+from typing import Callable, Sequence
 
 import uvicorn
 
 from simplebayes.api.app import create_app
+from simplebayes.api.coalesce import DEFAULT_CLASSIFY_BATCH_MAX
+from simplebayes.api.limits import MAX_REQUEST_BODY_BYTES, parse_body_limits
+from simplebayes.api.workers import serve_workers
+from simplebayes.tokenization import MAX_NGRAM_SIZE
 
 
 def _env_bool(name: str, default: bool) -> bool:
@@ -15,6 +19,21 @@ def _env_bool(name: str, default: bool) -> bool:
     return val in ("1", "true", "yes")
 
 
+def _ranged(convert: Callable[[str], float], minimum: float, maximum: float | None = None) -> Callable[[str], float]:
+    """Argparse type converting with ``convert`` that reports values outside minimum..maximum as usage errors."""
+
+    def parse(value: str) -> float:
+        number = convert(value)
+        if number < minimum or (maximum is not None and number > maximum):
+            bounds = f">= {minimum}" if maximum is None else f"between {minimum} and {maximum}"
+            raise argparse.ArgumentTypeError(f"must be {bounds}, got {value}")
+        return number
+
+    # argparse names the type in "invalid int value" messages
+    parse.__name__ = convert.__name__
+    return parse
+
+
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run the simplebayes API server.")
     parser.add_argument("--host", default=os.getenv("SIMPLEBAYES_HOST", "0.0.0.0"))
@@ -23,6 +42,13 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         type=int,
         default=int(os.getenv("SIMPLEBAYES_PORT", "8000")),
     )
+    parser.add_argument(
+        "--workers",
+        type=_ranged(int, 1),
+        default=os.getenv("SIMPLEBAYES_WORKERS", "1"),
+        help="Serve reads from N worker processes, each with a replica of the model; one primary process "
+        "applies every write and keeps the model files. Default 1 (one process).",
+    )
     parser.add_argument(
         "--auth-token",
         default=os.getenv("SIMPLEBAYES_AUTH_TOKEN", ""),
@@ -38,6 +64,158 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         default=_env_bool("SIMPLEBAYES_REMOVE_STOP_WORDS", False),
         help="Filter common stop words (the, is, and, etc.).",
     )
+    parser.add_argument(
+        "--ngrams",
+        type=_ranged(int, 1, MAX_NGRAM_SIZE),
+        default=os.getenv("SIMPLEBAYES_NGRAMS", "1"),
+        help="Largest word n-gram to add to unigrams (1-3). Default 1 (unigrams only).",
+    )
+    parser.add_argument(
+        "--ngram-hash-buckets",
+        type=_ranged(int, 0),
+        default=os.getenv("SIMPLEBAYES_NGRAM_HASH_BUCKETS", "0"),
+        help="Hash n-grams into this many buckets to bound vocabulary size. Default 0 (no hashing).",
+    )
+    parser.add_argument(
+        "--max-tokens-per-document",
+        type=_ranged(int, 0),
+        default=os.getenv("SIMPLEBAYES_MAX_TOKENS_PER_DOCUMENT", "0"),
+        help="Only train/score the first N tokens of each request body. Default 0 (no limit).",
+    )
+    parser.add_argument(
+        "--max-token-length",
+        type=_ranged(int, 0),
+        default=os.getenv("SIMPLEBAYES_MAX_TOKEN_LENGTH", "0"),
+        help="Ignore words longer than N characters. Default 0 (no limit).",
+    )
+    parser.add_argument(
+        "--max-new-tokens-per-train",
+        type=_ranged(int, 0),
+        default=os.getenv("SIMPLEBAYES_MAX_NEW_TOKENS_PER_TRAIN", "0"),
+        help="Add at most N previously unseen tokens to a category per /train call. Default 0 (no limit).",
+    )
+    parser.add_argument(
+        "--max-loaded-tokens",
+        type=_ranged(int, 0),
+        default=os.getenv("SIMPLEBAYES_MAX_LOADED_TOKENS", "0"),
+        help="Open binary models lazily, decoding category tokens on first use and keeping about N tokens "
+        "of unchanged categories in memory. Default 0 (load the whole model).",
+    )
+    parser.add_argument(
+        "--max-batch-size",
+        type=_ranged(int, 0),
+        default=os.getenv("SIMPLEBAYES_MAX_BATCH_SIZE", "1000"),
+        help="Accept at most N documents per /classify/batch, /score/batch, or /train/batch request. "
+        "Default 1000 (0 = no limit).",
+    )
+    parser.add_argument(
+        "--max-body-bytes",
+        type=_ranged(int, 0),
+        default=os.getenv("SIMPLEBAYES_MAX_BODY_BYTES", str(MAX_REQUEST_BODY_BYTES)),
+        help="Reject request bodies over N bytes with 413 before reading them, on endpoints without their own "
+        "--body-limit. Default 1048576 (0 = no limit).",
+    )
+    parser.add_argument(
+        "--body-limit",
+        action="append",
+        default=[os.getenv("SIMPLEBAYES_BODY_LIMITS", "")],
+        metavar="PATH=BYTES",
+        help="Body limit for one endpoint, e.g. /train/batch=67108864 or /train/*=4194304; repeatable. "
+        "Batch endpoints default to 16 MiB and /classify/stream to no limit.",
+    )
+    parser.add_argument(
+        "--mutation-summaries",
+        choices=("all", "touched", "none"),
+        default=os.getenv("SIMPLEBAYES_MUTATION_SUMMARIES", "all"),
+        help="Category summaries returned by /train, /untrain, and /flush unless a request asks otherwise with "
+        "?summaries=: all, touched (changed categories only), or none. Default all.",
+    )
+    parser.add_argument(
+        "--disable-metrics",
+        action="store_true",
+        default=_env_bool("SIMPLEBAYES_DISABLE_METRICS", False),
+        help="Turn off GET /metrics and the request and classifier timings behind it.",
+    )
+    parser.add_argument(
+        "--classify-batch-window-ms",
+        type=_ranged(float, 0),
+        default=os.getenv("SIMPLEBAYES_CLASSIFY_BATCH_WINDOW_MS", "0"),
+        help="Hold each /classify request up to N ms for concurrent ones and score them as one batch. "
+        "Default 0 (each request is scored on its own).",
+    )
+    parser.add_argument(
+        "--classify-batch-max",
+        type=_ranged(int, 1),
+        default=os.getenv("SIMPLEBAYES_CLASSIFY_BATCH_MAX", str(DEFAULT_CLASSIFY_BATCH_MAX)),
+        help=f"Score a /classify batch as soon as it has N requests. Default {DEFAULT_CLASSIFY_BATCH_MAX}.",
+    )
+    parser.add_argument(
+        "--model-directory",
+        default=os.getenv("SIMPLEBAYES_MODEL_DIRECTORY", ""),
+        help="Serve named models under /models/{name}/..., loaded from and saved to NAME.sbm files in this "
+        "directory. Default disabled.",
+    )
+    parser.add_argument(
+        "--max-model-tokens",
+        type=_ranged(int, 0),
+        default=os.getenv("SIMPLEBAYES_MAX_MODEL_TOKENS", "0"),
+        help="Keep loaded named models under about N distinct tokens in total, saving and unloading the least "
+        "recently used ones. Default 0 (no limit).",
+    )
+    parser.add_argument(
+        "--model-idle-seconds",
+        type=_ranged(float, 0),
+        default=os.getenv("SIMPLEBAYES_MODEL_IDLE_SECONDS", "0"),
+        help="Save and unload named models unused for N seconds. Default 0 (never).",
+    )
+    parser.add_argument(
+        "--mapped-model",
+        default=os.getenv("SIMPLEBAYES_MAPPED_MODEL", ""),
+        help="Serve this binary model read-only, memory-mapped instead of loaded, so worker processes share one "
+        "page-cache copy. Writes are answered with 409. Default empty (a writable in-memory model).",
+    )
+    parser.add_argument(
+        "--snapshot-path",
+        default=os.getenv("SIMPLEBAYES_SNAPSHOT_PATH", ""),
+        help="Absolute model path loaded at startup and saved at shutdown. Default empty (in-memory only).",
+    )
+    parser.add_argument(
+        "--snapshot-interval",
+        type=_ranged(float, 0),
+        default=os.getenv("SIMPLEBAYES_SNAPSHOT_INTERVAL", "0"),
+        help="Also save changed models to --snapshot-path every N seconds from a background thread. "
+        "Default 0 (only at shutdown).",
+    )
+    parser.add_argument(
+        "--wal-path",
+        default=os.getenv("SIMPLEBAYES_WAL_PATH", ""),
+        help="Absolute path of a write-ahead log of /train, /untrain, and /flush calls, "
+        "replayed onto the snapshot at startup. Default empty (disabled).",
+    )
+    parser.add_argument(
+        "--wal-commit-interval-ms",
+        type=_ranged(float, 0),
+        default=os.getenv("SIMPLEBAYES_WAL_COMMIT_INTERVAL_MS", "0"),
+        help="Gather write-ahead log appends for up to N ms before one fsync commits them all. "
+        "Default 0 (sync on every commit, shared by concurrent writers).",
+    )
+    parser.add_argument(
+        "--sqlite-path",
+        default=os.getenv("SIMPLEBAYES_SQLITE_PATH", ""),
+        help="Absolute path of a SQLite model store loaded at startup and updated by every /train, /untrain, "
+        "and /flush in batched transactions. Cannot be combined with --wal-path. Default empty (disabled).",
+    )
+    parser.add_argument(
+        "--reload-path",
+        default=os.getenv("SIMPLEBAYES_RELOAD_PATH", ""),
+        help="Absolute model file that POST /reload and SIGHUP swap in without a restart. Default empty (disabled).",
+    )
+    parser.add_argument(
+        "--reload-watch-interval",
+        type=_ranged(float, 0),
+        default=os.getenv("SIMPLEBAYES_RELOAD_WATCH_INTERVAL", "0"),
+        help="Also reload when --reload-path's mtime changes, checking every N seconds. Default 0 (no watching).",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -49,13 +227,40 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
 
 def run(argv: Sequence[str] | None = None) -> None:
     args = parse_args(argv)
-    app = create_app(
-        auth_token=args.auth_token,
-        language=args.language,
-        remove_stop_words=args.remove_stop_words,
-        verbose=args.verbose,
-    )
-    uvicorn.run(app, host=args.host, port=args.port)
+    options = {
+        "auth_token": args.auth_token,
+        "language": args.language,
+        "remove_stop_words": args.remove_stop_words,
+        "verbose": args.verbose,
+        "ngrams": args.ngrams,
+        "ngram_hash_buckets": args.ngram_hash_buckets,
+        "max_tokens_per_document": args.max_tokens_per_document,
+        "max_token_length": args.max_token_length,
+        "max_new_tokens_per_train": args.max_new_tokens_per_train,
+        "max_loaded_tokens": args.max_loaded_tokens,
+        "max_batch_size": args.max_batch_size,
+        "max_body_bytes": args.max_body_bytes,
+        "body_limits": parse_body_limits(args.body_limit),
+        "mutation_summaries": args.mutation_summaries,
+        "metrics": not args.disable_metrics,
+        "classify_batch_window": args.classify_batch_window_ms / 1000.0,
+        "classify_batch_max": args.classify_batch_max,
+        "model_directory": args.model_directory,
+        "max_model_tokens": args.max_model_tokens,
+        "model_idle_seconds": args.model_idle_seconds,
+        "mapped_model_path": args.mapped_model,
+        "snapshot_path": args.snapshot_path,
+        "snapshot_interval": args.snapshot_interval,
+        "wal_path": args.wal_path,
+        "wal_commit_interval": args.wal_commit_interval_ms / 1000.0,
+        "sqlite_path": args.sqlite_path,
+        "reload_path": args.reload_path,
+        "reload_watch_interval": args.reload_watch_interval,
+    }
+    if args.workers > 1:
+        serve_workers(options, host=args.host, port=args.port, workers=args.workers)
+        return
+    uvicorn.run(create_app(**options), host=args.host, port=args.port)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -0,0 +1,162 @@
+"""
+Streaming compression for persisted models using stdlib codecs.
+
+Compressed models are written and read through file-like wrappers, so only
+one chunk of compressed data is held in memory at a time. The codec is
+recorded by its own magic bytes, which ``detect_compression`` recognises.
+The gzip and lzma modules are imported the first time a stream needs them.
+"""
+import io
+import zlib
+from typing import BinaryIO, Optional, Tuple
+
+from simplebayes.errors import UnsupportedModelFormatError
+
+COMPRESSION_NONE = "none"
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_LZMA = "lzma"
+COMPRESSION_ZLIB = "zlib"
+COMPRESSIONS = (COMPRESSION_NONE, COMPRESSION_GZIP, COMPRESSION_LZMA, COMPRESSION_ZLIB)
+COMPRESSION_EXTENSIONS = {
+    ".gz": COMPRESSION_GZIP,
+    ".xz": COMPRESSION_LZMA,
+    ".zz": COMPRESSION_ZLIB,
+}
+DEFAULT_COMPRESSION_LEVEL = 6
+COMPRESSION_CHUNK_SIZE = 64 * 1024
+# Longest magic prefix needed by detect_compression (xz)
+COMPRESSION_MAGIC_SIZE = 6
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_XZ_MAGIC = b"\xfd7zXZ\x00"
+
+
+def decompression_errors() -> Tuple[type, ...]:
+    """
+    :return: the errors the codecs raise for corrupt or truncated input
+    """
+    import gzip  # pylint: disable=import-outside-toplevel
+    import lzma  # pylint: disable=import-outside-toplevel
+
+    return (EOFError, gzip.BadGzipFile, lzma.LZMAError, zlib.error)
+
+
+def detect_compression(prefix: bytes) -> str:
+    """
+    Identifies the codec of a stream from its leading bytes.
+
+    :param prefix: at least the first ``COMPRESSION_MAGIC_SIZE`` bytes of the stream
+    :return: one of ``COMPRESSIONS``; ``COMPRESSION_NONE`` when no codec matches
+    """
+    if prefix.startswith(_GZIP_MAGIC):
+        return COMPRESSION_GZIP
+    if prefix.startswith(_XZ_MAGIC):
+        return COMPRESSION_LZMA
+    # RFC 1950 header: deflate method and a CMF/FLG pair divisible by 31
+    if len(prefix) >= 2 and prefix[0] & 0x0F == 8 and (prefix[0] << 8 | prefix[1]) % 31 == 0:
+        return COMPRESSION_ZLIB
+    return COMPRESSION_NONE
+
+
+def validate_compression(compression: str, level: Optional[int] = None) -> None:
+    if compression not in COMPRESSIONS:
+        raise UnsupportedModelFormatError(f"unsupported model compression: {compression}")
+    if level is not None and not 0 <= level <= 9:
+        raise ValueError("compression level must be between 0 and 9")
+
+
+class _ZlibWriter(io.RawIOBase):
+    """Write-only stream that zlib-compresses into another stream."""
+
+    def __init__(self, stream: BinaryIO, level: int) -> None:
+        super().__init__()
+        self._stream = stream
+        self._compressor = zlib.compressobj(level)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._stream.write(self._compressor.compress(data))
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stream.write(self._compressor.flush())
+        super().close()
+
+
+class _ZlibReader(io.RawIOBase):
+    """Read-only stream that zlib-decompresses another stream chunk by chunk."""
+
+    def __init__(self, stream: BinaryIO) -> None:
+        super().__init__()
+        self._stream = stream
+        self._decompressor = zlib.decompressobj()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._decompressor.eof:
+            source = self._decompressor.unconsumed_tail or self._stream.read(COMPRESSION_CHUNK_SIZE)
+            if not source:
+                raise EOFError("compressed model ended before the end-of-stream marker")
+            data = self._decompressor.decompress(source, len(buffer))
+            if data:
+                buffer[:len(data)] = data
+                return len(data)
+        return 0
+
+    def readall(self) -> bytes:
+        chunks = []
+        while True:
+            chunk = self.read(COMPRESSION_CHUNK_SIZE)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+
+
+def open_compressor(stream: BinaryIO, compression: str, level: Optional[int] = None) -> BinaryIO:
+    """
+    Wraps a writable binary stream so writes are compressed. Closing the
+    wrapper finishes the compressed stream without closing ``stream``.
+
+    :param stream: destination binary stream
+    :param compression: ``gzip``, ``lzma``, or ``zlib``
+    :param level: 0-9; None uses ``DEFAULT_COMPRESSION_LEVEL``
+    """
+    validate_compression(compression, level)
+    level = DEFAULT_COMPRESSION_LEVEL if level is None else level
+    if compression == COMPRESSION_GZIP:
+        import gzip  # pylint: disable=import-outside-toplevel
+
+        return gzip.GzipFile(fileobj=stream, mode="wb", compresslevel=level, mtime=0)
+    if compression == COMPRESSION_LZMA:
+        import lzma  # pylint: disable=import-outside-toplevel
+
+        return lzma.LZMAFile(stream, mode="wb", preset=level)
+    if compression == COMPRESSION_ZLIB:
+        return io.BufferedWriter(_ZlibWriter(stream, level), COMPRESSION_CHUNK_SIZE)
+    raise UnsupportedModelFormatError("a compression codec is required")
+
+
+def open_decompressor(stream: BinaryIO, compression: str) -> BinaryIO:
+    """
+    Wraps a readable binary stream so reads return decompressed bytes.
+
+    :param stream: source binary stream
+    :param compression: ``gzip``, ``lzma``, or ``zlib``
+    """
+    validate_compression(compression)
+    if compression == COMPRESSION_GZIP:
+        import gzip  # pylint: disable=import-outside-toplevel
+
+        return gzip.GzipFile(fileobj=stream, mode="rb")
+    if compression == COMPRESSION_LZMA:
+        import lzma  # pylint: disable=import-outside-toplevel
+
+        return lzma.LZMAFile(stream, mode="rb")
+    if compression == COMPRESSION_ZLIB:
+        return io.BufferedReader(_ZlibReader(stream), COMPRESSION_CHUNK_SIZE)
+    raise UnsupportedModelFormatError("a compression codec is required")
@@ -1,3 +1,16 @@
 import re
 
 CATEGORY_PATTERN = re.compile(r"^[-_A-Za-z0-9]{1,64}$")
+
+PERSISTED_MODEL_VERSION = 1
+
+# Leading bytes of a binary model file (see simplebayes.binary_model)
+BINARY_MODEL_MAGIC = b"SBAYESB\x00"
+
+# Leading bytes of every SQLite database file (see simplebayes.sqlite_model)
+SQLITE_MODEL_MAGIC = b"SQLite format 3\x00"
+
+# Journaled operations (see simplebayes.wal and SimpleBayes.apply_change)
+WAL_TRAIN = "train"
+WAL_UNTRAIN = "untrain"
+WAL_FLUSH = "flush"
@@ -10,6 +10,10 @@ class InvalidCategoryError(SimpleBayesError):
     """Raised when a category value is invalid."""
 
 
+class InvalidModelNameError(SimpleBayesError):
+    """Raised when a named model's name is invalid."""
+
+
 class PersistencePathError(SimpleBayesError):
     """Raised when a persistence path is invalid."""
 
@@ -18,9 +22,17 @@ class UnsupportedModelVersionError(SimpleBayesError):
     """Raised when a persisted model version cannot be loaded."""
 
 
+class UnsupportedModelFormatError(SimpleBayesError):
+    """Raised when a requested model file format is not supported."""
+
+
 class InvalidModelStateError(SimpleBayesError):
     """Raised when persisted model data is malformed or inconsistent."""
 
 
+class ReadOnlyModelError(SimpleBayesError):
+    """Raised when a read-only (memory-mapped) model is asked to change."""
+
+
 class PayloadTooLargeError(SimpleBayesError):
     """Raised when inbound payload exceeds configured limits."""
@@ -0,0 +1,241 @@
+"""
+Lazily loaded categories for models with many categories.
+
+The binary layout already has a per-category index (the category table) with
+the positions of each category's token ids and counts. ``LazyCategories``
+maps the file and reads only that table on open, so names and tallies (and
+therefore priors and summaries) are available at once. A category's token
+map is decoded the first time it is scored and kept in an LRU cache bounded
+by a token budget. Startup time and resident memory follow the categories
+actually used rather than the size of the model.
+"""
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+from simplebayes.binary_model import (
+    BinaryModelHeader,
+    MappedVocabulary,
+    _read_array,
+    check_new_category_name,
+    check_unique_token_ids,
+    map_binary_model_file,
+)
+from simplebayes.categories import BayesCategories
+from simplebayes.category import BayesCategory
+from simplebayes.constants import CATEGORY_PATTERN
+from simplebayes.errors import InvalidModelStateError
+
+
+class LazyCategory(BayesCategory):
+    """
+    Category whose token counts stay in the model file until first needed.
+
+    Training or untraining moves the token counts into the category itself
+    ("pins" them): changed counts are never evicted.
+    """
+
+    def __init__(self, name: str, tally: int, record: tuple, source: "LazyCategories") -> None:
+        """
+        :param name: The name of the category
+        :param tally: The total token count stored for the category
+        :param record: The category's binary category table record
+        :param source: The container that reads and caches the token counts
+        """
+        super().__init__(name)
+        self.tally = tally
+        self.record = record
+        self._source = source
+        # Token counts owned by this category once pinned; None while they live in the file
+        self._pinned: Optional[Dict[str, int]] = None
+
+    @property
+    def tokens(self) -> Dict[str, int]:
+        if self._pinned is not None:
+            return self._pinned
+        return self._source.cached_tokens(self)
+
+    @tokens.setter
+    def tokens(self, tokens: Dict[str, int]) -> None:
+        self._pinned = tokens
+
+    @property
+    def is_loaded(self) -> bool:
+        """
+        :return: True when the token counts are in memory (pinned or cached)
+        :rtype: bool
+        """
+        return self._pinned is not None or self._source.is_cached(self.name)
+
+    def share_tokens(self) -> Dict[str, int]:
+        if self._pinned is None and not self._source.is_cached(self.name):
+            # Saves read the file directly instead of pushing the working set out of the cache
+            return self._source.read_tokens(self)
+        return super().share_tokens()
+
+    def _pin(self) -> None:
+        if self._pinned is None:
+            self._pinned = self._source.take_tokens(self)
+
+    def train_token(self, word: str, count: int) -> None:
+        self._pin()
+        super().train_token(word, count)
+
+    def untrain_token(self, word: str, count: int) -> None:
+        self._pin()
+        super().untrain_token(word, count)
+
+
+class HeldCategory:  # pylint: disable=too-few-public-methods
+    """A category's token counts, held by one scoring call whatever the cache evicts meanwhile."""
+
+    __slots__ = ("tokens",)
+
+    def __init__(self, tokens: Dict[str, int]) -> None:
+        self.tokens = tokens
+
+    def get_token_count(self, word: str) -> int:
+        """
+        :param word: the token we're getting the weight of
+        :return: the weight/count of the token
+        :rtype: int
+        """
+        return self.tokens.get(word, 0)
+
+
+class LazyCategories(BayesCategories):  # pylint: disable=too-many-instance-attributes
+    """Category container over a binary model file that decodes token maps on demand."""
+
+    def __init__(self, path: str, max_loaded_tokens: int) -> None:
+        """
+        :param path: absolute path of an uncompressed binary model file.
+        :param max_loaded_tokens: Keep at most about this many tokens of
+            unchanged categories decoded; the least recently used are dropped.
+            The category being read is always kept, even when it alone is larger.
+        """
+        if max_loaded_tokens <= 0:
+            raise ValueError("max_loaded_tokens must be > 0")
+
+        super().__init__()
+        self.max_loaded_tokens = max_loaded_tokens
+        self._buffer = map_binary_model_file(path)
+        # The checksum covers the whole file; checking it would read every category
+        self._header = BinaryModelHeader(self._buffer, verify_checksum=False)
+        self.sequence = self._header.sequence
+        self._vocabulary = MappedVocabulary(
+            self._buffer,
+            self._header,
+            _read_array("Q", self._buffer, self._header.vocab_offsets_pos, self._header.vocab_size + 1),
+        )
+        # Tokens in the file; ones first trained after opening are not counted
+        self.vocabulary_size = self._header.vocab_size
+        self._cache: "OrderedDict[str, Dict[str, int]]" = OrderedDict()
+        self.loaded_tokens = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        names: Set[str] = set()
+        for record in self._header.read_category_records(self._buffer):
+            name_pos, name_length, tally = record[:3]
+            try:
+                name = bytes(self._buffer[name_pos:name_pos + name_length]).decode("utf-8")
+            except UnicodeDecodeError as exc:
+                raise InvalidModelStateError("invalid category name in binary model") from exc
+            if not CATEGORY_PATTERN.match(name):
+                raise InvalidModelStateError("invalid category name in binary model")
+            check_new_category_name(names, name)
+            self.categories[name] = LazyCategory(name, tally, record, self)
+
+    def read_tokens(self, category: LazyCategory) -> Dict[str, int]:
+        """
+        Decodes one category's token counts from the file without caching them.
+
+        :param category: a category of this container
+        :return: token counts
+        :rtype: dict
+        """
+        _, tally, ids, counts = self._header.read_category(self._buffer, category.record)
+        try:
+            tokens = dict(zip(map(self._vocabulary.__getitem__, ids), counts))
+        except IndexError as exc:
+            raise InvalidModelStateError("invalid token id in binary model") from exc
+        check_unique_token_ids(tokens, ids)
+        if 0 in counts or sum(counts) != tally:
+            raise InvalidModelStateError("token tally mismatch in binary model")
+        return tokens
+
+    def is_cached(self, name: str) -> bool:
+        return name in self._cache
+
+    def cached_tokens(self, category: LazyCategory) -> Dict[str, int]:
+        """
+        Returns a category's token counts, decoding them on a cache miss and
+        evicting the least recently used categories beyond the token budget.
+
+        :param category: a category of this container
+        :return: token counts; callers must not change them
+        :rtype: dict
+        """
+        tokens = self._cache.get(category.name)
+        if tokens is not None:
+            self._cache.move_to_end(category.name)
+            self.cache_hits += 1
+            return tokens
+
+        self.cache_misses += 1
+        tokens = self.read_tokens(category)
+        self._cache[category.name] = tokens
+        self.loaded_tokens += len(tokens)
+        while self.loaded_tokens > self.max_loaded_tokens and len(self._cache) > 1:
+            _, evicted = self._cache.popitem(last=False)
+            self.loaded_tokens -= len(evicted)
+        return tokens
+
+    def hold_tokens(self, categories: List[Tuple[str, BayesCategory]]) -> List[Tuple[str, HeldCategory]]:
+        """
+        Fetches the token counts of the categories about to be scored once,
+        for the whole scoring call. Looking them up per word instead would
+        decode a category again for almost every word whenever the scored
+        categories hold more tokens than the budget.
+
+        :param categories: ``(name, category)`` pairs of this container
+        :return: ``(name, held category)`` pairs, valid while the classifier lock is held
+        :rtype: list
+        """
+        return [(name, HeldCategory(category.tokens)) for name, category in categories]
+
+    def count_vocabulary(self) -> int:
+        """
+        :return: the number of distinct tokens in the file, without decoding them
+        :rtype: int
+        """
+        return self.vocabulary_size
+
+    def take_tokens(self, category: LazyCategory) -> Dict[str, int]:
+        """
+        Removes a category's token counts from the cache (decoding them when
+        absent) so the category can own and change them.
+
+        :param category: a category of this container
+        :return: token counts
+        :rtype: dict
+        """
+        tokens = self._cache.pop(category.name, None)
+        if tokens is None:
+            return self.read_tokens(category)
+        self.loaded_tokens -= len(tokens)
+        return tokens
+
+    def close(self) -> None:
+        """
+        Unmaps the model file. Categories that were never pinned cannot be
+        read afterwards.
+        """
+        self._cache.clear()
+        self.loaded_tokens = 0
+        self._buffer.close()
+
+    def delete_category(self, name: str) -> None:
+        tokens = self._cache.pop(name, None)
+        if tokens is not None:
+            self.loaded_tokens -= len(tokens)
+        super().delete_category(name)
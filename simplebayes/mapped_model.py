@@ -0,0 +1,243 @@
+"""
+Read-only classifier that scores straight from a memory-mapped binary model.
+
+The binary layout already keeps a sorted vocabulary and flat, sorted
+per-category id/count arrays, so lookups are binary searches over the mapped
+file instead of dict reads. Nothing is expanded into Python objects on open:
+startup cost does not grow with model size, and every process that maps the
+same file shares one page-cache copy of it.
+"""
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Set, Tuple
+
+from simplebayes import SimpleBayes
+from simplebayes.binary_model import (
+    BinaryModelHeader,
+    MappedVocabulary,
+    _read_array,
+    check_new_category_name,
+    map_binary_model_file,
+)
+from simplebayes.errors import InvalidModelStateError, ReadOnlyModelError, SimpleBayesError
+from simplebayes.persistence import resolve_model_path
+
+
+class MappedCategory:
+    """Read-only category whose sorted token ids and counts live in a mapped buffer."""
+
+    def __init__(self, name: str, tally: int, ids, counts, vocabulary: MappedVocabulary) -> None:
+        self.name = name
+        self.tally = tally
+        self._ids = ids
+        self._counts = counts
+        self._vocabulary = vocabulary
+
+    @property
+    def tokens(self) -> Dict[str, int]:
+        """
+        Materializes the category's token counts. Only used for exporting the model.
+        """
+        return {self._vocabulary[token_id]: count for token_id, count in zip(self._ids, self._counts)}
+
+    def share_tokens(self) -> Dict[str, int]:
+        """
+        Materializes the token counts for a snapshot; mapped counts never change.
+        """
+        return self.tokens
+
+    def get_token_id_count(self, token_id: int) -> int:
+        """
+        Gets the count associated with a vocabulary id
+
+        :param token_id: id returned by ``MappedVocabulary.find``
+        :type token_id: int
+        :return: the weight/count of the token
+        :rtype: int
+        """
+        index = bisect_left(self._ids, token_id)
+        if index < len(self._ids) and self._ids[index] == token_id:
+            return self._counts[index]
+        return 0
+
+    def get_token_count(self, word: str) -> int:
+        """
+        Gets the count associated with a provided token/word
+
+        :param word: the token we're getting the weight of
+        :type word: str
+        :return: the weight/count of the token
+        :rtype: int
+        """
+        token_id = self._vocabulary.find(word)
+        return 0 if token_id is None else self.get_token_id_count(token_id)
+
+    def get_tally(self) -> int:
+        """
+        Gets the tally of all types
+
+        :return: The total number of tokens
+        :rtype: int
+        """
+        return self.tally
+
+
+class MappedCategories:
+    """Read-only category container over a memory-mapped binary model file."""
+
+    def __init__(self, path: str, verify_checksum: bool = False) -> None:
+        """
+        :param path: absolute path of a binary model file.
+        :param verify_checksum: Read the whole file once to check its CRC32.
+            Off by default so that opening stays independent of model size.
+        """
+        self._buffer = map_binary_model_file(path)
+        self._views: List[memoryview] = []
+        try:
+            header = BinaryModelHeader(self._buffer, verify_checksum=verify_checksum)
+            self.vocabulary = MappedVocabulary(
+                self._buffer,
+                header,
+                self._view("Q", header.vocab_offsets_pos, header.vocab_size + 1),
+            )
+            self.sequence = header.sequence
+            self.vocabulary_size = header.vocab_size
+            self.categories: Dict[str, MappedCategory] = {}
+            names: Set[str] = set()
+            for record in header.read_category_records(self._buffer):
+                name_pos, name_length, tally, token_count, ids_pos, counts_pos = record
+                name = self._decode_name(name_pos, name_length)
+                check_new_category_name(names, name)
+                self.categories[name] = MappedCategory(
+                    name,
+                    tally,
+                    self._view("I", ids_pos, token_count),
+                    self._view(header.count_typecode, counts_pos, token_count),
+                    self.vocabulary,
+                )
+        except SimpleBayesError:
+            self.close()
+            raise
+
+    def _decode_name(self, position: int, length: int) -> str:
+        try:
+            return self._buffer[position:position + length].decode("utf-8")
+        except UnicodeDecodeError as exc:
+            raise InvalidModelStateError("invalid category name in binary model") from exc
+
+    def _view(self, typecode: str, position: int, length: int):
+        end = position + length * array(typecode).itemsize
+        if end > len(self._buffer):
+            raise InvalidModelStateError("truncated binary model")
+        if sys.byteorder == "big":  # pragma: no cover - exercised only on big-endian hosts
+            return _read_array(typecode, self._buffer, position, length)
+        view = memoryview(self._buffer)[position:end]
+        typed_view = view.cast(typecode)
+        self._views.extend((view, typed_view))
+        return typed_view
+
+    def add_category(self, name: str) -> MappedCategory:
+        raise ReadOnlyModelError(f"cannot add category {name!r} to a memory-mapped model")
+
+    def get_category(self, name: str) -> MappedCategory:
+        """
+        Returns the expected category. Will KeyError if non existent
+
+        :param name: name of the category
+        :type name: str
+        :return: the requested category
+        :rtype: MappedCategory
+        """
+        return self.categories[name]
+
+    def get_categories(self) -> Dict[str, MappedCategory]:
+        """
+        :return: dict of all categories
+        :rtype: dict
+        """
+        return self.categories
+
+    def hold_tokens(self, categories: List[Tuple[str, MappedCategory]]) -> List[Tuple[str, MappedCategory]]:
+        """
+        :param categories: ``(name, category)`` pairs of this container
+        :return: the same pairs; mapped categories score straight from the file
+        :rtype: list
+        """
+        return categories
+
+    def count_vocabulary(self) -> int:
+        """
+        :return: the number of distinct tokens in the file
+        :rtype: int
+        """
+        return self.vocabulary_size
+
+    def delete_category(self, name: str) -> None:
+        raise ReadOnlyModelError(f"cannot delete category {name!r} from a memory-mapped model")
+
+    def close(self) -> None:
+        """
+        Releases the mapping. Categories must not be used afterwards.
+        """
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._buffer.close()
+
+
+class MappedModel(SimpleBayes):
+    """
+    A read-only SimpleBayes that scores directly from a memory-mapped binary
+    model file (see ``save_to_file(path, model_format="binary")``).
+
+    Scoring results match a SimpleBayes loaded from the same file. Training,
+    untraining, flushing, and loading raise ``ReadOnlyModelError``; saving
+    still works and writes the mapped model in either format.
+    """
+
+    def __init__(self, absolute_path: str = "", *, verify_checksum: bool = False, **classifier_options) -> None:
+        """
+        :param absolute_path: Binary model path. Empty uses the default model path.
+        :param verify_checksum: Check the file CRC32 on open (reads the whole file).
+        :param classifier_options: Tokenizer and scoring options accepted by SimpleBayes,
+            e.g. ``alpha``, ``language``, ``remove_stop_words``, ``ngrams``.
+        """
+        super().__init__(**classifier_options)
+        self.categories = MappedCategories(resolve_model_path(absolute_path), verify_checksum)
+        self.calculate_category_probability()
+
+    def __enter__(self) -> "MappedModel":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Unmaps the model file.
+        """
+        with self._lock:
+            self.categories.close()
+
+    def _token_scores(self, word: str, categories) -> Dict[str, float]:
+        # One vocabulary search per token, then one id search per category
+        token_id = self.categories.vocabulary.find(word)
+        token_scores = {}
+        for category, mapped_category in categories:
+            token_scores[category] = (
+                0.0 if token_id is None else float(mapped_category.get_token_id_count(token_id))
+            )
+        return token_scores
+
+    def flush(self) -> None:
+        raise ReadOnlyModelError("memory-mapped models cannot be flushed")
+
+    def _train_counts(self, category: str, occurrence_counts: Dict[str, int], *, recalculate: bool = True) -> int:
+        raise ReadOnlyModelError("memory-mapped models cannot be trained")
+
+    def _untrain_counts(self, category: str, occurrence_counts: Dict[str, int]) -> int:
+        raise ReadOnlyModelError("memory-mapped models cannot be untrained")
+
+    def _swap_categories(self, categories) -> None:
+        raise ReadOnlyModelError("memory-mapped models cannot load new state; open a new MappedModel instead")
@@ -0,0 +1,239 @@
+"""
+Low-overhead counters and histograms in the Prometheus text format.
+
+Each thread records into its own shard (a dict of plain lists reached through
+``threading.local``), so recording a value takes no lock and never contends
+with other threads. Reading merges the shards; a reader may see one thread's
+count and sum a single update apart, which scrapes tolerate. Shards of threads
+that have exited are kept, so totals never go down.
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+Labels = Tuple[Tuple[str, str], ...]
+
+# Upper bounds in seconds for in-process work (tokenizing, scoring, lock waits)
+FAST_BUCKETS = (0.00001, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    pairs = []
+    for name, value in labels:
+        escaped = value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+class _Sharded:  # pylint: disable=too-few-public-methods
+    """Per-thread storage for one metric family."""
+
+    def __init__(self, name: str, documentation: str) -> None:
+        self.name = name
+        self.documentation = documentation
+        self._local = threading.local()
+        self._shards: List[Dict[Labels, list]] = []
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> Dict[Labels, list]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = {}
+            self._local.shard = shard
+            # Taken once per thread, never while recording
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def _merged(self) -> Dict[Labels, list]:
+        with self._shards_lock:
+            shards = list(self._shards)
+        merged: Dict[Labels, list] = {}
+        for shard in shards:
+            # list() copies the keys in one step, so a thread adding a label set cannot break the loop
+            for labels in list(shard):
+                values = shard[labels]
+                total = merged.setdefault(labels, [0] * len(values))
+                for index, value in enumerate(values):
+                    total[index] += value
+        return merged
+
+    def _header(self, kind: str) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {kind}"]
+
+
+class Counter(_Sharded):
+    """A monotonically increasing count, optionally split by labels."""
+
+    def inc(self, amount: float = 1, labels: Labels = ()) -> None:
+        """
+        :param amount: how much to add; must not be negative
+        :param labels: ``(name, value)`` pairs, always given in the same order
+        """
+        shard = self._shard()
+        values = shard.get(labels)
+        if values is None:
+            shard[labels] = [amount]
+        else:
+            values[0] += amount
+
+    def value(self, labels: Labels = ()) -> float:
+        """
+        :return: the total across threads for one label set
+        """
+        return self._merged().get(labels, [0])[0]
+
+    def render(self) -> List[str]:
+        """
+        :return: the family's lines in the text exposition format
+        """
+        lines = self._header("counter")
+        for labels, values in sorted(self._merged().items()):
+            lines.append(f"{self.name}{_format_labels(labels)} {_format_value(values[0])}")
+        return lines
+
+
+class Histogram(_Sharded):
+    """Counts observations into cumulative ``le`` buckets, optionally split by labels."""
+
+    def __init__(self, name: str, documentation: str, buckets: Sequence[float] = FAST_BUCKETS) -> None:
+        """
+        :param name: metric name, without the ``_bucket``/``_sum``/``_count`` suffixes
+        :param documentation: the ``# HELP`` text
+        :param buckets: increasing upper bounds; ``+Inf`` is added
+        """
+        super().__init__(name, documentation)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        """
+        :param value: the observation, e.g. a duration in seconds
+        :param labels: ``(name, value)`` pairs, always given in the same order
+        """
+        shard = self._shard()
+        values = shard.get(labels)
+        if values is None:
+            # One slot per bucket, one for +Inf, then the sum
+            values = [0] * (len(self.buckets) + 2)
+            values[-1] = 0.0
+            shard[labels] = values
+        values[bisect_left(self.buckets, value)] += 1
+        values[-1] += value
+
+    def count(self, labels: Labels = ()) -> int:
+        """
+        :return: the number of observations across threads for one label set
+        """
+        values = self._merged().get(labels)
+        return sum(values[:-1]) if values else 0
+
+    def render(self) -> List[str]:
+        """
+        :return: the family's lines in the text exposition format
+        """
+        lines = self._header("histogram")
+        bounds = [_format_value(float(bound)) for bound in self.buckets] + ["+Inf"]
+        for labels, values in sorted(self._merged().items()):
+            cumulative = 0
+            for bound, count in zip(bounds, values):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(labels + (('le', bound),))} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(values[-1])}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+def render_gauges(name: str, documentation: str, samples: Iterable[Tuple[Labels, float]]) -> List[str]:
+    """
+    :param samples: ``(labels, value)`` pairs read at scrape time
+    :return: a gauge family's lines in the text exposition format
+    """
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} gauge"]
+    lines.extend(f"{name}{_format_labels(labels)} {_format_value(value)}" for labels, value in samples)
+    return lines
+
+
+class ClassifierMetrics:
+    """Timings and cache counts recorded by a ``SimpleBayes`` with ``attach_metrics``."""
+
+    def __init__(self) -> None:
+        self.tokenize_seconds = Histogram(
+            "simplebayes_tokenize_seconds", "Time spent tokenizing one text.",
+        )
+        self.score_seconds = Histogram(
+            "simplebayes_score_seconds", "Time spent scoring one text or batch while holding the classifier lock.",
+        )
+        self.lock_wait_seconds = Histogram(
+            "simplebayes_lock_wait_seconds", "Time spent waiting for the classifier lock.",
+        )
+        self.lock_hold_seconds = Histogram(
+            "simplebayes_lock_hold_seconds", "Time the classifier lock was held per acquisition.",
+        )
+        self.token_cache_hits = Counter(
+            "simplebayes_token_probability_cache_hits_total",
+            "Batch scoring lookups answered from the batch's token probability memo.",
+        )
+        self.token_cache_misses = Counter(
+            "simplebayes_token_probability_cache_misses_total",
+            "Batch scoring lookups that computed a token's probabilities.",
+        )
+
+    def timed_lock(self, lock) -> "TimedLock":
+        """
+        :param lock: the lock to time
+        :return: a wrapper of ``lock`` recording wait and hold times here
+        """
+        return TimedLock(lock, self.lock_wait_seconds, self.lock_hold_seconds)
+
+    def render(self) -> List[str]:
+        """
+        :return: every family's lines in the text exposition format
+        """
+        lines: List[str] = []
+        for metric in (
+            self.tokenize_seconds,
+            self.score_seconds,
+            self.lock_wait_seconds,
+            self.lock_hold_seconds,
+            self.token_cache_hits,
+            self.token_cache_misses,
+        ):
+            lines.extend(metric.render())
+        return lines
+
+
+class TimedLock:
+    """
+    Context manager over a reentrant lock that records how long each
+    outermost acquisition waited for it and how long it was held.
+    """
+
+    def __init__(self, lock, wait_seconds: Histogram, hold_seconds: Histogram) -> None:
+        self.lock = lock
+        self._wait_seconds = wait_seconds
+        self._hold_seconds = hold_seconds
+        # Only changed by the thread holding the lock
+        self._depth = 0
+        self._acquired_at = 0.0
+
+    def __enter__(self) -> "TimedLock":
+        started = time.perf_counter()
+        self.lock.acquire()
+        self._depth += 1
+        if self._depth == 1:
+            self._acquired_at = time.perf_counter()
+            self._wait_seconds.observe(self._acquired_at - started)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            self._hold_seconds.observe(time.perf_counter() - self._acquired_at)
+        self.lock.release()
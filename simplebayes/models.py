@@ -17,3 +17,21 @@ class CategorySummary:
     token_tally: int
     prob_in_cat: float
     prob_not_in_cat: float
+
+
+@dataclass(frozen=True)
+class ModelSize:
+    """Size of a trained model."""
+
+    categories: int
+    vocabulary: int
+    tally: int
+
+
+@dataclass(frozen=True)
+class TokenLimits:
+    """Per-document guards against pathological inputs. 0 disables a limit."""
+
+    max_tokens_per_document: int = 0
+    max_token_length: int = 0
+    max_new_tokens_per_train: int = 0
@@ -1,17 +1,39 @@
+import io
 import json
 import os
-import tempfile
-from typing import Dict, TextIO
+from typing import BinaryIO, Dict, Iterator, Optional, TextIO, Tuple
 
-from simplebayes.constants import CATEGORY_PATTERN
+from simplebayes.categories import BayesCategories
+from simplebayes.compression import (
+    COMPRESSION_EXTENSIONS,
+    COMPRESSION_MAGIC_SIZE,
+    COMPRESSION_NONE,
+    decompression_errors,
+    detect_compression,
+    open_compressor,
+    open_decompressor,
+    validate_compression,
+)
+from simplebayes.constants import (
+    BINARY_MODEL_MAGIC,
+    CATEGORY_PATTERN,
+    PERSISTED_MODEL_VERSION,
+    SQLITE_MODEL_MAGIC,
+)
 from simplebayes.errors import (
     InvalidModelStateError,
     PersistencePathError,
+    UnsupportedModelFormatError,
     UnsupportedModelVersionError,
 )
 
-PERSISTED_MODEL_VERSION = 1
 DEFAULT_MODEL_FILE_PATH = "/tmp/simplebayes-model.json"
+MODEL_FORMAT_JSON = "json"
+MODEL_FORMAT_BINARY = "binary"
+MODEL_FORMAT_SQLITE = "sqlite"
+MODEL_FORMATS = (MODEL_FORMAT_JSON, MODEL_FORMAT_BINARY, MODEL_FORMAT_SQLITE)
+BINARY_MODEL_EXTENSIONS = (".sbm", ".bin")
+SQLITE_MODEL_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
 
 
 def dump_model_state(stream: TextIO, model_state: Dict) -> None:
@@ -43,26 +65,195 @@ def resolve_model_path(path: str = "") -> str:
     return resolved_path
 
 
-def save_model_state_to_file(path: str, model_state: Dict) -> None:
+def _strip_compression_extension(path: str) -> str:
+    root, extension = os.path.splitext(path)
+    return root if extension.lower() in COMPRESSION_EXTENSIONS else path
+
+
+def resolve_model_format(path: str, model_format: Optional[str] = None) -> str:
+    """
+    Returns the explicit format when given, otherwise infers it from the file
+    extension, ignoring a trailing compression extension (".sbm.gz" is binary).
+    """
+    if model_format is None:
+        extension = os.path.splitext(_strip_compression_extension(path))[1].lower()
+        if extension in SQLITE_MODEL_EXTENSIONS:
+            return MODEL_FORMAT_SQLITE
+        return MODEL_FORMAT_BINARY if extension in BINARY_MODEL_EXTENSIONS else MODEL_FORMAT_JSON
+    if model_format not in MODEL_FORMATS:
+        raise UnsupportedModelFormatError(f"unsupported model format: {model_format}")
+    return model_format
+
+
+def resolve_model_compression(path: str, compression: Optional[str] = None) -> str:
+    """
+    Returns the explicit compression when given, otherwise infers it from the
+    file extension (".gz", ".xz", ".zz"); other paths are not compressed.
+    """
+    if compression is None:
+        return COMPRESSION_EXTENSIONS.get(os.path.splitext(path)[1].lower(), COMPRESSION_NONE)
+    validate_compression(compression)
+    return compression
+
+
+def _dump_model_state_as(stream: BinaryIO, model_state: Dict, model_format: str) -> None:
+    if model_format == MODEL_FORMAT_BINARY:
+        # binary_model loads mmap and array, which JSON-only callers never need
+        from simplebayes.binary_model import dump_binary_model_state  # pylint: disable=import-outside-toplevel
+
+        dump_binary_model_state(stream, model_state)
+        return
+
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8")
+    dump_model_state(text_stream, model_state)
+    text_stream.flush()
+    text_stream.detach()
+
+
+def dump_model_state_to_stream(
+    stream: BinaryIO,
+    model_state: Dict,
+    model_format: str = MODEL_FORMAT_JSON,
+    *,
+    compression: str = COMPRESSION_NONE,
+    compression_level: Optional[int] = None,
+) -> None:
+    """
+    Writes a model state to a binary stream in the given format, optionally
+    compressing it as it is written. ``stream`` is left open.
+    """
+    if stream is None:
+        raise InvalidModelStateError("destination stream is required")
+    if model_format not in MODEL_FORMATS:
+        raise UnsupportedModelFormatError(f"unsupported model format: {model_format}")
+    if model_format == MODEL_FORMAT_SQLITE:
+        raise UnsupportedModelFormatError("sqlite models can only be saved to files")
+    validate_compression(compression, compression_level)
+
+    if compression == COMPRESSION_NONE:
+        _dump_model_state_as(stream, model_state, model_format)
+        return
+
+    with open_compressor(stream, compression, compression_level) as compressed_stream:
+        _dump_model_state_as(compressed_stream, model_state, model_format)
+
+
+class _PrefixedReader(io.RawIOBase):
+    """Replays bytes already read from the front of a stream, then reads the rest of it."""
+
+    def __init__(self, prefix: bytes, stream: BinaryIO) -> None:
+        super().__init__()
+        self._prefix = prefix
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._prefix:
+            data = self._prefix[:len(buffer)]
+            self._prefix = self._prefix[len(data):]
+        else:
+            data = self._stream.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def readall(self) -> bytes:
+        data = self._prefix + self._stream.read()
+        self._prefix = b""
+        return data
+
+
+def _peek(stream: BinaryIO, size: int) -> Tuple[bytes, BinaryIO]:
+    """
+    Returns up to ``size`` leading bytes and a stream that still starts at them.
+    """
+    prefix = b""
+    while len(prefix) < size:
+        chunk = stream.read(size - len(prefix))
+        if not chunk:
+            break
+        prefix += chunk
+    if stream.seekable():
+        stream.seek(-len(prefix), io.SEEK_CUR)
+        return prefix, stream
+    return prefix, io.BufferedReader(_PrefixedReader(prefix, stream))
+
+
+def load_model_state_from_stream(stream: BinaryIO) -> Dict:
+    """
+    Loads a JSON or binary model from a binary stream, decompressing gzip,
+    lzma, or zlib input on the fly. Codec and format are detected from the
+    leading bytes.
+    """
+    if stream is None:
+        raise InvalidModelStateError("source stream is required")
+
+    prefix, stream = _peek(stream, max(COMPRESSION_MAGIC_SIZE, len(BINARY_MODEL_MAGIC)))
+    compression = detect_compression(prefix)
+    try:
+        if compression != COMPRESSION_NONE:
+            prefix, stream = _peek(open_decompressor(stream, compression), len(BINARY_MODEL_MAGIC))
+        if prefix.startswith(BINARY_MODEL_MAGIC):
+            from simplebayes.binary_model import load_binary_model_state  # pylint: disable=import-outside-toplevel
+
+            return load_binary_model_state(stream)
+        text_stream = io.TextIOWrapper(stream, encoding="utf-8")
+        try:
+            return load_model_state(text_stream)
+        finally:
+            text_stream.detach()
+    except decompression_errors() as exc:  # evaluated only once an error is raised
+        raise InvalidModelStateError(f"unable to decompress {compression} model") from exc
+
+
+def save_model_state_to_file(
+    path: str,
+    model_state: Dict,
+    model_format: Optional[str] = None,
+    *,
+    compression: Optional[str] = None,
+    compression_level: Optional[int] = None,
+) -> None:
+    # tempfile imports shutil and, through it, the bz2 and lzma codecs
+    import tempfile  # pylint: disable=import-outside-toplevel
+
     resolved_path = resolve_model_path(path)
+    resolved_format = resolve_model_format(resolved_path, model_format)
+    resolved_compression = resolve_model_compression(resolved_path, compression)
+    validate_compression(resolved_compression, compression_level)
+    if resolved_format == MODEL_FORMAT_SQLITE and resolved_compression != COMPRESSION_NONE:
+        raise UnsupportedModelFormatError("sqlite models cannot be compressed")
     model_directory = os.path.dirname(resolved_path)
     os.makedirs(model_directory, exist_ok=True)
 
     temp_path = ""
     try:
         with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
+            mode="wb",
             delete=False,
             dir=model_directory,
             prefix=".simplebayes-",
             suffix=".tmp",
         ) as temp_file:
             temp_path = temp_file.name
-            dump_model_state(temp_file, model_state)
-            temp_file.flush()
-            os.fsync(temp_file.fileno())
+            if resolved_format != MODEL_FORMAT_SQLITE:
+                dump_model_state_to_stream(
+                    temp_file,
+                    model_state,
+                    resolved_format,
+                    compression=resolved_compression,
+                    compression_level=compression_level,
+                )
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+
+        if resolved_format == MODEL_FORMAT_SQLITE:
+            # Imported here so that sqlite3 is only loaded by callers using SQLite models
+            from simplebayes.sqlite_model import save_sqlite_model_state  # pylint: disable=import-outside-toplevel
 
+            # SQLite syncs the database itself when the transaction commits
+            save_sqlite_model_state(temp_path, model_state)
         os.replace(temp_path, resolved_path)
     finally:
         if temp_path and os.path.exists(temp_path):
@@ -70,16 +261,55 @@ def save_model_state_to_file(path: str, model_state: Dict) -> None:
 
 
 def load_model_state_from_file(path: str) -> Dict:
+    """
+    Loads a JSON, binary, or SQLite model file, optionally compressed; codec
+    and format are detected from its leading bytes.
+    """
     resolved_path = resolve_model_path(path)
-    with open(resolved_path, "r", encoding="utf-8") as source_file:
-        return load_model_state(source_file)
+    with open(resolved_path, "rb") as source_file:
+        if source_file.read(len(SQLITE_MODEL_MAGIC)) == SQLITE_MODEL_MAGIC:
+            from simplebayes.sqlite_model import load_sqlite_model_state  # pylint: disable=import-outside-toplevel
 
+            return load_sqlite_model_state(resolved_path)
+        source_file.seek(0)
+        return load_model_state_from_stream(source_file)
 
-def validate_model_state(state: Dict) -> None:
+
+def load_model_categories_from_file(path: str) -> BayesCategories:
+    """
+    Loads a model file into category storage. Uncompressed binary models are
+    built straight from their arrays (``build_binary_model_categories``);
+    every other file goes through ``load_model_state_from_file``.
+    """
+    resolved_path = resolve_model_path(path)
+    with open(resolved_path, "rb") as source_file:
+        if source_file.read(len(BINARY_MODEL_MAGIC)) == BINARY_MODEL_MAGIC:
+            source_file.seek(0)
+            return build_binary_model_categories(source_file.read())
+    return build_model_categories(load_model_state_from_file(resolved_path))
+
+
+def is_binary_model_file(path: str) -> bool:
+    """
+    Returns True when ``path`` holds an uncompressed binary model.
+    """
+    with open(resolve_model_path(path), "rb") as source_file:
+        return source_file.read(len(BINARY_MODEL_MAGIC)) == BINARY_MODEL_MAGIC
+
+
+def _iter_validated_categories(state: Dict) -> Iterator[Tuple[str, int, Dict[str, int]]]:
+    """
+    Validates a model state dict, yielding (name, tally, tokens) per category as
+    soon as that category has been checked.
+    """
     version = state.get("version")
     if version != PERSISTED_MODEL_VERSION:
         raise UnsupportedModelVersionError(f"unsupported model version: {version}")
 
+    sequence = state.get("sequence", 0)
+    if not isinstance(sequence, int) or sequence < 0:
+        raise InvalidModelStateError("invalid sequence in persisted model")
+
     categories = state.get("categories")
     if not isinstance(categories, dict):
         raise InvalidModelStateError("persisted categories must be an object")
@@ -114,3 +344,53 @@ def validate_model_state(state: Dict) -> None:
 
         if token_sum != tally:
             raise InvalidModelStateError("token tally mismatch in persisted model")
+
+        yield category_name, tally, tokens
+
+
+def validate_model_state(state: Dict) -> None:
+    for _ in _iter_validated_categories(state):
+        pass
+
+
+def build_model_categories(state: Dict) -> BayesCategories:
+    """
+    Validates a model state dict and builds category storage from it in one pass.
+
+    Each validated token dict is adopted as-is rather than re-trained token by
+    token, so the state dict must not be reused afterwards.
+    """
+    model_categories = BayesCategories()
+    model_categories.sequence = state.get("sequence", 0)
+    for category_name, tally, tokens in _iter_validated_categories(state):
+        category = model_categories.add_category(category_name)
+        category.tokens = tokens
+        category.tally = tally
+    return model_categories
+
+
+def build_binary_model_categories(buffer: bytes) -> BayesCategories:
+    """
+    Builds category storage from a whole binary model. The format and its
+    CRC32 already guarantee token and count types and non-negative tallies,
+    so the remaining checks run once per category on the count arrays
+    (``sum``, ``0 in counts``) instead of once per token in Python.
+    """
+    from simplebayes.binary_model import BinaryModelHeader  # pylint: disable=import-outside-toplevel
+
+    header = BinaryModelHeader(buffer)
+    model_categories = BayesCategories()
+    model_categories.sequence = header.sequence
+    for category_name, tally, counts, tokens in header.iter_categories(buffer):
+        if not CATEGORY_PATTERN.match(category_name):
+            raise InvalidModelStateError("invalid category name in persisted model")
+        if "" in tokens:
+            raise InvalidModelStateError("invalid token name in persisted model")
+        if 0 in counts:
+            raise InvalidModelStateError("invalid token count in persisted model")
+        if sum(counts) != tally:
+            raise InvalidModelStateError("token tally mismatch in persisted model")
+        category = model_categories.add_category(category_name)
+        category.tokens = tokens
+        category.tally = tally
+    return model_categories
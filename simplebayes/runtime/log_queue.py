@@ -0,0 +1,70 @@
+import queue
+import sys
+import threading
+
+DEFAULT_MAX_PENDING_LINES = 10000
+
+
+class QueuedLog:
+    """
+    Writes log lines to stderr from a background thread. Callers only put a
+    line on a bounded queue, so a slow or blocked stderr never delays a
+    request; when the queue is full, lines are dropped and counted instead.
+    """
+
+    def __init__(self, max_pending: int = DEFAULT_MAX_PENDING_LINES) -> None:
+        """
+        :param max_pending: lines queued before new ones are dropped
+        """
+        if max_pending <= 0:
+            raise ValueError("max_pending must be > 0")
+
+        self.dropped = 0
+        self._queue: "queue.Queue" = queue.Queue(max_pending)
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def log(self, *parts: str) -> None:
+        """
+        Queues one ``[simplebayes]``-prefixed line made of ``parts``, like ``print``.
+        """
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(" ".join(("[simplebayes]",) + parts))
+        except queue.Full:
+            self.dropped += 1
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="simplebayes-log", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            line = self._queue.get()
+            try:
+                if line is None:
+                    return
+                # Looked up per line so redirected stderr (e.g. in tests) is honoured
+                print(line, file=sys.stderr, flush=True)
+            finally:
+                self._queue.task_done()
+
+    def flush(self) -> None:
+        """
+        Blocks until every queued line has been written.
+        """
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """
+        Writes the queued lines and stops the writer thread.
+        """
+        with self._start_lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
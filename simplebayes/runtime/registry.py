@@ -0,0 +1,280 @@
+"""
+Serves many named classifiers from one process.
+
+A ``ModelRegistry`` loads each model from ``<directory>/<name>.sbm`` the first
+time it is used, or starts it empty, and keeps the loaded models in least
+recently used order. Models that sat unused for ``idle_seconds``, and the
+least recently used ones while the loaded models hold more than
+``max_tokens`` distinct tokens in total, are saved back to their file (when
+changed) and dropped from memory. A model is never dropped while a request
+is using it.
+"""
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from simplebayes import SimpleBayes
+from simplebayes.errors import InvalidModelNameError
+
+MODEL_NAME_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.-]{0,127}")
+MODEL_FILE_EXTENSION = ".sbm"
+DEFAULT_SWEEP_INTERVAL = 1.0
+
+
+def _report_failed_save(error: OSError) -> None:
+    # The model stays loaded and is saved again by the next eviction attempt
+    print(f"[simplebayes] saving an evicted model failed: {error}", file=sys.stderr)
+
+
+class _LoadedModel:  # pylint: disable=too-few-public-methods
+    """A registry entry; ``leases`` and ``last_used`` are guarded by the registry lock."""
+
+    def __init__(self, classifier: SimpleBayes) -> None:
+        self.classifier = classifier
+        self.leases = 0
+        self.last_used = time.monotonic()
+        # Held while the model is read from or written to its file
+        self.file_lock = threading.Lock()
+        self.loaded = False
+        self.saved_revision = classifier.revision
+        self.measured_revision = -1
+        self.tokens = 0
+
+
+class ModelRegistry:
+    """Named classifiers, loaded on first use and evicted to disk."""
+
+    def __init__(
+        self,
+        directory: str,
+        create_classifier: Callable[[], SimpleBayes] = SimpleBayes,
+        *,
+        max_tokens: int = 0,
+        idle_seconds: float = 0.0,
+        sweep_interval: float = DEFAULT_SWEEP_INTERVAL,
+    ) -> None:
+        """
+        :param directory: where model files are read from and saved to
+        :param create_classifier: makes an empty classifier for each model
+        :param max_tokens: keep loaded models under about this many distinct
+            tokens in total; 0 = no limit
+        :param idle_seconds: drop models unused for this long; 0 = never
+        :param sweep_interval: seconds between idle and size checks by ``start``
+        """
+        if max_tokens < 0 or idle_seconds < 0:
+            raise ValueError("max_tokens and idle_seconds must be >= 0")
+        if sweep_interval <= 0:
+            raise ValueError("sweep_interval must be > 0")
+
+        self.directory = directory
+        self._create_classifier = create_classifier
+        self.max_tokens = max_tokens
+        self.idle_seconds = idle_seconds
+        self._sweep_interval = sweep_interval
+        self._models: "OrderedDict[str, _LoadedModel]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="simplebayes-models", daemon=True)
+
+    def path_for(self, name: str) -> str:
+        """
+        :return: the file model ``name`` is kept in
+        :raises InvalidModelNameError: unless the name is 1-128 letters, digits,
+            ``_``, ``.``, or ``-``, starting with a letter or digit
+        """
+        if not MODEL_NAME_PATTERN.fullmatch(name):
+            raise InvalidModelNameError(f"invalid model name: {name!r}")
+        return os.path.join(self.directory, name + MODEL_FILE_EXTENSION)
+
+    def acquire_loaded(self, name: str) -> Optional[SimpleBayes]:
+        """
+        Leases model ``name`` if it is in memory, without waiting on any file.
+
+        :return: the model, to be given back with ``release``; None when it
+            needs loading (use ``acquire``), in which case nothing is leased
+        """
+        self.path_for(name)
+        with self._lock:
+            entry = self._models.get(name)
+            if entry is None or not entry.loaded:
+                return None
+            self._models.move_to_end(name)
+            entry.leases += 1
+            return entry.classifier
+
+    def acquire(self, name: str) -> SimpleBayes:
+        """
+        Leases model ``name``, loading it first if needed. The model stays in
+        memory until it is given back with ``release``.
+
+        :raises InvalidModelNameError: for names ``path_for`` rejects
+        """
+        path = self.path_for(name)
+        with self._lock:
+            entry = self._models.get(name)
+            if entry is None:
+                entry = _LoadedModel(self._create_classifier())
+                self._models[name] = entry
+            else:
+                self._models.move_to_end(name)
+            entry.leases += 1
+        try:
+            with entry.file_lock:
+                loading = not entry.loaded
+                if loading:
+                    if os.path.exists(path):
+                        entry.classifier.load_from_file(path)
+                    entry.saved_revision = entry.classifier.revision
+                    entry.loaded = True
+        except BaseException:
+            self.release(name)
+            raise
+        if loading and self.max_tokens:
+            try:
+                self._evict(self._over_budget())
+            except OSError as error:
+                _report_failed_save(error)
+        return entry.classifier
+
+    def release(self, name: str) -> None:
+        """
+        Gives back a lease taken with ``acquire``.
+        """
+        with self._lock:
+            entry = self._models[name]
+            entry.leases -= 1
+            entry.last_used = time.monotonic()
+            if not entry.loaded and entry.leases == 0:
+                # Loading failed; the next request tries again
+                del self._models[name]
+
+    @contextmanager
+    def use(self, name: str) -> Iterator[SimpleBayes]:
+        """
+        Leases model ``name`` for the ``with`` block (see ``acquire``).
+        """
+        classifier = self.acquire(name)
+        try:
+            yield classifier
+        finally:
+            self.release(name)
+
+    def loaded(self) -> List[str]:
+        """
+        :return: names of the models in memory, least recently used first
+        """
+        with self._lock:
+            return list(self._models)
+
+    def stored(self) -> List[str]:
+        """
+        :return: names of the models saved in the directory
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        names = [
+            file_name[:-len(MODEL_FILE_EXTENSION)]
+            for file_name in os.listdir(self.directory)
+            if file_name.endswith(MODEL_FILE_EXTENSION)
+        ]
+        return sorted(name for name in names if MODEL_NAME_PATTERN.fullmatch(name))
+
+    def sweep(self) -> int:
+        """
+        Drops idle models, then the least recently used ones while over budget.
+
+        :return: the number of models dropped
+        """
+        evicted = 0
+        if self.idle_seconds:
+            cutoff = time.monotonic() - self.idle_seconds
+            with self._lock:
+                idle = [
+                    (name, entry)
+                    for name, entry in self._models.items()
+                    if entry.leases == 0 and entry.last_used < cutoff
+                ]
+            evicted += self._evict(idle)
+        if self.max_tokens:
+            evicted += self._evict(self._over_budget())
+        return evicted
+
+    def save_all(self) -> None:
+        """
+        Saves every loaded model that changed since it was loaded or saved.
+        """
+        with self._lock:
+            entries = list(self._models.items())
+        for name, entry in entries:
+            with entry.file_lock:
+                self._save(name, entry)
+
+    def start(self) -> None:
+        """Checks for idle models and the token budget from a background thread."""
+        if self.idle_seconds or self.max_tokens:
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the background checks and saves the changed models."""
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.save_all()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._sweep_interval):
+            try:
+                self.sweep()
+            except OSError as error:
+                _report_failed_save(error)
+
+    def _over_budget(self) -> List[Tuple[str, _LoadedModel]]:
+        with self._lock:
+            entries = [(name, entry) for name, entry in self._models.items() if entry.loaded]
+        for _, entry in entries:
+            revision = entry.classifier.revision
+            if revision != entry.measured_revision:
+                # Kept current by the categories after the first count, without sharing their token dicts
+                entry.tokens = entry.classifier.model_size().vocabulary
+                entry.measured_revision = revision
+
+        excess = sum(entry.tokens for _, entry in entries) - self.max_tokens
+        victims = []
+        for name, entry in entries:
+            if excess <= 0:
+                break
+            if entry.leases == 0:
+                victims.append((name, entry))
+                excess -= entry.tokens
+        return victims
+
+    def _evict(self, victims: List[Tuple[str, _LoadedModel]]) -> int:
+        evicted = 0
+        for name, entry in victims:
+            with entry.file_lock:
+                self._save(name, entry)
+                with self._lock:
+                    # Skipped when a request leased or changed the model meanwhile
+                    if (
+                        entry.leases == 0
+                        and entry.classifier.revision == entry.saved_revision
+                        and self._models.get(name) is entry
+                    ):
+                        del self._models[name]
+                        evicted += 1
+        return evicted
+
+    def _save(self, name: str, entry: _LoadedModel) -> bool:
+        # Read first: a change racing with the save is saved next time
+        revision = entry.classifier.revision
+        if not entry.loaded or revision == entry.saved_revision:
+            return False
+        os.makedirs(self.directory, exist_ok=True)
+        entry.classifier.save_to_file(self.path_for(name))
+        entry.saved_revision = revision
+        return True
@@ -0,0 +1,112 @@
+import os
+import signal
+import sys
+import threading
+
+from simplebayes.errors import SimpleBayesError
+from simplebayes.persistence import resolve_model_path
+
+
+class ModelReloader:
+    """
+    Replaces a running classifier's model with the contents of a model file.
+
+    The file is parsed and the new model built without holding the classifier
+    lock (see ``SimpleBayes.load_from_file``), then swapped in at once, so
+    requests are never blocked by a reload and never see a half-loaded model.
+    Reloads run on demand, from a background thread when ``request`` is
+    called (e.g. by SIGHUP), and whenever the file's mtime changes if
+    ``watch_interval`` is set.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        classifier,
+        absolute_path: str,
+        *,
+        watch_interval: float = 0.0,
+        journal=None,
+        snapshot_path: str = "",
+    ) -> None:
+        """
+        :param classifier: the SimpleBayes whose model is replaced
+        :param absolute_path: model file to load
+        :param watch_interval: seconds between mtime checks; 0 disables watching
+        :param journal: WriteAheadLog or SQLiteModelStore attached to ``classifier``, if any.
+            Each reload is compacted into it so recovery starts from the reloaded model.
+        :param snapshot_path: snapshot written by that compaction (required for a WriteAheadLog)
+        """
+        if watch_interval < 0:
+            raise ValueError("watch interval must be >= 0")
+
+        self._classifier = classifier
+        self.path = resolve_model_path(absolute_path)
+        self._watch_interval = watch_interval
+        self._journal = journal
+        self._snapshot_path = snapshot_path
+        self._reload_lock = threading.Lock()
+        self._loaded_stamp = self._stamp()
+        self._requested = threading.Event()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="simplebayes-reload", daemon=True)
+        self._previous_handler = None
+
+    def _stamp(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload(self) -> None:
+        """
+        Loads the model file and swaps it in. On error the current model
+        keeps serving and the error is raised.
+        """
+        with self._reload_lock:
+            stamp = self._stamp()
+            self._classifier.load_from_file(self.path)
+            if self._journal is not None:
+                self._journal.compact(self._classifier, self._snapshot_path)
+            self._loaded_stamp = stamp
+
+    def changed(self) -> bool:
+        """
+        :return: True when the file's mtime or size differs from the last reload
+        """
+        stamp = self._stamp()
+        return stamp is not None and stamp != self._loaded_stamp
+
+    def request(self) -> None:
+        """Asks the background thread to reload; safe to call from a signal handler."""
+        self._requested.set()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped = True
+        self._requested.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def install_signal_handler(self) -> None:
+        """Reloads on SIGHUP. Must be called from the main thread."""
+        self._previous_handler = signal.signal(signal.SIGHUP, lambda _signum, _frame: self.request())
+
+    def restore_signal_handler(self) -> None:
+        if self._previous_handler is not None:
+            signal.signal(signal.SIGHUP, self._previous_handler)
+            self._previous_handler = None
+
+    def _run(self) -> None:
+        while True:
+            requested = self._requested.wait(self._watch_interval or None)
+            self._requested.clear()
+            if self._stopped:
+                return
+            if requested or self.changed():
+                try:
+                    self.reload()
+                except (OSError, SimpleBayesError) as error:
+                    print(f"[simplebayes] reload failed: {error}", file=sys.stderr)
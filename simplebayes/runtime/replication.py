@@ -0,0 +1,236 @@
+"""
+Keeps replica classifiers in step with one primary classifier.
+
+The primary publishes every change to a ``ChangeFeed`` in the order it was
+applied, numbered by ``SimpleBayes.revision``. A ``ReplicaFollower`` reads
+the feed from the primary's ``GET /replication/changes`` over a local unix
+socket: first the whole model, then each change as it happens, which it
+applies to its own classifier with ``SimpleBayes.apply_change``. The feed
+drops changes every connected follower has been sent. A follower that falls
+too far behind, or a primary that loads another model, is sent the whole
+model again.
+"""
+import http.client
+import io
+import json
+import socket
+import sys
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from simplebayes import CHANGE_LOAD, SimpleBayes
+from simplebayes.errors import SimpleBayesError
+
+DEFAULT_MAX_PENDING_CHANGES = 100000
+# Seconds between keep-alive lines on an idle feed, so followers notice a dead primary
+FEED_HEARTBEAT_SECONDS = 1.0
+REVISION_HEADER = "x-simplebayes-revision"
+
+Change = Tuple[int, str, str, Optional[Dict[str, int]]]
+
+
+class ChangeFeed:
+    """Recent changes of a primary classifier, for followers to read in order."""
+
+    def __init__(self, classifier: SimpleBayes, max_pending: int = DEFAULT_MAX_PENDING_CHANGES) -> None:
+        """
+        :param classifier: the primary; the feed attaches itself as its ``change_feed``
+        :param max_pending: changes kept for followers that are behind; older
+            ones are dropped and those followers get the whole model instead
+        """
+        if max_pending <= 0:
+            raise ValueError("max_pending must be > 0")
+
+        self.classifier = classifier
+        self._changes: "deque[Change]" = deque(maxlen=max_pending)
+        self._changed = threading.Condition(threading.Lock())
+        self._revision = classifier.revision
+        # Revision each connected follower has been sent, by follower id
+        self._followers: Dict[int, int] = {}
+        self._next_follower = 0
+        classifier.change_feed = self
+
+    @property
+    def pending(self) -> int:
+        """
+        :return: the number of changes kept for followers
+        :rtype: int
+        """
+        with self._changed:
+            return len(self._changes)
+
+    def add_follower(self, revision: int) -> int:
+        """
+        Registers a connected follower, so that changes it has not been sent
+        yet are kept for it.
+
+        :param revision: the revision the follower reflects; -1 when it has no model yet
+        :return: the follower id for ``changes_after`` and ``remove_follower``
+        """
+        with self._changed:
+            follower = self._next_follower
+            self._next_follower += 1
+            self._followers[follower] = revision
+            return follower
+
+    def remove_follower(self, follower: int) -> None:
+        """
+        Forgets a follower that disconnected. If it reconnects after the
+        changes it missed were dropped, it gets the whole model.
+        """
+        with self._changed:
+            del self._followers[follower]
+
+    def publish(
+        self, revision: int, operation: str, category: str = "", counts: Optional[Dict[str, int]] = None
+    ) -> None:
+        """
+        Called by the classifier, under its lock, after each change.
+        """
+        with self._changed:
+            self._changes.append((revision, operation, category, counts))
+            self._revision = revision
+            self._changed.notify_all()
+
+    def changes_after(self, revision: int, timeout: float, follower: Optional[int] = None) -> Optional[List[Change]]:
+        """
+        Waits up to ``timeout`` seconds for changes newer than ``revision``.
+
+        :param follower: id from ``add_follower``; records that this follower
+            has everything up to ``revision``. Changes every connected
+            follower has are dropped.
+        :return: the changes in order; ``[]`` when none arrived in time; None
+            when they cannot be replayed (no longer kept, or a new model was
+            loaded) and the follower needs the whole model from ``export_state``
+        """
+        with self._changed:
+            if follower is not None:
+                self._followers[follower] = revision
+                acknowledged = min(self._followers.values())
+                while self._changes and self._changes[0][0] <= acknowledged:
+                    self._changes.popleft()
+            self._changed.wait_for(lambda: self._revision > revision, timeout)
+            if self._revision <= revision:
+                return []
+            # Revisions are consecutive, so the first wanted change is found by position
+            start = revision + 1 - self._changes[0][0] if self._changes else -1
+            if start < 0:
+                return None
+            changes = [self._changes[index] for index in range(start, len(self._changes))]
+        if any(operation == CHANGE_LOAD for _, operation, _, _ in changes):
+            return None
+        return changes
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a unix domain socket."""
+
+    def __init__(self, path: str, timeout: float) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self.path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.path)
+
+
+class ReplicaFollower:
+    """
+    Applies a primary's changes to a replica classifier from a background
+    thread, and forwards requests to the primary.
+    """
+
+    def __init__(self, classifier: SimpleBayes, socket_path: str, auth_token: str = "",
+                 retry_interval: float = 0.5) -> None:
+        """
+        :param classifier: the replica to keep in step
+        :param socket_path: unix socket the primary's API is served on
+        :param auth_token: bearer token for the primary's API, if it needs one
+        :param retry_interval: seconds between reconnects after losing the primary
+        """
+        self.classifier = classifier
+        self.socket_path = socket_path
+        self._headers = {"Authorization": f"Bearer {auth_token}"} if auth_token else {}
+        self._retry_interval = retry_interval
+        # The primary revision the replica reflects; -1 until the first model arrives
+        self.revision = -1
+        self._applied = threading.Condition(threading.Lock())
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="simplebayes-replica", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def wait_for(self, revision: int, timeout: float) -> bool:
+        """
+        Blocks until the replica reflects ``revision`` of the primary.
+
+        :return: False when ``timeout`` seconds passed first
+        """
+        with self._applied:
+            return self._applied.wait_for(lambda: self.revision >= revision, timeout)
+
+    def forward(self, method: str, target: str, headers: Dict[str, str], body: bytes) -> Tuple[int, list, bytes]:
+        """
+        Sends one request to the primary.
+
+        :param target: path and query string
+        :return: ``(status, headers, body)`` of the primary's response
+        :raises OSError: when the primary cannot be reached
+        """
+        connection = _UnixHTTPConnection(self.socket_path, timeout=60.0)
+        try:
+            connection.request(method, target, body=body, headers=headers)
+            response = connection.getresponse()
+            return response.status, response.getheaders(), response.read()
+        except http.client.HTTPException as error:
+            raise OSError(f"primary request failed: {error}") from error
+        finally:
+            connection.close()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self._follow()
+            except (OSError, http.client.HTTPException, ValueError, SimpleBayesError) as error:
+                if not self._stopped.is_set():
+                    print(f"[simplebayes] replica lost the primary: {error}", file=sys.stderr)
+            self._stopped.wait(self._retry_interval)
+
+    def _follow(self) -> None:
+        # Heartbeats arrive every second, so reads time out only when the primary is gone
+        connection = _UnixHTTPConnection(self.socket_path, timeout=FEED_HEARTBEAT_SECONDS * 10)
+        try:
+            connection.request("GET", f"/replication/changes?after={self.revision}", headers=self._headers)
+            response = connection.getresponse()
+            if response.status != 200:
+                raise ValueError(f"change feed answered {response.status}")
+            while not self._stopped.is_set():
+                line = response.readline()
+                if not line:
+                    return
+                if line.strip():
+                    self._apply(json.loads(line), response)
+        finally:
+            connection.close()
+
+    def _apply(self, change: Dict, response) -> None:
+        revision = change["revision"]
+        if change["operation"] == CHANGE_LOAD:
+            # The whole model follows on the next line
+            self.classifier.load(io.BytesIO(response.readline()))
+        elif revision != self.revision + 1:
+            skipped_from, self.revision = self.revision, -1
+            raise ValueError(f"change feed skipped from revision {skipped_from} to {revision}")
+        else:
+            self.classifier.apply_change(change["operation"], change.get("category", ""), change.get("counts"))
+        with self._applied:
+            self.revision = revision
+            self._applied.notify_all()
@@ -0,0 +1,61 @@
+import sys
+import threading
+
+
+class BackgroundSnapshotter:
+    """
+    Periodically saves a classifier from a background thread. Saving only
+    holds the classifier lock while the copy-on-write snapshot is captured,
+    so requests keep being served while the file is written.
+    """
+
+    def __init__(self, classifier, absolute_path: str, interval: float, journal=None) -> None:
+        """
+        :param classifier: the SimpleBayes to save
+        :param absolute_path: snapshot destination
+        :param interval: seconds between snapshots; unchanged models are skipped
+        :param journal: WriteAheadLog to compact into each snapshot, if any
+        """
+        if interval <= 0:
+            raise ValueError("snapshot interval must be > 0")
+
+        self._classifier = classifier
+        self._path = absolute_path
+        self._interval = interval
+        self._journal = journal
+        self._saved_revision = classifier.revision
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="simplebayes-snapshot", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def snapshot(self) -> bool:
+        """
+        Saves the classifier if it changed since the last snapshot.
+
+        :return: True when a snapshot was written
+        """
+        # Read first: a change racing with the save is picked up next time
+        revision = self._classifier.revision
+        if revision == self._saved_revision:
+            return False
+        if self._journal is not None:
+            self._journal.compact(self._classifier, self._path)
+        else:
+            self._classifier.save_to_file(self._path)
+        self._saved_revision = revision
+        return True
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            try:
+                self.snapshot()
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                # Any failure is retried at the next interval; letting it end the thread would stop all snapshots
+                print(f"[simplebayes] snapshot failed: {error}", file=sys.stderr)
@@ -0,0 +1,144 @@
+"""
+SQLite model layout.
+
+A model is stored in three tables:
+
+- ``model_meta(key, value)``: ``version`` and the write-ahead ``sequence``
+- ``categories(name, tally)``: one row per category, in insertion order
+- ``tokens(category, token, count)``: one row per category and token
+
+The whole model loads with two bulk queries, offline tools can read token
+statistics with plain SQL, and ``simplebayes.sqlite_store.SQLiteModelStore``
+applies train and untrain deltas to it in batched transactions.
+"""
+import pathlib
+import sqlite3
+from typing import Dict, Iterable, Tuple
+
+from simplebayes.constants import PERSISTED_MODEL_VERSION
+from simplebayes.errors import InvalidModelStateError, UnsupportedModelVersionError
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS model_meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS categories (name TEXT PRIMARY KEY, tally INTEGER NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS tokens ("
+    "category TEXT NOT NULL, token TEXT NOT NULL, count INTEGER NOT NULL, "
+    "PRIMARY KEY (category, token)) WITHOUT ROWID",
+)
+_SET_META = "INSERT INTO model_meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value"
+
+
+def connect_model_database(path: str, *, check_same_thread: bool = True) -> sqlite3.Connection:
+    """
+    Opens (creating when missing) a SQLite model database and checks its version.
+
+    :param path: absolute database path
+    :param check_same_thread: passed to ``sqlite3.connect``; False lets one
+        connection be used from several threads under the caller's own locking
+    """
+    connection = sqlite3.connect(path, check_same_thread=check_same_thread)
+    try:
+        with connection:
+            for statement in _SCHEMA:
+                connection.execute(statement)
+            connection.execute(
+                "INSERT OR IGNORE INTO model_meta (key, value) VALUES ('version', ?)",
+                (PERSISTED_MODEL_VERSION,),
+            )
+        _check_version(connection)
+    except sqlite3.DatabaseError as exc:
+        connection.close()
+        raise InvalidModelStateError("not a simplebayes SQLite model") from exc
+    except UnsupportedModelVersionError:
+        connection.close()
+        raise
+    return connection
+
+
+def _check_version(connection: sqlite3.Connection) -> None:
+    version = read_meta(connection, "version")
+    if version != PERSISTED_MODEL_VERSION:
+        raise UnsupportedModelVersionError(f"unsupported model version: {version}")
+
+
+def read_meta(connection: sqlite3.Connection, key: str, default: int = 0) -> int:
+    row = connection.execute("SELECT value FROM model_meta WHERE key = ?", (key,)).fetchone()
+    return default if row is None else row[0]
+
+
+def write_meta(connection: sqlite3.Connection, key: str, value: int) -> None:
+    connection.execute(_SET_META, (key, value))
+
+
+def write_model_state(connection: sqlite3.Connection, model_state: Dict) -> None:
+    """
+    Replaces every row with ``model_state``. Runs in the caller's transaction.
+    """
+    categories = model_state["categories"]
+    connection.execute("DELETE FROM tokens")
+    connection.execute("DELETE FROM categories")
+    connection.executemany(
+        "INSERT INTO categories (name, tally) VALUES (?, ?)",
+        ((name, category["tally"]) for name, category in categories.items()),
+    )
+    connection.executemany(
+        "INSERT INTO tokens (category, token, count) VALUES (?, ?, ?)",
+        _token_rows(categories),
+    )
+    write_meta(connection, "sequence", int(model_state.get("sequence", 0)))
+
+
+def _token_rows(categories: Dict) -> Iterable[Tuple[str, str, int]]:
+    for name, category in categories.items():
+        for token, count in category["tokens"].items():
+            yield name, token, count
+
+
+def read_model_state(connection: sqlite3.Connection) -> Dict:
+    """
+    Reads the whole model with two bulk queries.
+    """
+    categories = {
+        name: {"tally": tally, "tokens": {}}
+        for name, tally in connection.execute("SELECT name, tally FROM categories ORDER BY rowid")
+    }
+    current_name, current_tokens = None, {}
+    # Primary key order, so each category's rows are contiguous
+    for name, token, count in connection.execute("SELECT category, token, count FROM tokens ORDER BY category"):
+        if name != current_name:
+            if name not in categories:
+                raise InvalidModelStateError(f"tokens stored for unknown category: {name}")
+            current_name, current_tokens = name, categories[name]["tokens"]
+        current_tokens[token] = count
+
+    state = {"version": read_meta(connection, "version"), "categories": categories}
+    sequence = read_meta(connection, "sequence")
+    if sequence:
+        state["sequence"] = sequence
+    return state
+
+
+def save_sqlite_model_state(path: str, model_state: Dict) -> None:
+    """
+    Writes ``model_state`` to a new SQLite database at ``path``.
+    """
+    connection = connect_model_database(path)
+    try:
+        with connection:
+            write_model_state(connection, model_state)
+    finally:
+        connection.close()
+
+
+def load_sqlite_model_state(path: str) -> Dict:
+    """
+    Reads a model state from a SQLite database without modifying it.
+    """
+    connection = sqlite3.connect(f"{pathlib.Path(path).as_uri()}?mode=ro", uri=True)
+    try:
+        _check_version(connection)
+        return read_model_state(connection)
+    except sqlite3.DatabaseError as exc:
+        raise InvalidModelStateError("not a simplebayes SQLite model") from exc
+    finally:
+        connection.close()
@@ -0,0 +1,196 @@
+"""
+SQLite-backed model store with incremental updates.
+
+``SQLiteModelStore`` is attached to a classifier like a write-ahead log
+(``SimpleBayes.attach_journal``), but instead of appending records it
+applies each train, untrain, and flush to the tables described in
+``simplebayes.sqlite_model``. Operations are queued as they happen and
+written by whichever committing thread gets there first, so concurrent
+writers share one transaction (and one sync) per batch. The database is
+always the current model: there is nothing to replay and nothing to
+rewrite on save.
+"""
+import os
+import threading
+from typing import Dict, Iterator, List, Optional
+
+from simplebayes.errors import InvalidModelStateError
+from simplebayes.persistence import resolve_model_path
+from simplebayes.wal import WAL_FLUSH, WAL_TRAIN, WalRecord
+
+_ADD_TOKEN = (
+    "INSERT INTO tokens (category, token, count) VALUES (?, ?, ?) "
+    "ON CONFLICT(category, token) DO UPDATE SET count = count + excluded.count"
+)
+_ADD_TALLY = (
+    "INSERT INTO categories (name, tally) VALUES (?, ?) "
+    "ON CONFLICT(name) DO UPDATE SET tally = tally + excluded.tally"
+)
+
+
+def _apply_untrain(connection, category: str, counts: Dict[str, int]) -> None:
+    # Mirrors BayesCategory.untrain_token: never below zero, drop emptied rows
+    removed_total = 0
+    for token, count in counts.items():
+        row = connection.execute(
+            "SELECT count FROM tokens WHERE category = ? AND token = ?", (category, token),
+        ).fetchone()
+        if row is None:
+            continue
+        removed = min(count, row[0])
+        removed_total += removed
+        if row[0] - removed <= 0:
+            connection.execute("DELETE FROM tokens WHERE category = ? AND token = ?", (category, token))
+        else:
+            connection.execute(
+                "UPDATE tokens SET count = ? WHERE category = ? AND token = ?", (row[0] - removed, category, token),
+            )
+    connection.execute("UPDATE categories SET tally = tally - ? WHERE name = ?", (removed_total, category))
+    connection.execute("DELETE FROM categories WHERE name = ? AND tally <= 0", (category,))
+
+
+def _apply_record(connection, record: WalRecord) -> None:
+    _, operation, category, counts = record
+    if operation == WAL_FLUSH:
+        connection.execute("DELETE FROM tokens")
+        connection.execute("DELETE FROM categories")
+    elif operation == WAL_TRAIN:
+        connection.executemany(_ADD_TOKEN, ((category, token, count) for token, count in counts.items()))
+        connection.execute(_ADD_TALLY, (category, sum(counts.values())))
+    else:
+        _apply_untrain(connection, category, counts)
+
+
+class SQLiteModelStore:  # pylint: disable=too-many-instance-attributes
+    """
+    Durable model store that is updated incrementally as the classifier changes.
+
+    Load the classifier from the store first, then attach it::
+
+        classifier.load_from_file("/srv/models/spam.db")
+        classifier.attach_journal(SQLiteModelStore("/srv/models/spam.db"))
+    """
+
+    def __init__(self, absolute_path: str) -> None:
+        """
+        :param absolute_path: database path; created with an empty model when missing.
+        """
+        # Imported here so that importing this module does not load sqlite3
+        from simplebayes.sqlite_model import (  # pylint: disable=import-outside-toplevel
+            connect_model_database,
+            read_meta,
+        )
+
+        self.path = resolve_model_path(absolute_path)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._connection = connect_model_database(self.path, check_same_thread=False)
+        # Readers such as offline tools or load_from_file do not block batch writes
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=FULL")
+        self.last_sequence = read_meta(self._connection, "sequence")
+        self._committed_sequence = self.last_sequence
+        self._pending: List[WalRecord] = []
+        self._writing = False
+        self._closed = False
+        self._changed = threading.Condition(threading.Lock())
+
+    def read_records(self, after_sequence: int = 0) -> Iterator[WalRecord]:
+        """
+        The store holds applied state rather than a log, so there is nothing
+        to replay. A classifier older than the store was not loaded from it.
+        """
+        if after_sequence < self.last_sequence:
+            raise InvalidModelStateError("load the model from the SQLite store before attaching it")
+        return iter(())
+
+    def advance(self, sequence: int) -> None:
+        with self._changed:
+            self.last_sequence = max(self.last_sequence, sequence)
+            self._committed_sequence = max(self._committed_sequence, sequence)
+
+    def append(self, operation: str, category: str = "", counts: Optional[Dict[str, int]] = None) -> int:
+        """
+        Queues one operation and returns its sequence number. The change is
+        durable once ``commit`` returns for that sequence.
+        """
+        with self._changed:
+            if self._closed:
+                raise InvalidModelStateError("SQLite model store is closed")
+            self.last_sequence += 1
+            self._pending.append((self.last_sequence, operation, category, counts or {}))
+            return self.last_sequence
+
+    def commit(self, sequence: int) -> None:
+        """
+        Blocks until every operation up to ``sequence`` has been written. The
+        first waiting thread writes everything queued so far in one transaction.
+        """
+        with self._changed:
+            while self._committed_sequence < sequence:
+                if self._writing:
+                    self._changed.wait()
+                else:
+                    self._write_pending_locked()
+
+    def _write_pending_locked(self) -> None:
+        """Writes the queued batch; the lock is released while SQLite runs."""
+        from simplebayes.sqlite_model import write_meta  # pylint: disable=import-outside-toplevel
+
+        batch, self._pending = self._pending, []
+        self._writing = True
+        written = False
+        self._changed.release()
+        try:
+            with self._connection:
+                for record in batch:
+                    _apply_record(self._connection, record)
+                write_meta(self._connection, "sequence", batch[-1][0])
+            written = True
+        finally:
+            self._changed.acquire()
+            self._writing = False
+            if written:
+                self._committed_sequence = max(self._committed_sequence, batch[-1][0])
+            else:
+                # Keep the batch queued so the next commit retries it in order
+                self._pending[:0] = batch
+            self._changed.notify_all()
+
+    def compact(self, classifier, snapshot_path: str = "", model_format: Optional[str] = None, **save_options) -> None:
+        """
+        Rewrites the store from ``classifier`` in one transaction, e.g. after a
+        new model was loaded into it, and optionally saves a snapshot as well.
+
+        :param classifier: the SimpleBayes this store is attached to
+        :param snapshot_path: also save the model here with ``save_to_file``. Empty skips the snapshot.
+        :param model_format: snapshot format, as for ``save_to_file``
+        :param save_options: ``compression`` / ``compression_level`` for ``save_to_file``
+        """
+        if classifier.journal is not self:
+            raise ValueError("compact requires the classifier this store is attached to")
+
+        from simplebayes.sqlite_model import write_model_state  # pylint: disable=import-outside-toplevel
+
+        state = classifier.export_state()[1]
+        sequence = state.get("sequence", 0)
+        with self._changed:
+            self._changed.wait_for(lambda: not self._writing)
+            # Queued operations up to the snapshot's sequence are already in it
+            self._pending = [record for record in self._pending if record[0] > sequence]
+            with self._connection:
+                write_model_state(self._connection, state)
+            self._committed_sequence = max(self._committed_sequence, sequence)
+            self._changed.notify_all()
+        if snapshot_path:
+            classifier.save_to_file(snapshot_path, model_format, **save_options)
+
+    def close(self) -> None:
+        """
+        Writes outstanding operations and closes the database.
+        """
+        self.commit(self.last_sequence)
+        with self._changed:
+            if self._closed:
+                return
+            self._closed = True
+            self._connection.close()
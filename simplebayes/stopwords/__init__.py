@@ -0,0 +1,59 @@
+"""
+Built-in stopword lists. No external download or file storage required.
+
+Each language lives in its own module and is only imported the first time
+its stop words are requested, so importing simplebayes stays cheap.
+"""
+import importlib
+from typing import FrozenSet
+
+# Maps Snowball stemmer language name -> stopword module
+# porter -> english, dutch_porter -> dutch
+LANGUAGE_MODULES: dict[str, str] = {
+    "arabic": "arabic",
+    "armenian": "armenian",
+    "basque": "basque",
+    "catalan": "catalan",
+    "danish": "danish",
+    "dutch": "dutch",
+    "dutch_porter": "dutch",
+    "english": "english",
+    "esperanto": "esperanto",
+    "estonian": "estonian",
+    "finnish": "finnish",
+    "french": "french",
+    "german": "german",
+    "greek": "greek",
+    "hindi": "hindi",
+    "hungarian": "hungarian",
+    "indonesian": "indonesian",
+    "irish": "irish",
+    "italian": "italian",
+    "lithuanian": "lithuanian",
+    "nepali": "nepali",
+    "norwegian": "norwegian",
+    "porter": "english",
+    "portuguese": "portuguese",
+    "romanian": "romanian",
+    "russian": "russian",
+    "serbian": "serbian",
+    "spanish": "spanish",
+    "swedish": "swedish",
+    "tamil": "tamil",
+    "turkish": "turkish",
+    "yiddish": "yiddish",
+}
+
+
+def load_stop_words(language: str) -> FrozenSet[str]:
+    """
+    Imports and returns the built-in stop words for a language.
+
+    :param language: Snowball stemmer language name (e.g. "english").
+    :return: frozenset of stop words, empty when the language has no list.
+    """
+    module_name = LANGUAGE_MODULES.get(language)
+    if module_name is None:
+        return frozenset()
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    return module.STOP_WORDS
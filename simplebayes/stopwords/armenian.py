@@ -0,0 +1,9 @@
+# Armenian stop words. Source: stopwords-iso (MIT).
+
+STOP_WORDS = frozenset((
+    "այդ", "այլ", "այն", "այս", "դու", "դուք", "եմ", "են", "ենք", "ես",
+    "եք", "է", "էի", "էին", "էինք", "էիր", "էիք", "էր", "ըստ", "թ",
+    "ի", "ին", "իսկ", "իր", "կամ", "համար", "հետ", "հետո", "մենք", "մեջ",
+    "մի", "ն", "նա", "նաև", "նրա", "նրանք", "որ", "որը", "որոնք", "որպես",
+    "ու", "ում", "պիտի", "վրա", "և"
+))
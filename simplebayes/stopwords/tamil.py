@@ -0,0 +1,17 @@
+# Tamil stop words. Source: arulrajnet/TamilStopWords.
+
+STOP_WORDS = frozenset((
+    "அங்கு", "அங்கே", "அடுத்த", "அதனால்", "அதன்", "அதற்கு", "அதிக", "அதில்", "அது", "அதே",
+    "அதை", "அந்த", "அந்தக்", "அந்தப்", "அன்று", "அல்லது", "அவன்", "அவரது", "அவர்", "அவர்கள்",
+    "அவள்", "அவை", "ஆகிய", "ஆகியோர்", "ஆகும்", "ஆனால்", "இங்கு", "இங்கே", "இடத்தில்", "இடம்",
+    "இதனால்", "இதனை", "இதன்", "இதற்கு", "இதில்", "இது", "இதை", "இந்த", "இந்தக்", "இந்தத்",
+    "இந்தப்", "இன்னும்", "இப்போது", "இரு", "இருக்கும்", "இருந்த", "இருந்தது", "இருந்து", "இல்லை", "இவர்",
+    "இவை", "உன்", "உள்ள", "உள்ளது", "உள்ளன", "எந்த", "என", "எனக்", "எனக்கு", "எனப்படும்",
+    "எனவும்", "எனவே", "எனினும்", "எனும்", "என்", "என்ன", "என்னும்", "என்பது", "என்பதை", "என்ற",
+    "என்று", "என்றும்", "எல்லாம்", "ஏன்", "ஒரு", "ஒரே", "ஓர்", "கொண்ட", "கொண்டு", "கொள்ள",
+    "சற்று", "சிறு", "சில", "சேர்ந்த", "தனது", "தன்", "தவிர", "தான்", "நான்", "நாம்",
+    "நீ", "பற்றி", "பற்றிய", "பல", "பலரும்", "பல்வேறு", "பின்", "பின்னர்", "பிற", "பிறகு",
+    "பெரும்", "பேர்", "போது", "போன்ற", "போல", "போல்", "மட்டுமே", "மட்டும்", "மற்ற", "மற்றும்",
+    "மிக", "மிகவும்", "மீது", "முதல்", "முறை", "மேலும்", "மேல்", "யார்", "வந்த", "வந்து",
+    "வரும்", "வரை", "வரையில்", "விட", "விட்டு", "வேண்டும்", "வேறு"
+))
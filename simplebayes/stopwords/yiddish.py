@@ -0,0 +1,10 @@
+# Yiddish stop words. Source: function words from Wiktionary/Wortschatz Leipzig frequency, stemmed for filter match.
+
+STOP_WORDS = frozenset((
+    "א", "אבער", "אדער", "אונ", "אז", "אזױ", "איב", "איז", "אימ", "אינ",
+    "איר", "אלס", "אלע", "אנ", "אפילו", "אױב", "אױכ", "אױס", "אױפ", "ביז",
+    "בײ", "דא", "דאס", "דורכ", "די", "דעמ", "דער", "האב", "האט", "זאל",
+    "זי", "זיכ", "זענ", "זײ", "זײנ", "זײער", "מיט", "מענ", "מער", "נאכ",
+    "נאר", "ניש", "עס", "ער", "פאר", "פונ", "צו", "צומ", "צװיש", "קעג",
+    "קענ", "קײנ", "שױנ", "װאס", "װאר", "װי", "װעט", "װעלכ", "װענ", "װער"
+))
@@ -1,1513 +1,18 @@
-# pylint: disable=too-many-lines
-# Built-in stopword lists. No external download or file storage required.
-# Sourced from stopwords-iso (MIT), prtx/Nepali-Stopwords, arulrajnet/TamilStopWords.
-# Croatian used for Serbian (mutually intelligible).
-# Yiddish: function words from Wiktionary/Wortschatz Leipzig frequency, stemmed for filter match.
+"""
+Compatibility module for the stop word constants (``ENGLISH``, ``GERMAN``, ...).
 
-ARABIC = frozenset((
-    "،", "آض", "آمينَ", "آه", "آهاً", "آي", "أ", "أب", "أجل", "أجمع",
-    "أخ", "أخذ", "أصبح", "أضحى", "أقبل", "أقل", "أكثر", "ألا", "أم", "أما",
-    "أمامك", "أمامكَ", "أمسى", "أمّا", "أن", "أنا", "أنت", "أنتم", "أنتما", "أنتن",
-    "أنتِ", "أنشأ", "أنّى", "أو", "أوشك", "أولئك", "أولئكم", "أولاء", "أولالك", "أوّهْ",
-    "أي", "أيا", "أين", "أينما", "أيّ", "أَنَّ", "أََيُّ", "أُفٍّ", "إذ", "إذا",
-    "إذاً", "إذما", "إذن", "إلى", "إليكم", "إليكما", "إليكنّ", "إليكَ", "إلَيْكَ", "إلّا",
-    "إمّا", "إن", "إنّما", "إي", "إياك", "إياكم", "إياكما", "إياكن", "إيانا", "إياه",
-    "إياها", "إياهم", "إياهما", "إياهن", "إياي", "إيهٍ", "إِنَّ", "ا", "ابتدأ", "اثر",
-    "اجل", "احد", "اخرى", "اخلولق", "اذا", "اربعة", "ارتدّ", "استحال", "اطار", "اعادة",
-    "اعلنت", "اف", "اكثر", "اكد", "الألاء", "الألى", "الا", "الاخيرة", "الان", "الاول",
-    "الاولى", "التى", "التي", "الثاني", "الثانية", "الذاتي", "الذى", "الذي", "الذين", "السابق",
-    "الف", "اللائي", "اللاتي", "اللتان", "اللتيا", "اللتين", "اللذان", "اللذين", "اللواتي", "الماضي",
-    "المقبل", "الوقت", "الى", "اليوم", "اما", "امام", "امس", "ان", "انبرى", "انقلب",
-    "انه", "انها", "او", "اول", "اي", "ايار", "ايام", "ايضا", "ب", "بات",
-    "باسم", "بان", "بخٍ", "برس", "بسبب", "بسّ", "بشكل", "بضع", "بطآن", "بعد",
-    "بعض", "بك", "بكم", "بكما", "بكن", "بل", "بلى", "بما", "بماذا", "بمن",
-    "بن", "بنا", "به", "بها", "بي", "بيد", "بين", "بَسْ", "بَلْهَ", "بِئْسَ",
-    "تانِ", "تانِك", "تبدّل", "تجاه", "تحوّل", "تلقاء", "تلك", "تلكم", "تلكما", "تم",
-    "تينك", "تَيْنِ", "تِه", "تِي", "ثلاثة", "ثم", "ثمّ", "ثمّة", "ثُمَّ", "جعل",
-    "جلل", "جميع", "جير", "حار", "حاشا", "حاليا", "حاي", "حتى", "حرى", "حسب",
-    "حم", "حوالى", "حول", "حيث", "حيثما", "حين", "حيَّ", "حَبَّذَا", "حَتَّى", "حَذارِ",
-    "خلا", "خلال", "دون", "دونك", "ذا", "ذات", "ذاك", "ذانك", "ذانِ", "ذلك",
-    "ذلكم", "ذلكما", "ذلكن", "ذو", "ذوا", "ذواتا", "ذواتي", "ذيت", "ذينك", "ذَيْنِ",
-    "ذِه", "ذِي", "راح", "رجع", "رويدك", "ريث", "رُبَّ", "زيارة", "سبحان", "سرعان",
-    "سنة", "سنوات", "سوف", "سوى", "سَاءَ", "سَاءَمَا", "شبه", "شخصا", "شرع", "شَتَّانَ",
-    "صار", "صباح", "صفر", "صهٍ", "صهْ", "ضد", "ضمن", "طاق", "طالما", "طفق",
-    "طَق", "ظلّ", "عاد", "عام", "عاما", "عامة", "عدا", "عدة", "عدد", "عدم",
-    "عسى", "عشر", "عشرة", "علق", "على", "عليك", "عليه", "عليها", "علًّ", "عن",
-    "عند", "عندما", "عوض", "عين", "عَدَسْ", "عَمَّا", "غدا", "غير", "ـ", "ف",
-    "فان", "فلان", "فو", "فى", "في", "فيم", "فيما", "فيه", "فيها", "قال",
-    "قام", "قبل", "قد", "قطّ", "قلما", "قوة", "كأنّما", "كأين", "كأيّ", "كأيّن",
-    "كاد", "كان", "كانت", "كذا", "كذلك", "كرب", "كل", "كلا", "كلاهما", "كلتا",
-    "كلم", "كليكما", "كليهما", "كلّما", "كلَّا", "كم", "كما", "كي", "كيت", "كيف",
-    "كيفما", "كَأَنَّ", "كِخ", "لئن", "لا", "لات", "لاسيما", "لدن", "لدى", "لعمر",
-    "لقاء", "لك", "لكم", "لكما", "لكن", "لكنَّما", "لكي", "لكيلا", "للامم", "لم",
-    "لما", "لمّا", "لن", "لنا", "له", "لها", "لو", "لوكالة", "لولا", "لوما",
-    "لي", "لَسْتَ", "لَسْتُ", "لَسْتُم", "لَسْتُمَا", "لَسْتُنَّ", "لَسْتِ", "لَسْنَ", "لَعَلَّ", "لَكِنَّ",
-    "لَيْتَ", "لَيْسَ", "لَيْسَا", "لَيْسَتَا", "لَيْسَتْ", "لَيْسُوا", "لَِسْنَا", "ما", "ماانفك", "مابرح",
-    "مادام", "ماذا", "مازال", "مافتئ", "مايو", "متى", "مثل", "مذ", "مساء", "مع",
-    "معاذ", "مقابل", "مكانكم", "مكانكما", "مكانكنّ", "مكانَك", "مليار", "مليون", "مما", "ممن",
-    "من", "منذ", "منها", "مه", "مهما", "مَنْ", "مِن", "نحن", "نحو", "نعم",
-    "نفس", "نفسه", "نهاية", "نَخْ", "نِعِمّا", "نِعْمَ", "ها", "هاؤم", "هاكَ", "هاهنا",
-    "هبّ", "هذا", "هذه", "هكذا", "هل", "هلمَّ", "هلّا", "هم", "هما", "هن",
-    "هنا", "هناك", "هنالك", "هو", "هي", "هيا", "هيت", "هيّا", "هَؤلاء", "هَاتانِ",
-    "هَاتَيْنِ", "هَاتِه", "هَاتِي", "هَجْ", "هَذا", "هَذانِ", "هَذَيْنِ", "هَذِه", "هَذِي", "هَيْهَاتَ",
-    "و", "و6", "وا", "واحد", "واضاف", "واضافت", "واكد", "وان", "واهاً", "واوضح",
-    "وراءَك", "وفي", "وقال", "وقالت", "وقد", "وقف", "وكان", "وكانت", "ولا", "ولم",
-    "ومن", "وهو", "وهي", "ويكأنّ", "وَيْ", "وُشْكَانََ", "يكون", "يمكن", "يوم", "ّأيّان"
-))
+The lists now live in ``simplebayes.stopwords``, one module per language.
+Each constant here is looked up on first access and imports only its own
+language, so importing this module stays cheap.
+"""
+from typing import FrozenSet
 
-ARMENIAN = frozenset((
-    "այդ", "այլ", "այն", "այս", "դու", "դուք", "եմ", "են", "ենք", "ես",
-    "եք", "է", "էի", "էին", "էինք", "էիր", "էիք", "էր", "ըստ", "թ",
-    "ի", "ին", "իսկ", "իր", "կամ", "համար", "հետ", "հետո", "մենք", "մեջ",
-    "մի", "ն", "նա", "նաև", "նրա", "նրանք", "որ", "որը", "որոնք", "որպես",
-    "ու", "ում", "պիտի", "վրա", "և"
-))
+from simplebayes.stopwords import LANGUAGE_MODULES, load_stop_words
 
-BASQUE = frozenset((
-    "al", "anitz", "arabera", "asko", "baina", "bat", "batean", "batek", "bati", "batzuei",
-    "batzuek", "batzuetan", "batzuk", "bera", "beraiek", "berau", "berauek", "bere", "berori", "beroriek",
-    "beste", "bezala", "da", "dago", "dira", "ditu", "du", "dute", "edo", "egin",
-    "ere", "eta", "eurak", "ez", "gainera", "gu", "gutxi", "guzti", "haiei", "haiek",
-    "haietan", "hainbeste", "hala", "han", "handik", "hango", "hara", "hari", "hark", "hartan",
-    "hau", "hauei", "hauek", "hauetan", "hemen", "hemendik", "hemengo", "hi", "hona", "honek",
-    "honela", "honetan", "honi", "hor", "hori", "horiei", "horiek", "horietan", "horko", "horra",
-    "horrek", "horrela", "horretan", "horri", "hortik", "hura", "izan", "ni", "noiz", "nola",
-    "non", "nondik", "nongo", "nor", "nora", "ze", "zein", "zen", "zenbait", "zenbat",
-    "zer", "zergatik", "ziren", "zituen", "zu", "zuek", "zuen", "zuten"
-))
+__all__ = sorted({module_name.upper() for module_name in LANGUAGE_MODULES.values()})
 
-CATALAN = frozenset((
-    "a", "abans", "ací", "ah", "així", "això", "al", "aleshores", "algun", "alguna",
-    "algunes", "alguns", "alhora", "allà", "allí", "allò", "als", "altra", "altre", "altres",
-    "amb", "ambdues", "ambdós", "anar", "ans", "apa", "aquell", "aquella", "aquelles", "aquells",
-    "aquest", "aquesta", "aquestes", "aquests", "aquí", "baix", "bastant", "bé", "cada", "cadascuna",
-    "cadascunes", "cadascuns", "cadascú", "com", "consegueixo", "conseguim", "conseguir", "consigueix", "consigueixen",
-    "consigueixes",
-    "contra", "d'un", "d'una", "d'unes", "d'uns", "dalt", "de", "del", "dels", "des",
-    "des de", "després", "dins", "dintre", "donat", "doncs", "durant", "e", "eh", "el",
-    "elles", "ells", "els", "em", "en", "encara", "ens", "entre", "era", "erem",
-    "eren", "eres", "es", "esta", "estan", "estat", "estava", "estaven", "estem", "esteu",
-    "estic", "està", "estàvem", "estàveu", "et", "etc", "ets", "fa", "faig", "fan",
-    "fas", "fem", "fer", "feu", "fi", "fins", "fora", "gairebé", "ha", "han",
-    "has", "haver", "havia", "he", "hem", "heu", "hi", "ho", "i", "igual",
-    "iguals", "inclòs", "ja", "jo", "l'hi", "la", "les", "li", "li'n", "llarg",
-    "llavors", "m'he", "ma", "mal", "malgrat", "mateix", "mateixa", "mateixes", "mateixos", "me",
-    "mentre", "meu", "meus", "meva", "meves", "mode", "molt", "molta", "moltes", "molts",
-    "mon", "mons", "més", "n'he", "n'hi", "ne", "ni", "no", "nogensmenys", "només",
-    "nosaltres", "nostra", "nostre", "nostres", "o", "oh", "oi", "on", "pas", "pel",
-    "pels", "per", "per que", "perquè", "però", "poc", "poca", "pocs", "podem", "poden",
-    "poder", "podeu", "poques", "potser", "primer", "propi", "puc", "qual", "quals", "quan",
-    "quant", "que", "quelcom", "qui", "quin", "quina", "quines", "quins", "què", "s'ha",
-    "s'han", "sa", "sabem", "saben", "saber", "sabeu", "sap", "saps", "semblant", "semblants",
-    "sense", "ser", "ses", "seu", "seus", "seva", "seves", "si", "sobre", "sobretot",
-    "soc", "solament", "sols", "som", "son", "sons", "sota", "sou", "sóc", "són",
-    "t'ha", "t'han", "t'he", "ta", "tal", "també", "tampoc", "tan", "tant", "tanta",
-    "tantes", "te", "tene", "tenim", "tenir", "teniu", "teu", "teus", "teva", "teves",
-    "tinc", "ton", "tons", "tot", "tota", "totes", "tots", "un", "una", "unes",
-    "uns", "us", "va", "vaig", "vam", "van", "vas", "veu", "vosaltres", "vostra",
-    "vostre", "vostres", "érem", "éreu", "és", "éssent", "últim", "ús"
-))
 
-DANISH = frozenset((
-    "ad", "af", "aldrig", "alle", "alt", "anden", "andet", "andre", "at", "bare",
-    "begge", "blev", "blive", "bliver", "da", "de", "dem", "den", "denne", "der",
-    "deres", "det", "dette", "dig", "din", "dine", "disse", "dit", "dog", "du",
-    "efter", "ej", "eller", "en", "end", "ene", "eneste", "enhver", "er", "et",
-    "far", "fem", "fik", "fire", "flere", "fleste", "for", "fordi", "forrige", "fra",
-    "få", "får", "før", "god", "godt", "ham", "han", "hans", "har", "havde",
-    "have", "hej", "helt", "hende", "hendes", "her", "hos", "hun", "hvad", "hvem",
-    "hver", "hvilken", "hvis", "hvor", "hvordan", "hvorfor", "hvornår", "i", "ikke", "ind",
-    "ingen", "intet", "ja", "jeg", "jer", "jeres", "jo", "kan", "kom", "komme",
-    "kommer", "kun", "kunne", "lad", "lav", "lidt", "lige", "lille", "man", "mand",
-    "mange", "med", "meget", "men", "mens", "mere", "mig", "min", "mine", "mit",
-    "mod", "må", "ned", "nej", "ni", "nogen", "noget", "nogle", "nu", "ny",
-    "nyt", "når", "nær", "næste", "næsten", "og", "også", "okay", "om", "op",
-    "os", "otte", "over", "på", "se", "seks", "selv", "ser", "ses", "sig",
-    "sige", "sin", "sine", "sit", "skal", "skulle", "som", "stor", "store", "syv",
-    "så", "sådan", "tag", "tage", "thi", "ti", "til", "to", "tre", "ud",
-    "under", "var", "ved", "vi", "vil", "ville", "vor", "vores", "være", "været"
-))
-
-DUTCH = frozenset((
-    "aan", "aangaande", "aangezien", "achte", "achter", "achterna", "af", "afgelopen", "al", "aldaar",
-    "aldus", "alhoewel", "alias", "alle", "allebei", "alleen", "alles", "als", "alsnog", "altijd",
-    "altoos", "ander", "andere", "anders", "anderszins", "beetje", "behalve", "behoudens", "beide", "beiden",
-    "ben", "beneden", "bent", "bepaald", "betreffende", "bij", "bijna", "bijv", "binnen", "binnenin",
-    "blijkbaar", "blijken", "boven", "bovenal", "bovendien", "bovengenoemd", "bovenstaand", "bovenvermeld", "buiten",
-    "bv",
-    "daar", "daardoor", "daarheen", "daarin", "daarna", "daarnet", "daarom", "daarop", "daaruit", "daarvanlangs",
-    "dan", "dat", "de", "deden", "deed", "der", "derde", "derhalve", "dertig", "deze",
-    "dhr", "die", "dikwijls", "dit", "doch", "doe", "doen", "doet", "door", "doorgaand",
-    "drie", "duizend", "dus", "echter", "een", "eens", "eer", "eerdat", "eerder", "eerlang",
-    "eerst", "eerste", "eigen", "eigenlijk", "elk", "elke", "en", "enig", "enige", "enigszins",
-    "enkel", "er", "erdoor", "erg", "ergens", "etc", "etcetera", "even", "eveneens", "evenwel",
-    "gauw", "ge", "gedurende", "geen", "gehad", "gekund", "geleden", "gelijk", "gemoeten", "gemogen",
-    "genoeg", "geweest", "gewoon", "gewoonweg", "haar", "haarzelf", "had", "hadden", "hare", "heb",
-    "hebben", "hebt", "hedden", "heeft", "heel", "hem", "hemzelf", "hen", "het", "hetzelfde",
-    "hier", "hierbeneden", "hierboven", "hierin", "hierna", "hierom", "hij", "hijzelf", "hoe", "hoewel",
-    "honderd", "hun", "hunne", "ieder", "iedere", "iedereen", "iemand", "iets", "ik", "ikzelf",
-    "in", "inderdaad", "inmiddels", "intussen", "inzake", "is", "ja", "je", "jezelf", "jij",
-    "jijzelf", "jou", "jouw", "jouwe", "juist", "jullie", "kan", "klaar", "kon", "konden",
-    "krachtens", "kun", "kunnen", "kunt", "laatst", "later", "liever", "lijken", "lijkt", "maak",
-    "maakt", "maakte", "maakten", "maar", "mag", "maken", "me", "meer", "meest", "meestal",
-    "men", "met", "mevr", "mezelf", "mij", "mijn", "mijnent", "mijner", "mijzelf", "minder",
-    "miss", "misschien", "missen", "mits", "mocht", "mochten", "moest", "moesten", "moet", "moeten",
-    "mogen", "mr", "mrs", "mw", "na", "naar", "nadat", "nam", "namelijk", "nee",
-    "neem", "negen", "nemen", "nergens", "net", "niemand", "niet", "niets", "niks", "noch",
-    "nochtans", "nog", "nogal", "nooit", "nu", "nv", "of", "ofschoon", "om", "omdat",
-    "omhoog", "omlaag", "omstreeks", "omtrent", "omver", "ondanks", "onder", "ondertussen", "ongeveer", "ons",
-    "onszelf", "onze", "onzeker", "ooit", "ook", "op", "opnieuw", "opzij", "over", "overal",
-    "overeind", "overige", "overigens", "paar", "pas", "per", "precies", "recent", "redelijk", "reeds",
-    "rond", "rondom", "samen", "sedert", "sinds", "sindsdien", "slechts", "sommige", "spoedig", "steeds",
-    "tamelijk", "te", "tegen", "tegenover", "tenzij", "terwijl", "thans", "tien", "tiende", "tijdens",
-    "tja", "toch", "toe", "toen", "toenmaals", "toenmalig", "tot", "totdat", "tussen", "twee",
-    "tweede", "u", "uit", "uitgezonderd", "uw", "vaak", "vaakwat", "van", "vanaf", "vandaan",
-    "vanuit", "vanwege", "veel", "veeleer", "veertig", "verder", "verscheidene", "verschillende", "vervolgens", "via",
-    "vier", "vierde", "vijf", "vijfde", "vijftig", "vol", "volgend", "volgens", "voor", "vooraf",
-    "vooral", "vooralsnog", "voorbij", "voordat", "voordezen", "voordien", "voorheen", "voorop", "voorts", "vooruit",
-    "vrij", "vroeg", "waar", "waarom", "waarschijnlijk", "wanneer", "want", "waren", "was", "wat",
-    "we", "wederom", "weer", "weg", "wegens", "weinig", "wel", "weldra", "welk", "welke",
-    "werd", "werden", "werder", "wezen", "whatever", "wie", "wiens", "wier", "wij", "wijzelf",
-    "wil", "wilden", "willen", "word", "worden", "wordt", "zal", "ze", "zei", "zeker",
-    "zelf", "zelfde", "zelfs", "zes", "zeven", "zich", "zichzelf", "zij", "zijn", "zijne",
-    "zijzelf", "zo", "zoals", "zodat", "zodra", "zonder", "zou", "zouden", "zowat", "zulk",
-    "zulke", "zullen", "zult"
-))
-
-ENGLISH = frozenset((
-    "'ll", "'tis", "'twas", "'ve", "10", "39", "a", "a's", "able", "ableabout",
-    "about", "above", "abroad", "abst", "accordance", "according", "accordingly", "across", "act", "actually",
-    "ad", "added", "adj", "adopted", "ae", "af", "affected", "affecting", "affects", "after",
-    "afterwards", "ag", "again", "against", "ago", "ah", "ahead", "ai", "ain't", "aint",
-    "al", "all", "allow", "allows", "almost", "alone", "along", "alongside", "already", "also",
-    "although", "always", "am", "amid", "amidst", "among", "amongst", "amoungst", "amount", "an",
-    "and", "announce", "another", "any", "anybody", "anyhow", "anymore", "anyone", "anything", "anyway",
-    "anyways", "anywhere", "ao", "apart", "apparently", "appear", "appreciate", "appropriate", "approximately", "aq",
-    "ar", "are", "area", "areas", "aren", "aren't", "arent", "arise", "around", "arpa",
-    "as", "aside", "ask", "asked", "asking", "asks", "associated", "at", "au", "auth",
-    "available", "aw", "away", "awfully", "az", "b", "ba", "back", "backed", "backing",
-    "backs", "backward", "backwards", "bb", "bd", "be", "became", "because", "become", "becomes",
-    "becoming", "been", "before", "beforehand", "began", "begin", "beginning", "beginnings", "begins", "behind",
-    "being", "beings", "believe", "below", "beside", "besides", "best", "better", "between", "beyond",
-    "bf", "bg", "bh", "bi", "big", "bill", "billion", "biol", "bj", "bm",
-    "bn", "bo", "both", "bottom", "br", "brief", "briefly", "bs", "bt", "but",
-    "buy", "bv", "bw", "by", "bz", "c", "c'mon", "c's", "ca", "call",
-    "came", "can", "can't", "cannot", "cant", "caption", "case", "cases", "cause", "causes",
-    "cc", "cd", "certain", "certainly", "cf", "cg", "ch", "changes", "ci", "ck",
-    "cl", "clear", "clearly", "click", "cm", "cmon", "cn", "co", "co.", "com",
-    "come", "comes", "computer", "con", "concerning", "consequently", "consider", "considering", "contain",
-    "containing",
-    "contains", "copy", "corresponding", "could", "could've", "couldn", "couldn't", "couldnt", "course", "cr",
-    "cry", "cs", "cu", "currently", "cv", "cx", "cy", "cz", "d", "dare",
-    "daren't", "darent", "date", "de", "dear", "definitely", "describe", "described", "despite", "detail",
-    "did", "didn", "didn't", "didnt", "differ", "different", "differently", "directly", "dj", "dk",
-    "dm", "do", "does", "doesn", "doesn't", "doesnt", "doing", "don", "don't", "done",
-    "dont", "doubtful", "down", "downed", "downing", "downs", "downwards", "due", "during", "dz",
-    "e", "each", "early", "ec", "ed", "edu", "ee", "effect", "eg", "eh",
-    "eight", "eighty", "either", "eleven", "else", "elsewhere", "empty", "end", "ended", "ending",
-    "ends", "enough", "entirely", "er", "es", "especially", "et", "et-al", "etc", "even",
-    "evenly", "ever", "evermore", "every", "everybody", "everyone", "everything", "everywhere", "ex", "exactly",
-    "example", "except", "f", "face", "faces", "fact", "facts", "fairly", "far", "farther",
-    "felt", "few", "fewer", "ff", "fi", "fifteen", "fifth", "fifty", "fify", "fill",
-    "find", "finds", "fire", "first", "five", "fix", "fj", "fk", "fm", "fo",
-    "followed", "following", "follows", "for", "forever", "former", "formerly", "forth", "forty", "forward",
-    "found", "four", "fr", "free", "from", "front", "full", "fully", "further", "furthered",
-    "furthering", "furthermore", "furthers", "fx", "g", "ga", "gave", "gb", "gd", "ge",
-    "general", "generally", "get", "gets", "getting", "gf", "gg", "gh", "gi", "give",
-    "given", "gives", "giving", "gl", "gm", "gmt", "gn", "go", "goes", "going",
-    "gone", "good", "goods", "got", "gotten", "gov", "gp", "gq", "gr", "great",
-    "greater", "greatest", "greetings", "group", "grouped", "grouping", "groups", "gs", "gt", "gu",
-    "gw", "gy", "h", "had", "hadn't", "hadnt", "half", "happens", "hardly", "has",
-    "hasn", "hasn't", "hasnt", "have", "haven", "haven't", "havent", "having", "he", "he'd",
-    "he'll", "he's", "hed", "hell", "hello", "help", "hence", "her", "here", "here's",
-    "hereafter", "hereby", "herein", "heres", "hereupon", "hers", "herself", "herse”", "hes", "hi",
-    "hid", "high", "higher", "highest", "him", "himself", "himse”", "his", "hither", "hk",
-    "hm", "hn", "home", "homepage", "hopefully", "how", "how'd", "how'll", "how's", "howbeit",
-    "however", "hr", "ht", "htm", "html", "http", "hu", "hundred", "i", "i'd",
-    "i'll", "i'm", "i've", "i.e.", "id", "ie", "if", "ignored", "ii", "il",
-    "ill", "im", "immediate", "immediately", "importance", "important", "in", "inasmuch", "inc", "inc.",
-    "indeed", "index", "indicate", "indicated", "indicates", "information", "inner", "inside", "insofar", "instead",
-    "int", "interest", "interested", "interesting", "interests", "into", "invention", "inward", "io", "iq",
-    "ir", "is", "isn", "isn't", "isnt", "it", "it'd", "it'll", "it's", "itd",
-    "itll", "its", "itself", "itse”", "ive", "j", "je", "jm", "jo", "join",
-    "jp", "just", "k", "ke", "keep", "keeps", "kept", "keys", "kg", "kh",
-    "ki", "kind", "km", "kn", "knew", "know", "known", "knows", "kp", "kr",
-    "kw", "ky", "kz", "l", "la", "large", "largely", "last", "lately", "later",
-    "latest", "latter", "latterly", "lb", "lc", "least", "length", "less", "lest", "let",
-    "let's", "lets", "li", "like", "liked", "likely", "likewise", "line", "little", "lk",
-    "ll", "long", "longer", "longest", "look", "looking", "looks", "low", "lower", "lr",
-    "ls", "lt", "ltd", "lu", "lv", "ly", "m", "ma", "made", "mainly",
-    "make", "makes", "making", "man", "many", "may", "maybe", "mayn't", "maynt", "mc",
-    "md", "me", "mean", "means", "meantime", "meanwhile", "member", "members", "men", "merely",
-    "mg", "mh", "microsoft", "might", "might've", "mightn't", "mightnt", "mil", "mill", "million",
-    "mine", "minus", "miss", "mk", "ml", "mm", "mn", "mo", "more", "moreover",
-    "most", "mostly", "move", "mp", "mq", "mr", "mrs", "ms", "msie", "mt",
-    "mu", "much", "mug", "must", "must've", "mustn't", "mustnt", "mv", "mw", "mx",
-    "my", "myself", "myse”", "mz", "n", "na", "name", "namely", "nay", "nc",
-    "nd", "ne", "near", "nearly", "necessarily", "necessary", "need", "needed", "needing", "needn't",
-    "neednt", "needs", "neither", "net", "netscape", "never", "neverf", "neverless", "nevertheless", "new",
-    "newer", "newest", "next", "nf", "ng", "ni", "nine", "ninety", "nl", "no",
-    "no-one", "nobody", "non", "none", "nonetheless", "noone", "nor", "normally", "nos", "not",
-    "noted", "nothing", "notwithstanding", "novel", "now", "nowhere", "np", "nr", "nu", "null",
-    "number", "numbers", "nz", "o", "obtain", "obtained", "obviously", "of", "off", "often",
-    "oh", "ok", "okay", "old", "older", "oldest", "om", "omitted", "on", "once",
-    "one", "one's", "ones", "only", "onto", "open", "opened", "opening", "opens", "opposite",
-    "or", "ord", "order", "ordered", "ordering", "orders", "org", "other", "others", "otherwise",
-    "ought", "oughtn't", "oughtnt", "our", "ours", "ourselves", "out", "outside", "over", "overall",
-    "owing", "own", "p", "pa", "page", "pages", "part", "parted", "particular", "particularly",
-    "parting", "parts", "past", "pe", "per", "perhaps", "pf", "pg", "ph", "pk",
-    "pl", "place", "placed", "places", "please", "plus", "pm", "pmid", "pn", "point",
-    "pointed", "pointing", "points", "poorly", "possible", "possibly", "potentially", "pp", "pr", "predominantly",
-    "present", "presented", "presenting", "presents", "presumably", "previously", "primarily", "probably", "problem",
-    "problems",
-    "promptly", "proud", "provided", "provides", "pt", "put", "puts", "pw", "py", "q",
-    "qa", "que", "quickly", "quite", "qv", "r", "ran", "rather", "rd", "re",
-    "readily", "really", "reasonably", "recent", "recently", "ref", "refs", "regarding", "regardless", "regards",
-    "related", "relatively", "research", "reserved", "respectively", "resulted", "resulting", "results", "right",
-    "ring",
-    "ro", "room", "rooms", "round", "ru", "run", "rw", "s", "sa", "said",
-    "same", "saw", "say", "saying", "says", "sb", "sc", "sd", "se", "sec",
-    "second", "secondly", "seconds", "section", "see", "seeing", "seem", "seemed", "seeming", "seems",
-    "seen", "sees", "self", "selves", "sensible", "sent", "serious", "seriously", "seven", "seventy",
-    "several", "sg", "sh", "shall", "shan't", "shant", "she", "she'd", "she'll", "she's",
-    "shed", "shell", "shes", "should", "should've", "shouldn", "shouldn't", "shouldnt", "show", "showed",
-    "showing", "shown", "showns", "shows", "si", "side", "sides", "significant", "significantly", "similar",
-    "similarly", "since", "sincere", "site", "six", "sixty", "sj", "sk", "sl", "slightly",
-    "sm", "small", "smaller", "smallest", "sn", "so", "some", "somebody", "someday", "somehow",
-    "someone", "somethan", "something", "sometime", "sometimes", "somewhat", "somewhere", "soon", "sorry",
-    "specifically",
-    "specified", "specify", "specifying", "sr", "st", "state", "states", "still", "stop", "strongly",
-    "su", "sub", "substantially", "successfully", "such", "sufficiently", "suggest", "sup", "sure", "sv",
-    "sy", "system", "sz", "t", "t's", "take", "taken", "taking", "tc", "td",
-    "tell", "ten", "tends", "test", "text", "tf", "tg", "th", "than", "thank",
-    "thanks", "thanx", "that", "that'll", "that's", "that've", "thatll", "thats", "thatve", "the",
-    "their", "theirs", "them", "themselves", "then", "thence", "there", "there'd", "there'll", "there're",
-    "there's", "there've", "thereafter", "thereby", "thered", "therefore", "therein", "therell", "thereof", "therere",
-    "theres", "thereto", "thereupon", "thereve", "these", "they", "they'd", "they'll", "they're", "they've",
-    "theyd", "theyll", "theyre", "theyve", "thick", "thin", "thing", "things", "think", "thinks",
-    "third", "thirty", "this", "thorough", "thoroughly", "those", "thou", "though", "thoughh", "thought",
-    "thoughts", "thousand", "three", "throug", "through", "throughout", "thru", "thus", "til", "till",
-    "tip", "tis", "tj", "tk", "tm", "tn", "to", "today", "together", "too",
-    "took", "top", "toward", "towards", "tp", "tr", "tried", "tries", "trillion", "truly",
-    "try", "trying", "ts", "tt", "turn", "turned", "turning", "turns", "tv", "tw",
-    "twas", "twelve", "twenty", "twice", "two", "tz", "u", "ua", "ug", "uk",
-    "um", "un", "under", "underneath", "undoing", "unfortunately", "unless", "unlike", "unlikely", "until",
-    "unto", "up", "upon", "ups", "upwards", "us", "use", "used", "useful", "usefully",
-    "usefulness", "uses", "using", "usually", "uucp", "uy", "uz", "v", "va", "value",
-    "various", "vc", "ve", "versus", "very", "vg", "vi", "via", "viz", "vn",
-    "vol", "vols", "vs", "vu", "w", "want", "wanted", "wanting", "wants", "was",
-    "wasn", "wasn't", "wasnt", "way", "ways", "we", "we'd", "we'll", "we're", "we've",
-    "web", "webpage", "website", "wed", "welcome", "well", "wells", "went", "were", "weren",
-    "weren't", "werent", "weve", "wf", "what", "what'd", "what'll", "what's", "what've", "whatever",
-    "whatll", "whats", "whatve", "when", "when'd", "when'll", "when's", "whence", "whenever", "where",
-    "where'd", "where'll", "where's", "whereafter", "whereas", "whereby", "wherein", "wheres", "whereupon", "wherever",
-    "whether", "which", "whichever", "while", "whilst", "whim", "whither", "who", "who'd", "who'll",
-    "who's", "whod", "whoever", "whole", "wholl", "whom", "whomever", "whos", "whose", "why",
-    "why'd", "why'll", "why's", "widely", "width", "will", "willing", "wish", "with", "within",
-    "without", "won", "won't", "wonder", "wont", "words", "work", "worked", "working", "works",
-    "world", "would", "would've", "wouldn", "wouldn't", "wouldnt", "ws", "www", "x", "y",
-    "ye", "year", "years", "yes", "yet", "you", "you'd", "you'll", "you're", "you've",
-    "youd", "youll", "young", "younger", "youngest", "your", "youre", "yours", "yourself", "yourselves",
-    "youve", "yt", "yu", "z", "za", "zero", "zm", "zr"
-))
-
-ESPERANTO = frozenset((
-    "adiaŭ", "ajn", "al", "ankoraŭ", "antaŭ", "aŭ", "bonan", "bonvole", "bonvolu", "bv",
-    "ci", "cia", "cian", "cin", "d-ro", "da", "de", "dek", "deka", "do",
-    "doktor'", "doktoro", "du", "dua", "dum", "eble", "ekz", "ekzemple", "en", "estas",
-    "estis", "estos", "estu", "estus", "eĉ", "f-no", "feliĉan", "for", "fraŭlino", "ha",
-    "havas", "havis", "havos", "havu", "havus", "he", "ho", "hu", "ili", "ilia",
-    "ilian", "ilin", "inter", "io", "ion", "iu", "iujn", "iun", "ja", "jam",
-    "je", "jes", "k", "kaj", "ke", "kio", "kion", "kiu", "kiujn", "kiun",
-    "kvankam", "kvar", "kvara", "kvazaŭ", "kvin", "kvina", "la", "li", "lia", "lian",
-    "lin", "malantaŭ", "male", "malgraŭ", "mem", "mi", "mia", "mian", "min", "minus",
-    "naŭ", "naŭa", "ne", "nek", "nenio", "nenion", "neniu", "neniun", "nepre", "ni",
-    "nia", "nian", "nin", "nu", "nun", "nur", "ok", "oka", "oni", "onia",
-    "onian", "onin", "plej", "pli", "plu", "plus", "por", "post", "preter", "s-no",
-    "s-ro", "se", "sed", "sep", "sepa", "ses", "sesa", "si", "sia", "sian",
-    "sin", "sinjor'", "sinjorino", "sinjoro", "sub", "super", "supren", "sur", "tamen", "tio",
-    "tion", "tiu", "tiujn", "tiun", "tra", "tri", "tria", "tuj", "tute", "unu",
-    "unua", "ve", "verŝajne", "vi", "via", "vian", "vin", "ĉi", "ĉio", "ĉion",
-    "ĉiu", "ĉiujn", "ĉiun", "ĉu", "ĝi", "ĝia", "ĝian", "ĝin", "ĝis", "ĵus",
-    "ŝi", "ŝia", "ŝin"
-))
-
-ESTONIAN = frozenset((
-    "aga", "ei", "et", "ja", "jah", "kas", "kui", "kõik", "ma", "me",
-    "mida", "midagi", "mind", "minu", "mis", "mu", "mul", "mulle", "nad", "nii",
-    "oled", "olen", "oli", "oma", "on", "pole", "sa", "seda", "see", "selle",
-    "siin", "siis", "ta", "te", "ära"
-))
-
-FINNISH = frozenset((
-    "aiemmin", "aika", "aikaa", "aikaan", "aikaisemmin", "aikaisin", "aikajen", "aikana", "aikoina", "aikoo",
-    "aikovat", "aina", "ainakaan", "ainakin", "ainoa", "ainoat", "aiomme", "aion", "aiotte", "aist",
-    "aivan", "ajan", "alas", "alemmas", "alkuisin", "alkuun", "alla", "alle", "aloitamme", "aloitan",
-    "aloitat", "aloitatte", "aloitattivat", "aloitettava", "aloitettevaksi", "aloitettu", "aloitimme", "aloitin",
-    "aloitit", "aloititte",
-    "aloittaa", "aloittamatta", "aloitti", "aloittivat", "alta", "aluksi", "alussa", "alusta", "annettavaksi",
-    "annetteva",
-    "annettu", "ansiosta", "antaa", "antamatta", "antoi", "aoua", "apu", "asia", "asiaa", "asian",
-    "asiasta", "asiat", "asioiden", "asioihin", "asioita", "asti", "avuksi", "avulla", "avun", "avutta",
-    "edelle", "edelleen", "edellä", "edeltä", "edemmäs", "edes", "edessä", "edestä", "ehkä", "ei",
-    "eikä", "eilen", "eivät", "eli", "ellei", "elleivät", "ellemme", "ellen", "ellet", "ellette",
-    "emme", "en", "enemmän", "eniten", "ennen", "ensi", "ensimmäinen", "ensimmäiseksi", "ensimmäisen", "ensimmäisenä",
-    "ensimmäiset", "ensimmäisiksi", "ensimmäisinä", "ensimmäisiä", "ensimmäistä", "ensin", "entinen", "entisen",
-    "entisiä", "entisten",
-    "entistä", "enää", "eri", "erittäin", "erityisesti", "eräiden", "eräs", "eräät", "esi", "esiin",
-    "esillä", "esimerkiksi", "et", "eteen", "etenkin", "etessa", "ette", "ettei", "että", "haikki",
-    "halua", "haluaa", "haluamatta", "haluamme", "haluan", "haluat", "haluatte", "haluavat", "halunnut", "halusi",
-    "halusimme", "halusin", "halusit", "halusitte", "halusivat", "halutessa", "haluton", "he", "hei", "heidän",
-    "heidät", "heihin", "heille", "heillä", "heiltä", "heissä", "heistä", "heitä", "helposti", "heti",
-    "hetkellä", "hieman", "hitaasti", "hoikein", "huolimatta", "huomenna", "hyvien", "hyviin", "hyviksi", "hyville",
-    "hyviltä", "hyvin", "hyvinä", "hyvissä", "hyvistä", "hyviä", "hyvä", "hyvät", "hyvää", "hän",
-    "häneen", "hänelle", "hänellä", "häneltä", "hänen", "hänessä", "hänestä", "hänet", "häntä", "ihan",
-    "ilman", "ilmeisesti", "itse", "itsensä", "itseään", "ja", "jo", "johon", "joiden", "joihin",
-    "joiksi", "joilla", "joille", "joilta", "joina", "joissa", "joista", "joita", "joka", "jokainen",
-    "jokin", "joko", "joksi", "joku", "jolla", "jolle", "jolloin", "jolta", "jompikumpi", "jona",
-    "jonka", "jonkin", "jonne", "joo", "jopa", "jos", "joskus", "jossa", "josta", "jota",
-    "jotain", "joten", "jotenkin", "jotenkuten", "jotka", "jotta", "jouduimme", "jouduin", "jouduit", "jouduitte",
-    "joudumme", "joudun", "joudutte", "joukkoon", "joukossa", "joukosta", "joutua", "joutui", "joutuivat", "joutumaan",
-    "joutuu", "joutuvat", "juuri", "jälkeen", "jälleen", "jää", "kahdeksan", "kahdeksannen", "kahdella", "kahdelle",
-    "kahdelta", "kahden", "kahdessa", "kahdesta", "kahta", "kahteen", "kai", "kaiken", "kaikille", "kaikilta",
-    "kaikkea", "kaikki", "kaikkia", "kaikkiaan", "kaikkialla", "kaikkialle", "kaikkialta", "kaikkien", "kaikkin",
-    "kaksi",
-    "kannalta", "kannattaa", "kanssa", "kanssaan", "kanssamme", "kanssani", "kanssanne", "kanssasi", "kauan",
-    "kauemmas",
-    "kaukana", "kautta", "kehen", "keiden", "keihin", "keiksi", "keille", "keillä", "keiltä", "keinä",
-    "keissä", "keistä", "keitten", "keittä", "keitä", "keneen", "keneksi", "kenelle", "kenellä", "keneltä",
-    "kenen", "kenenä", "kenessä", "kenestä", "kenet", "kenettä", "kennessästä", "kenties", "kerran", "kerta",
-    "kertaa", "keskellä", "kesken", "keskimäärin", "ketkä", "ketä", "kiitos", "kohti", "koko", "kokonaan",
-    "kolmas", "kolme", "kolmen", "kolmesti", "koska", "koskaan", "kovin", "kuin", "kuinka", "kuinkan",
-    "kuitenkaan", "kuitenkin", "kuka", "kukaan", "kukin", "kukka", "kumpainen", "kumpainenkaan", "kumpi", "kumpikaan",
-    "kumpikin", "kun", "kuten", "kuuden", "kuusi", "kuutta", "kylliksi", "kyllä", "kymmenen", "kyse",
-    "liian", "liki", "lisäksi", "lisää", "lla", "luo", "luona", "lähekkäin", "lähelle", "lähellä",
-    "läheltä", "lähemmäs", "lähes", "lähinnä", "lähtien", "läpi", "mahdollisimman", "mahdollista", "me", "meidän",
-    "meidät", "meihin", "meille", "meillä", "meiltä", "meissä", "meistä", "meitä", "melkein", "melko",
-    "menee", "meneet", "menemme", "menen", "menet", "menette", "menevät", "meni", "menimme", "menin",
-    "menit", "menivät", "mennessä", "mennyt", "menossa", "mihin", "mikin", "miksi", "mikä", "mikäli",
-    "mikään", "mille", "milloin", "milloinkan", "millä", "miltä", "minkä", "minne", "minua", "minulla",
-    "minulle", "minulta", "minun", "minussa", "minusta", "minut", "minuun", "minä", "missä", "mistä",
-    "miten", "mitkä", "mitä", "mitään", "moi", "molemmat", "mones", "monesti", "monet", "moni",
-    "moniaalla", "moniaalle", "moniaalta", "monta", "muassa", "muiden", "muita", "muka", "mukaan", "mukaansa",
-    "mukana", "mutta", "muu", "muualla", "muualle", "muualta", "muuanne", "muulloin", "muun", "muut",
-    "muuta", "muutama", "muutaman", "muuten", "myöhemmin", "myös", "myöskin", "myöskään", "myötä", "ne",
-    "neljä", "neljän", "neljää", "niiden", "niihin", "niiksi", "niille", "niillä", "niiltä", "niin",
-    "niinä", "niissä", "niistä", "niitä", "noiden", "noihin", "noiksi", "noilla", "noille", "noilta",
-    "noin", "noina", "noissa", "noista", "noita", "nopeammin", "nopeasti", "nopeiten", "nro", "nuo",
-    "nyt", "näiden", "näihin", "näiksi", "näille", "näillä", "näiltä", "näin", "näinä", "näissä",
-    "näissähin", "näissälle", "näissältä", "näissästä", "näistä", "näitä", "nämä", "ohi", "oikea", "oikealla",
-    "oikein", "ole", "olemme", "olen", "olet", "olette", "oleva", "olevan", "olevat", "oli",
-    "olimme", "olin", "olisi", "olisimme", "olisin", "olisit", "olisitte", "olisivat", "olit", "olitte",
-    "olivat", "olla", "olleet", "olli", "ollut", "oma", "omaa", "omaan", "omaksi", "omalle",
-    "omalta", "oman", "omassa", "omat", "omia", "omien", "omiin", "omiksi", "omille", "omilta",
-    "omissa", "omista", "on", "onkin", "onko", "ovat", "paikoittain", "paitsi", "pakosti", "paljon",
-    "paremmin", "parempi", "parhaillaan", "parhaiten", "perusteella", "peräti", "pian", "pieneen", "pieneksi",
-    "pienelle",
-    "pienellä", "pieneltä", "pienempi", "pienestä", "pieni", "pienin", "poikki", "puolesta", "puolestaan", "päälle",
-    "runsaasti", "saakka", "sadam", "sama", "samaa", "samaan", "samalla", "samallalta", "samallassa", "samallasta",
-    "saman", "samat", "samoin", "sata", "sataa", "satojen", "se", "seitsemän", "sekä", "sen",
-    "seuraavat", "siellä", "sieltä", "siihen", "siinä", "siis", "siitä", "sijaan", "siksi", "sille",
-    "silloin", "sillä", "silti", "siltä", "sinne", "sinua", "sinulla", "sinulle", "sinulta", "sinun",
-    "sinussa", "sinusta", "sinut", "sinuun", "sinä", "sisäkkäin", "sisällä", "siten", "sitten", "sitä",
-    "ssa", "sta", "suoraan", "suuntaan", "suuren", "suuret", "suuri", "suuria", "suurin", "suurten",
-    "taa", "taas", "taemmas", "tahansa", "tai", "takaa", "takaisin", "takana", "takia", "tallä",
-    "tapauksessa", "tarpeeksi", "tavalla", "tavoitteena", "te", "teidän", "teidät", "teihin", "teille", "teillä",
-    "teiltä", "teissä", "teistä", "teitä", "tietysti", "todella", "toinen", "toisaalla", "toisaalle", "toisaalta",
-    "toiseen", "toiseksi", "toisella", "toiselle", "toiselta", "toisemme", "toisen",
-    "toisensa", "toisessa", "toisesta",
-    "toista", "toistaiseksi", "toki", "tosin", "tuhannen", "tuhat", "tule", "tulee", "tulemme", "tulen",
-    "tulet", "tulette", "tulevat", "tulimme", "tulin", "tulisi", "tulisimme", "tulisin", "tulisit", "tulisitte",
-    "tulisivat", "tulit", "tulitte", "tulivat", "tulla", "tulleet", "tullut", "tuntuu", "tuo", "tuohon",
-    "tuoksi", "tuolla", "tuolle", "tuolloin", "tuolta", "tuon", "tuona", "tuonne", "tuossa", "tuosta",
-    "tuota", "tuotä", "tuskin", "tykö", "tähän", "täksi", "tälle", "tällä", "tällöin", "tältä",
-    "tämä", "tämän", "tänne", "tänä", "tänään", "tässä", "tästä", "täten", "tätä", "täysin",
-    "täytyvät", "täytyy", "täällä", "täältä", "ulkopuolella", "usea", "useasti", "useimmiten", "usein", "useita",
-    "uudeksi", "uudelleen", "uuden", "uudet", "uusi", "uusia", "uusien", "uusinta", "uuteen", "uutta",
-    "vaan", "vahemmän", "vai", "vaiheessa", "vaikea", "vaikean", "vaikeat", "vaikeilla", "vaikeille", "vaikeilta",
-    "vaikeissa", "vaikeista", "vaikka", "vain", "varmasti", "varsin", "varsinkin", "varten", "vasen", "vasenmalla",
-    "vasta", "vastaan", "vastakkain", "vastan", "verran", "vielä", "vierekkäin", "vieressä", "vieri", "viiden",
-    "viime", "viimeinen", "viimeisen", "viimeksi", "viisi", "voi", "voidaan", "voimme", "voin", "voisi",
-    "voit", "voitte", "voivat", "vuoden", "vuoksi", "vuosi", "vuosien", "vuosina", "vuotta", "vähemmän",
-    "vähintään", "vähiten", "vähän", "välillä", "yhdeksän", "yhden", "yhdessä", "yhteen", "yhteensä", "yhteydessä",
-    "yhteyteen", "yhtä", "yhtäälle", "yhtäällä", "yhtäältä", "yhtään", "yhä", "yksi", "yksin", "yksittäin",
-    "yleensä", "ylemmäs", "yli", "ylös", "ympäri", "älköön", "älä"
-))
-
-FRENCH = frozenset((
-    "a", "abord", "absolument", "afin", "ah", "ai", "aie", "aient", "aies", "ailleurs",
-    "ainsi", "ait", "allaient", "allo", "allons", "allô", "alors", "anterieur", "anterieure", "anterieures",
-    "apres", "après", "as", "assez", "attendu", "au", "aucun", "aucune", "aucuns", "aujourd",
-    "aujourd'hui", "aupres", "auquel", "aura", "aurai", "auraient", "aurais", "aurait", "auras", "aurez",
-    "auriez", "aurions", "aurons", "auront", "aussi", "autant", "autre", "autrefois", "autrement", "autres",
-    "autrui", "aux", "auxquelles", "auxquels", "avaient", "avais", "avait", "avant", "avec", "avez",
-    "aviez", "avions", "avoir", "avons", "ayant", "ayez", "ayons", "b", "bah", "bas",
-    "basee", "bat", "beau", "beaucoup", "bien", "bigre", "bon", "boum", "bravo", "brrr",
-    "c", "car", "ce", "ceci", "cela", "celle", "celle-ci", "celle-là", "celles", "celles-ci",
-    "celles-là", "celui", "celui-ci", "celui-là", "celà", "cent", "cependant", "certain", "certaine", "certaines",
-    "certains", "certes", "ces", "cet", "cette", "ceux", "ceux-ci", "ceux-là", "chacun", "chacune",
-    "chaque", "cher", "chers", "chez", "chiche", "chut", "chère", "chères", "ci", "cinq",
-    "cinquantaine", "cinquante", "cinquantième", "cinquième", "clac", "clic", "combien", "comme", "comment",
-    "comparable",
-    "comparables", "compris", "concernant", "contre", "couic", "crac", "d", "da", "dans", "de",
-    "debout", "dedans", "dehors", "deja", "delà", "depuis", "dernier", "derniere", "derriere", "derrière",
-    "des", "desormais", "desquelles", "desquels", "dessous", "dessus", "deux", "deuxième", "deuxièmement", "devant",
-    "devers", "devra", "devrait", "different", "differentes", "differents", "différent", "différente", "différentes",
-    "différents",
-    "dire", "directe", "directement", "dit", "dite", "dits", "divers", "diverse", "diverses", "dix",
-    "dix-huit", "dix-neuf", "dix-sept", "dixième", "doit", "doivent", "donc", "dont", "dos", "douze",
-    "douzième", "dring", "droite", "du", "duquel", "durant", "dès", "début", "désormais", "e",
-    "effet", "egale", "egalement", "egales", "eh", "elle", "elle-même", "elles", "elles-mêmes", "en",
-    "encore", "enfin", "entre", "envers", "environ", "es", "essai", "est", "et", "etant",
-    "etc", "etre", "eu", "eue", "eues", "euh", "eurent", "eus", "eusse", "eussent",
-    "eusses", "eussiez", "eussions", "eut", "eux", "eux-mêmes", "exactement", "excepté", "extenso", "exterieur",
-    "eûmes", "eût", "eûtes", "f", "fais", "faisaient", "faisant", "fait", "faites", "façon",
-    "feront", "fi", "flac", "floc", "fois", "font", "force", "furent", "fus", "fusse",
-    "fussent", "fusses", "fussiez", "fussions", "fut", "fûmes", "fût", "fûtes", "g", "gens",
-    "h", "ha", "haut", "hein", "hem", "hep", "hi", "ho", "holà", "hop",
-    "hormis", "hors", "hou", "houp", "hue", "hui", "huit", "huitième", "hum", "hurrah",
-    "hé", "hélas", "i", "ici", "il", "ils", "importe", "j", "je", "jusqu",
-    "jusque", "juste", "k", "l", "la", "laisser", "laquelle", "las", "le", "lequel",
-    "les", "lesquelles", "lesquels", "leur", "leurs", "longtemps", "lors", "lorsque", "lui", "lui-meme",
-    "lui-même", "là", "lès", "m", "ma", "maint", "maintenant", "mais", "malgre", "malgré",
-    "maximale", "me", "meme", "memes", "merci", "mes", "mien", "mienne", "miennes", "miens",
-    "mille", "mince", "mine", "minimale", "moi", "moi-meme", "moi-même", "moindres", "moins", "mon",
-    "mot", "moyennant", "multiple", "multiples", "même", "mêmes", "n", "na", "naturel", "naturelle",
-    "naturelles", "ne", "neanmoins", "necessaire", "necessairement", "neuf", "neuvième", "ni", "nombreuses", "nombreux",
-    "nommés", "non", "nos", "notamment", "notre", "nous", "nous-mêmes", "nouveau", "nouveaux", "nul",
-    "néanmoins", "nôtre", "nôtres", "o", "oh", "ohé", "ollé", "olé", "on", "ont",
-    "onze", "onzième", "ore", "ou", "ouf", "ouias", "oust", "ouste", "outre", "ouvert",
-    "ouverte", "ouverts", "o|", "où", "p", "paf", "pan", "par", "parce", "parfois",
-    "parle", "parlent", "parler", "parmi", "parole", "parseme", "partant", "particulier", "particulière",
-    "particulièrement",
-    "pas", "passé", "pendant", "pense", "permet", "personne", "personnes", "peu", "peut", "peuvent",
-    "peux", "pff", "pfft", "pfut", "pif", "pire", "pièce", "plein", "plouf", "plupart",
-    "plus", "plusieurs", "plutôt", "possessif", "possessifs", "possible", "possibles", "pouah", "pour", "pourquoi",
-    "pourrais", "pourrait", "pouvait", "prealable", "precisement", "premier", "première", "premièrement", "pres",
-    "probable",
-    "probante", "procedant", "proche", "près", "psitt", "pu", "puis", "puisque", "pur", "pure",
-    "q", "qu", "quand", "quant", "quant-à-soi", "quanta", "quarante", "quatorze", "quatre", "quatre-vingt",
-    "quatrième", "quatrièmement", "que", "quel", "quelconque", "quelle", "quelles", "quelqu'un", "quelque", "quelques",
-    "quels", "qui", "quiconque", "quinze", "quoi", "quoique", "r", "rare", "rarement", "rares",
-    "relative", "relativement", "remarquable", "rend", "rendre", "restant", "reste", "restent", "restrictif", "retour",
-    "revoici", "revoilà", "rien", "s", "sa", "sacrebleu", "sait", "sans", "sapristi", "sauf",
-    "se", "sein", "seize", "selon", "semblable", "semblaient", "semble", "semblent", "sent", "sept",
-    "septième", "sera", "serai", "seraient", "serais", "serait", "seras", "serez", "seriez", "serions",
-    "serons", "seront", "ses", "seul", "seule", "seulement", "si", "sien", "sienne", "siennes",
-    "siens", "sinon", "six", "sixième", "soi", "soi-même", "soient", "sois", "soit", "soixante",
-    "sommes", "son", "sont", "sous", "souvent", "soyez", "soyons", "specifique", "specifiques", "speculatif",
-    "stop", "strictement", "subtiles", "suffisant", "suffisante", "suffit", "suis", "suit", "suivant", "suivante",
-    "suivantes", "suivants", "suivre", "sujet", "superpose", "sur", "surtout", "t", "ta", "tac",
-    "tandis", "tant", "tardive", "te", "tel", "telle", "tellement", "telles", "tels", "tenant",
-    "tend", "tenir", "tente", "tes", "tic", "tien", "tienne", "tiennes", "tiens", "toc",
-    "toi", "toi-même", "ton", "touchant", "toujours", "tous", "tout", "toute", "toutefois", "toutes",
-    "treize", "trente", "tres", "trois", "troisième", "troisièmement", "trop", "très", "tsoin", "tsouin",
-    "tu", "té", "u", "un", "une", "unes", "uniformement", "unique", "uniques", "uns",
-    "v", "va", "vais", "valeur", "vas", "vers", "via", "vif", "vifs", "vingt",
-    "vivat", "vive", "vives", "vlan", "voici", "voie", "voient", "voilà", "voire", "vont",
-    "vos", "votre", "vous", "vous-mêmes", "vu", "vé", "vôtre", "vôtres", "w", "x",
-    "y", "z", "zut", "à", "â", "ça", "ès", "étaient", "étais", "était",
-    "étant", "état", "étiez", "étions", "été", "étée", "étées", "étés", "êtes", "être",
-    "ô"
-))
-
-GERMAN = frozenset((
-    "a", "ab", "aber", "ach", "acht", "achte", "achten", "achter", "achtes", "ag",
-    "alle", "allein", "allem", "allen", "aller", "allerdings", "alles", "allgemeinen", "als", "also",
-    "am", "an", "ander", "andere", "anderem", "anderen", "anderer", "anderes", "anderm", "andern",
-    "anderr", "anders", "au", "auch", "auf", "aus", "ausser", "ausserdem", "außer", "außerdem",
-    "b", "bald", "bei", "beide", "beiden", "beim", "beispiel", "bekannt", "bereits", "besonders",
-    "besser", "besten", "bin", "bis", "bisher", "bist", "c", "d", "d.h", "da",
-    "dabei", "dadurch", "dafür", "dagegen", "daher", "dahin", "dahinter", "damals", "damit", "danach",
-    "daneben", "dank", "dann", "daran", "darauf", "daraus", "darf", "darfst", "darin", "darum",
-    "darunter", "darüber", "das", "dasein", "daselbst", "dass", "dasselbe", "davon", "davor", "dazu",
-    "dazwischen", "daß", "dein", "deine", "deinem", "deinen", "deiner", "deines", "dem", "dementsprechend",
-    "demgegenüber", "demgemäss", "demgemäß", "demselben", "demzufolge", "den", "denen", "denn", "denselben", "der",
-    "deren", "derer", "derjenige", "derjenigen", "dermassen", "dermaßen", "derselbe", "derselben", "des", "deshalb",
-    "desselben", "dessen", "deswegen", "dich", "die", "diejenige", "diejenigen", "dies", "diese", "dieselbe",
-    "dieselben", "diesem", "diesen", "dieser", "dieses", "dir", "doch", "dort", "drei", "drin",
-    "dritte", "dritten", "dritter", "drittes", "du", "durch", "durchaus", "durfte", "durften", "dürfen",
-    "dürft", "e", "eben", "ebenso", "ehrlich", "ei", "ei,", "eigen", "eigene", "eigenen",
-    "eigener", "eigenes", "ein", "einander", "eine", "einem", "einen", "einer", "eines", "einig",
-    "einige", "einigem", "einigen", "einiger", "einiges", "einmal", "eins", "elf", "en", "ende",
-    "endlich", "entweder", "er", "ernst", "erst", "erste", "ersten", "erster", "erstes", "es",
-    "etwa", "etwas", "euch", "euer", "eure", "eurem", "euren", "eurer", "eures", "f",
-    "folgende", "früher", "fünf", "fünfte", "fünften", "fünfter", "fünftes", "für", "g", "gab",
-    "ganz", "ganze", "ganzen", "ganzer", "ganzes", "gar", "gedurft", "gegen", "gegenüber", "gehabt",
-    "gehen", "geht", "gekannt", "gekonnt", "gemacht", "gemocht", "gemusst", "genug", "gerade", "gern",
-    "gesagt", "geschweige", "gewesen", "gewollt", "geworden", "gibt", "ging", "gleich", "gott", "gross",
-    "grosse", "grossen", "grosser", "grosses", "groß", "große", "großen", "großer", "großes", "gut",
-    "gute", "guter", "gutes", "h", "hab", "habe", "haben", "habt", "hast", "hat",
-    "hatte", "hatten", "hattest", "hattet", "heisst", "her", "heute", "hier", "hin", "hinter",
-    "hoch", "hätte", "hätten", "i", "ich", "ihm", "ihn", "ihnen", "ihr", "ihre",
-    "ihrem", "ihren", "ihrer", "ihres", "im", "immer", "in", "indem", "infolgedessen", "ins",
-    "irgend", "ist", "j", "ja", "jahr", "jahre", "jahren", "je", "jede", "jedem",
-    "jeden", "jeder", "jedermann", "jedermanns", "jedes", "jedoch", "jemand", "jemandem", "jemanden", "jene",
-    "jenem", "jenen", "jener", "jenes", "jetzt", "k", "kam", "kann", "kannst", "kaum",
-    "kein", "keine", "keinem", "keinen", "keiner", "keines", "kleine", "kleinen", "kleiner", "kleines",
-    "kommen", "kommt", "konnte", "konnten", "kurz", "können", "könnt", "könnte", "l", "lang",
-    "lange", "leicht", "leide", "lieber", "los", "m", "machen", "macht", "machte", "mag",
-    "magst", "mahn", "mal", "man", "manche", "manchem", "manchen", "mancher", "manches", "mann",
-    "mehr", "mein", "meine", "meinem", "meinen", "meiner", "meines", "mensch", "menschen", "mich",
-    "mir", "mit", "mittel", "mochte", "mochten", "morgen", "muss", "musst", "musste", "mussten",
-    "muß", "mußt", "möchte", "mögen", "möglich", "mögt", "müssen", "müsst", "müßt", "n",
-    "na", "nach", "nachdem", "nahm", "natürlich", "neben", "nein", "neue", "neuen", "neun",
-    "neunte", "neunten", "neunter", "neuntes", "nicht", "nichts", "nie", "niemand", "niemandem", "niemanden",
-    "noch", "nun", "nur", "o", "ob", "oben", "oder", "offen", "oft", "ohne",
-    "ordnung", "p", "q", "r", "recht", "rechte", "rechten", "rechter", "rechtes", "richtig",
-    "rund", "s", "sa", "sache", "sagt", "sagte", "sah", "satt", "schlecht", "schluss",
-    "schon", "sechs", "sechste", "sechsten", "sechster", "sechstes", "sehr", "sei", "seid", "seien",
-    "sein", "seine", "seinem", "seinen", "seiner", "seines", "seit", "seitdem", "selbst", "sich",
-    "sie", "sieben", "siebente", "siebenten", "siebenter", "siebentes", "sind", "so", "solang", "solche",
-    "solchem", "solchen", "solcher", "solches", "soll", "sollen", "sollst", "sollt", "sollte", "sollten",
-    "sondern", "sonst", "soweit", "sowie", "später", "startseite", "statt", "steht", "suche", "t",
-    "tag", "tage", "tagen", "tat", "teil", "tel", "tritt", "trotzdem", "tun", "u",
-    "uhr", "um", "und", "uns", "unse", "unsem", "unsen", "unser", "unsere", "unserer",
-    "unses", "unter", "v", "vergangenen", "viel", "viele", "vielem", "vielen", "vielleicht", "vier",
-    "vierte", "vierten", "vierter", "viertes", "vom", "von", "vor", "w", "wahr", "wann",
-    "war", "waren", "warst", "wart", "warum", "was", "weg", "wegen", "weil", "weit",
-    "weiter", "weitere", "weiteren", "weiteres", "welche", "welchem", "welchen", "welcher", "welches", "wem",
-    "wen", "wenig", "wenige", "weniger", "weniges", "wenigstens", "wenn", "wer", "werde", "werden",
-    "werdet", "weshalb", "wessen", "wie", "wieder", "wieso", "will", "willst", "wir", "wird",
-    "wirklich", "wirst", "wissen", "wo", "woher", "wohin", "wohl", "wollen", "wollt", "wollte",
-    "wollten", "worden", "wurde", "wurden", "während", "währenddem", "währenddessen", "wäre", "würde", "würden",
-    "x", "y", "z", "z.b", "zehn", "zehnte", "zehnten", "zehnter", "zehntes", "zeit",
-    "zu", "zuerst", "zugleich", "zum", "zunächst", "zur", "zurück", "zusammen", "zwanzig", "zwar",
-    "zwei", "zweite", "zweiten", "zweiter", "zweites", "zwischen", "zwölf", "über", "überhaupt", "übrigens"
-))
-
-GREEK = frozenset((
-    "ένα", "έναν", "ένας", "αι", "ακομα", "ακομη", "ακριβως", "αληθεια", "αληθινα", "αλλα",
-    "αλλαχου", "αλλες", "αλλη", "αλλην", "αλλης", "αλλιως", "αλλιωτικα", "αλλο", "αλλοι", "αλλοιως",
-    "αλλοιωτικα", "αλλον", "αλλος", "αλλοτε", "αλλου", "αλλους", "αλλων", "αμα", "αμεσα", "αμεσως",
-    "αν", "ανα", "αναμεσα", "αναμεταξυ", "ανευ", "αντι", "αντιπερα", "αντις", "ανω", "ανωτερω",
-    "αξαφνα", "απ", "απεναντι", "απο", "αποψε", "από", "αρα", "αραγε", "αργα", "αργοτερο",
-    "αριστερα", "αρκετα", "αρχικα", "ας", "αυριο", "αυτα", "αυτες", "αυτεσ", "αυτη", "αυτην",
-    "αυτης", "αυτο", "αυτοι", "αυτον", "αυτος", "αυτοσ", "αυτου", "αυτους", "αυτουσ", "αυτων",
-    "αφοτου", "αφου", "αἱ", "αἳ", "αἵ", "αὐτόσ", "αὐτὸς", "αὖ", "α∆ιακοπα", "βεβαια",
-    "βεβαιοτατα", "γάρ", "γα", "γα^", "γε", "γι", "για", "γοῦν", "γρηγορα", "γυρω",
-    "γὰρ", "δ'", "δέ", "δή", "δαί", "δαίσ", "δαὶ", "δαὶς", "δε", "δεν",
-    "δι", "δι'", "διά", "δια", "διὰ", "δὲ", "δὴ", "δ’", "εαν", "εαυτο",
-    "εαυτον", "εαυτου", "εαυτους", "εαυτων", "εγκαιρα", "εγκαιρως", "εγω", "ειθε", "ειμαι", "ειμαστε",
-    "ειναι", "εις", "εισαι", "εισαστε", "ειστε", "ειτε", "ειχα", "ειχαμε", "ειχαν", "ειχατε",
-    "ειχε", "ειχες", "ει∆εμη", "εκ", "εκαστα", "εκαστες", "εκαστη", "εκαστην", "εκαστης", "εκαστο",
-    "εκαστοι", "εκαστον", "εκαστος", "εκαστου", "εκαστους", "εκαστων", "εκει", "εκεινα", "εκεινες", "εκεινεσ",
-    "εκεινη", "εκεινην", "εκεινης", "εκεινο", "εκεινοι", "εκεινον", "εκεινος", "εκεινοσ", "εκεινου", "εκεινους",
-    "εκεινουσ", "εκεινων", "εκτος", "εμας", "εμεις", "εμενα", "εμπρος", "εν", "ενα", "εναν",
-    "ενας", "ενος", "εντελως", "εντος", "εντωμεταξυ", "ενω", "ενός", "εξ", "εξαφνα", "εξης",
-    "εξισου", "εξω", "επ", "επί", "επανω", "επειτα", "επει∆η", "επι", "επισης", "επομενως",
-    "εσας", "εσεις", "εσενα", "εστω", "εσυ", "ετερα", "ετεραι", "ετερας", "ετερες", "ετερη",
-    "ετερης", "ετερο", "ετεροι", "ετερον", "ετερος", "ετερου", "ετερους", "ετερων", "ετουτα", "ετουτες",
-    "ετουτη", "ετουτην", "ετουτης", "ετουτο", "ετουτοι", "ετουτον", "ετουτος", "ετουτου", "ετουτους", "ετουτων",
-    "ετσι", "ευγε", "ευθυς", "ευτυχως", "εφεξης", "εχει", "εχεις", "εχετε", "εχθες", "εχομε",
-    "εχουμε", "εχουν", "εχτες", "εχω", "εως", "εἰ", "εἰμί", "εἰμὶ", "εἰς", "εἰσ",
-    "εἴ", "εἴμι", "εἴτε", "ε∆ω", "η", "ημασταν", "ημαστε", "ημουν", "ησασταν", "ησαστε",
-    "ησουν", "ηταν", "ητανε", "ητοι", "ηττον", "η∆η", "θα", "ι", "ιι", "ιιι",
-    "ισαμε", "ισια", "ισως", "ισωσ", "ι∆ια", "ι∆ιαν", "ι∆ιας", "ι∆ιες", "ι∆ιο", "ι∆ιοι",
-    "ι∆ιον", "ι∆ιος", "ι∆ιου", "ι∆ιους", "ι∆ιων", "ι∆ιως", "κ", "καί", "καίτοι", "καθ",
-    "καθε", "καθεμια", "καθεμιας", "καθενα", "καθενας", "καθενος", "καθετι", "καθολου", "καθως", "και",
-    "κακα", "κακως", "καλα", "καλως", "καμια", "καμιαν", "καμιας", "καμποσα", "καμποσες", "καμποση",
-    "καμποσην", "καμποσης", "καμποσο", "καμποσοι", "καμποσον", "καμποσος", "καμποσου", "καμποσους", "καμποσων",
-    "κανεις",
-    "κανεν", "κανενα", "κανεναν", "κανενας", "κανενος", "καποια", "καποιαν", "καποιας", "καποιες", "καποιο",
-    "καποιοι", "καποιον", "καποιος", "καποιου", "καποιους", "καποιων", "καποτε", "καπου", "καπως", "κατ",
-    "κατά", "κατα", "κατι", "κατιτι", "κατοπιν", "κατω", "κατὰ", "καὶ", "κι", "κιολας",
-    "κλπ", "κοντα", "κτλ", "κυριως", "κἀν", "κἂν", "λιγακι", "λιγο", "λιγωτερο", "λογω",
-    "λοιπα", "λοιπον", "μέν", "μέσα", "μή", "μήτε", "μία", "μα", "μαζι", "μακαρι",
-    "μακρυα", "μαλιστα", "μαλλον", "μας", "με", "μεθ", "μεθαυριο", "μειον", "μελει", "μελλεται",
-    "μεμιας", "μεν", "μερικα", "μερικες", "μερικοι", "μερικους", "μερικων", "μεσα", "μετ", "μετά",
-    "μετα", "μεταξυ", "μετὰ", "μεχρι", "μη", "μην", "μηπως", "μητε", "μη∆ε", "μιά",
-    "μια", "μιαν", "μιας", "μολις", "μολονοτι", "μοναχα", "μονες", "μονη", "μονην", "μονης",
-    "μονο", "μονοι", "μονομιας", "μονος", "μονου", "μονους", "μονων", "μου", "μπορει", "μπορουν",
-    "μπραβο", "μπρος", "μἐν", "μὲν", "μὴ", "μὴν", "να", "ναι", "νωρις", "ξανα",
-    "ξαφνικα", "ο", "οι", "ολα", "ολες", "ολη", "ολην", "ολης", "ολο", "ολογυρα",
-    "ολοι", "ολον", "ολονεν", "ολος", "ολοτελα", "ολου", "ολους", "ολων", "ολως", "ολως∆ιολου",
-    "ομως", "ομωσ", "οποια", "οποιαν", "οποιαν∆ηποτε", "οποιας", "οποιας∆ηποτε", "οποια∆ηποτε", "οποιες",
-    "οποιες∆ηποτε",
-    "οποιο", "οποιοι", "οποιον", "οποιον∆ηποτε", "οποιος", "οποιος∆ηποτε", "οποιου", "οποιους", "οποιους∆ηποτε",
-    "οποιου∆ηποτε",
-    "οποιο∆ηποτε", "οποιων", "οποιων∆ηποτε", "οποι∆ηποτε", "οποτε", "οποτε∆ηποτε", "οπου", "οπου∆ηποτε", "οπως", "οπωσ",
-    "ορισμενα", "ορισμενες", "ορισμενων", "ορισμενως", "οσα", "οσα∆ηποτε", "οσες", "οσες∆ηποτε", "οση", "οσην",
-    "οσην∆ηποτε", "οσης", "οσης∆ηποτε", "οση∆ηποτε", "οσο", "οσοι", "οσοι∆ηποτε", "οσον", "οσον∆ηποτε", "οσος",
-    "οσος∆ηποτε", "οσου", "οσους", "οσους∆ηποτε", "οσου∆ηποτε", "οσο∆ηποτε", "οσων", "οσων∆ηποτε", "οταν", "οτι",
-    "οτι∆ηποτε", "οτου", "ου", "ουτε", "ου∆ε", "οχι", "οἱ", "οἳ", "οἷς", "οὐ",
-    "οὐδ", "οὐδέ", "οὐδείσ", "οὐδεὶς", "οὐδὲ", "οὐδὲν", "οὐκ", "οὐχ", "οὐχὶ", "οὓς",
-    "οὔτε", "οὕτω", "οὕτως", "οὕτωσ", "οὖν", "οὗ", "οὗτος", "οὗτοσ", "παλι", "παντοτε",
-    "παντου", "παντως", "παρ", "παρά", "παρα", "παρὰ", "περί", "περα", "περι", "περιπου",
-    "περισσοτερο", "περσι", "περυσι", "περὶ", "πια", "πιθανον", "πιο", "πισω", "πλαι", "πλεον",
-    "πλην", "ποια", "ποιαν", "ποιας", "ποιες", "ποιεσ", "ποιο", "ποιοι", "ποιον", "ποιος",
-    "ποιοσ", "ποιου", "ποιους", "ποιουσ", "ποιων", "πολυ", "ποσες", "ποση", "ποσην", "ποσης",
-    "ποσοι", "ποσος", "ποσους", "ποτε", "που", "πουθε", "πουθενα", "ποῦ", "πρεπει", "πριν",
-    "προ", "προκειμενου", "προκειται", "προπερσι", "προς", "προσ", "προτου", "προχθες", "προχτες", "πρωτυτερα",
-    "πρόσ", "πρὸ", "πρὸς", "πως", "πωσ", "σαν", "σας", "σε", "σεις", "σημερα",
-    "σιγα", "σου", "στα", "στη", "στην", "στης", "στις", "στο", "στον", "στου",
-    "στους", "στων", "συγχρονως", "συν", "συναμα", "συνεπως", "συνηθως", "συχνα", "συχνας", "συχνες",
-    "συχνη", "συχνην", "συχνης", "συχνο", "συχνοι", "συχνον", "συχνος", "συχνου", "συχνους", "συχνων",
-    "συχνως", "σχε∆ον", "σωστα", "σόσ", "σύ", "σύν", "σὸς", "σὺ", "σὺν", "τά",
-    "τήν", "τί", "τίς", "τίσ", "τα", "ταυτα", "ταυτες", "ταυτη", "ταυτην", "ταυτης",
-    "ταυτο,ταυτον", "ταυτος", "ταυτου", "ταυτων", "ταχα", "ταχατε", "ταῖς", "τα∆ε", "τε", "τελικα",
-    "τελικως", "τες", "τετοια", "τετοιαν", "τετοιας", "τετοιες", "τετοιο", "τετοιοι", "τετοιον", "τετοιος",
-    "τετοιου", "τετοιους", "τετοιων", "τη", "την", "της", "τησ", "τι", "τινα", "τιποτα",
-    "τιποτε", "τις", "τισ", "το", "τοί", "τοι", "τοιοῦτος", "τοιοῦτοσ", "τον", "τος",
-    "τοσα", "τοσες", "τοση", "τοσην", "τοσης", "τοσο", "τοσοι", "τοσον", "τοσος", "τοσου",
-    "τοσους", "τοσων", "τοτε", "του", "τουλαχιστο", "τουλαχιστον", "τους", "τουτα", "τουτες", "τουτη",
-    "τουτην", "τουτης", "τουτο", "τουτοι", "τουτοις", "τουτον", "τουτος", "τουτου", "τουτους", "τουτων",
-    "τούσ", "τοὺς", "τοῖς", "τοῦ", "τυχον", "των", "τωρα", "τό", "τόν", "τότε",
-    "τὰ", "τὰς", "τὴν", "τὸ", "τὸν", "τῆς", "τῆσ", "τῇ", "τῶν", "τῷ",
-    "υπ", "υπερ", "υπο", "υποψη", "υποψιν", "υπό", "υστερα", "φετος", "χαμηλα", "χθες",
-    "χτες", "χωρις", "χωριστα", "ψηλα", "ω", "ωραια", "ως", "ωσ", "ωσαν", "ωσοτου",
-    "ωσπου", "ωστε", "ωστοσο", "ωχ", "ἀλλ'", "ἀλλά", "ἀλλὰ", "ἀλλ’", "ἀπ", "ἀπό",
-    "ἀπὸ", "ἀφ", "ἂν", "ἃ", "ἄλλος", "ἄλλοσ", "ἄν", "ἄρα", "ἅμα", "ἐάν",
-    "ἐγώ", "ἐγὼ", "ἐκ", "ἐμόσ", "ἐμὸς", "ἐν", "ἐξ", "ἐπί", "ἐπεὶ", "ἐπὶ",
-    "ἐστι", "ἐφ", "ἐὰν", "ἑαυτοῦ", "ἔτι", "ἡ", "ἢ", "ἣ", "ἤ", "ἥ",
-    "ἧς", "ἵνα", "ὁ", "ὃ", "ὃν", "ὃς", "ὅ", "ὅδε", "ὅθεν", "ὅπερ",
-    "ὅς", "ὅσ", "ὅστις", "ὅστισ", "ὅτε", "ὅτι", "ὑμόσ", "ὑπ", "ὑπέρ", "ὑπό",
-    "ὑπὲρ", "ὑπὸ", "ὡς", "ὡσ", "ὥς", "ὥστε", "ὦ", "ᾧ", "∆α", "∆ε",
-    "∆εινα", "∆εν", "∆εξια", "∆ηθεν", "∆ηλα∆η", "∆ι", "∆ια", "∆ιαρκως", "∆ικα", "∆ικο",
-    "∆ικοι", "∆ικος", "∆ικου", "∆ικους", "∆ιολου", "∆ιπλα", "∆ιχως"
-))
-
-HINDI = frozenset((
-    "अंदर", "अत", "अदि", "अप", "अपना", "अपनि", "अपनी", "अपने", "अभि", "अभी",
-    "आदि", "आप", "इंहिं", "इंहें", "इंहों", "इतयादि", "इत्यादि", "इन", "इनका", "इन्हीं",
-    "इन्हें", "इन्हों", "इस", "इसका", "इसकि", "इसकी", "इसके", "इसमें", "इसि", "इसी",
-    "इसे", "उंहिं", "उंहें", "उंहों", "उन", "उनका", "उनकि", "उनकी", "उनके", "उनको",
-    "उन्हीं", "उन्हें", "उन्हों", "उस", "उसके", "उसि", "उसी", "उसे", "एक", "एवं",
-    "एस", "एसे", "ऐसे", "ओर", "और", "कइ", "कई", "कर", "करता", "करते",
-    "करना", "करने", "करें", "कहते", "कहा", "का", "काफि", "काफ़ी", "कि", "किंहें",
-    "किंहों", "कितना", "किन्हें", "किन्हों", "किया", "किर", "किस", "किसि", "किसी", "किसे",
-    "की", "कुछ", "कुल", "के", "को", "कोइ", "कोई", "कोन", "कोनसा", "कौन",
-    "कौनसा", "गया", "घर", "जब", "जहाँ", "जहां", "जा", "जिंहें", "जिंहों", "जितना",
-    "जिधर", "जिन", "जिन्हें", "जिन्हों", "जिस", "जिसे", "जीधर", "जेसा", "जेसे", "जैसा",
-    "जैसे", "जो", "तक", "तब", "तरह", "तिंहें", "तिंहों", "तिन", "तिन्हें", "तिन्हों",
-    "तिस", "तिसे", "तो", "था", "थि", "थी", "थे", "दबारा", "दवारा", "दिया",
-    "दुसरा", "दुसरे", "दूसरे", "दो", "द्वारा", "न", "नहिं", "नहीं", "ना", "निचे",
-    "निहायत", "नीचे", "ने", "पर", "पहले", "पुरा", "पूरा", "पे", "फिर", "बनि",
-    "बनी", "बहि", "बही", "बहुत", "बाद", "बाला", "बिलकुल", "भि", "भितर", "भी",
-    "भीतर", "मगर", "मानो", "मे", "में", "यदि", "यह", "यहाँ", "यहां", "यहि",
-    "यही", "या", "यिह", "ये", "रखें", "रवासा", "रहा", "रहे", "ऱ्वासा", "लिए",
-    "लिये", "लेकिन", "व", "वगेरह", "वरग", "वर्ग", "वह", "वहाँ", "वहां", "वहिं",
-    "वहीं", "वाले", "वुह", "वे", "वग़ैरह", "संग", "सकता", "सकते", "सबसे", "सभि",
-    "सभी", "साथ", "साबुत", "साभ", "सारा", "से", "सो", "हि", "ही", "हुअ",
-    "हुआ", "हुइ", "हुई", "हुए", "हे", "हें", "है", "हैं", "हो", "होता",
-    "होति", "होती", "होते", "होना", "होने"
-))
-
-HUNGARIAN = frozenset((
-    "a", "abba", "abban", "abból", "addig", "ahhoz", "ahogy", "ahol", "aki", "akik",
-    "akkor", "akár", "alapján", "alatt", "alatta", "alattad", "alattam", "alattatok", "alattuk", "alattunk",
-    "alá", "alád", "alájuk", "alám", "alánk", "alátok", "alól", "alóla", "alólad", "alólam",
-    "alólatok", "alóluk", "alólunk", "amely", "amelybol", "amelyek", "amelyekben", "amelyeket", "amelyet", "amelyik",
-    "amelynek", "ami", "amikor", "amit", "amolyan", "amott", "amíg", "annak", "annál", "arra",
-    "arról", "attól", "az", "aznap", "azok", "azokat", "azokba", "azokban", "azokból", "azokhoz",
-    "azokig", "azokkal", "azokká", "azoknak", "azoknál", "azokon", "azokra", "azokról", "azoktól", "azokért",
-    "azon", "azonban", "azonnal", "azt", "aztán", "azután", "azzal", "azzá", "azért", "bal",
-    "balra", "ban", "be", "belé", "beléd", "beléjük", "belém", "belénk", "belétek", "belül",
-    "belőle", "belőled", "belőlem", "belőletek", "belőlük", "belőlünk", "ben", "benne", "benned", "bennem",
-    "bennetek", "bennük", "bennünk", "bár", "bárcsak", "bármilyen", "búcsú", "cikk", "cikkek", "cikkeket",
-    "csak", "csakhogy", "csupán", "de", "dehogy", "e", "ebbe", "ebben", "ebből", "eddig",
-    "egy", "egyebek", "egyebet", "egyedül", "egyelőre", "egyes", "egyet", "egyetlen", "egyik", "egymás",
-    "egyre", "egyszerre", "egyéb", "együtt", "egész", "egészen", "ehhez", "ekkor", "el", "eleinte",
-    "ellen", "ellenes", "elleni", "ellenére", "elmondta", "elsõ", "első", "elsők", "elsősorban", "elsőt",
-    "elé", "eléd", "elég", "eléjük", "elém", "elénk", "elétek", "elõ", "elõször", "elõtt",
-    "elő", "előbb", "elől", "előle", "előled", "előlem", "előletek", "előlük", "előlünk", "először",
-    "előtt", "előtte", "előtted", "előttem", "előttetek", "előttük", "előttünk", "előző", "emilyen", "engem",
-    "ennek", "ennyi", "ennél", "enyém", "erre", "erről", "esetben", "ettől", "ez", "ezek",
-    "ezekbe", "ezekben", "ezekből", "ezeken", "ezeket", "ezekhez", "ezekig", "ezekkel", "ezekké", "ezeknek",
-    "ezeknél", "ezekre", "ezekről", "ezektől", "ezekért", "ezen", "ezentúl", "ezer", "ezret", "ezt",
-    "ezután", "ezzel", "ezzé", "ezért", "fel", "fele", "felek", "felet", "felett", "felé",
-    "fent", "fenti", "fél", "fölé", "gyakran", "ha", "halló", "hamar", "hanem", "harmadik",
-    "harmadikat", "harminc", "hat", "hatodik", "hatodikat", "hatot", "hatvan", "helyett", "hetedik", "hetediket",
-    "hetet", "hetven", "hirtelen", "hiszen", "hiába", "hogy", "hogyan", "hol", "holnap", "holnapot",
-    "honnan", "hova", "hozzá", "hozzád", "hozzájuk", "hozzám", "hozzánk", "hozzátok", "hurrá", "huszadik",
-    "hány", "hányszor", "hármat", "három", "hát", "hátha", "hátulsó", "hét", "húsz", "ide",
-    "ide-оda", "idén", "igazán", "igen", "ill", "ill.", "illetve", "ilyen", "ilyenkor", "immár",
-    "inkább", "is", "ismét", "ison", "itt", "jelenleg", "jobban", "jobbra", "jó", "jól",
-    "jólesik", "jóval", "jövőre", "kell", "kellene", "kellett", "kelljen", "keressünk", "keresztül", "ketten",
-    "kettő", "kettőt", "kevés", "ki", "kiben", "kiből", "kicsit", "kicsoda", "kihez", "kik",
-    "kikbe", "kikben", "kikből", "kiken", "kiket", "kikhez", "kikkel", "kikké", "kiknek", "kiknél",
-    "kikre", "kikről", "kiktől", "kikért", "kilenc", "kilencedik", "kilencediket", "kilencet", "kilencven", "kin",
-    "kinek", "kinél", "kire", "kiről", "kit", "kitől", "kivel", "kivé", "kié", "kiért",
-    "korábban", "képest", "kérem", "kérlek", "kész", "késő", "később", "későn", "két", "kétszer",
-    "kívül", "körül", "köszönhetően", "köszönöm", "közben", "közel", "közepesen", "közepén", "közé", "között",
-    "közül", "külön", "különben", "különböző", "különbözőbb", "különbözőek", "lassan", "le", "legalább", "legyen",
-    "lehet", "lehetetlen", "lehetett", "lehetőleg", "lehetőség", "lenne", "lenni", "lennék", "lennének", "lesz",
-    "leszek", "lesznek", "leszünk", "lett", "lettek", "lettem", "lettünk", "lévő", "ma", "maga",
-    "magad", "magam", "magatokat", "magukat", "magunkat", "magát", "mai", "majd", "majdnem", "manapság",
-    "meg", "megcsinál", "megcsinálnak", "megint", "megvan", "mellett", "mellette", "melletted", "mellettem",
-    "mellettetek",
-    "mellettük", "mellettünk", "mellé", "melléd", "melléjük", "mellém", "mellénk", "mellétek", "mellől", "mellőle",
-    "mellőled", "mellőlem", "mellőletek", "mellőlük", "mellőlünk", "mely", "melyek", "melyik", "mennyi", "mert",
-    "mi", "miatt", "miatta", "miattad", "miattam", "miattatok", "miattuk", "miattunk", "mibe", "miben",
-    "miből", "mihez", "mik", "mikbe", "mikben", "mikből", "miken", "miket", "mikhez", "mikkel",
-    "mikké", "miknek", "miknél", "mikor", "mikre", "mikről", "miktől", "mikért", "milyen", "min",
-    "mind", "mindegyik", "mindegyiket", "minden", "mindenesetre", "mindenki", "mindent", "mindenütt", "mindig",
-    "mindketten",
-    "minek", "minket", "mint", "mintha", "minél", "mire", "miről", "mit", "mitől", "mivel",
-    "mivé", "miért", "mondta", "most", "mostanáig", "már", "más", "másik", "másikat", "másnap",
-    "második", "másodszor", "mások", "másokat", "mást", "még", "mégis", "míg", "mögé", "mögéd",
-    "mögéjük", "mögém", "mögénk", "mögétek", "mögött", "mögötte", "mögötted", "mögöttem", "mögöttetek", "mögöttük",
-    "mögöttünk", "mögül", "mögüle", "mögüled", "mögülem", "mögületek", "mögülük", "mögülünk", "múltkor", "múlva",
-    "na", "nagy", "nagyobb", "nagyon", "naponta", "napot", "ne", "negyedik", "negyediket", "negyven",
-    "neked", "nekem", "neki", "nekik", "nektek", "nekünk", "nem", "nemcsak", "nemrég", "nincs",
-    "nyolc", "nyolcadik", "nyolcadikat", "nyolcat", "nyolcvan", "nála", "nálad", "nálam", "nálatok", "náluk",
-    "nálunk", "négy", "négyet", "néha", "néhány", "nélkül", "o", "oda", "ok", "olyan",
-    "onnan", "ott", "pedig", "persze", "pár", "például", "rajta", "rajtad", "rajtam", "rajtatok",
-    "rajtuk", "rajtunk", "rendben", "rosszul", "rá", "rád", "rájuk", "rám", "ránk", "rátok",
-    "régen", "régóta", "részére", "róla", "rólad", "rólam", "rólatok", "róluk", "rólunk", "rögtön",
-    "s", "saját", "se", "sem", "semmi", "semmilyen", "semmiség", "senki", "soha", "sok",
-    "sokan", "sokat", "sokkal", "sokszor", "sokáig", "során", "stb.", "szemben", "szerbusz", "szerint",
-    "szerinte", "szerinted", "szerintem", "szerintetek", "szerintük", "szerintünk", "szervusz", "szinte", "számára",
-    "száz",
-    "századik", "százat", "szépen", "szét", "szíves", "szívesen", "szíveskedjék", "sőt", "talán", "tavaly",
-    "te", "tegnap", "tegnapelőtt", "tehát", "tele", "teljes", "tessék", "ti", "tied", "titeket",
-    "tizedik", "tizediket", "tizenegy", "tizenegyedik", "tizenhat", "tizenhárom", "tizenhét", "tizenkettedik",
-    "tizenkettő", "tizenkilenc",
-    "tizenkét", "tizennyolc", "tizennégy", "tizenöt", "tizet", "tovább", "további", "továbbá", "távol", "téged",
-    "tényleg", "tíz", "több", "többi", "többször", "túl", "tőle", "tőled", "tőlem", "tőletek",
-    "tőlük", "tőlünk", "ugyanakkor", "ugyanez", "ugyanis", "ugye", "urak", "uram", "urat", "utoljára",
-    "utolsó", "után", "utána", "vagy", "vagyis", "vagyok", "vagytok", "vagyunk", "vajon", "valahol",
-    "valaki", "valakit", "valamelyik", "valami", "valamint", "való", "van", "vannak", "vele", "veled",
-    "velem", "veletek", "velük", "velünk", "vissza", "viszlát", "viszont", "viszontlátásra", "volna", "volnának",
-    "volnék", "volt", "voltak", "voltam", "voltunk", "végre", "végén", "végül", "által", "általában",
-    "ám", "át", "éljen", "én", "éppen", "érte", "érted", "értem", "értetek", "értük",
-    "értünk", "és", "év", "évben", "éve", "évek", "éves", "évi", "évvel", "így",
-    "óta", "õ", "õk", "õket", "ön", "önbe", "önben", "önből", "önhöz", "önnek",
-    "önnel", "önnél", "önre", "önről", "önt", "öntől", "önért", "önök", "önökbe", "önökben",
-    "önökből", "önöket", "önökhöz", "önökkel", "önöknek", "önöknél", "önökre", "önökről", "önöktől", "önökért",
-    "önökön", "önön", "össze", "öt", "ötven", "ötödik", "ötödiket", "ötöt", "úgy", "úgyis",
-    "úgynevezett", "új", "újabb", "újra", "úr", "ő", "ők", "őket", "őt"
-))
-
-INDONESIAN = frozenset((
-    "ada", "adalah", "adanya", "adapun", "agak", "agaknya", "agar", "akan", "akankah", "akhir",
-    "akhiri", "akhirnya", "aku", "akulah", "amat", "amatlah", "anda", "andalah", "antar", "antara",
-    "antaranya", "apa", "apaan", "apabila", "apakah", "apalagi", "apatah", "artinya", "asal", "asalkan",
-    "atas", "atau", "ataukah", "ataupun", "awal", "awalnya", "bagai", "bagaikan", "bagaimana", "bagaimanakah",
-    "bagaimanapun", "bagi", "bagian", "bahkan", "bahwa", "bahwasanya", "baik", "bakal", "bakalan", "balik",
-    "banyak", "bapak", "baru", "bawah", "beberapa", "begini", "beginian", "beginikah", "beginilah", "begitu",
-    "begitukah", "begitulah", "begitupun", "bekerja", "belakang", "belakangan", "belum", "belumlah", "benar",
-    "benarkah",
-    "benarlah", "berada", "berakhir", "berakhirlah", "berakhirnya", "berapa", "berapakah", "berapalah", "berapapun",
-    "berarti",
-    "berawal", "berbagai", "berdatangan", "beri", "berikan", "berikut", "berikutnya", "berjumlah", "berkali-kali",
-    "berkata",
-    "berkehendak", "berkeinginan", "berkenaan", "berlainan", "berlalu", "berlangsung", "berlebihan", "bermacam",
-    "bermacam-macam", "bermaksud",
-    "bermula", "bersama", "bersama-sama", "bersiap", "bersiap-siap", "bertanya", "bertanya-tanya", "berturut",
-    "berturut-turut", "bertutur",
-    "berujar", "berupa", "besar", "betul", "betulkah", "biasa", "biasanya", "bila", "bilakah", "bisa",
-    "bisakah", "boleh", "bolehkah", "bolehlah", "buat", "bukan", "bukankah", "bukanlah", "bukannya", "bulan",
-    "bung", "cara", "caranya", "cukup", "cukupkah", "cukuplah", "cuma", "dahulu", "dalam", "dan",
-    "dapat", "dari", "daripada", "datang", "dekat", "demi", "demikian", "demikianlah", "dengan", "depan",
-    "di", "dia", "diakhiri", "diakhirinya", "dialah", "diantara", "diantaranya", "diberi", "diberikan", "diberikannya",
-    "dibuat", "dibuatnya", "didapat", "didatangkan", "digunakan", "diibaratkan", "diibaratkannya", "diingat",
-    "diingatkan", "diinginkan",
-    "dijawab", "dijelaskan", "dijelaskannya", "dikarenakan", "dikatakan", "dikatakannya", "dikerjakan", "diketahui",
-    "diketahuinya", "dikira",
-    "dilakukan", "dilalui", "dilihat", "dimaksud", "dimaksudkan", "dimaksudkannya", "dimaksudnya", "diminta",
-    "dimintai", "dimisalkan",
-    "dimulai", "dimulailah", "dimulainya", "dimungkinkan", "dini", "dipastikan", "diperbuat", "diperbuatnya",
-    "dipergunakan", "diperkirakan",
-    "diperlihatkan", "diperlukan", "diperlukannya", "dipersoalkan", "dipertanyakan", "dipunyai", "diri", "dirinya",
-    "disampaikan", "disebut",
-    "disebutkan", "disebutkannya", "disini", "disinilah", "ditambahkan", "ditandaskan", "ditanya", "ditanyai",
-    "ditanyakan", "ditegaskan",
-    "ditujukan", "ditunjuk", "ditunjuki", "ditunjukkan", "ditunjukkannya", "ditunjuknya", "dituturkan",
-    "dituturkannya", "diucapkan", "diucapkannya",
-    "diungkapkan", "dong", "dua", "dulu", "empat", "enggak", "enggaknya", "entah", "entahlah", "guna",
-    "gunakan", "hal", "hampir", "hanya", "hanyalah", "hari", "harus", "haruslah", "harusnya", "hendak",
-    "hendaklah", "hendaknya", "hingga", "ia", "ialah", "ibarat", "ibaratkan", "ibaratnya", "ibu", "ikut",
-    "ingat", "ingat-ingat", "ingin", "inginkah", "inginkan", "ini", "inikah", "inilah", "itu", "itukah",
-    "itulah", "jadi", "jadilah", "jadinya", "jangan", "jangankan", "janganlah", "jauh", "jawab", "jawaban",
-    "jawabnya", "jelas", "jelaskan", "jelaslah", "jelasnya", "jika", "jikalau", "juga", "jumlah", "jumlahnya",
-    "justru", "kala", "kalau", "kalaulah", "kalaupun", "kalian", "kami", "kamilah", "kamu", "kamulah",
-    "kan", "kapan", "kapankah", "kapanpun", "karena", "karenanya", "kasus", "kata", "katakan", "katakanlah",
-    "katanya", "ke", "keadaan", "kebetulan", "kecil", "kedua", "keduanya", "keinginan", "kelamaan", "kelihatan",
-    "kelihatannya", "kelima", "keluar", "kembali", "kemudian", "kemungkinan", "kemungkinannya", "kenapa", "kepada",
-    "kepadanya",
-    "kesampaian", "keseluruhan", "keseluruhannya", "keterlaluan", "ketika", "khususnya", "kini", "kinilah", "kira",
-    "kira-kira",
-    "kiranya", "kita", "kitalah", "kok", "kurang", "lagi", "lagian", "lah", "lain", "lainnya",
-    "lalu", "lama", "lamanya", "lanjut", "lanjutnya", "lebih", "lewat", "lima", "luar", "macam",
-    "maka", "makanya", "makin", "malah", "malahan", "mampu", "mampukah", "mana", "manakala", "manalagi",
-    "masa", "masalah", "masalahnya", "masih", "masihkah", "masing", "masing-masing", "mau", "maupun", "melainkan",
-    "melakukan", "melalui", "melihat", "melihatnya", "memang", "memastikan", "memberi", "memberikan", "membuat",
-    "memerlukan",
-    "memihak", "meminta", "memintakan", "memisalkan", "memperbuat", "mempergunakan", "memperkirakan", "memperlihatkan",
-    "mempersiapkan", "mempersoalkan",
-    "mempertanyakan", "mempunyai", "memulai", "memungkinkan", "menaiki", "menambahkan", "menandaskan", "menanti",
-    "menanti-nanti", "menantikan",
-    "menanya", "menanyai", "menanyakan", "mendapat", "mendapatkan", "mendatang", "mendatangi", "mendatangkan",
-    "menegaskan", "mengakhiri",
-    "mengapa", "mengatakan", "mengatakannya", "mengenai", "mengerjakan", "mengetahui", "menggunakan", "menghendaki",
-    "mengibaratkan", "mengibaratkannya",
-    "mengingat", "mengingatkan", "menginginkan", "mengira", "mengucapkan", "mengucapkannya", "mengungkapkan",
-    "menjadi", "menjawab", "menjelaskan",
-    "menuju", "menunjuk", "menunjuki", "menunjukkan", "menunjuknya", "menurut", "menuturkan", "menyampaikan",
-    "menyangkut", "menyatakan",
-    "menyebutkan", "menyeluruh", "menyiapkan", "merasa", "mereka", "merekalah", "merupakan", "meski", "meskipun",
-    "meyakini",
-    "meyakinkan", "minta", "mirip", "misal", "misalkan", "misalnya", "mula", "mulai", "mulailah", "mulanya",
-    "mungkin", "mungkinkah", "nah", "naik", "namun", "nanti", "nantinya", "nyaris", "nyatanya", "oleh",
-    "olehnya", "pada", "padahal", "padanya", "pak", "paling", "panjang", "pantas", "para", "pasti",
-    "pastilah", "penting", "pentingnya", "per", "percuma", "perlu", "perlukah", "perlunya", "pernah", "persoalan",
-    "pertama", "pertama-tama", "pertanyaan", "pertanyakan", "pihak", "pihaknya", "pukul", "pula", "pun", "punya",
-    "rasa", "rasanya", "rata", "rupanya", "saat", "saatnya", "saja", "sajalah", "saling", "sama",
-    "sama-sama", "sambil", "sampai", "sampai-sampai", "sampaikan", "sana", "sangat", "sangatlah", "satu", "saya",
-    "sayalah", "se", "sebab", "sebabnya", "sebagai", "sebagaimana", "sebagainya", "sebagian", "sebaik",
-    "sebaik-baiknya",
-    "sebaiknya", "sebaliknya", "sebanyak", "sebegini", "sebegitu", "sebelum", "sebelumnya", "sebenarnya", "seberapa",
-    "sebesar",
-    "sebetulnya", "sebisanya", "sebuah", "sebut", "sebutlah", "sebutnya", "secara", "secukupnya", "sedang", "sedangkan",
-    "sedemikian", "sedikit", "sedikitnya", "seenaknya", "segala", "segalanya", "segera", "seharusnya", "sehingga",
-    "seingat",
-    "sejak", "sejauh", "sejenak", "sejumlah", "sekadar", "sekadarnya", "sekali", "sekali-kali", "sekalian", "sekaligus",
-    "sekalipun", "sekarang", "sekecil", "seketika", "sekiranya", "sekitar", "sekitarnya", "sekurang-kurangnya",
-    "sekurangnya", "sela",
-    "selagi", "selain", "selaku", "selalu", "selama", "selama-lamanya", "selamanya", "selanjutnya", "seluruh",
-    "seluruhnya",
-    "semacam", "semakin", "semampu", "semampunya", "semasa", "semasih", "semata", "semata-mata", "semaunya",
-    "sementara",
-    "semisal", "semisalnya", "sempat", "semua", "semuanya", "semula", "sendiri", "sendirian", "sendirinya", "seolah",
-    "seolah-olah", "seorang", "sepanjang", "sepantasnya", "sepantasnyalah", "seperlunya", "seperti", "sepertinya",
-    "sepihak", "sering",
-    "seringnya", "serta", "serupa", "sesaat", "sesama", "sesampai", "sesegera", "sesekali", "seseorang", "sesuatu",
-    "sesuatunya", "sesudah", "sesudahnya", "setelah", "setempat", "setengah", "seterusnya", "setiap", "setiba",
-    "setibanya",
-    "setidak-tidaknya", "setidaknya", "setinggi", "seusai", "sewaktu", "siap", "siapa", "siapakah", "siapapun", "sini",
-    "sinilah", "soal", "soalnya", "suatu", "sudah", "sudahkah", "sudahlah", "supaya", "tadi", "tadinya",
-    "tahu", "tahun", "tak", "tambah", "tambahnya", "tampak", "tampaknya", "tandas", "tandasnya", "tanpa",
-    "tanya", "tanyakan", "tanyanya", "tapi", "tegas", "tegasnya", "telah", "tempat", "tengah", "tentang",
-    "tentu", "tentulah", "tentunya", "tepat", "terakhir", "terasa", "terbanyak", "terdahulu", "terdapat", "terdiri",
-    "terhadap", "terhadapnya", "teringat", "teringat-ingat", "terjadi", "terjadilah", "terjadinya", "terkira",
-    "terlalu", "terlebih",
-    "terlihat", "termasuk", "ternyata", "tersampaikan", "tersebut", "tersebutlah", "tertentu", "tertuju", "terus",
-    "terutama",
-    "tetap", "tetapi", "tiap", "tiba", "tiba-tiba", "tidak", "tidakkah", "tidaklah", "tiga", "tinggi",
-    "toh", "tunjuk", "turut", "tutur", "tuturnya", "ucap", "ucapnya", "ujar", "ujarnya", "umum",
-    "umumnya", "ungkap", "ungkapnya", "untuk", "usah", "usai", "waduh", "wah", "wahai", "waktu",
-    "waktunya", "walau", "walaupun", "wong", "yaitu", "yakin", "yakni", "yang"
-))
-
-IRISH = frozenset((
-    "a", "ach", "ag", "agus", "an", "aon", "ar", "arna", "as", "b'",
-    "ba", "beirt", "bhúr", "caoga", "ceathair", "ceathrar", "chomh", "chtó", "chuig", "chun",
-    "cois", "céad", "cúig", "cúigear", "d'", "daichead", "dar", "de", "deich", "deichniúr",
-    "den", "dhá", "do", "don", "dtí", "dá", "dár", "dó", "faoi", "faoin",
-    "faoina", "faoinár", "fara", "fiche", "gach", "gan", "go", "gur", "haon", "hocht",
-    "i", "iad", "idir", "in", "ina", "ins", "inár", "is", "le", "leis",
-    "lena", "lenár", "m'", "mar", "mo", "mé", "na", "nach", "naoi", "naonúr",
-    "ná", "ní", "níor", "nó", "nócha", "ocht", "ochtar", "os", "roimh", "sa",
-    "seacht", "seachtar", "seachtó", "seasca", "seisear", "siad", "sibh", "sinn", "sna", "sé",
-    "sí", "tar", "thar", "thú", "triúr", "trí", "trína", "trínár", "tríocha", "tú",
-    "um", "ár", "é", "éis", "í", "ó", "ón", "óna", "ónár"
-))
-
-ITALIAN = frozenset((
-    "a", "abbastanza", "abbia", "abbiamo", "abbiano", "abbiate", "accidenti", "ad", "adesso", "affinché",
-    "agl", "agli", "ahime", "ahimè", "ai", "al", "alcuna", "alcuni", "alcuno", "all",
-    "alla", "alle", "allo", "allora", "altre", "altri", "altrimenti", "altro", "altrove", "altrui",
-    "anche", "ancora", "anni", "anno", "ansa", "anticipo", "assai", "attesa", "attraverso", "avanti",
-    "avemmo", "avendo", "avente", "aver", "avere", "averlo", "avesse", "avessero", "avessi", "avessimo",
-    "aveste", "avesti", "avete", "aveva", "avevamo", "avevano", "avevate", "avevi", "avevo", "avrai",
-    "avranno", "avrebbe", "avrebbero", "avrei", "avremmo", "avremo", "avreste", "avresti", "avrete", "avrà",
-    "avrò", "avuta", "avute", "avuti", "avuto", "basta", "ben", "bene", "benissimo", "brava",
-    "bravo", "buono", "c", "caso", "cento", "certa", "certe", "certi", "certo", "che",
-    "chi", "chicchessia", "chiunque", "ci", "ciascuna", "ciascuno", "cima", "cinque", "cio", "cioe",
-    "cioè", "circa", "citta", "città", "ciò", "co", "codesta", "codesti", "codesto", "cogli",
-    "coi", "col", "colei", "coll", "coloro", "colui", "come", "cominci", "comprare", "comunque",
-    "con", "concernente", "conclusione", "consecutivi", "consecutivo", "consiglio", "contro", "cortesia", "cos", "cosa",
-    "cosi", "così", "cui", "d", "da", "dagl", "dagli", "dai", "dal", "dall",
-    "dalla", "dalle", "dallo", "dappertutto", "davanti", "degl", "degli", "dei", "del", "dell",
-    "della", "delle", "dello", "dentro", "detto", "deve", "devo", "di", "dice", "dietro",
-    "dire", "dirimpetto", "diventa", "diventare", "diventato", "dopo", "doppio", "dov", "dove", "dovra",
-    "dovrà", "dovunque", "due", "dunque", "durante", "e", "ebbe", "ebbero", "ebbi", "ecc",
-    "ecco", "ed", "effettivamente", "egli", "ella", "entrambi", "eppure", "era", "erano", "eravamo",
-    "eravate", "eri", "ero", "esempio", "esse", "essendo", "esser", "essere", "essi", "ex",
-    "fa", "faccia", "facciamo", "facciano", "facciate", "faccio", "facemmo", "facendo", "facesse", "facessero",
-    "facessi", "facessimo", "faceste", "facesti", "faceva", "facevamo", "facevano", "facevate", "facevi", "facevo",
-    "fai", "fanno", "farai", "faranno", "fare", "farebbe", "farebbero", "farei", "faremmo", "faremo",
-    "fareste", "faresti", "farete", "farà", "farò", "fatto", "favore", "fece", "fecero", "feci",
-    "fin", "finalmente", "finche", "fine", "fino", "forse", "forza", "fosse", "fossero", "fossi",
-    "fossimo", "foste", "fosti", "fra", "frattempo", "fu", "fui", "fummo", "fuori", "furono",
-    "futuro", "generale", "gente", "gia", "giacche", "giorni", "giorno", "giu", "già", "gli",
-    "gliela", "gliele", "glieli", "glielo", "gliene", "grande", "grazie", "gruppo", "ha", "haha",
-    "hai", "hanno", "ho", "i", "ie", "ieri", "il", "improvviso", "in", "inc",
-    "indietro", "infatti", "inoltre", "insieme", "intanto", "intorno", "invece", "io", "l", "la",
-    "lasciato", "lato", "le", "lei", "li", "lo", "lontano", "loro", "lui", "lungo",
-    "luogo", "là", "ma", "macche", "magari", "maggior", "mai", "male", "malgrado", "malissimo",
-    "me", "medesimo", "mediante", "meglio", "meno", "mentre", "mesi", "mezzo", "mi", "mia",
-    "mie", "miei", "mila", "miliardi", "milioni", "minimi", "mio", "modo", "molta", "molti",
-    "moltissimo", "molto", "momento", "mondo", "ne", "negl", "negli", "nei", "nel", "nell",
-    "nella", "nelle", "nello", "nemmeno", "neppure", "nessun", "nessuna", "nessuno", "niente", "no",
-    "noi", "nome", "non", "nondimeno", "nonostante", "nonsia", "nostra", "nostre", "nostri", "nostro",
-    "novanta", "nove", "nulla", "nuovi", "nuovo", "o", "od", "oggi", "ogni", "ognuna",
-    "ognuno", "oltre", "oppure", "ora", "ore", "osi", "ossia", "ottanta", "otto", "paese",
-    "parecchi", "parecchie", "parecchio", "parte", "partendo", "peccato", "peggio", "per", "perche", "perchè",
-    "perché", "percio", "perciò", "perfino", "pero", "persino", "persone", "però", "piedi", "pieno",
-    "piglia", "piu", "piuttosto", "più", "po", "pochissimo", "poco", "poi", "poiche", "possa",
-    "possedere", "posteriore", "posto", "potrebbe", "preferibilmente", "presa", "press", "prima", "primo",
-    "principalmente",
-    "probabilmente", "promesso", "proprio", "puo", "pure", "purtroppo", "può", "qua", "qualche", "qualcosa",
-    "qualcuna", "qualcuno", "quale", "quali", "qualunque", "quando", "quanta", "quante", "quanti", "quanto",
-    "quantunque", "quarto", "quasi", "quattro", "quel", "quella", "quelle", "quelli", "quello", "quest",
-    "questa", "queste", "questi", "questo", "qui", "quindi", "quinto", "realmente", "recente", "recentemente",
-    "registrazione", "relativo", "riecco", "rispetto", "salvo", "sara", "sarai", "saranno", "sarebbe", "sarebbero",
-    "sarei", "saremmo", "saremo", "sareste", "saresti", "sarete", "sarà", "sarò", "scola", "scopo",
-    "scorso", "se", "secondo", "seguente", "seguito", "sei", "sembra", "sembrare", "sembrato", "sembrava",
-    "sembri", "sempre", "senza", "sette", "si", "sia", "siamo", "siano", "siate", "siete",
-    "sig", "solito", "solo", "soltanto", "sono", "sopra", "soprattutto", "sotto", "spesso", "sta",
-    "stai", "stando", "stanno", "starai", "staranno", "starebbe", "starebbero", "starei", "staremmo", "staremo",
-    "stareste", "staresti", "starete", "starà", "starò", "stata", "state", "stati", "stato", "stava",
-    "stavamo", "stavano", "stavate", "stavi", "stavo", "stemmo", "stessa", "stesse", "stessero", "stessi",
-    "stessimo", "stesso", "steste", "stesti", "stette", "stettero", "stetti", "stia", "stiamo", "stiano",
-    "stiate", "sto", "su", "sua", "subito", "successivamente", "successivo", "sue", "sugl", "sugli",
-    "sui", "sul", "sull", "sulla", "sulle", "sullo", "suo", "suoi", "tale", "tali",
-    "talvolta", "tanto", "te", "tempo", "terzo", "th", "ti", "titolo", "tra", "tranne",
-    "tre", "trenta", "triplo", "troppo", "trovato", "tu", "tua", "tue", "tuo", "tuoi",
-    "tutta", "tuttavia", "tutte", "tutti", "tutto", "uguali", "ulteriore", "ultimo", "un", "una",
-    "uno", "uomo", "va", "vai", "vale", "vari", "varia", "varie", "vario", "verso",
-    "vi", "vicino", "visto", "vita", "voi", "volta", "volte", "vostra", "vostre", "vostri",
-    "vostro", "è"
-))
-
-LITHUANIAN = frozenset((
-    "abi", "abidvi", "abiejose", "abiejuose", "abiejø", "abiem", "abigaliai", "abipus", "abu", "abudu",
-    "ai", "ana", "anaiptol", "anaisiais", "anajai", "anajam", "anajame", "anapus", "anas", "anasai",
-    "anasis", "anei", "aniedvi", "anieji", "aniesiems", "anoji", "anojo", "anojoje", "anokia", "anoks",
-    "anosiomis", "anosioms", "anosios", "anosiose", "anot", "ant", "antai", "anuodu", "anuoju", "anuosiuose",
-    "anuosius", "anàja", "anàjà", "anàjá", "anàsias", "anøjø", "apie", "aplink", "ar", "arba",
-    "argi", "arti", "aukðèiau", "að", "be", "bei", "beje", "bemaþ", "bent", "bet",
-    "betgi", "beveik", "dar", "dargi", "daugmaþ", "deja", "dëka", "dël", "dëlei", "dëlto",
-    "ech", "et", "gal", "galbût", "galgi", "gan", "gana", "gi", "greta", "idant",
-    "iki", "ir", "irgi", "it", "itin", "ið", "iðilgai", "iðvis", "jaisiais", "jajai",
-    "jajam", "jajame", "jei", "jeigu", "ji", "jiedu", "jiedvi", "jieji", "jiesiems", "jinai",
-    "jis", "jisai", "jog", "joji", "jojo", "jojoje", "jokia", "joks", "josiomis", "josioms",
-    "josios", "josiose", "judu", "judvi", "juk", "jumis", "jums", "jumyse", "juodu", "juoju",
-    "juosiuose", "juosius", "jus", "jàja", "jàjà", "jàsias", "jájá", "jøjø", "jûs", "jûsiðkis",
-    "jûsiðkë", "jûsø", "kad", "kada", "kadangi", "kai", "kaip", "kaipgi", "kas", "katra",
-    "katras", "katriedvi", "katruodu", "kaþin", "kaþkas", "kaþkatra", "kaþkatras", "kaþkokia", "kaþkoks", "kaþkuri",
-    "kaþkuris", "kiaurai", "kiek", "kiekvienas", "kieno", "kita", "kitas", "kitokia", "kitoks", "kodël",
-    "kokia", "koks", "kol", "kolei", "kone", "kuomet", "kur", "kurgi", "kuri", "kuriedvi",
-    "kuris", "kuriuodu", "lai", "lig", "ligi", "link", "lyg", "man", "manaisiais", "manajai",
-    "manajam", "manajame", "manas", "manasai", "manasis", "mane", "manieji", "maniesiems", "manim", "manimi",
-    "maniðkis", "maniðkë", "mano", "manoji", "manojo", "manojoje", "manosiomis", "manosioms", "manosios", "manosiose",
-    "manuoju", "manuosiuose", "manuosius", "manyje", "manàja", "manàjà", "manàjá", "manàsias", "manæs", "manøjø",
-    "mat", "maþdaug", "maþne", "mes", "mudu", "mudvi", "mumis", "mums", "mumyse", "mus",
-    "mûsiðkis", "mûsiðkë", "mûsø", "na", "nagi", "ne", "nebe", "nebent", "negi", "negu",
-    "nei", "nejau", "nejaugi", "nekaip", "nelyginant", "nes", "net", "netgi", "netoli", "neva",
-    "nors", "nuo", "në", "o", "ogi", "oi", "paeiliui", "pagal", "pakeliui", "palaipsniui",
-    "palei", "pas", "pasak", "paskos", "paskui", "paskum", "pat", "pati", "patiems", "paties",
-    "pats", "patys", "patá", "paèiais", "paèiam", "paèiame", "paèiu", "paèiuose", "paèius", "paèiø",
-    "per", "pernelyg", "pirm", "pirma", "pirmiau", "po", "prie", "prieð", "prieðais", "pro",
-    "pusiau", "rasi", "rodos", "sau", "savaisiais", "savajai", "savajam", "savajame", "savas", "savasai",
-    "savasis", "save", "savieji", "saviesiems", "savimi", "saviðkis", "saviðkë", "savo", "savoji", "savojo",
-    "savojoje", "savosiomis", "savosioms", "savosios", "savosiose", "savuoju", "savuosiuose", "savuosius", "savyje",
-    "savàja",
-    "savàjà", "savàjá", "savàsias", "savæs", "savøjø", "skersai", "skradþiai", "staèiai", "su", "sulig",
-    "ta", "tad", "tai", "taigi", "taip", "taipogi", "taisiais", "tajai", "tajam", "tajame",
-    "tamsta", "tarp", "tarsi", "tartum", "tarytum", "tas", "tasai", "tau", "tavaisiais", "tavajai",
-    "tavajam", "tavajame", "tavas", "tavasai", "tavasis", "tave", "tavieji", "taviesiems", "tavimi", "taviðkis",
-    "taviðkë", "tavo", "tavoji", "tavojo", "tavojoje", "tavosiomis", "tavosioms", "tavosios", "tavosiose", "tavuoju",
-    "tavuosiuose", "tavuosius", "tavyje", "tavàja", "tavàjà", "tavàjá", "tavàsias", "tavæs", "tavøjø", "taèiau",
-    "te", "tegu", "tegul", "tiedvi", "tieji", "ties", "tiesiems", "tiesiog", "tik", "tikriausiai",
-    "tiktai", "toji", "tojo", "tojoje", "tokia", "toks", "tol", "tolei", "toliau", "tosiomis",
-    "tosioms", "tosios", "tosiose", "tu", "tuodu", "tuoju", "tuosiuose", "tuosius", "turbût", "tàja",
-    "tàjà", "tàjá", "tàsias", "tøjø", "tûlas", "uþ", "uþtat", "uþvis", "va", "vai",
-    "viduj", "vidury", "vien", "vienas", "vienokia", "vienoks", "vietoj", "virð", "virðuj", "virðum",
-    "vis", "vis dëlto", "visa", "visas", "visgi", "visokia", "visoks", "vos", "vël", "vëlgi",
-    "ypaè", "á", "ákypai", "ástriþai", "ðalia", "ðe", "ði", "ðiaisiais", "ðiajai", "ðiajam",
-    "ðiajame", "ðiapus", "ðiedvi", "ðieji", "ðiesiems", "ðioji", "ðiojo", "ðiojoje", "ðiokia", "ðioks",
-    "ðiosiomis", "ðiosioms", "ðiosios", "ðiosiose", "ðis", "ðisai", "ðit", "ðita", "ðitas", "ðitiedvi",
-    "ðitokia", "ðitoks", "ðituodu", "ðiuodu", "ðiuoju", "ðiuosiuose", "ðiuosius", "ðiàja", "ðiàjà", "ðiàsias",
-    "ðiøjø", "ðtai", "ðájá", "þemiau"
-))
-
-NEPALI = frozenset((
-    "अक्सर", "अगाडि", "अझै", "अनुसार", "अन्तर्गत", "अन्य", "अन्यत्र", "अन्यथा", "अब", "अरू",
-    "अरूलाई", "अर्को", "अर्थात", "अर्थात्", "अलग", "आए", "आजको", "आठ", "आत्म", "आदि",
-    "आफू", "आफूलाई", "आफैलाई", "आफ्नै", "आफ्नो", "आयो", "उदाहरण", "उन", "उनको", "उनले",
-    "उप", "उहाँलाई", "एउटै", "एक", "एकदम", "औं", "कतै", "कम", "कसरी", "कसै",
-    "कसैले", "कहाँबाट", "कहिलेकाहीं", "कहिल्यै", "कहीं", "का", "कि", "किन", "किनभने", "कुनै",
-    "कुरा", "कृपया", "के", "केहि", "केही", "को", "कोही", "क्रमशः", "गए", "गरि",
-    "गरी", "गरेका", "गरेको", "गरेर", "गरौं", "गर्छ", "गर्छु", "गर्दै", "गर्न", "गर्नु",
-    "गर्नुपर्छ", "गर्ने", "गर्यौं", "गैर", "चाँडै", "चार", "चाले", "चाहनुहुन्छ", "चाहन्छु", "चाहिए",
-    "छ", "छन्", "छु", "छैन", "छौँ", "छौं", "जताततै", "जब", "जबकि", "जसको",
-    "जसबाट", "जसमा", "जसलाई", "जसले", "जस्तै", "जस्तो", "जस्तोसुकै", "जहाँ", "जान", "जाहिर",
-    "जुन", "जे", "जो", "ठीक", "त", "तत्काल", "तथा", "तदनुसार", "तपाइँको", "तपाईं",
-    "तर", "तल", "तापनि", "तिनी", "तिनीहरू", "तिनीहरूको", "तिनीहरूलाई", "तिनीहरूले", "तिमी", "तिर",
-    "ती", "तीन", "तुरुन्तै", "तेस्रो", "त्यसकारण", "त्यसपछि", "त्यसमा", "त्यसैले", "त्यहाँ", "त्यो",
-    "थिए", "थिएन", "थिएनन्", "थियो", "दिए", "दिनुभएको", "दिनुहुन्छ", "दुई", "देख", "देखि",
-    "देखिन्छ", "देखियो", "देखे", "देखेको", "देखेर", "देख्न", "दोश्रो", "दोस्रो", "धेरै", "न",
-    "नजिकै", "नत्र", "नयाँ", "नि", "निम्ति", "निम्न", "निम्नानुसार", "निर्दिष्ट", "नै", "नौ",
-    "पक्का", "पक्कै", "पछि", "पछिल्लो", "पटक", "पनि", "पर्छ", "पर्थ्यो", "पर्याप्त", "पहिले",
-    "पहिलो", "पहिल्यै", "पाँच", "पाँचौं", "पूर्व", "प्रति", "प्रत्येक", "प्लस", "फेरि", "बने",
-    "बन्द", "बन्न", "बरु", "बाटो", "बारे", "बाहिर", "बाहेक", "बीच", "बीचमा", "भए",
-    "भएको", "भन", "भने", "भने्", "भन्छन्", "भन्छु", "भन्दा", "भन्नुभयो", "भन्ने", "भर",
-    "भित्र", "भित्री", "म", "मलाई", "मा", "मात्र", "माथि", "मुख्य", "मेरो", "यति",
-    "यथोचित", "यदि", "यद्यपि", "यस", "यसको", "यसपछि", "यसबाहेक", "यसरी", "यसो", "यस्तो",
-    "यहाँ", "यहाँसम्म", "या", "यी", "यो", "र", "रही", "रहेका", "रहेको", "राखे",
-    "राख्छ", "राम्रो", "रूप", "लगभग", "लाई", "लागि", "ले", "वरिपरि", "वास्तवमा", "वाहेक",
-    "विरुद्ध", "विशेष", "शायद", "सँग", "सँगै", "सक्छ", "सट्टा", "सधैं", "सबै", "सबैलाई",
-    "समय", "सम्भव", "सम्म", "सही", "साँच्चै", "सात", "साथ", "साथै", "सायद", "सारा",
-    "से", "सो", "सोध्न", "सोही", "स्पष्ट", "हरे", "हरेक", "हामी", "हामीलाई", "हाम्रो",
-    "हुँ", "हुन", "हुने", "हुनेछ", "हुन्", "हुन्छ", "हो", "होइन", "होइनन्", "होला",
-    "होस्"
-))
-
-NORWEGIAN = frozenset((
-    "alle", "andre", "arbeid", "at", "av", "bare", "begge", "ble", "blei", "bli",
-    "blir", "blitt", "bort", "bra", "bruke", "både", "båe", "da", "de", "deg",
-    "dei", "deim", "deira", "deires", "dem", "den", "denne", "der", "dere", "deres",
-    "det", "dette", "di", "din", "disse", "ditt", "du", "dykk", "dykkar", "då",
-    "eg", "ein", "eit", "eitt", "eller", "elles", "en", "ene", "eneste", "enhver",
-    "enn", "er", "et", "ett", "etter", "folk", "for", "fordi", "forsûke", "fra",
-    "få", "før", "fûr", "fûrst", "gjorde", "gjûre", "god", "gå", "ha", "hadde",
-    "han", "hans", "har", "hennar", "henne", "hennes", "her", "hjå", "ho", "hoe",
-    "honom", "hoss", "hossen", "hun", "hva", "hvem", "hver", "hvilke", "hvilken", "hvis",
-    "hvor", "hvordan", "hvorfor", "i", "ikke", "ikkje", "ingen", "ingi", "inkje", "inn",
-    "innen", "inni", "ja", "jeg", "kan", "kom", "korleis", "korso", "kun", "kunne",
-    "kva", "kvar", "kvarhelst", "kven", "kvi", "kvifor", "lage", "lang", "lik", "like",
-    "makt", "man", "mange", "me", "med", "medan", "meg", "meget", "mellom", "men",
-    "mens", "mer", "mest", "mi", "min", "mine", "mitt", "mot", "mye", "mykje",
-    "må", "måte", "navn", "ned", "nei", "no", "noe", "noen", "noka", "noko",
-    "nokon", "nokor", "nokre", "ny", "nå", "når", "og", "også", "om", "opp",
-    "oss", "over", "part", "punkt", "på", "rett", "riktig", "samme", "sant", "seg",
-    "selv", "si", "sia", "sidan", "siden", "sin", "sine", "sist", "sitt", "sjøl",
-    "skal", "skulle", "slik", "slutt", "so", "som", "somme", "somt", "start", "stille",
-    "så", "sånn", "tid", "til", "tilbake", "tilstand", "um", "under", "upp", "ut",
-    "uten", "var", "vart", "varte", "ved", "verdi", "vere", "verte", "vi", "vil",
-    "ville", "vite", "vore", "vors", "vort", "vår", "være", "vært", "vöre", "vört",
-    "å"
-))
-
-PORTUGUESE = frozenset((
-    "a", "acerca", "adeus", "agora", "ainda", "alem", "algmas", "algo", "algumas", "alguns",
-    "ali", "além", "ambas", "ambos", "ano", "anos", "antes", "ao", "aonde", "aos",
-    "apenas", "apoio", "apontar", "apos", "após", "aquela", "aquelas", "aquele", "aqueles", "aqui",
-    "aquilo", "as", "assim", "através", "atrás", "até", "aí", "baixo", "bastante", "bem",
-    "boa", "boas", "bom", "bons", "breve", "cada", "caminho", "catorze", "cedo", "cento",
-    "certamente", "certeza", "cima", "cinco", "coisa", "com", "como", "comprido", "conhecido", "conselho",
-    "contra", "contudo", "corrente", "cuja", "cujas", "cujo", "cujos", "custa", "cá", "da",
-    "daquela", "daquelas", "daquele", "daqueles", "dar", "das", "de", "debaixo", "dela", "delas",
-    "dele", "deles", "demais", "dentro", "depois", "desde", "desligado", "dessa", "dessas", "desse",
-    "desses", "desta", "destas", "deste", "destes", "deve", "devem", "deverá", "dez", "dezanove",
-    "dezasseis", "dezassete", "dezoito", "dia", "diante", "direita", "dispoe", "dispoem", "diversa", "diversas",
-    "diversos", "diz", "dizem", "dizer", "do", "dois", "dos", "doze", "duas", "durante",
-    "dá", "dão", "dúvida", "e", "ela", "elas", "ele", "eles", "em", "embora",
-    "enquanto", "entao", "entre", "então", "era", "eram", "essa", "essas", "esse", "esses",
-    "esta", "estado", "estamos", "estar", "estará", "estas", "estava", "estavam", "este", "esteja",
-    "estejam", "estejamos", "estes", "esteve", "estive", "estivemos", "estiver", "estivera", "estiveram", "estiverem",
-    "estivermos", "estivesse", "estivessem", "estiveste", "estivestes", "estivéramos", "estivéssemos", "estou", "está",
-    "estás",
-    "estávamos", "estão", "eu", "exemplo", "falta", "fará", "favor", "faz", "fazeis", "fazem",
-    "fazemos", "fazer", "fazes", "fazia", "faço", "fez", "fim", "final", "foi", "fomos",
-    "for", "fora", "foram", "forem", "forma", "formos", "fosse", "fossem", "foste", "fostes",
-    "fui", "fôramos", "fôssemos", "geral", "grande", "grandes", "grupo", "ha", "haja", "hajam",
-    "hajamos", "havemos", "havia", "hei", "hoje", "hora", "horas", "houve", "houvemos", "houver",
-    "houvera", "houveram", "houverei", "houverem", "houveremos", "houveria", "houveriam", "houvermos", "houverá",
-    "houverão",
-    "houveríamos", "houvesse", "houvessem", "houvéramos", "houvéssemos", "há", "hão", "iniciar", "inicio", "ir",
-    "irá", "isso", "ista", "iste", "isto", "já", "lado", "lhe", "lhes", "ligado",
-    "local", "logo", "longe", "lugar", "lá", "maior", "maioria", "maiorias", "mais", "mal",
-    "mas", "me", "mediante", "meio", "menor", "menos", "meses", "mesma", "mesmas", "mesmo",
-    "mesmos", "meu", "meus", "mil", "minha", "minhas", "momento", "muito", "muitos", "máximo",
-    "mês", "na", "nada", "nao", "naquela", "naquelas", "naquele", "naqueles", "nas", "nem",
-    "nenhuma", "nessa", "nessas", "nesse", "nesses", "nesta", "nestas", "neste", "nestes", "no",
-    "noite", "nome", "nos", "nossa", "nossas", "nosso", "nossos", "nova", "novas", "nove",
-    "novo", "novos", "num", "numa", "numas", "nunca", "nuns", "não", "nível", "nós",
-    "número", "o", "obra", "obrigada", "obrigado", "oitava", "oitavo", "oito", "onde", "ontem",
-    "onze", "os", "ou", "outra", "outras", "outro", "outros", "para", "parece", "parte",
-    "partir", "paucas", "pegar", "pela", "pelas", "pelo", "pelos", "perante", "perto", "pessoas",
-    "pode", "podem", "poder", "poderá", "podia", "pois", "ponto", "pontos", "por", "porque",
-    "porquê", "portanto", "posição", "possivelmente", "posso", "possível", "pouca", "pouco", "poucos", "povo",
-    "primeira", "primeiras", "primeiro", "primeiros", "promeiro", "propios", "proprio", "própria", "próprias",
-    "próprio",
-    "próprios", "próxima", "próximas", "próximo", "próximos", "puderam", "pôde", "põe", "põem", "quais",
-    "qual", "qualquer", "quando", "quanto", "quarta", "quarto", "quatro", "que", "quem", "quer",
-    "quereis", "querem", "queremas", "queres", "quero", "questão", "quieto", "quinta", "quinto", "quinze",
-    "quáis", "quê", "relação", "sabe", "sabem", "saber", "se", "segunda", "segundo", "sei",
-    "seis", "seja", "sejam", "sejamos", "sem", "sempre", "sendo", "ser", "serei", "seremos",
-    "seria", "seriam", "será", "serão", "seríamos", "sete", "seu", "seus", "sexta", "sexto",
-    "sim", "sistema", "sob", "sobre", "sois", "somente", "somos", "sou", "sua", "suas",
-    "são", "sétima", "sétimo", "só", "tal", "talvez", "tambem", "também", "tanta", "tantas",
-    "tanto", "tarde", "te", "tem", "temos", "tempo", "tendes", "tenha", "tenham", "tenhamos",
-    "tenho", "tens", "tentar", "tentaram", "tente", "tentei", "ter", "terceira", "terceiro", "terei",
-    "teremos", "teria", "teriam", "terá", "terão", "teríamos", "teu", "teus", "teve", "tinha",
-    "tinham", "tipo", "tive", "tivemos", "tiver", "tivera", "tiveram", "tiverem", "tivermos", "tivesse",
-    "tivessem", "tiveste", "tivestes", "tivéramos", "tivéssemos", "toda", "todas", "todo", "todos", "trabalhar",
-    "trabalho", "treze", "três", "tu", "tua", "tuas", "tudo", "tão", "tém", "têm",
-    "tínhamos", "um", "uma", "umas", "uns", "usa", "usar", "vai", "vais", "valor",
-    "veja", "vem", "vens", "ver", "verdade", "verdadeiro", "vez", "vezes", "viagem", "vindo",
-    "vinte", "você", "vocês", "vos", "vossa", "vossas", "vosso", "vossos", "vários", "vão",
-    "vêm", "vós", "zero", "à", "às", "área", "é", "éramos", "és", "último"
-))
-
-ROMANIAN = frozenset((
-    "a", "abia", "acea", "aceasta", "această", "aceea", "aceeasi", "acei", "aceia", "acel",
-    "acela", "acelasi", "acele", "acelea", "acest", "acesta", "aceste", "acestea", "acestei", "acestia",
-    "acestui", "aceşti", "aceştia", "acolo", "acord", "acum", "adica", "ai", "aia", "aibă",
-    "aici", "aiurea", "al", "ala", "alaturi", "ale", "alea", "alt", "alta", "altceva",
-    "altcineva", "alte", "altfel", "alti", "altii", "altul", "am", "anume", "apoi", "ar",
-    "are", "as", "asa", "asemenea", "asta", "astazi", "astea", "astfel", "astăzi", "asupra",
-    "atare", "atat", "atata", "atatea", "atatia", "ati", "atit", "atita", "atitea", "atitia",
-    "atunci", "au", "avea", "avem", "aveţi", "avut", "azi", "aş", "aşadar", "aţi",
-    "b", "ba", "bine", "bucur", "bună", "c", "ca", "cam", "cand", "capat",
-    "care", "careia", "carora", "caruia", "cat", "catre", "caut", "ce", "cea", "ceea",
-    "cei", "ceilalti", "cel", "cele", "celor", "ceva", "chiar", "ci", "cinci", "cind",
-    "cine", "cineva", "cit", "cita", "cite", "citeva", "citi", "citiva", "conform", "contra",
-    "cu", "cui", "cum", "cumva", "curând", "curînd", "când", "cât", "câte", "câtva",
-    "câţi", "cînd", "cît", "cîte", "cîtva", "cîţi", "că", "căci", "cărei", "căror",
-    "cărui", "către", "d", "da", "daca", "dacă", "dar", "dat", "datorită", "dată",
-    "dau", "de", "deasupra", "deci", "decit", "degraba", "deja", "deoarece", "departe", "desi",
-    "despre", "deşi", "din", "dinaintea", "dintr", "dintr-", "dintre", "doar", "doi", "doilea",
-    "două", "drept", "dupa", "după", "dă", "e", "ea", "ei", "el", "ele",
-    "era", "eram", "este", "eu", "exact", "eşti", "f", "face", "fara", "fata",
-    "fel", "fi", "fie", "fiecare", "fii", "fim", "fiu", "fiţi", "foarte", "fost",
-    "frumos", "fără", "g", "geaba", "graţie", "h", "halbă", "i", "ia", "iar",
-    "ieri", "ii", "il", "imi", "in", "inainte", "inapoi", "inca", "incit", "insa",
-    "intr", "intre", "isi", "iti", "j", "k", "l", "la", "le", "li",
-    "lor", "lui", "lângă", "lîngă", "m", "ma", "mai", "mare", "mea", "mei",
-    "mele", "mereu", "meu", "mi", "mie", "mine", "mod", "mult", "multa", "multe",
-    "multi", "multă", "mulţi", "mulţumesc", "mâine", "mîine", "mă", "n", "ne", "nevoie",
-    "ni", "nici", "niciodata", "nicăieri", "nimeni", "nimeri", "nimic", "niste", "nişte", "noastre",
-    "noastră", "noi", "noroc", "nostri", "nostru", "nou", "noua", "nouă", "noştri", "nu",
-    "numai", "o", "opt", "or", "ori", "oricare", "orice", "oricine", "oricum", "oricând",
-    "oricât", "oricînd", "oricît", "oriunde", "p", "pai", "parca", "patra", "patru", "patrulea",
-    "pe", "pentru", "peste", "pic", "pina", "plus", "poate", "pot", "prea", "prima",
-    "primul", "prin", "printr-", "putini", "puţin", "puţina", "puţină", "până", "pînă", "r",
-    "rog", "s", "sa", "sa-mi", "sa-ti", "sai", "sale", "sau", "se", "si",
-    "sint", "sintem", "spate", "spre", "sub", "sunt", "suntem", "sunteţi", "sus", "sută",
-    "sînt", "sîntem", "sînteţi", "să", "săi", "său", "t", "ta", "tale", "te",
-    "ti", "timp", "tine", "toata", "toate", "toată", "tocmai", "tot", "toti", "totul",
-    "totusi", "totuşi", "toţi", "trei", "treia", "treilea", "tu", "tuturor", "tăi", "tău",
-    "u", "ul", "ului", "un", "una", "unde", "undeva", "unei", "uneia", "unele",
-    "uneori", "unii", "unor", "unora", "unu", "unui", "unuia", "unul", "v", "va",
-    "vi", "voastre", "voastră", "voi", "vom", "vor", "vostru", "vouă", "voştri", "vreme",
-    "vreo", "vreun", "vă", "x", "z", "zece", "zero", "zi", "zice", "îi",
-    "îl", "îmi", "împotriva", "în", "înainte", "înaintea", "încotro", "încât", "încît", "între",
-    "întrucât", "întrucît", "îţi", "ăla", "ălea", "ăsta", "ăstea", "ăştia", "şapte", "şase",
-    "şi", "ştiu", "ţi", "ţie"
-))
-
-RUSSIAN = frozenset((
-    "c", "а", "алло", "без", "белый", "близко", "более", "больше", "большой", "будем",
-    "будет", "будете", "будешь", "будто", "буду", "будут", "будь", "бы", "бывает", "бывь",
-    "был", "была", "были", "было", "быть", "в", "важная", "важное", "важные", "важный",
-    "вам", "вами", "вас", "ваш", "ваша", "ваше", "ваши", "вверх", "вдали", "вдруг",
-    "ведь", "везде", "вернуться", "весь", "вечер", "взгляд", "взять", "вид", "видел", "видеть",
-    "вместе", "вне", "вниз", "внизу", "во", "вода", "война", "вокруг", "вон", "вообще",
-    "вопрос", "восемнадцатый", "восемнадцать", "восемь", "восьмой", "вот", "впрочем", "времени", "время", "все",
-    "все еще", "всегда", "всего", "всем", "всеми", "всему", "всех", "всею", "всю", "всюду",
-    "вся", "всё", "второй", "вы", "выйти", "г", "где", "главный", "глаз", "говорил",
-    "говорит", "говорить", "год", "года", "году", "голова", "голос", "город", "да", "давать",
-    "давно", "даже", "далекий", "далеко", "дальше", "даром", "дать", "два", "двадцатый", "двадцать",
-    "две", "двенадцатый", "двенадцать", "дверь", "двух", "девятнадцатый", "девятнадцать", "девятый", "девять",
-    "действительно",
-    "дел", "делал", "делать", "делаю", "дело", "день", "деньги", "десятый", "десять", "для",
-    "до", "довольно", "долго", "должен", "должно", "должный", "дом", "дорога", "друг", "другая",
-    "другие", "других", "друго", "другое", "другой", "думать", "душа", "е", "его", "ее",
-    "ей", "ему", "если", "есть", "еще", "ещё", "ею", "её", "ж", "ждать",
-    "же", "жена", "женщина", "жизнь", "жить", "за", "занят", "занята", "занято", "заняты",
-    "затем", "зато", "зачем", "здесь", "земля", "знать", "значит", "значить", "и", "иди",
-    "идти", "из", "или", "им", "имеет", "имел", "именно", "иметь", "ими", "имя",
-    "иногда", "их", "к", "каждая", "каждое", "каждые", "каждый", "кажется", "казаться", "как",
-    "какая", "какой", "кем", "книга", "когда", "кого", "ком", "комната", "кому", "конец",
-    "конечно", "которая", "которого", "которой", "которые", "который", "которых", "кроме", "кругом", "кто",
-    "куда", "лежать", "лет", "ли", "лицо", "лишь", "лучше", "любить", "люди", "м",
-    "маленький", "мало", "мать", "машина", "между", "меля", "менее", "меньше", "меня", "место",
-    "миллионов", "мимо", "минута", "мир", "мира", "мне", "много", "многочисленная", "многочисленное", "многочисленные",
-    "многочисленный", "мной", "мною", "мог", "могу", "могут", "мож", "может", "может быть", "можно",
-    "можхо", "мои", "мой", "мор", "москва", "мочь", "моя", "моё", "мы", "на",
-    "наверху", "над", "надо", "назад", "наиболее", "найти", "наконец", "нам", "нами", "народ",
-    "нас", "начала", "начать", "наш", "наша", "наше", "наши", "не", "него", "недавно",
-    "недалеко", "нее", "ней", "некоторый", "нельзя", "нем", "немного", "нему", "непрерывно", "нередко",
-    "несколько", "нет", "нею", "неё", "ни", "нибудь", "ниже", "низко", "никакой", "никогда",
-    "никто", "никуда", "ним", "ними", "них", "ничего", "ничто", "но", "новый", "нога",
-    "ночь", "ну", "нужно", "нужный", "нх", "о", "об", "оба", "обычно", "один",
-    "одиннадцатый", "одиннадцать", "однажды", "однако", "одного", "одной", "оказаться", "окно", "около", "он",
-    "она", "они", "оно", "опять", "особенно", "остаться", "от", "ответить", "отец", "откуда",
-    "отовсюду", "отсюда", "очень", "первый", "перед", "писать", "плечо", "по", "под", "подойди",
-    "подумать", "пожалуйста", "позже", "пойти", "пока", "пол", "получить", "помнить", "понимать", "понять",
-    "пор", "пора", "после", "последний", "посмотреть", "посреди", "потом", "потому", "почему", "почти",
-    "правда", "прекрасно", "при", "про", "просто", "против", "процентов", "путь", "пятнадцатый", "пятнадцать",
-    "пятый", "пять", "работа", "работать", "раз", "разве", "рано", "раньше", "ребенок", "решить",
-    "россия", "рука", "русский", "ряд", "рядом", "с", "с кем", "сам", "сама", "сами",
-    "самим", "самими", "самих", "само", "самого", "самой", "самом", "самому", "саму", "самый",
-    "свет", "свое", "своего", "своей", "свои", "своих", "свой", "свою", "сделать", "сеаой",
-    "себе", "себя", "сегодня", "седьмой", "сейчас", "семнадцатый", "семнадцать", "семь", "сидеть", "сила",
-    "сих", "сказал", "сказала", "сказать", "сколько", "слишком", "слово", "случай", "смотреть", "сначала",
-    "снова", "со", "собой", "собою", "советский", "совсем", "спасибо", "спросить", "сразу", "стал",
-    "старый", "стать", "стол", "сторона", "стоять", "страна", "суть", "считать", "т", "та",
-    "так", "такая", "также", "таки", "такие", "такое", "такой", "там", "твои", "твой",
-    "твоя", "твоё", "те", "тебе", "тебя", "тем", "теми", "теперь", "тех", "то",
-    "тобой", "тобою", "товарищ", "тогда", "того", "тоже", "только", "том", "тому", "тот",
-    "тою", "третий", "три", "тринадцатый", "тринадцать", "ту", "туда", "тут", "ты", "тысяч",
-    "у", "увидеть", "уж", "уже", "улица", "уметь", "утро", "хороший", "хорошо", "хотел бы",
-    "хотеть", "хоть", "хотя", "хочешь", "час", "часто", "часть", "чаще", "чего", "человек",
-    "чем", "чему", "через", "четвертый", "четыре", "четырнадцатый", "четырнадцать", "что", "чтоб", "чтобы",
-    "чуть", "шестнадцатый", "шестнадцать", "шестой", "шесть", "эта", "эти", "этим", "этими", "этих",
-    "это", "этого", "этой", "этом", "этому", "этот", "эту", "я", "являюсь"
-))
-
-SERBIAN = frozenset((
-    "a", "ako", "ali", "bi", "bih", "bila", "bili", "bilo", "bio", "bismo",
-    "biste", "biti", "bumo", "da", "do", "duž", "ga", "hoće", "hoćemo", "hoćete",
-    "hoćeš", "hoću", "i", "iako", "ih", "ili", "iz", "ja", "je", "jedna",
-    "jedne", "jedno", "jer", "jesam", "jesi", "jesmo", "jest", "jeste", "jesu", "jim",
-    "joj", "još", "ju", "kada", "kako", "kao", "koja", "koje", "koji", "kojima",
-    "koju", "kroz", "li", "me", "mene", "meni", "mi", "mimo", "moj", "moja",
-    "moje", "mu", "na", "nad", "nakon", "nam", "nama", "nas", "naš", "naša",
-    "naše", "našeg", "ne", "nego", "neka", "neki", "nekog", "neku", "nema", "netko",
-    "neće", "nećemo", "nećete", "nećeš", "neću", "nešto", "ni", "nije", "nikoga", "nikoje",
-    "nikoju", "nisam", "nisi", "nismo", "niste", "nisu", "njega", "njegov", "njegova", "njegovo",
-    "njemu", "njezin", "njezina", "njezino", "njih", "njihov", "njihova", "njihovo", "njim", "njima",
-    "njoj", "nju", "no", "o", "od", "odmah", "on", "ona", "oni", "ono",
-    "ova", "pa", "pak", "po", "pod", "pored", "prije", "s", "sa", "sam",
-    "samo", "se", "sebe", "sebi", "si", "smo", "ste", "su", "sve", "svi",
-    "svog", "svoj", "svoja", "svoje", "svom", "ta", "tada", "taj", "tako", "te",
-    "tebe", "tebi", "ti", "to", "toj", "tome", "tu", "tvoj", "tvoja", "tvoje",
-    "u", "uz", "vam", "vama", "vas", "vaš", "vaša", "vaše", "već", "vi",
-    "vrlo", "za", "zar", "će", "ćemo", "ćete", "ćeš", "ću", "što"
-))
-
-SPANISH = frozenset((
-    "0", "1", "2", "3", "4", "5", "6", "7", "8", "9",
-    "_", "a", "actualmente", "acuerdo", "adelante", "ademas", "además", "adrede", "afirmó", "agregó",
-    "ahi", "ahora", "ahí", "al", "algo", "alguna", "algunas", "alguno", "algunos", "algún",
-    "alli", "allí", "alrededor", "ambos", "ampleamos", "antano", "antaño", "ante", "anterior", "antes",
-    "apenas", "aproximadamente", "aquel", "aquella", "aquellas", "aquello", "aquellos", "aqui", "aquél", "aquélla",
-    "aquéllas", "aquéllos", "aquí", "arriba", "arribaabajo", "aseguró", "asi", "así", "atras", "aun",
-    "aunque", "ayer", "añadió", "aún", "b", "bajo", "bastante", "bien", "breve", "buen",
-    "buena", "buenas", "bueno", "buenos", "c", "cada", "casi", "cerca", "cierta", "ciertas",
-    "cierto", "ciertos", "cinco", "claro", "comentó", "como", "con", "conmigo", "conocer", "conseguimos",
-    "conseguir", "considera", "consideró", "consigo", "consigue", "consiguen", "consigues", "contigo", "contra",
-    "cosas",
-    "creo", "cual", "cuales", "cualquier", "cuando", "cuanta", "cuantas", "cuanto", "cuantos", "cuatro",
-    "cuenta", "cuál", "cuáles", "cuándo", "cuánta", "cuántas", "cuánto", "cuántos", "cómo", "d",
-    "da", "dado", "dan", "dar", "de", "debajo", "debe", "deben", "debido", "decir",
-    "dejó", "del", "delante", "demasiado", "demás", "dentro", "deprisa", "desde", "despacio", "despues",
-    "después", "detras", "detrás", "dia", "dias", "dice", "dicen", "dicho", "dieron", "diferente",
-    "diferentes", "dijeron", "dijo", "dio", "donde", "dos", "durante", "día", "días", "dónde",
-    "e", "ejemplo", "el", "ella", "ellas", "ello", "ellos", "embargo", "empleais", "emplean",
-    "emplear", "empleas", "empleo", "en", "encima", "encuentra", "enfrente", "enseguida", "entonces", "entre",
-    "era", "erais", "eramos", "eran", "eras", "eres", "es", "esa", "esas", "ese",
-    "eso", "esos", "esta", "estaba", "estabais", "estaban", "estabas", "estad", "estada", "estadas",
-    "estado", "estados", "estais", "estamos", "estan", "estando", "estar", "estaremos", "estará", "estarán",
-    "estarás", "estaré", "estaréis", "estaría", "estaríais", "estaríamos", "estarían", "estarías", "estas", "este",
-    "estemos", "esto", "estos", "estoy", "estuve", "estuviera", "estuvierais", "estuvieran", "estuvieras", "estuvieron",
-    "estuviese", "estuvieseis", "estuviesen", "estuvieses", "estuvimos", "estuviste", "estuvisteis", "estuviéramos",
-    "estuviésemos", "estuvo",
-    "está", "estábamos", "estáis", "están", "estás", "esté", "estéis", "estén", "estés", "ex",
-    "excepto", "existe", "existen", "explicó", "expresó", "f", "fin", "final", "fue", "fuera",
-    "fuerais", "fueran", "fueras", "fueron", "fuese", "fueseis", "fuesen", "fueses", "fui", "fuimos",
-    "fuiste", "fuisteis", "fuéramos", "fuésemos", "g", "general", "gran", "grandes", "gueno", "h",
-    "ha", "haber", "habia", "habida", "habidas", "habido", "habidos", "habiendo", "habla", "hablan",
-    "habremos", "habrá", "habrán", "habrás", "habré", "habréis", "habría", "habríais", "habríamos", "habrían",
-    "habrías", "habéis", "había", "habíais", "habíamos", "habían", "habías", "hace", "haceis", "hacemos",
-    "hacen", "hacer", "hacerlo", "haces", "hacia", "haciendo", "hago", "han", "has", "hasta",
-    "hay", "haya", "hayamos", "hayan", "hayas", "hayáis", "he", "hecho", "hemos", "hicieron",
-    "hizo", "horas", "hoy", "hube", "hubiera", "hubierais", "hubieran", "hubieras", "hubieron", "hubiese",
-    "hubieseis", "hubiesen", "hubieses", "hubimos", "hubiste", "hubisteis", "hubiéramos", "hubiésemos", "hubo", "i",
-    "igual", "incluso", "indicó", "informo", "informó", "intenta", "intentais", "intentamos", "intentan", "intentar",
-    "intentas", "intento", "ir", "j", "junto", "k", "l", "la", "lado", "largo",
-    "las", "le", "lejos", "les", "llegó", "lleva", "llevar", "lo", "los", "luego",
-    "lugar", "m", "mal", "manera", "manifestó", "mas", "mayor", "me", "mediante", "medio",
-    "mejor", "mencionó", "menos", "menudo", "mi", "mia", "mias", "mientras", "mio", "mios",
-    "mis", "misma", "mismas", "mismo", "mismos", "modo", "momento", "mucha", "muchas", "mucho",
-    "muchos", "muy", "más", "mí", "mía", "mías", "mío", "míos", "n", "nada",
-    "nadie", "ni", "ninguna", "ningunas", "ninguno", "ningunos", "ningún", "no", "nos", "nosotras",
-    "nosotros", "nuestra", "nuestras", "nuestro", "nuestros", "nueva", "nuevas", "nuevo", "nuevos", "nunca",
-    "o", "ocho", "os", "otra", "otras", "otro", "otros", "p", "pais", "para",
-    "parece", "parte", "partir", "pasada", "pasado", "paìs", "peor", "pero", "pesar", "poca",
-    "pocas", "poco", "pocos", "podeis", "podemos", "poder", "podria", "podriais", "podriamos", "podrian",
-    "podrias", "podrá", "podrán", "podría", "podrían", "poner", "por", "por qué", "porque", "posible",
-    "primer", "primera", "primero", "primeros", "principalmente", "pronto", "propia", "propias", "propio", "propios",
-    "proximo", "próximo", "próximos", "pudo", "pueda", "puede", "pueden", "puedo", "pues", "q",
-    "qeu", "que", "quedó", "queremos", "quien", "quienes", "quiere", "quiza", "quizas", "quizá",
-    "quizás", "quién", "quiénes", "qué", "r", "raras", "realizado", "realizar", "realizó", "repente",
-    "respecto", "s", "sabe", "sabeis", "sabemos", "saben", "saber", "sabes", "sal", "salvo",
-    "se", "sea", "seamos", "sean", "seas", "segun", "segunda", "segundo", "según", "seis",
-    "ser", "sera", "seremos", "será", "serán", "serás", "seré", "seréis", "sería", "seríais",
-    "seríamos", "serían", "serías", "seáis", "señaló", "si", "sido", "siempre", "siendo", "siete",
-    "sigue", "siguiente", "sin", "sino", "sobre", "sois", "sola", "solamente", "solas", "solo",
-    "solos", "somos", "son", "soy", "soyos", "su", "supuesto", "sus", "suya", "suyas",
-    "suyo", "suyos", "sé", "sí", "sólo", "t", "tal", "tambien", "también", "tampoco",
-    "tan", "tanto", "tarde", "te", "temprano", "tendremos", "tendrá", "tendrán", "tendrás", "tendré",
-    "tendréis", "tendría", "tendríais", "tendríamos", "tendrían", "tendrías", "tened", "teneis", "tenemos", "tener",
-    "tenga", "tengamos", "tengan", "tengas", "tengo", "tengáis", "tenida", "tenidas", "tenido", "tenidos",
-    "teniendo", "tenéis", "tenía", "teníais", "teníamos", "tenían", "tenías", "tercera", "ti", "tiempo",
-    "tiene", "tienen", "tienes", "toda", "todas", "todavia", "todavía", "todo", "todos", "total",
-    "trabaja", "trabajais", "trabajamos", "trabajan", "trabajar", "trabajas", "trabajo", "tras", "trata", "través",
-    "tres", "tu", "tus", "tuve", "tuviera", "tuvierais", "tuvieran", "tuvieras", "tuvieron", "tuviese",
-    "tuvieseis", "tuviesen", "tuvieses", "tuvimos", "tuviste", "tuvisteis", "tuviéramos", "tuviésemos", "tuvo", "tuya",
-    "tuyas", "tuyo", "tuyos", "tú", "u", "ultimo", "un", "una", "unas", "uno",
-    "unos", "usa", "usais", "usamos", "usan", "usar", "usas", "uso", "usted", "ustedes",
-    "v", "va", "vais", "valor", "vamos", "van", "varias", "varios", "vaya", "veces",
-    "ver", "verdad", "verdadera", "verdadero", "vez", "vosotras", "vosotros", "voy", "vuestra", "vuestras",
-    "vuestro", "vuestros", "w", "x", "y", "ya", "yo", "z", "él", "éramos",
-    "ésa", "ésas", "ése", "ésos", "ésta", "éstas", "éste", "éstos", "última", "últimas",
-    "último", "últimos"
-))
-
-SWEDISH = frozenset((
-    "aderton", "adertonde", "adjö", "aldrig", "alla", "allas", "allt", "alltid", "alltså", "andra",
-    "andras", "annan", "annat", "artonde", "artonn", "att", "av", "bakom", "bara", "behöva",
-    "behövas", "behövde", "behövt", "beslut", "beslutat", "beslutit", "bland", "blev", "bli", "blir",
-    "blivit", "bort", "borta", "bra", "bäst", "bättre", "båda", "bådas", "dag", "dagar",
-    "dagarna", "dagen", "de", "del", "delen", "dem", "den", "denna", "deras", "dess",
-    "dessa", "det", "detta", "dig", "din", "dina", "dit", "ditt", "dock", "dom",
-    "du", "där", "därför", "då", "e", "efter", "eftersom", "ej", "elfte", "eller",
-    "elva", "emot", "en", "enkel", "enkelt", "enkla", "enligt", "ens", "er", "era",
-    "ers", "ert", "ett", "ettusen", "fanns", "fem", "femte", "femtio", "femtionde", "femton",
-    "femtonde", "fick", "fin", "finnas", "finns", "fjorton", "fjortonde", "fjärde", "fler", "flera",
-    "flesta", "fram", "framför", "från", "fyra", "fyrtio", "fyrtionde", "få", "får", "fått",
-    "följande", "för", "före", "förlåt", "förra", "första", "genast", "genom", "gick", "gjorde",
-    "gjort", "god", "goda", "godare", "godast", "gott", "gälla", "gäller", "gällt", "gärna",
-    "gå", "går", "gått", "gör", "göra", "ha", "hade", "haft", "han", "hans",
-    "har", "heller", "hellre", "helst", "helt", "henne", "hennes", "hit", "hon", "honom",
-    "hundra", "hundraen", "hundraett", "hur", "här", "hög", "höger", "högre", "högst", "i",
-    "ibland", "icke", "idag", "igen", "igår", "imorgon", "in", "inför", "inga", "ingen",
-    "ingenting", "inget", "innan", "inne", "inom", "inte", "inuti", "ja", "jag", "jo",
-    "ju", "just", "jämfört", "kan", "kanske", "knappast", "kom", "komma", "kommer", "kommit",
-    "kr", "kunde", "kunna", "kunnat", "kvar", "legat", "ligga", "ligger", "lika", "likställd",
-    "likställda", "lilla", "lite", "liten", "litet", "länge", "längre", "längst", "lätt", "lättare",
-    "lättast", "långsam", "långsammare", "långsammast", "långsamt", "långt", "låt", "man", "med", "mej",
-    "mellan", "men", "mer", "mera", "mest", "mig", "min", "mina", "mindre", "minst",
-    "mitt", "mittemot", "mot", "mycket", "många", "måste", "möjlig", "möjligen", "möjligt", "möjligtvis",
-    "ned", "nederst", "nedersta", "nedre", "nej", "ner", "ni", "nio", "nionde", "nittio",
-    "nittionde", "nitton", "nittonde", "nog", "noll", "nr", "nu", "nummer", "när", "nästa",
-    "någon", "någonting", "något", "några", "nån", "nånting", "nåt", "nödvändig", "nödvändiga", "nödvändigt",
-    "nödvändigtvis", "och", "också", "ofta", "oftast", "olika", "olikt", "om", "oss", "på",
-    "rakt", "redan", "rätt", "sa", "sade", "sagt", "samma", "sedan", "senare", "senast",
-    "sent", "sex", "sextio", "sextionde", "sexton", "sextonde", "sig", "sin", "sina", "sist",
-    "sista", "siste", "sitt", "sitta", "sju", "sjunde", "sjuttio", "sjuttionde", "sjutton", "sjuttonde",
-    "själv", "sjätte", "ska", "skall", "skulle", "slutligen", "små", "smått", "snart", "som",
-    "stor", "stora", "stort", "större", "störst", "säga", "säger", "sämre", "sämst", "så",
-    "sådan", "sådana", "sådant", "ta", "tack", "tar", "tidig", "tidigare", "tidigast", "tidigt",
-    "till", "tills", "tillsammans", "tio", "tionde", "tjugo", "tjugoen", "tjugoett", "tjugonde", "tjugotre",
-    "tjugotvå", "tjungo", "tolfte", "tolv", "tre", "tredje", "trettio", "trettionde", "tretton", "trettonde",
-    "två", "tvåhundra", "under", "upp", "ur", "ursäkt", "ut", "utan", "utanför", "ute",
-    "va", "vad", "var", "vara", "varför", "varifrån", "varit", "varje", "varken", "vars",
-    "varsågod", "vart", "vem", "vems", "verkligen", "vi", "vid", "vidare", "viktig", "viktigare",
-    "viktigast", "viktigt", "vilka", "vilkas", "vilken", "vilket", "vill", "väl", "vänster", "vänstra",
-    "värre", "vår", "våra", "vårt", "än", "ännu", "är", "även", "åt", "åtminstone",
-    "åtta", "åttio", "åttionde", "åttonde", "över", "övermorgon", "överst", "övre"
-))
-
-TAMIL = frozenset((
-    "அங்கு", "அங்கே", "அடுத்த", "அதனால்", "அதன்", "அதற்கு", "அதிக", "அதில்", "அது", "அதே",
-    "அதை", "அந்த", "அந்தக்", "அந்தப்", "அன்று", "அல்லது", "அவன்", "அவரது", "அவர்", "அவர்கள்",
-    "அவள்", "அவை", "ஆகிய", "ஆகியோர்", "ஆகும்", "ஆனால்", "இங்கு", "இங்கே", "இடத்தில்", "இடம்",
-    "இதனால்", "இதனை", "இதன்", "இதற்கு", "இதில்", "இது", "இதை", "இந்த", "இந்தக்", "இந்தத்",
-    "இந்தப்", "இன்னும்", "இப்போது", "இரு", "இருக்கும்", "இருந்த", "இருந்தது", "இருந்து", "இல்லை", "இவர்",
-    "இவை", "உன்", "உள்ள", "உள்ளது", "உள்ளன", "எந்த", "என", "எனக்", "எனக்கு", "எனப்படும்",
-    "எனவும்", "எனவே", "எனினும்", "எனும்", "என்", "என்ன", "என்னும்", "என்பது", "என்பதை", "என்ற",
-    "என்று", "என்றும்", "எல்லாம்", "ஏன்", "ஒரு", "ஒரே", "ஓர்", "கொண்ட", "கொண்டு", "கொள்ள",
-    "சற்று", "சிறு", "சில", "சேர்ந்த", "தனது", "தன்", "தவிர", "தான்", "நான்", "நாம்",
-    "நீ", "பற்றி", "பற்றிய", "பல", "பலரும்", "பல்வேறு", "பின்", "பின்னர்", "பிற", "பிறகு",
-    "பெரும்", "பேர்", "போது", "போன்ற", "போல", "போல்", "மட்டுமே", "மட்டும்", "மற்ற", "மற்றும்",
-    "மிக", "மிகவும்", "மீது", "முதல்", "முறை", "மேலும்", "மேல்", "யார்", "வந்த", "வந்து",
-    "வரும்", "வரை", "வரையில்", "விட", "விட்டு", "வேண்டும்", "வேறு"
-))
-
-TURKISH = frozenset((
-    "acaba", "acep", "adamakıllı", "adeta", "ait", "altmýþ", "altmış", "altý", "altı", "ama",
-    "amma", "anca", "ancak", "arada", "artýk", "aslında", "aynen", "ayrıca", "az", "açıkça",
-    "açıkçası", "bana", "bari", "bazen", "bazý", "bazı", "başkası", "baţka", "belki", "ben",
-    "benden", "beni", "benim", "beri", "beriki", "beþ", "beş", "beţ", "bilcümle", "bile",
-    "bin", "binaen", "binaenaleyh", "bir", "biraz", "birazdan", "birbiri", "birden", "birdenbire", "biri",
-    "birice", "birileri", "birisi", "birkaç", "birkaçı", "birkez", "birlikte", "birçok", "birçoğu", "birþey",
-    "birþeyi", "birşey", "birşeyi", "birţey", "bitevi", "biteviye", "bittabi", "biz", "bizatihi", "bizce",
-    "bizcileyin", "bizden", "bize", "bizi", "bizim", "bizimki", "bizzat", "boşuna", "bu", "buna",
-    "bunda", "bundan", "bunlar", "bunları", "bunların", "bunu", "bunun", "buracıkta", "burada", "buradan",
-    "burası", "böyle", "böylece", "böylecene", "böylelikle", "böylemesine", "böylesine", "büsbütün", "bütün", "cuk",
-    "cümlesi", "da", "daha", "dahi", "dahil", "dahilen", "daima", "dair", "dayanarak", "de",
-    "defa", "dek", "demin", "demincek", "deminden", "denli", "derakap", "derhal", "derken", "deđil",
-    "değil", "değin", "diye", "diđer", "diğer", "diğeri", "doksan", "dokuz", "dolayı", "dolayısıyla",
-    "doğru", "dört", "edecek", "eden", "ederek", "edilecek", "ediliyor", "edilmesi", "ediyor", "elbet",
-    "elbette", "elli", "emme", "en", "enikonu", "epey", "epeyce", "epeyi", "esasen", "esnasında",
-    "etmesi", "etraflı", "etraflıca", "etti", "ettiği", "ettiğini", "evleviyetle", "evvel", "evvela", "evvelce",
-    "evvelden", "evvelemirde", "evveli", "eđer", "eğer", "fakat", "filanca", "gah", "gayet", "gayetle",
-    "gayri", "gayrı", "gelgelelim", "gene", "gerek", "gerçi", "geçende", "geçenlerde", "gibi", "gibilerden",
-    "gibisinden", "gine", "göre", "gırla", "hakeza", "halbuki", "halen", "halihazırda", "haliyle", "handiyse",
-    "hangi", "hangisi", "hani", "hariç", "hasebiyle", "hasılı", "hatta", "hele", "hem", "henüz",
-    "hep", "hepsi", "her", "herhangi", "herkes", "herkesin", "hiç", "hiçbir", "hiçbiri", "hoş",
-    "hulasaten", "iken", "iki", "ila", "ile", "ilen", "ilgili", "ilk", "illa", "illaki",
-    "imdi", "indinde", "inen", "insermi", "ise", "ister", "itibaren", "itibariyle", "itibarıyla", "iyi",
-    "iyice", "iyicene", "için", "iş", "işte", "iţte", "kadar", "kaffesi", "kah", "kala",
-    "kanýmca", "karşın", "katrilyon", "kaynak", "kaçı", "kelli", "kendi", "kendilerine", "kendini", "kendisi",
-    "kendisine", "kendisini", "kere", "kez", "keza", "kezalik", "keşke", "keţke", "ki", "kim",
-    "kimden", "kime", "kimi", "kimisi", "kimse", "kimsecik", "kimsecikler", "külliyen", "kýrk", "kýsaca",
-    "kırk", "kısaca", "lakin", "leh", "lütfen", "maada", "madem", "mademki", "mamafih", "mebni",
-    "međer", "meğer", "meğerki", "meğerse", "milyar", "milyon", "mu", "mü", "mý", "mı",
-    "nasýl", "nasıl", "nasılsa", "nazaran", "naşi", "ne", "neden", "nedeniyle", "nedenle", "nedense",
-    "nerde", "nerden", "nerdeyse", "nere", "nerede", "nereden", "neredeyse", "neresi", "nereye", "netekim",
-    "neye", "neyi", "neyse", "nice", "nihayet", "nihayetinde", "nitekim", "niye", "niçin", "o",
-    "olan", "olarak", "oldu", "olduklarını", "oldukça", "olduğu", "olduğunu", "olmadı", "olmadığı", "olmak",
-    "olması", "olmayan", "olmaz", "olsa", "olsun", "olup", "olur", "olursa", "oluyor", "on",
-    "ona", "onca", "onculayın", "onda", "ondan", "onlar", "onlardan", "onlari", "onlarýn", "onları",
-    "onların", "onu", "onun", "oracık", "oracıkta", "orada", "oradan", "oranca", "oranla", "oraya",
-    "otuz", "oysa", "oysaki", "pek", "pekala", "peki", "pekçe", "peyderpey", "rağmen", "sadece",
-    "sahi", "sahiden", "sana", "sanki", "sekiz", "seksen", "sen", "senden", "seni", "senin",
-    "siz", "sizden", "sizi", "sizin", "sonra", "sonradan", "sonraları", "sonunda", "tabii", "tam",
-    "tamam", "tamamen", "tamamıyla", "tarafından", "tek", "trilyon", "tüm", "var", "vardı", "vasıtasıyla",
-    "ve", "velev", "velhasıl", "velhasılıkelam", "veya", "veyahut", "ya", "yahut", "yakinen", "yakında",
-    "yakından", "yakınlarda", "yalnız", "yalnızca", "yani", "yapacak", "yapmak", "yaptı", "yaptıkları", "yaptığı",
-    "yaptığını", "yapılan", "yapılması", "yapıyor", "yedi", "yeniden", "yenilerde", "yerine", "yetmiþ", "yetmiş",
-    "yetmiţ", "yine", "yirmi", "yok", "yoksa", "yoluyla", "yüz", "yüzünden", "zarfında", "zaten",
-    "zati", "zira", "çabuk", "çabukça", "çeşitli", "çok", "çokları", "çoklarınca", "çokluk", "çoklukla",
-    "çokça", "çoğu", "çoğun", "çoğunca", "çoğunlukla", "çünkü", "öbür", "öbürkü", "öbürü", "önce",
-    "önceden", "önceleri", "öncelikle", "öteki", "ötekisi", "öyle", "öylece", "öylelikle", "öylemesine", "öz",
-    "üzere", "üç", "þey", "þeyden", "þeyi", "þeyler", "þu", "þuna", "þunda", "þundan",
-    "þunu", "şayet", "şey", "şeyden", "şeyi", "şeyler", "şu", "şuna", "şuncacık", "şunda",
-    "şundan", "şunlar", "şunları", "şunu", "şunun", "şura", "şuracık", "şuracıkta", "şurası", "şöyle",
-    "ţayet", "ţimdi", "ţu", "ţöyle"
-))
-
-YIDDISH = frozenset((
-    "א", "אבער", "אדער", "אונ", "אז", "אזױ", "איב", "איז", "אימ", "אינ",
-    "איר", "אלס", "אלע", "אנ", "אפילו", "אױב", "אױכ", "אױס", "אױפ", "ביז",
-    "בײ", "דא", "דאס", "דורכ", "די", "דעמ", "דער", "האב", "האט", "זאל",
-    "זי", "זיכ", "זענ", "זײ", "זײנ", "זײער", "מיט", "מענ", "מער", "נאכ",
-    "נאר", "ניש", "עס", "ער", "פאר", "פונ", "צו", "צומ", "צװיש", "קעג",
-    "קענ", "קײנ", "שױנ", "װאס", "װאר", "װי", "װעט", "װעלכ", "װענ", "װער"
-))
-
-# Maps Snowball stemmer language name -> stopword set
-# porter -> english, dutch_porter -> dutch
-_BUILTIN_STOPWORDS: dict[str, frozenset[str]] = {
-    "arabic": ARABIC,
-    "armenian": ARMENIAN,
-    "basque": BASQUE,
-    "catalan": CATALAN,
-    "danish": DANISH,
-    "dutch": DUTCH,
-    "dutch_porter": DUTCH,
-    "english": ENGLISH,
-    "esperanto": ESPERANTO,
-    "estonian": ESTONIAN,
-    "finnish": FINNISH,
-    "french": FRENCH,
-    "german": GERMAN,
-    "greek": GREEK,
-    "hindi": HINDI,
-    "hungarian": HUNGARIAN,
-    "indonesian": INDONESIAN,
-    "irish": IRISH,
-    "italian": ITALIAN,
-    "lithuanian": LITHUANIAN,
-    "nepali": NEPALI,
-    "norwegian": NORWEGIAN,
-    "porter": ENGLISH,
-    "portuguese": PORTUGUESE,
-    "romanian": ROMANIAN,
-    "russian": RUSSIAN,
-    "serbian": SERBIAN,
-    "spanish": SPANISH,
-    "swedish": SWEDISH,
-    "tamil": TAMIL,
-    "turkish": TURKISH,
-    "yiddish": YIDDISH,
-}
+def __getattr__(name: str) -> FrozenSet[str]:
+    if name in __all__:
+        return load_stop_words(name.lower())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
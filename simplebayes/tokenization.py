@@ -1,57 +1,248 @@
 import re
+import threading
 import unicodedata
-from typing import Callable, List, Set
+import zlib
+from collections import Counter
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Set, TextIO, Union
 
 import snowballstemmer
 
-from simplebayes.stopwords_data import _BUILTIN_STOPWORDS
+from simplebayes.stopwords import load_stop_words
 
 TOKEN_SPLIT_PATTERN = re.compile(r"[^\w]+", re.UNICODE)
+# Last whitespace run in a string; tokens never span whitespace, before or after NFKC
+_TRAILING_SEGMENT_PATTERN = re.compile(r"\s\S*\Z", re.UNICODE)
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+MAX_NGRAM_SIZE = 3
+# FNV-1a 32-bit prime; mixes per-token CRC32 values into a stable n-gram hash
+_NGRAM_HASH_PRIME = 0x01000193
+
+TextSource = Union[str, TextIO, Iterable[str]]
 _STOPWORDS_CACHE: dict[str, Set[str]] = {}
+_TOKENIZER_CACHE: dict[tuple, Callable[[str], List[str]]] = {}
+
+
+class _ThreadLocalStemmer(threading.local):  # pylint: disable=too-few-public-methods
+    """One Snowball stemmer per thread; stemmers keep per-word cursor state and are not thread-safe."""
+
+    def __init__(self, language: str) -> None:
+        super().__init__()
+        self.stemmer = snowballstemmer.stemmer(language)
 
 
 def _get_stop_words(language: str) -> Set[str]:
-    """Return built-in stop words for the language. Empty set if unavailable."""
+    """Return built-in stop words for the language, loading them on first use. Empty set if unavailable."""
     if language in _STOPWORDS_CACHE:
         return _STOPWORDS_CACHE[language]
-    words = set(_BUILTIN_STOPWORDS.get(language, ()))
+    words = set(load_stop_words(language))
     _STOPWORDS_CACHE[language] = words
     return words
 
 
-def create_tokenizer(
+class NgramTokenizer:
+    """
+    Appends word n-grams (sizes 2..max_n) to the unigrams of a base tokenizer.
+
+    Unhashed n-grams are the space-joined unigrams (e.g. "limit offer").
+    With hash_buckets > 0 every n-gram becomes "#<bucket>", so at most
+    hash_buckets distinct n-gram features can ever enter the model. Hashes
+    are built from one CRC32 per unigram, so no n-gram string is assembled.
+    """
+
+    def __init__(
+        self,
+        base: Callable[[str], List[str]],
+        max_n: int = 2,
+        hash_buckets: int = 0,
+    ) -> None:
+        """
+        :param base: Unigram tokenizer the n-grams are built from.
+        :param max_n: Largest n-gram size, 2..MAX_NGRAM_SIZE.
+        :param hash_buckets: Size of the hashed n-gram space. 0 disables hashing.
+        """
+        if not 2 <= max_n <= MAX_NGRAM_SIZE:
+            raise ValueError(f"max_n must be between 2 and {MAX_NGRAM_SIZE}")
+        if hash_buckets < 0:
+            raise ValueError("hash_buckets must be >= 0")
+        self.base = base
+        self.max_n = max_n
+        self.hash_buckets = hash_buckets
+
+    def __call__(self, text: str) -> List[str]:
+        tokens = self.base(text)
+        if len(tokens) < 2:
+            return tokens
+        return tokens + list(self.iter_ngrams(tokens))
+
+    def iter_ngrams(self, tokens: List[str], start: int = 0) -> Iterator[str]:
+        """
+        Yields the n-grams of a unigram list whose last token is at index >= start.
+
+        :param tokens: Unigrams in document order.
+        :param start: Index of the first token whose n-grams are wanted.
+        :return: Iterator of n-gram features.
+        """
+        if self.hash_buckets:
+            hashes = [zlib.crc32(token.encode("utf-8")) for token in tokens]
+            for size in range(2, self.max_n + 1):
+                first = max(0, start - size + 1)
+                for window in zip(*(islice(hashes, first + k, None) for k in range(size))):
+                    value = size
+                    for token_hash in window:
+                        value = ((value ^ token_hash) * _NGRAM_HASH_PRIME) & 0xFFFFFFFF
+                    yield f"#{value % self.hash_buckets}"
+            return
+
+        for size in range(2, self.max_n + 1):
+            first = max(0, start - size + 1)
+            yield from map(" ".join, zip(*(islice(tokens, first + k, None) for k in range(size))))
+
+    def iter_stream_tokens(
+        self,
+        segments: Iterable[str],
+        max_tokens: int = 0,
+        max_token_length: int = 0,
+    ) -> Iterator[str]:
+        """
+        Tokenizes consecutive text segments, including n-grams that span segments.
+
+        :param segments: Text segments cut at whitespace, in document order.
+        :param max_tokens: Stop after this many unigrams in the whole stream. 0 = no limit.
+        :param max_token_length: Drop unigrams longer than this. 0 = no limit.
+        :return: Iterator of unigrams and n-grams.
+        """
+        history: List[str] = []
+        remaining = max_tokens
+        for segment in segments:
+            tokens = self.base(segment)
+            if max_token_length:
+                tokens = [token for token in tokens if len(token) <= max_token_length]
+            if max_tokens:
+                tokens = tokens[:remaining]
+                remaining -= len(tokens)
+            if tokens:
+                yield from tokens
+                window = history + tokens
+                yield from self.iter_ngrams(window, start=len(history))
+                history = window[-(self.max_n - 1):]
+            if max_tokens and not remaining:
+                return
+
+
+def create_tokenizer(  # pylint: disable=too-many-arguments
     language: str = "english",
     remove_stop_words: bool = False,
+    ngrams: int = 1,
+    ngram_hash_buckets: int = 0,
+    *,
+    max_tokens: int = 0,
+    max_token_length: int = 0,
 ) -> Callable[[str], List[str]]:
     """
-    Create a tokenizer with the given language and stop-word settings.
+    Create a tokenizer with the given language, stop-word, n-gram and limit settings.
 
     :param language: Language code for stemmer and stop words (e.g. "english", "spanish").
     :param remove_stop_words: If True, filter out stop words. Default False (backwards compatible).
-    :return: A tokenize function.
+    :param ngrams: Largest word n-gram emitted alongside unigrams (1-3). Default 1 (unigrams only).
+    :param ngram_hash_buckets: When > 0, hash n-grams into this many buckets. Default 0 (no hashing).
+    :param max_tokens: Keep only the first N unigrams of each text; n-grams are built from those.
+        Default 0 (no limit).
+    :param max_token_length: Drop words longer than this many characters before stemming.
+        Default 0 (no limit).
+    :return: A thread-safe tokenize function.
     """
-    stemmer = snowballstemmer.stemmer(language)
+    if not 1 <= ngrams <= MAX_NGRAM_SIZE:
+        raise ValueError(f"ngrams must be between 1 and {MAX_NGRAM_SIZE}")
+    if max_tokens < 0 or max_token_length < 0:
+        raise ValueError("token limits must be >= 0")
+
+    local = _ThreadLocalStemmer(language)
     stop_words: Set[str] = _get_stop_words(language) if remove_stop_words else set()
 
+    def stem_and_filter(raw_tokens: List[str]) -> List[str]:
+        stemmed = local.stemmer.stemWords(raw_tokens)
+        if stop_words:
+            return [t for t in stemmed if t and t not in stop_words]
+        return [t for t in stemmed if t]
+
     def tokenize(text: str) -> List[str]:
         if not text:
             return []
 
         normalized = unicodedata.normalize("NFKC", text).lower()
-        raw_tokens = [
-            t for t in TOKEN_SPLIT_PATTERN.split(normalized) if t
-        ]
+        if max_token_length:
+            raw_tokens = [
+                t for t in TOKEN_SPLIT_PATTERN.split(normalized) if t and len(t) <= max_token_length
+            ]
+        else:
+            raw_tokens = [
+                t for t in TOKEN_SPLIT_PATTERN.split(normalized) if t
+            ]
         if not raw_tokens:
             return []
 
-        stemmed = stemmer.stemWords(raw_tokens)
-        if stop_words:
-            return [t for t in stemmed if t and t not in stop_words]
-        return [t for t in stemmed if t]
+        if not max_tokens:
+            return stem_and_filter(raw_tokens)
 
+        # Only stem as many words as can still fit, so a huge document costs O(max_tokens) stemming
+        tokens: List[str] = []
+        start = 0
+        while len(tokens) < max_tokens and start < len(raw_tokens):
+            needed = max_tokens - len(tokens)
+            tokens.extend(stem_and_filter(raw_tokens[start:start + needed]))
+            start += needed
+        return tokens
+
+    if ngrams > 1:
+        return NgramTokenizer(tokenize, max_n=ngrams, hash_buckets=ngram_hash_buckets)
     return tokenize
 
 
+def get_tokenizer(  # pylint: disable=too-many-arguments
+    language: str = "english",
+    remove_stop_words: bool = False,
+    ngrams: int = 1,
+    ngram_hash_buckets: int = 0,
+    *,
+    max_tokens: int = 0,
+    max_token_length: int = 0,
+) -> Callable[[str], List[str]]:
+    """
+    Return the process-wide shared tokenizer for the given settings, creating it on first use.
+
+    :param language: Language code for stemmer and stop words (e.g. "english", "spanish").
+    :param remove_stop_words: If True, filter out stop words. Default False (backwards compatible).
+    :param ngrams: Largest word n-gram emitted alongside unigrams (1-3). Default 1.
+    :param ngram_hash_buckets: When > 0, hash n-grams into this many buckets. Default 0.
+    :param max_tokens: Keep only the first N unigrams of each text. Default 0 (no limit).
+    :param max_token_length: Drop words longer than this many characters. Default 0 (no limit).
+    :return: A shared, thread-safe tokenize function.
+    """
+    key = (
+        language,
+        bool(remove_stop_words),
+        ngrams,
+        ngram_hash_buckets if ngrams > 1 else 0,
+        max_tokens,
+        max_token_length,
+    )
+    tokenizer = _TOKENIZER_CACHE.get(key)
+    if tokenizer is None:
+        tokenizer = _TOKENIZER_CACHE.setdefault(
+            key,
+            create_tokenizer(
+                language=language,
+                remove_stop_words=remove_stop_words,
+                ngrams=ngrams,
+                ngram_hash_buckets=ngram_hash_buckets,
+                max_tokens=max_tokens,
+                max_token_length=max_token_length,
+            ),
+        )
+    return tokenizer
+
+
 def default_tokenize_text(
     text: str,
     language: str = "english",
@@ -65,6 +256,134 @@ def default_tokenize_text(
     :param remove_stop_words: If True, filter stop words. Default False (backwards compatible).
     :return: List of tokens.
     """
-    return create_tokenizer(language=language, remove_stop_words=remove_stop_words)(
-        text
-    )
+    return get_tokenizer(language=language, remove_stop_words=remove_stop_words)(text)
+
+
+def iter_text_chunks(source: TextSource, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Yields raw text chunks from a string, a readable text stream, or an iterable of strings.
+
+    :param source: str, object with ``read(size)``, or iterable of str chunks.
+    :param chunk_size: Characters requested per ``read`` call on streams.
+    :return: Iterator of non-empty chunks.
+    """
+    if isinstance(source, str):
+        if source:
+            yield source
+        return
+
+    read = getattr(source, "read", None)
+    if read is not None:
+        while True:
+            chunk = read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        for chunk in source:
+            if chunk:
+                yield chunk
+
+
+def iter_text_segments(source: TextSource, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Re-cuts text chunks at whitespace so no token spans two segments.
+
+    Trailing text after the last whitespace in a chunk is carried into the next
+    one, so memory is bounded by the chunk size plus the longest run of
+    non-whitespace characters.
+
+    :param source: str, object with ``read(size)``, or iterable of str chunks.
+    :param chunk_size: Characters requested per ``read`` call on streams.
+    :return: Iterator of segments that can be tokenized independently.
+    """
+    # Carried pieces hold no whitespace, so only the new chunk needs searching.
+    # They are joined once a cut is found, not copied again for every chunk.
+    carry: List[str] = []
+    for chunk in iter_text_chunks(source, chunk_size):
+        match = _TRAILING_SEGMENT_PATTERN.search(chunk)
+        if match is None:
+            carry.append(chunk)
+            continue
+        # Keep the whitespace with the head so casing context (e.g. final sigma) is unchanged
+        cut = match.start() + 1
+        carry.append(chunk[:cut])
+        yield "".join(carry)
+        carry = [chunk[cut:]]
+
+    tail = "".join(carry)
+    if tail:
+        yield tail
+
+
+def limit_tokens(tokens: List[str], max_tokens: int = 0, max_token_length: int = 0) -> List[str]:
+    """
+    Applies per-document token limits to an already tokenized document.
+
+    :param tokens: Tokens in document order.
+    :param max_tokens: Keep only the first N tokens. 0 = no limit.
+    :param max_token_length: Drop tokens longer than this. 0 = no limit.
+    :return: The limited token list.
+    """
+    if max_token_length:
+        tokens = [token for token in tokens if len(token) <= max_token_length]
+    if max_tokens and len(tokens) > max_tokens:
+        tokens = tokens[:max_tokens]
+    return tokens
+
+
+def iter_tokens(
+    tokenizer: Callable[[str], List[str]],
+    source: TextSource,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    max_tokens: int = 0,
+    max_token_length: int = 0,
+) -> Iterator[str]:
+    """
+    Lazily tokenizes a text source segment by segment.
+
+    :param tokenizer: Tokenize function applied to each segment.
+    :param source: str, object with ``read(size)``, or iterable of str chunks.
+    :param chunk_size: Characters requested per ``read`` call on streams.
+    :param max_tokens: Stop reading after this many tokens (unigrams for n-gram
+        tokenizers) in the whole source. 0 = no limit.
+    :param max_token_length: Drop tokens (unigrams for n-gram tokenizers) longer than this. 0 = no limit.
+    :return: Iterator of tokens in document order.
+    """
+    segments = iter_text_segments(source, chunk_size)
+    if isinstance(tokenizer, NgramTokenizer):
+        yield from tokenizer.iter_stream_tokens(segments, max_tokens, max_token_length)
+        return
+
+    tokens: Iterator[str] = (token for segment in segments for token in tokenizer(segment))
+    if max_token_length:
+        tokens = (token for token in tokens if len(token) <= max_token_length)
+    if max_tokens:
+        tokens = islice(tokens, max_tokens)
+    yield from tokens
+
+
+def count_stream_tokens(
+    tokenizer: Callable[[str], List[str]],
+    source: TextSource,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    max_tokens: int = 0,
+    max_token_length: int = 0,
+) -> Dict[str, int]:
+    """
+    Counts token occurrences in a text source without materializing the full text.
+
+    :param tokenizer: Tokenize function applied to each segment.
+    :param source: str, object with ``read(size)``, or iterable of str chunks.
+    :param chunk_size: Characters requested per ``read`` call on streams.
+    :param max_tokens: Stop reading after this many tokens. 0 = no limit.
+    :param max_token_length: Drop tokens longer than this. 0 = no limit.
+    :return: key/value pairs of tokens and their counts.
+    """
+    if max_tokens or max_token_length or isinstance(tokenizer, NgramTokenizer):
+        return dict(Counter(iter_tokens(tokenizer, source, chunk_size, max_tokens, max_token_length)))
+
+    counts: Counter = Counter()
+    for segment in iter_text_segments(source, chunk_size):
+        counts.update(tokenizer(segment))
+    return dict(counts)
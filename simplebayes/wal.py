@@ -0,0 +1,271 @@
+"""
+Append-only write-ahead log of training operations.
+
+Every train, untrain, and flush applied to a classifier with an attached
+log is appended as one framed record:
+
+- ``<IIQB`` header: payload length, CRC32 of the rest of the record,
+  sequence number, operation code
+- payload: compact JSON ``[category, {token: count}]`` (empty for flush)
+
+Records are written to the OS as they are appended and made durable with
+batched ``fsync`` calls (group commit): one sync covers every record
+appended before it, however many threads are waiting. Sequence numbers
+increase by one per record. Snapshots record the last sequence they
+include, so replay after a crash skips records a snapshot already holds
+and compaction can never apply a record twice.
+"""
+import json
+import os
+import struct
+import tempfile
+import threading
+import zlib
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple
+
+from simplebayes.constants import WAL_FLUSH, WAL_TRAIN, WAL_UNTRAIN
+from simplebayes.errors import InvalidModelStateError
+from simplebayes.persistence import resolve_model_path
+
+WAL_MAGIC = b"SBAYESW\x00"
+WAL_VERSION = 1
+
+_OPERATION_CODES = {WAL_TRAIN: 1, WAL_UNTRAIN: 2, WAL_FLUSH: 3}
+_OPERATION_NAMES = {code: name for name, code in _OPERATION_CODES.items()}
+
+_FILE_HEADER = struct.Struct("<8sH6x")
+_RECORD_HEADER = struct.Struct("<IIQB")
+_CHECKED_HEADER = struct.Struct("<QB")
+
+WalRecord = Tuple[int, str, str, Dict[str, int]]
+
+
+def _encode_record(sequence: int, operation: str, category: str, counts: Optional[Dict[str, int]]) -> bytes:
+    payload = b""
+    if operation != WAL_FLUSH:
+        payload = json.dumps([category, counts], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    code = _OPERATION_CODES[operation]
+    checksum = zlib.crc32(payload, zlib.crc32(_CHECKED_HEADER.pack(sequence, code)))
+    return _RECORD_HEADER.pack(len(payload), checksum, sequence, code) + payload
+
+
+def _iter_stream_records(stream: BinaryIO) -> Iterator[Tuple[int, WalRecord]]:
+    """
+    Yields (end offset, record) for each intact record. Stops at the first
+    torn or corrupt record, which is where a crash interrupted an append.
+    """
+    offset = stream.tell()
+    while True:
+        header = stream.read(_RECORD_HEADER.size)
+        if len(header) < _RECORD_HEADER.size:
+            return
+        length, checksum, sequence, code = _RECORD_HEADER.unpack(header)
+        payload = stream.read(length)
+        if (
+            len(payload) < length
+            or code not in _OPERATION_NAMES
+            or zlib.crc32(payload, zlib.crc32(_CHECKED_HEADER.pack(sequence, code))) != checksum
+        ):
+            return
+        category, counts = json.loads(payload.decode("utf-8")) if payload else ("", {})
+        offset += _RECORD_HEADER.size + length
+        yield offset, (sequence, _OPERATION_NAMES[code], category, counts)
+
+
+def _read_file_header(stream: BinaryIO) -> None:
+    header = stream.read(_FILE_HEADER.size)
+    if len(header) < _FILE_HEADER.size:
+        raise InvalidModelStateError("truncated write-ahead log header")
+    magic, version = _FILE_HEADER.unpack(header)
+    if magic != WAL_MAGIC:
+        raise InvalidModelStateError("not a simplebayes write-ahead log")
+    if version != WAL_VERSION:
+        raise InvalidModelStateError(f"unsupported write-ahead log version: {version}")
+
+
+class WriteAheadLog:  # pylint: disable=too-many-instance-attributes
+    """
+    Durable, append-only log of classifier mutations.
+
+    Attach it with ``SimpleBayes.attach_journal`` so every train, untrain,
+    and flush is logged, and fold it into a snapshot with ``compact``.
+    """
+
+    def __init__(self, absolute_path: str, commit_interval: float = 0.0) -> None:
+        """
+        :param absolute_path: log file path; created when missing.
+        :param commit_interval: Seconds to gather appends before one background
+            ``fsync`` covers them all. 0 syncs as soon as a writer commits, still
+            sharing each sync between concurrent writers.
+        """
+        if commit_interval < 0:
+            raise ValueError("commit_interval must be >= 0")
+
+        self.path = resolve_model_path(absolute_path)
+        self.commit_interval = commit_interval
+        self.last_sequence = 0
+        self._synced_sequence = 0
+        self._syncing = False
+        self._closed = False
+        self._changed = threading.Condition(threading.Lock())
+        self._file = self._open()
+
+        self._flusher: Optional[threading.Thread] = None
+        if commit_interval > 0:
+            self._flusher = threading.Thread(target=self._run_flusher, name="simplebayes-wal", daemon=True)
+            self._flusher.start()
+
+    def _open(self) -> BinaryIO:
+        """Opens the log for appending, dropping any torn tail left by a crash."""
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "wb") as log_file:
+                log_file.write(_FILE_HEADER.pack(WAL_MAGIC, WAL_VERSION))
+                log_file.flush()
+                os.fsync(log_file.fileno())
+
+        with open(self.path, "r+b") as log_file:
+            _read_file_header(log_file)
+            end = log_file.tell()
+            for end, (sequence, _, _, _) in _iter_stream_records(log_file):
+                self.last_sequence = sequence
+            log_file.truncate(end)
+
+        self._synced_sequence = self.last_sequence
+        return open(self.path, "ab")  # pylint: disable=consider-using-with
+
+    def read_records(self, after_sequence: int = 0) -> Iterator[WalRecord]:
+        """
+        Yields (sequence, operation, category, counts) for records newer than
+        ``after_sequence``, in the order they were applied.
+        """
+        with self._changed:
+            if not self._closed:
+                self._file.flush()
+        with open(self.path, "rb") as log_file:
+            _read_file_header(log_file)
+            for _, record in _iter_stream_records(log_file):
+                if record[0] > after_sequence:
+                    yield record
+
+    def advance(self, sequence: int) -> None:
+        """
+        Makes the next appended record follow ``sequence``, e.g. the sequence
+        stored in a snapshot that is newer than every record left in the log.
+        """
+        with self._changed:
+            self.last_sequence = max(self.last_sequence, sequence)
+            self._synced_sequence = max(self._synced_sequence, sequence)
+
+    def append(self, operation: str, category: str = "", counts: Optional[Dict[str, int]] = None) -> int:
+        """
+        Appends one operation and returns its sequence number. The record is
+        durable once ``commit`` returns for that sequence.
+
+        :param operation: ``WAL_TRAIN``, ``WAL_UNTRAIN``, or ``WAL_FLUSH``
+        :param category: category name (unused for flush)
+        :param counts: token counts applied (unused for flush)
+        """
+        with self._changed:
+            if self._closed:
+                raise InvalidModelStateError("write-ahead log is closed")
+            sequence = self.last_sequence + 1
+            self._file.write(_encode_record(sequence, operation, category, counts))
+            self.last_sequence = sequence
+            self._changed.notify_all()
+            return sequence
+
+    def commit(self, sequence: int) -> None:
+        """
+        Blocks until every record up to ``sequence`` has been synced to disk.
+        """
+        with self._changed:
+            while self._synced_sequence < sequence and not self._closed:
+                if self._flusher is not None or self._syncing:
+                    self._changed.wait()
+                else:
+                    self._sync_locked()
+
+    def _sync_locked(self) -> None:
+        """Flushes and fsyncs the log; the lock is released while fsync runs."""
+        self._syncing = True
+        target = self.last_sequence
+        self._file.flush()
+        file_descriptor = self._file.fileno()
+        self._changed.release()
+        try:
+            os.fsync(file_descriptor)
+        finally:
+            self._changed.acquire()
+            self._syncing = False
+        self._synced_sequence = max(self._synced_sequence, target)
+        self._changed.notify_all()
+
+    def _run_flusher(self) -> None:
+        with self._changed:
+            while True:
+                self._changed.wait_for(lambda: self._closed or self.last_sequence > self._synced_sequence)
+                # Let more appends join this group before syncing; close() syncs whatever is left
+                if self._changed.wait_for(lambda: self._closed, self.commit_interval):
+                    return
+                self._sync_locked()
+
+    def truncate(self, through_sequence: int) -> None:
+        """
+        Drops records up to and including ``through_sequence`` by atomically
+        rewriting the log with only the newer records.
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: not self._syncing)
+            self._file.flush()
+            log_directory = os.path.dirname(self.path)
+            with open(self.path, "rb") as source, tempfile.NamedTemporaryFile(
+                mode="wb", delete=False, dir=log_directory, prefix=".simplebayes-wal-", suffix=".tmp",
+            ) as destination:
+                _read_file_header(source)
+                destination.write(_FILE_HEADER.pack(WAL_MAGIC, WAL_VERSION))
+                for _, (sequence, operation, category, counts) in _iter_stream_records(source):
+                    if sequence > through_sequence:
+                        destination.write(_encode_record(sequence, operation, category, counts))
+                destination.flush()
+                os.fsync(destination.fileno())
+            os.replace(destination.name, self.path)
+            self._file.close()
+            self._file = open(self.path, "ab")  # pylint: disable=consider-using-with
+            self._synced_sequence = self.last_sequence
+            self._changed.notify_all()
+
+    def compact(self, classifier, snapshot_path: str = "", model_format: Optional[str] = None, **save_options) -> None:
+        """
+        Folds the log into a new snapshot written with ``classifier.save_to_file``
+        (and so ``save_model_state_to_file``), then drops the records it covers.
+
+        :param classifier: the SimpleBayes this log is attached to
+        :param snapshot_path: snapshot destination. Empty uses the default model path.
+        :param model_format: snapshot format, as for ``save_to_file``
+        :param save_options: ``compression`` / ``compression_level`` for ``save_to_file``
+        """
+        if classifier.journal is not self:
+            raise ValueError("compact requires the classifier this log is attached to")
+
+        # Every record up to here is already applied, so the snapshot holds it
+        sequence = self.last_sequence
+        classifier.save_to_file(snapshot_path, model_format, **save_options)
+        self.truncate(sequence)
+
+    def close(self) -> None:
+        """
+        Syncs outstanding records and closes the log.
+        """
+        with self._changed:
+            if self._closed:
+                return
+            self._changed.wait_for(lambda: not self._syncing)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._synced_sequence = self.last_sequence
+            self._closed = True
+            self._changed.notify_all()
+        if self._flusher is not None:
+            self._flusher.join()
+        self._file.close()
@@ -21,3 +21,17 @@ class BayesCategoriesTests(unittest.TestCase):
         bc = BayesCategories()
         bc.add_category('foo')
         self.assertEqual(bc.get_categories(), bc.categories)
+
+    def test_count_vocabulary(self):
+        bc = BayesCategories()
+        bc.add_category('foo').train_token('a', 1)
+        self.assertEqual(bc.count_vocabulary(), 1)
+
+        second = bc.add_category('bar')
+        second.train_token('a', 2)
+        second.train_token('b', 1)
+        self.assertEqual(bc.count_vocabulary(), 2)
+        bc.delete_category('bar')
+        self.assertEqual(bc.count_vocabulary(), 1)
+        self.assertIsNone(second.vocabulary_counts)
+        bc.delete_category('missing')
@@ -39,3 +39,19 @@ class BayesCategoryTests(unittest.TestCase):
         bc = BayesCategory('foo')
         bc.train_token('foo', 5)
         self.assertEqual(5, bc.get_tally())
+
+    def test_share_tokens_is_copy_on_write(self):
+        bc = BayesCategory('foo')
+        bc.train_token('foo', 5)
+        shared = bc.share_tokens()
+        bc.train_token('foo', 1)
+        bc.train_token('bar', 2)
+        self.assertEqual(shared, {'foo': 5})
+        self.assertEqual(bc.tokens, {'foo': 6, 'bar': 2})
+
+        shared = bc.share_tokens()
+        bc.untrain_token('baz', 1)
+        self.assertIs(shared, bc.tokens)
+        bc.untrain_token('foo', 6)
+        self.assertEqual(shared, {'foo': 6, 'bar': 2})
+        self.assertEqual(bc.tokens, {'bar': 2})
@@ -1,6 +1,12 @@
+import asyncio
+import os
+import signal
+import tempfile
+
 from fastapi.testclient import TestClient
 import pytest
 
+from simplebayes import SimpleBayes
 from simplebayes.api.app import create_app
 
 
@@ -58,6 +64,65 @@ def test_train_info_score_classify_and_flush_flow():
     assert flush_response.json() == {"success": True, "categories": {}}
 
 
+def test_score_and_classify_accept_category_subset():
+    client = TestClient(create_app())
+    headers = {"Content-Type": "text/plain"}
+    client.post("/train/spam", content="buy now limited offer", headers=headers)
+    client.post("/train/news", content="limited election results", headers=headers)
+
+    assert set(client.post("/score?categories=news,%20missing,", content="limited offer").json()) == {"news"}
+    assert client.post("/classify?categories=news", content="limited offer").json()["category"] == "news"
+    assert set(client.post("/score?categories=", content="limited offer").json()) == {"spam", "news"}
+
+
+def test_mutation_summaries_can_be_limited_per_request_or_by_default():
+    client = TestClient(create_app())
+    client.post("/train/spam", content="buy now limited offer")
+    client.post("/train/ham", content="team meeting")
+
+    assert set(client.post("/train/spam", content="offer").json()["categories"]) == {"spam", "ham"}
+    touched = client.post("/untrain/ham?summaries=touched", content="team").json()
+    assert touched == {"success": True, "categories": {"ham": client.get("/info").json()["categories"]["ham"]}}
+    emptied = client.post("/untrain/ham?summaries=touched", content="meeting").json()
+    assert emptied == {"success": True, "categories": {}}
+    assert client.post("/train/news?summaries=none", content="election").json() == {"success": True}
+    assert client.post("/train/spam?summaries=some", content="offer").status_code == 422
+
+    client = TestClient(create_app(mutation_summaries="none"))
+    assert client.post("/train/spam", content="buy now").json() == {"success": True}
+    assert client.post("/train/batch", json={"ham": ["team"]}).json() == {"success": True}
+    assert set(client.post("/train/batch?summaries=touched", json={"ham": ["x"]}).json()["categories"]) == {"ham"}
+    assert set(client.post("/untrain/ham?summaries=all", content="team").json()["categories"]) == {"spam", "ham"}
+    assert client.post("/flush").json() == {"success": True}
+    assert client.post("/flush?summaries=touched").json() == {"success": True, "categories": {}}
+
+    with pytest.raises(ValueError):
+        create_app(mutation_summaries="some")
+
+
+def test_batch_summaries_use_normalized_category_names():
+    client = TestClient(create_app())
+    samples = [{"category": " ham ", "text": "team"}, {"category": "ham\t", "text": "meeting"}]
+    response = client.post("/train/batch?summaries=touched", json=samples).json()
+    assert response == {"success": True, "categories": {"ham": client.get("/info").json()["categories"]["ham"]}}
+    assert response["categories"]["ham"]["tokenTally"] == 2
+
+
+def test_max_loaded_tokens_opens_snapshot_lazily():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        snapshot_path = os.path.join(temp_dir, "model.sbm")
+        trained = SimpleBayes()
+        trained.train("spam", "buy now limited offer")
+        trained.train("news", "limited election results")
+        trained.save_to_file(snapshot_path)
+
+        app = create_app(snapshot_path=snapshot_path, max_loaded_tokens=100)
+        with TestClient(app) as client:
+            assert client.post("/classify?categories=spam", content="limited").json()["category"] == "spam"
+            categories = app.state.classifier.categories.get_categories()
+            assert categories["spam"].is_loaded and not categories["news"].is_loaded
+
+
 def test_invalid_category_route_returns_422():
     client = TestClient(create_app())
     response = client.post(
@@ -119,7 +184,7 @@ def test_classify_returns_null_category_when_untrained():
     assert response.json() == {"category": None, "score": 0.0}
 
 
-@pytest.mark.parametrize("path", ["/train/spam", "/classify", "/score"])
+@pytest.mark.parametrize("path", ["/train/spam", "/untrain/spam", "/classify", "/score", "/flush"])
 def test_invalid_utf8_payload_returns_400(path):
     client = TestClient(create_app())
     response = client.post(
@@ -272,6 +337,7 @@ def test_verbose_mode_logs_to_stderr(capsys):
     client = TestClient(app)
     headers = {"Content-Type": "text/plain"}
     client.post("/train/spam", content="buy now", headers=headers)
+    app.state.verbose_log.flush()
     captured = capsys.readouterr()
     assert "[simplebayes]" in captured.err
     assert "POST" in captured.err or "train" in captured.err
@@ -284,6 +350,7 @@ def test_verbose_mode_off_no_output(capsys):
     client = TestClient(app)
     headers = {"Content-Type": "text/plain"}
     client.post("/train/spam", content="buy now", headers=headers)
+    app.state.verbose_log.flush()
     captured = capsys.readouterr()
     assert "[simplebayes]" not in captured.err
 
@@ -293,6 +360,7 @@ def test_verbose_middleware_content_length_branch(capsys):
     app = create_app(verbose=True)
     client = TestClient(app)
     client.get("/healthz")
+    app.state.verbose_log.flush()
     captured = capsys.readouterr()
     assert "[simplebayes]" in captured.err
     assert "GET" in captured.err
@@ -309,6 +377,7 @@ def test_verbose_middleware_exception_branch(capsys):
     client = TestClient(app)
     with pytest.raises(RuntimeError):
         client.get("/raise")
+    app.state.verbose_log.flush()
     captured = capsys.readouterr()
     assert "[simplebayes]" in captured.err
     assert "(exception)" in captured.err
@@ -322,6 +391,7 @@ def test_verbose_middleware_large_response_body(capsys):
     for i in range(25):
         client.post(f"/train/cat{i}", content=f"word{i} x y z", headers=headers)
     client.get("/info")
+    app.state.verbose_log.flush()
     captured = capsys.readouterr()
     assert "[simplebayes]" in captured.err
     assert "..." in captured.err
@@ -334,6 +404,137 @@ def test_verbose_format_tokens_truncation(capsys):
     headers = {"Content-Type": "text/plain"}
     long_text = " ".join(f"word{i}" for i in range(25))
     client.post("/train/spam", content=long_text, headers=headers)
+    app.state.verbose_log.flush()
     captured = capsys.readouterr()
     assert "[simplebayes]" in captured.err
     assert "..." in captured.err
+
+
+def test_wal_and_snapshot_survive_restart():
+    headers = {"Content-Type": "text/plain"}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        options = {
+            "snapshot_path": os.path.join(temp_dir, "model.sbm"),
+            "wal_path": os.path.join(temp_dir, "model.wal"),
+        }
+        app = create_app(**options)
+        client = TestClient(app)
+        client.post("/train/spam", content="buy now limited offer", headers=headers)
+        client.post("/train/ham", content="team schedule meeting", headers=headers)
+        expected = client.post("/score", content="limited offer", headers=headers).json()
+        # Simulate a crash: the log is the only record of the training
+        app.state.journal.close()
+        assert not os.path.exists(options["snapshot_path"])
+
+        with TestClient(create_app(**options)) as restarted:
+            assert restarted.post("/score", content="limited offer", headers=headers).json() == expected
+            restarted.post("/untrain/ham", content="meeting", headers=headers)
+
+        # Clean shutdown folds the log into the snapshot
+        assert os.path.exists(options["snapshot_path"])
+        assert os.path.getsize(options["wal_path"]) == 16
+
+        with TestClient(create_app(snapshot_path=options["snapshot_path"])) as snapshot_only:
+            assert snapshot_only.get("/info").json()["categories"]["ham"]["tokenTally"] == 2
+            snapshot_only.post("/flush", content="", headers=headers)
+        with TestClient(create_app(snapshot_path=options["snapshot_path"])) as reloaded:
+            assert reloaded.get("/info").json()["categories"] == {}
+
+
+def test_wal_without_snapshot_is_kept_on_shutdown():
+    headers = {"Content-Type": "text/plain"}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        wal_path = os.path.join(temp_dir, "model.wal")
+        with TestClient(create_app(wal_path=wal_path, wal_commit_interval=0.001)) as client:
+            client.post("/train/spam", content="buy now", headers=headers)
+
+        with TestClient(create_app(wal_path=wal_path)) as restarted:
+            assert restarted.get("/info").json()["categories"]["spam"]["tokenTally"] == 2
+
+
+def test_snapshot_interval_saves_in_background():
+    headers = {"Content-Type": "text/plain"}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        snapshot_path = os.path.join(temp_dir, "model.json")
+        app = create_app(snapshot_path=snapshot_path, snapshot_interval=0.01)
+        with TestClient(app) as client:
+            client.post("/train/spam", content="buy now", headers=headers)
+            while not os.path.exists(snapshot_path):
+                assert client.get("/healthz").status_code == 200
+
+        with TestClient(create_app(snapshot_path=snapshot_path)) as restarted:
+            assert restarted.get("/info").json()["categories"]["spam"]["tokenTally"] == 2
+
+    with pytest.raises(ValueError):
+        create_app(snapshot_interval=10)
+
+
+def test_reload_endpoint_swaps_model_file():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        reload_path = os.path.join(temp_dir, "model.sbm")
+        with TestClient(create_app(auth_token="secret-token", reload_path=reload_path)) as client:
+            _exercise_reload(client, reload_path)
+
+    not_configured = TestClient(create_app()).post("/reload")
+    assert not_configured.status_code == 404
+    assert not_configured.json() == {"error": "model reload is not configured"}
+
+
+def _exercise_reload(client, reload_path):
+    headers = {"Content-Type": "text/plain"}
+    auth = {"Authorization": "Bearer secret-token"}
+
+    assert client.post("/reload").status_code == 401
+    missing = client.post("/reload", headers=auth)
+    assert missing.status_code == 400
+    assert missing.json() == {"error": "unable to reload model"}
+
+    replacement = SimpleBayes()
+    replacement.train("ham", "team schedule meeting")
+    replacement.save_to_file(reload_path)
+    client.post("/train/spam", content="buy now", headers={**headers, **auth})
+
+    response = client.post("/reload", headers=auth)
+    assert response.status_code == 200
+    assert list(response.json()["categories"]) == ["ham"]
+    assert client.post("/classify", content="meeting", headers={**headers, **auth}).json()["category"] == "ham"
+
+
+def test_reload_path_installs_sighup_handler_in_main_thread():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        app = create_app(reload_path=os.path.join(temp_dir, "model.sbm"), reload_watch_interval=30)
+        previous = signal.getsignal(signal.SIGHUP)
+
+        async def run_lifespan():
+            async with app.router.lifespan_context(app):
+                assert signal.getsignal(signal.SIGHUP) is not previous
+
+        asyncio.run(run_lifespan())
+        assert signal.getsignal(signal.SIGHUP) is previous
+
+    with pytest.raises(ValueError):
+        create_app(wal_path="/tmp/simplebayes-test.wal", reload_path="/tmp/model.sbm")
+
+
+def test_sqlite_store_survives_restart_and_reload():
+    headers = {"Content-Type": "text/plain"}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sqlite_path = os.path.join(temp_dir, "model.db")
+        reload_path = os.path.join(temp_dir, "replacement.json")
+        with TestClient(create_app(sqlite_path=sqlite_path)) as client:
+            client.post("/train/spam", content="buy now", headers=headers)
+
+        replacement = SimpleBayes()
+        replacement.train("ham", "team meeting")
+        replacement.save_to_file(reload_path)
+        with TestClient(create_app(sqlite_path=sqlite_path, reload_path=reload_path)) as restarted:
+            assert restarted.get("/info").json()["categories"]["spam"]["tokenTally"] == 2
+            assert list(restarted.post("/reload").json()["categories"]) == ["ham"]
+
+        snapshot_path = os.path.join(temp_dir, "snapshot.json")
+        with TestClient(create_app(sqlite_path=sqlite_path, snapshot_path=snapshot_path)) as reloaded:
+            assert list(reloaded.get("/info").json()["categories"]) == ["ham"]
+        assert os.path.exists(snapshot_path)
+
+    with pytest.raises(ValueError):
+        create_app(wal_path="/tmp/simplebayes-test.wal", sqlite_path="/tmp/simplebayes-test.db")
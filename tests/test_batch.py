@@ -0,0 +1,228 @@
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+import pytest
+
+from simplebayes import SimpleBayes
+from simplebayes.api.app import create_app
+from simplebayes.api.routes import MAX_STREAM_LINE_BYTES, _read_line_batches
+from simplebayes.errors import InvalidCategoryError
+from simplebayes.wal import WriteAheadLog
+
+
+TEXTS = ["limited offer now", "meeting schedule", "nothing known here", "", "offer offer election"]
+
+
+def _trained():
+    classifier = SimpleBayes()
+    classifier.train("spam", "buy now limited offer")
+    classifier.train("ham", "team schedule meeting now")
+    classifier.train("news", "limited election results today")
+    return classifier
+
+
+def test_score_batch_matches_score():
+    classifier = _trained()
+    assert classifier.score_batch(TEXTS) == [classifier.score(text) for text in TEXTS]
+    assert classifier.score_batch(TEXTS, categories=["news", "missing"]) == [
+        classifier.score(text, categories=["news"]) for text in TEXTS
+    ]
+    assert not classifier.score_batch([])
+
+
+def test_classify_result_batch_matches_classify_result():
+    classifier = _trained()
+    assert classifier.classify_result_batch(iter(TEXTS)) == [classifier.classify_result(text) for text in TEXTS]
+    assert classifier.classify_result_batch(TEXTS, categories=["ham"])[1].category == "ham"
+
+
+def _client(**options):
+    client = TestClient(create_app(**options))
+    client.post("/train/spam", content="buy now limited offer")
+    client.post("/train/ham", content="team schedule meeting now")
+    return client
+
+
+def test_batch_endpoints_accept_json_arrays():
+    client = _client()
+    classify_response = client.post("/classify/batch", json=TEXTS)
+    assert classify_response.status_code == 200
+    assert [result["category"] for result in classify_response.json()] == ["spam", "ham", None, None, "spam"]
+
+    scores = client.post("/score/batch?categories=ham", json=TEXTS[:2]).json()
+    assert set(scores[0]) == {"ham"}
+    assert scores[1]["ham"] > 0
+
+
+def test_batch_endpoints_answer_ndjson_with_ndjson():
+    client = _client()
+    headers = {"Content-Type": "application/x-ndjson; charset=utf-8"}
+    body = "\n".join(json.dumps(text) for text in TEXTS[:2]) + "\n\n"
+
+    response = client.post("/classify/batch", content=body, headers=headers)
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["category"] for line in lines] == ["spam", "ham"]
+
+    response = client.post("/score/batch", content=body, headers=headers)
+    assert len(response.text.splitlines()) == 2
+
+
+@pytest.mark.parametrize("body", ["", "{", '{"text": "offer"}', '["offer", 1]'])
+def test_batch_endpoints_reject_invalid_payloads(body):
+    client = _client()
+    for path in ("/classify/batch", "/score/batch"):
+        response = client.post(path, content=body, headers={"Content-Type": "application/json"})
+        assert response.status_code == 400
+
+
+def test_batch_endpoints_enforce_limits():
+    client = _client(max_batch_size=2)
+    assert client.post("/classify/batch", json=TEXTS[:2]).status_code == 200
+    response = client.post("/score/batch", json=TEXTS[:3])
+    assert response.status_code == 413
+    assert response.json() == {"error": "batch larger than 2 documents"}
+
+    assert _client(max_batch_size=0).post("/score/batch", json=TEXTS * 500).status_code == 200
+    assert client.post("/score/batch", content=b"\xff", headers={"Content-Type": "application/json"}).status_code == 400
+
+    with pytest.raises(ValueError):
+        create_app(max_batch_size=-1)
+
+
+def _stream_lines(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_classify_stream_answers_each_line_in_order():
+    client = _client()
+
+    def body():
+        yield b"limited off"
+        yield b"er\n\nteam meeting\r\n\xff\n" + b"x" * (MAX_STREAM_LINE_BYTES + 1) + b"\noffer"
+
+    response = client.post("/classify/stream", content=body())
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert [line.get("category", line.get("error")) for line in _stream_lines(response)] == [
+        "spam", "ham", "invalid utf-8 payload", "line too long", "spam",
+    ]
+
+    response = client.post(
+        "/classify/stream?categories=ham",
+        content=b'"offer meeting"\n[1]\n{\n',
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    expected = client.post("/classify?categories=ham", content="offer meeting").json()
+    assert _stream_lines(response) == [
+        expected,
+        {"error": "expected a JSON string"},
+        {"error": "expected a JSON string"},
+    ]
+    assert not client.post("/classify/stream", content=b"").text
+
+
+def test_classify_stream_is_logged_in_verbose_mode(capsys):
+    client = _client(verbose=True)
+    client.post("/classify/stream", content=b"offer\n\xff\nmeeting\n")
+    client.app.state.verbose_log.flush()
+    # The malformed line is answered with an error and not counted as classified
+    assert "classify stream: documents= 2 errors= 1" in capsys.readouterr().err
+
+
+def test_read_line_batches_holds_at_most_one_line():
+    async def chunks(*parts):
+        for part in parts:
+            yield part
+
+    async def collect(*parts):
+        return [batch async for batch in _read_line_batches(chunks(*parts), max_line_bytes=4)]
+
+    assert asyncio.run(collect(b"ab", b"c\nde", b"f")) == [[b"abc"], [b"def"]]
+    assert asyncio.run(collect(b"abcdefgh", b"ij\nok\n", b"toolong")) == [[None, b"ok"], [None]]
+    assert asyncio.run(collect(b"abcde\n")) == [[None]]
+
+
+EXAMPLES = [
+    ("spam", "buy now limited offer"),
+    ("ham", "team schedule meeting now"),
+    ("spam", "offer offer click"),
+    ("news", "limited election results today"),
+]
+
+
+def test_train_batch_matches_train_and_recalculates_once(monkeypatch):
+    reference = SimpleBayes()
+    for category, text in EXAMPLES:
+        reference.train(category, text)
+
+    classifier = SimpleBayes()
+    calls = []
+    original = classifier.calculate_category_probability
+    monkeypatch.setattr(classifier, "calculate_category_probability", lambda: calls.append(1) or original())
+    classifier.train_batch(EXAMPLES)
+
+    assert len(calls) == 1
+    assert classifier.get_summaries() == reference.get_summaries()
+    assert classifier.get_summaries(categories=["news", "missing"]) == {"news": reference.get_summaries()["news"]}
+    assert classifier.score("limited offer meeting") == reference.score("limited offer meeting")
+
+
+def test_train_batch_checks_every_category_before_training():
+    classifier = SimpleBayes()
+    with pytest.raises(InvalidCategoryError):
+        classifier.train_batch([("spam", "buy now"), ("not valid!", "text")])
+    assert not classifier.get_summaries()
+
+
+def test_train_batch_journals_each_sample(tmp_path):
+    classifier = SimpleBayes(max_new_tokens_per_train=2)
+    classifier.attach_journal(WriteAheadLog(str(tmp_path / "model.wal")))
+    classifier.train_batch([("spam", "one two three"), ("spam", "four five six")])
+    classifier.journal.close()
+
+    replayed = SimpleBayes(max_new_tokens_per_train=2)
+    replayed.attach_journal(WriteAheadLog(str(tmp_path / "model.wal")))
+    assert replayed.tally("spam") == classifier.tally("spam") == 4
+
+
+@pytest.mark.parametrize("body, headers", [
+    (json.dumps([{"category": category, "text": text} for category, text in EXAMPLES]), {}),
+    (json.dumps({"spam": ["buy now limited offer", "offer offer click"], "ham": ["team schedule meeting now"],
+                 "news": ["limited election results today"]}), {}),
+    ("\n".join(json.dumps({"category": category, "text": text}) for category, text in EXAMPLES),
+     {"Content-Type": "application/x-ndjson"}),
+])
+def test_train_batch_endpoint_accepts_pairs_and_category_arrays(body, headers):
+    client = TestClient(create_app())
+    response = client.post("/train/batch", content=body, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["success"] is True
+    assert response.json()["categories"] == client.get("/info").json()["categories"]
+
+    reference = SimpleBayes()
+    reference.train_batch(EXAMPLES)
+    assert {name: summary["tokenTally"] for name, summary in response.json()["categories"].items()} == {
+        name: summary.token_tally for name, summary in reference.get_summaries().items()
+    }
+
+
+@pytest.mark.parametrize("body", [
+    "buy now", '["buy now"]', '{"spam": "buy now"}', '[{"category": "spam"}]', '{"spam": [1]}', "7",
+])
+def test_train_batch_endpoint_rejects_invalid_payloads(body):
+    client = TestClient(create_app())
+    assert client.post("/train/batch", content=body).status_code == 400
+    assert not client.get("/info").json()["categories"]
+
+
+def test_train_batch_endpoint_enforces_limits():
+    client = TestClient(create_app(max_batch_size=2))
+    response = client.post("/train/batch", json={"spam": ["a", "b"], "bad name": ["c"]})
+    assert response.status_code == 413
+
+    response = client.post("/train/batch", json={"spam": ["buy now"], "bad name": ["c"]})
+    assert response.status_code == 400
+    assert "category" in response.json()["error"]
+    assert client.post("/train/batch", content=b"\xff").status_code == 400
+    assert not client.get("/info").json()["categories"]
@@ -0,0 +1,250 @@
+import io
+import os
+import struct
+import tempfile
+import zlib
+
+import pytest
+
+from simplebayes import SimpleBayes
+from simplebayes.binary_model import (
+    BINARY_MODEL_MAGIC,
+    BinaryModelHeader,
+    dump_binary_model_state,
+    load_binary_model_state,
+)
+from simplebayes.errors import (
+    InvalidModelStateError,
+    UnsupportedModelFormatError,
+    UnsupportedModelVersionError,
+)
+from simplebayes.persistence import (
+    MODEL_FORMAT_BINARY,
+    MODEL_FORMAT_JSON,
+    PERSISTED_MODEL_VERSION,
+    build_binary_model_categories,
+    build_model_categories,
+    load_model_state_from_file,
+    resolve_model_format,
+    save_model_state_to_file,
+)
+
+
+def _state(categories):
+    return {"version": PERSISTED_MODEL_VERSION, "categories": categories}
+
+
+def _dump(state):
+    destination = io.BytesIO()
+    dump_binary_model_state(destination, state)
+    return destination.getvalue()
+
+
+def test_binary_round_trip_preserves_state():
+    state = _state({
+        "spam": {"tally": 4, "tokens": {"buy": 2, "now": 1, "café": 1}},
+        "ham": {"tally": 3, "tokens": {"meeting": 2, "now": 1}},
+        "empty": {"tally": 0, "tokens": {}},
+    })
+
+    loaded = load_binary_model_state(io.BytesIO(_dump(state)))
+
+    assert loaded == state
+    assert list(loaded["categories"]) == ["spam", "ham", "empty"]
+
+
+def test_binary_round_trip_empty_model():
+    payload = _dump(_state({}))
+    assert payload.startswith(BINARY_MODEL_MAGIC)
+    assert load_binary_model_state(io.BytesIO(payload)) == _state({})
+
+
+def test_binary_round_trip_preserves_sequence():
+    state = _state({"spam": {"tally": 1, "tokens": {"buy": 1}}})
+    state["sequence"] = 42
+
+    payload = _dump(state)
+
+    assert BinaryModelHeader(payload).sequence == 42
+    assert load_binary_model_state(io.BytesIO(payload)) == state
+
+
+def test_binary_wide_counts_round_trip():
+    state = _state({"big": {"tally": 1 << 40, "tokens": {"token": 1 << 40}}})
+    narrow = _dump(_state({"big": {"tally": 5, "tokens": {"token": 5}}}))
+
+    wide = _dump(state)
+
+    assert BinaryModelHeader(wide).count_typecode == "Q"
+    assert BinaryModelHeader(narrow).count_typecode == "I"
+    assert load_binary_model_state(io.BytesIO(wide)) == state
+
+
+def test_binary_stores_shared_tokens_once():
+    state = _state({
+        "alpha": {"tally": 1, "tokens": {"sharedtoken": 1}},
+        "beta": {"tally": 1, "tokens": {"sharedtoken": 1}},
+    })
+    assert _dump(state).count(b"sharedtoken") == 1
+
+
+def test_binary_rejects_nul_tokens_and_missing_streams():
+    with pytest.raises(InvalidModelStateError):
+        _dump(_state({"alpha": {"tally": 1, "tokens": {"a\x00b": 1}}}))
+    with pytest.raises(InvalidModelStateError):
+        dump_binary_model_state(None, _state({}))  # type: ignore[arg-type]
+    with pytest.raises(InvalidModelStateError):
+        load_binary_model_state(None)  # type: ignore[arg-type]
+
+
+def test_binary_rejects_corrupt_payloads():
+    payload = bytearray(_dump(_state({"alpha": {"tally": 2, "tokens": {"one": 1, "two": 1}}})))
+
+    with pytest.raises(InvalidModelStateError, match="truncated"):
+        load_binary_model_state(io.BytesIO(bytes(payload[:10])))
+
+    with pytest.raises(InvalidModelStateError, match="not a binary"):
+        load_binary_model_state(io.BytesIO(b"X" + bytes(payload[1:])))
+
+    flipped = bytearray(payload)
+    flipped[-8] ^= 0xFF
+    with pytest.raises(InvalidModelStateError, match="checksum"):
+        load_binary_model_state(io.BytesIO(bytes(flipped)))
+    assert BinaryModelHeader(bytes(flipped), verify_checksum=False).category_count == 1
+
+    future = bytearray(payload)
+    future[8] = 99
+    with pytest.raises(UnsupportedModelVersionError):
+        load_binary_model_state(io.BytesIO(bytes(future)))
+
+
+def test_binary_header_detects_inconsistent_sections():
+    payload = _dump(_state({"alpha": {"tally": 2, "tokens": {"one": 1, "two": 1}}}))
+    header = BinaryModelHeader(payload)
+
+    header.vocab_size = 3
+    with pytest.raises(InvalidModelStateError, match="vocabulary size"):
+        header.read_vocabulary(payload)
+
+    header.category_count = 1000
+    with pytest.raises(InvalidModelStateError, match="truncated"):
+        header.read_category_records(payload)
+
+    header = BinaryModelHeader(payload)
+    record = header.read_category_records(payload)[0]
+    with pytest.raises(InvalidModelStateError, match="truncated"):
+        header.read_category(payload, record[:3] + (10 ** 6,) + record[4:])
+
+
+def test_binary_rejects_out_of_range_token_ids(monkeypatch):
+    payload = _dump(_state({"alpha": {"tally": 2, "tokens": {"one": 1, "two": 1}}}))
+    monkeypatch.setattr(BinaryModelHeader, "read_vocabulary", lambda self, buffer: ["one"])
+    with pytest.raises(InvalidModelStateError, match="token id"):
+        load_binary_model_state(io.BytesIO(payload))
+
+
+def _resealed(payload):
+    body = bytes(payload[:-4])
+    return body + struct.pack("<I", zlib.crc32(body))
+
+
+def test_binary_rejects_duplicates_that_pass_the_checksum():
+    payload = _dump(_state({
+        "alpha": {"tally": 2, "tokens": {"one": 1, "two": 1}},
+        "alphb": {"tally": 1, "tokens": {"one": 1}},
+    }))
+    ids_pos = BinaryModelHeader(payload).read_category_records(payload)[0][4]
+    duplicate_ids = bytearray(payload)
+    duplicate_ids[ids_pos + 4:ids_pos + 8] = struct.pack("<I", 0)
+    for corrupt, message in (
+        (payload.replace(b"alphb", b"alpha"), "duplicate category name"),
+        # Two ids spelling the same token within one category
+        (payload.replace(b"two", b"one"), "duplicate token id"),
+        (duplicate_ids, "duplicate token id"),
+    ):
+        with pytest.raises(InvalidModelStateError, match=message):
+            load_binary_model_state(io.BytesIO(_resealed(corrupt)))
+        with pytest.raises(InvalidModelStateError, match=message):
+            build_binary_model_categories(_resealed(corrupt))
+
+
+def test_binary_categories_match_validated_state():
+    state = _state({
+        "spam": {"tally": 4, "tokens": {"buy": 2, "now": 1, "café": 1}},
+        "empty": {"tally": 0, "tokens": {}},
+    })
+    state["sequence"] = 3
+    payload = _dump(state)
+
+    categories = build_binary_model_categories(payload)
+    expected = build_model_categories(load_binary_model_state(io.BytesIO(payload)))
+    assert categories.sequence == expected.sequence == 3
+    assert {name: (c.tally, c.tokens) for name, c in categories.get_categories().items()} == {
+        name: (c.tally, c.tokens) for name, c in expected.get_categories().items()
+    }
+
+
+@pytest.mark.parametrize(
+    ("categories", "message"),
+    [
+        ({"bad name": {"tally": 1, "tokens": {"a": 1}}}, "category name"),
+        ({"alpha": {"tally": 1, "tokens": {"": 1}}}, "token name"),
+        ({"alpha": {"tally": 1, "tokens": {"a": 1, "b": 0}}}, "token count"),
+        ({"alpha": {"tally": 5, "tokens": {"a": 1}}}, "tally mismatch"),
+    ],
+)
+def test_binary_categories_reject_invalid_models(categories, message):
+    with pytest.raises(InvalidModelStateError, match=message):
+        build_binary_model_categories(_dump(_state(categories)))
+
+
+def test_resolve_model_format():
+    assert resolve_model_format("/tmp/model.json") == MODEL_FORMAT_JSON
+    assert resolve_model_format("/tmp/model") == MODEL_FORMAT_JSON
+    assert resolve_model_format("/tmp/model.SBM") == MODEL_FORMAT_BINARY
+    assert resolve_model_format("/tmp/model.bin") == MODEL_FORMAT_BINARY
+    assert resolve_model_format("/tmp/model.bin", MODEL_FORMAT_JSON) == MODEL_FORMAT_JSON
+    with pytest.raises(UnsupportedModelFormatError):
+        resolve_model_format("/tmp/model.json", "yaml")
+
+
+def test_save_to_file_picks_format_and_load_detects_it():
+    classifier = SimpleBayes()
+    classifier.train("spam", "buy now limited offer")
+    classifier.train("ham", "team schedule meeting")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        by_extension = os.path.join(temp_dir, "model.sbm")
+        explicit = os.path.join(temp_dir, "model.data")
+        as_json = os.path.join(temp_dir, "model.json")
+        classifier.save_to_file(by_extension)
+        classifier.save_to_file(explicit, model_format=MODEL_FORMAT_BINARY)
+        classifier.save_to_file(as_json)
+
+        for path in (by_extension, explicit):
+            with open(path, "rb") as source:
+                assert source.read(len(BINARY_MODEL_MAGIC)) == BINARY_MODEL_MAGIC
+        with open(as_json, "rb") as source:
+            assert source.read(1) == b"{"
+
+        for path in (by_extension, explicit, as_json):
+            loaded = SimpleBayes()
+            loaded.load_from_file(path)
+            assert loaded.tally("spam") == classifier.tally("spam")
+            assert loaded.classify_result("limited offer").category == "spam"
+
+
+def test_save_model_state_to_file_rejects_unknown_format():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with pytest.raises(UnsupportedModelFormatError):
+            save_model_state_to_file(os.path.join(temp_dir, "model.json"), _state({}), "yaml")
+        assert not os.listdir(temp_dir)
+
+
+def test_load_model_state_from_file_validates_binary_payload():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "model.sbm")
+        with open(path, "wb") as destination:
+            destination.write(BINARY_MODEL_MAGIC + b"\x01")
+        with pytest.raises(InvalidModelStateError):
+            load_model_state_from_file(path)
@@ -0,0 +1,149 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+import pytest
+
+from simplebayes.api.app import create_app
+from simplebayes.api.limits import BodyLimitMiddleware, parse_body_limits
+
+TOO_LARGE = {"error": "request body too large"}
+
+
+def _chunks(size, chunk_size=64 * 1024):
+    sent = 0
+    while sent < size:
+        yield b"x" * min(chunk_size, size - sent)
+        sent += chunk_size
+
+
+def test_content_length_over_limit_is_rejected_before_the_app_runs():
+    calls = []
+
+    async def app(scope, _receive, _send):
+        calls.append(scope)
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    async def receive():
+        raise AssertionError("the body must not be read")
+
+    middleware = BodyLimitMiddleware(app, max_body_bytes=10)
+    scope = {"type": "http", "path": "/score", "headers": [(b"content-length", b"11")]}
+    asyncio.run(middleware(scope, receive, send))
+    assert not calls
+    assert sent[0]["status"] == 413
+    assert (b"connection", b"close") in sent[0]["headers"]
+
+    asyncio.run(middleware({"type": "lifespan"}, receive, send))
+    assert calls == [{"type": "lifespan"}]
+
+
+def test_chunked_bodies_are_cut_off_at_the_limit():
+    client = TestClient(create_app(max_body_bytes=100 * 1024))
+    for path in ("/score", "/train/spam", "/flush"):
+        response = client.post(path, content=_chunks(200 * 1024))
+        assert response.status_code == 413
+        assert response.json() == TOO_LARGE
+    assert client.post("/score", content=_chunks(100 * 1024)).status_code == 200
+    assert not client.get("/info").json()["categories"]
+
+
+def test_limits_apply_per_endpoint():
+    client = TestClient(create_app(
+        max_body_bytes=1024,
+        body_limits={"/train/*": 4096, "/train/spam": 2048, "/classify/stream": 1024},
+    ))
+    assert client.post("/score", content=b"x" * 1025).status_code == 413
+    assert client.post("/train/ham", content=b"x" * 4096).status_code == 200
+    assert client.post("/train/spam", content=b"x" * 2049).status_code == 413
+    assert client.post("/classify/batch", json=["x" * 5000]).status_code == 200
+
+    response = client.post("/classify/stream", content=_chunks(2048, chunk_size=512))
+    assert response.status_code == 413
+    assert response.json() == TOO_LARGE
+
+
+def test_named_model_routes_share_the_route_limits(tmp_path):
+    middleware = BodyLimitMiddleware(None, max_body_bytes=1024, body_limits={"/train/*": 4096})
+    assert middleware.limit_for("/models/acme/train/batch") == 16 * 1024 * 1024
+    assert middleware.limit_for("/models/acme/classify/stream") == 0
+    assert middleware.limit_for("/models/acme/train/spam") == 4096
+    assert middleware.limit_for("/models/acme/score") == 1024
+    assert middleware.limit_for("/models") == 1024
+
+    with TestClient(create_app(model_directory=str(tmp_path))) as client:
+        batch = [{"category": "spam", "text": "x" * 1800}] * 1000
+        assert client.post("/models/m1/train/batch", json=batch).status_code == 200
+        assert client.post("/models/m1/classify/batch", json=["x" * 1100] * 1000).status_code == 200
+        body = (b"x" * 11000 + b"\n") * 100
+        assert len(body) > 1024 * 1024
+        response = client.post("/models/m1/classify/stream", content=body)
+        assert response.status_code == 200
+        assert len(response.text.splitlines()) == 100
+        assert client.post("/models/m1/score", content=b"x" * (1024 * 1024 + 1)).status_code == 413
+
+
+def test_limits_can_be_disabled():
+    client = TestClient(create_app(max_body_bytes=0))
+    assert client.post("/score", content=_chunks(2 * 1024 * 1024)).status_code == 200
+    assert client.post("/classify/stream", content=_chunks(20 * 1024 * 1024, chunk_size=1024 * 1024)).status_code == 200
+
+
+def test_body_cut_off_after_the_response_started_ends_the_response():
+    sent = []
+
+    async def app(_scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await receive()
+        await receive()
+
+    messages = iter([
+        {"type": "http.request", "body": b"12345", "more_body": True},
+        {"type": "http.request", "body": b"67890", "more_body": False},
+    ])
+
+    async def receive():
+        return next(messages)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "path": "/classify/stream", "headers": []}
+    asyncio.run(BodyLimitMiddleware(app, body_limits={"/classify/stream": 8})(scope, receive, send))
+    assert [message["type"] for message in sent] == ["http.response.start"]
+
+
+def test_disconnects_pass_through():
+    sent = []
+
+    async def app(_scope, receive, send):
+        assert (await receive())["type"] == "http.disconnect"
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "path": "/score", "headers": []}
+    asyncio.run(BodyLimitMiddleware(app)(scope, receive, send))
+    assert sent[0]["status"] == 200
+
+
+def test_parse_body_limits():
+    assert parse_body_limits(["", "/train/batch=10, /train/*=20,", "/score=0"]) == {
+        "/train/batch": 10,
+        "/train/*": 20,
+        "/score": 0,
+    }
+    for spec in ("/score", "score=1", "/score=-1", "/score=big"):
+        with pytest.raises(ValueError):
+            parse_body_limits([spec])
+    with pytest.raises(ValueError):
+        create_app(max_body_bytes=-1)
+    with pytest.raises(ValueError):
+        create_app(body_limits={"/score": -1})
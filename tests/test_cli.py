@@ -1,3 +1,5 @@
+import pytest
+
 from simplebayes import cli
 
 
@@ -8,6 +10,24 @@ def test_parse_args_defaults(monkeypatch):
     monkeypatch.delenv("SIMPLEBAYES_LANGUAGE", raising=False)
     monkeypatch.delenv("SIMPLEBAYES_REMOVE_STOP_WORDS", raising=False)
     monkeypatch.delenv("SIMPLEBAYES_VERBOSE", raising=False)
+    monkeypatch.delenv("SIMPLEBAYES_NGRAMS", raising=False)
+    monkeypatch.delenv("SIMPLEBAYES_NGRAM_HASH_BUCKETS", raising=False)
+    monkeypatch.delenv("SIMPLEBAYES_MAX_TOKENS_PER_DOCUMENT", raising=False)
+    monkeypatch.delenv("SIMPLEBAYES_MAX_TOKEN_LENGTH", raising=False)
+    monkeypatch.delenv("SIMPLEBAYES_MAX_NEW_TOKENS_PER_TRAIN", raising=False)
+    monkeypatch.delenv("SIMPLEBAYES_SNAPSHOT_PATH", raising=False)
+    monkeypatch.delenv("SIMPLEBAYES_SNAPSHOT_INTERVAL", raising=False)
+    monkeypatch.delenv("SIMPLEBAYES_WAL_PATH", raising=False)
+    monkeypatch.delenv("SIMPLEBAYES_WAL_COMMIT_INTERVAL_MS", raising=False)
+    monkeypatch.delenv("SIMPLEBAYES_SQLITE_PATH", raising=False)
+    monkeypatch.delenv("SIMPLEBAYES_RELOAD_PATH", raising=False)
+    monkeypatch.delenv("SIMPLEBAYES_RELOAD_WATCH_INTERVAL", raising=False)
+    monkeypatch.delenv("SIMPLEBAYES_MAX_LOADED_TOKENS", raising=False)
+    monkeypatch.delenv("SIMPLEBAYES_MAX_BATCH_SIZE", raising=False)
+    monkeypatch.delenv("SIMPLEBAYES_MAX_BODY_BYTES", raising=False)
+    monkeypatch.delenv("SIMPLEBAYES_BODY_LIMITS", raising=False)
+    monkeypatch.delenv("SIMPLEBAYES_MUTATION_SUMMARIES", raising=False)
+    monkeypatch.delenv("SIMPLEBAYES_DISABLE_METRICS", raising=False)
 
     args = cli.parse_args([])
     assert args.host == "0.0.0.0"
@@ -16,6 +36,24 @@ def test_parse_args_defaults(monkeypatch):
     assert args.language == "english"
     assert args.remove_stop_words is False
     assert args.verbose is False
+    assert args.ngrams == 1
+    assert args.ngram_hash_buckets == 0
+    assert args.max_tokens_per_document == 0
+    assert args.max_token_length == 0
+    assert args.max_new_tokens_per_train == 0
+    assert args.max_loaded_tokens == 0
+    assert args.max_batch_size == 1000
+    assert args.max_body_bytes == 1024 * 1024
+    assert args.body_limit == [""]
+    assert args.mutation_summaries == "all"
+    assert args.disable_metrics is False
+    assert args.snapshot_path == ""
+    assert args.snapshot_interval == 0
+    assert args.wal_path == ""
+    assert args.wal_commit_interval_ms == 0
+    assert args.sqlite_path == ""
+    assert args.reload_path == ""
+    assert args.reload_watch_interval == 0
 
 
 def test_parse_args_uses_env(monkeypatch):
@@ -105,19 +143,122 @@ def test_parse_args_verbose_env(monkeypatch):
     assert args.verbose is True
 
 
+def test_parse_args_workers_default(monkeypatch):
+    monkeypatch.delenv("SIMPLEBAYES_WORKERS", raising=False)
+    args = cli.parse_args([])
+    assert args.workers == 1
+
+
+def test_parse_args_classify_batching(monkeypatch):
+    monkeypatch.delenv("SIMPLEBAYES_CLASSIFY_BATCH_WINDOW_MS", raising=False)
+    monkeypatch.delenv("SIMPLEBAYES_CLASSIFY_BATCH_MAX", raising=False)
+    args = cli.parse_args([])
+    assert args.classify_batch_window_ms == 0
+    assert args.classify_batch_max == 64
+
+    monkeypatch.setenv("SIMPLEBAYES_CLASSIFY_BATCH_WINDOW_MS", "1.5")
+    monkeypatch.setenv("SIMPLEBAYES_CLASSIFY_BATCH_MAX", "32")
+    args = cli.parse_args([])
+    assert args.classify_batch_window_ms == 1.5
+    assert args.classify_batch_max == 32
+
+
+def test_parse_args_named_models(monkeypatch):
+    monkeypatch.delenv("SIMPLEBAYES_MODEL_DIRECTORY", raising=False)
+    monkeypatch.delenv("SIMPLEBAYES_MAX_MODEL_TOKENS", raising=False)
+    monkeypatch.delenv("SIMPLEBAYES_MODEL_IDLE_SECONDS", raising=False)
+    args = cli.parse_args([])
+    assert args.model_directory == ""
+    assert args.max_model_tokens == 0
+    assert args.model_idle_seconds == 0
+
+    monkeypatch.setenv("SIMPLEBAYES_MODEL_DIRECTORY", "/data/models")
+    monkeypatch.setenv("SIMPLEBAYES_MAX_MODEL_TOKENS", "1000000")
+    monkeypatch.setenv("SIMPLEBAYES_MODEL_IDLE_SECONDS", "300")
+    args = cli.parse_args([])
+    assert args.model_directory == "/data/models"
+    assert args.max_model_tokens == 1000000
+    assert args.model_idle_seconds == 300
+
+
+def test_parse_args_ngrams_env(monkeypatch):
+    monkeypatch.setenv("SIMPLEBAYES_NGRAMS", "3")
+    monkeypatch.setenv("SIMPLEBAYES_NGRAM_HASH_BUCKETS", "1024")
+    args = cli.parse_args([])
+    assert args.ngrams == 3
+    assert args.ngram_hash_buckets == 1024
+
+
+def test_parse_args_rejects_out_of_range_ngrams(monkeypatch, capsys):
+    with pytest.raises(SystemExit):
+        cli.parse_args(["--ngrams", "4"])
+    assert "argument --ngrams: must be between 1 and 3, got 4" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        cli.parse_args(["--ngram-hash-buckets", "x"])
+    assert "argument --ngram-hash-buckets: invalid int value: 'x'" in capsys.readouterr().err
+
+    monkeypatch.setenv("SIMPLEBAYES_NGRAM_HASH_BUCKETS", "-1")
+    with pytest.raises(SystemExit):
+        cli.parse_args([])
+    assert "argument --ngram-hash-buckets: must be >= 0, got -1" in capsys.readouterr().err
+
+
+def test_parse_args_token_limits_env(monkeypatch):
+    monkeypatch.setenv("SIMPLEBAYES_MAX_TOKENS_PER_DOCUMENT", "5000")
+    monkeypatch.setenv("SIMPLEBAYES_MAX_TOKEN_LENGTH", "64")
+    monkeypatch.setenv("SIMPLEBAYES_MAX_NEW_TOKENS_PER_TRAIN", "1000")
+    monkeypatch.setenv("SIMPLEBAYES_MAX_LOADED_TOKENS", "50000")
+    monkeypatch.setenv("SIMPLEBAYES_MAX_BATCH_SIZE", "250")
+    monkeypatch.setenv("SIMPLEBAYES_MAX_BODY_BYTES", "2048")
+    monkeypatch.setenv("SIMPLEBAYES_BODY_LIMITS", "/train/*=4096")
+    monkeypatch.setenv("SIMPLEBAYES_MUTATION_SUMMARIES", "touched")
+    monkeypatch.setenv("SIMPLEBAYES_DISABLE_METRICS", "1")
+    monkeypatch.setenv("SIMPLEBAYES_WORKERS", "4")
+    args = cli.parse_args([])
+    assert args.max_tokens_per_document == 5000
+    assert args.max_token_length == 64
+    assert args.max_new_tokens_per_train == 1000
+    assert args.max_loaded_tokens == 50000
+    assert args.max_batch_size == 250
+    assert args.max_body_bytes == 2048
+    assert args.mutation_summaries == "touched"
+    assert args.disable_metrics is True
+    assert args.workers == 4
+    assert cli.parse_args(["--body-limit", "/score=10"]).body_limit == ["/train/*=4096", "/score=10"]
+
+
+def test_parse_args_token_limits_cli():
+    args = cli.parse_args(
+        [
+            "--max-tokens-per-document",
+            "10",
+            "--max-token-length",
+            "20",
+            "--max-new-tokens-per-train",
+            "30",
+        ]
+    )
+    assert args.max_tokens_per_document == 10
+    assert args.max_token_length == 20
+    assert args.max_new_tokens_per_train == 30
+
+
+def test_parse_args_rejects_negative_token_limits(monkeypatch, capsys):
+    with pytest.raises(SystemExit):
+        cli.parse_args(["--max-token-length", "-5"])
+    assert "argument --max-token-length: must be >= 0, got -5" in capsys.readouterr().err
+
+    monkeypatch.setenv("SIMPLEBAYES_MAX_NEW_TOKENS_PER_TRAIN", "-1")
+    with pytest.raises(SystemExit):
+        cli.parse_args([])
+    assert "argument --max-new-tokens-per-train: must be >= 0" in capsys.readouterr().err
+
+
 def test_run_invokes_uvicorn(monkeypatch):
     captured = {}
 
-    def fake_create_app(
-        auth_token: str = "",
-        language: str = "english",
-        remove_stop_words: bool = False,
-        verbose: bool = False,
-    ):
-        captured["auth_token"] = auth_token
-        captured["language"] = language
-        captured["remove_stop_words"] = remove_stop_words
-        captured["verbose"] = verbose
+    def fake_create_app(**kwargs):
+        captured.update(kwargs)
         return "app-object"
 
     def fake_uvicorn_run(app, host, port):
@@ -134,6 +275,29 @@ def test_run_invokes_uvicorn(monkeypatch):
     assert captured["language"] == "english"
     assert captured["remove_stop_words"] is False
     assert captured["verbose"] is False
+    assert captured["ngrams"] == 1
+    assert captured["ngram_hash_buckets"] == 0
+    assert captured["max_tokens_per_document"] == 0
+    assert captured["max_token_length"] == 0
+    assert captured["max_new_tokens_per_train"] == 0
+    assert captured["max_loaded_tokens"] == 0
+    assert captured["max_batch_size"] == 1000
+    assert captured["max_body_bytes"] == 1024 * 1024
+    assert captured["body_limits"] == {}
+    assert captured["mutation_summaries"] == "all"
+    assert captured["metrics"] is True
+    assert captured["classify_batch_window"] == 0
+    assert captured["classify_batch_max"] == 64
+    assert captured["model_directory"] == ""
+    assert captured["max_model_tokens"] == 0
+    assert captured["model_idle_seconds"] == 0
+    assert captured["snapshot_path"] == ""
+    assert captured["snapshot_interval"] == 0
+    assert captured["wal_path"] == ""
+    assert captured["wal_commit_interval"] == 0
+    assert captured["sqlite_path"] == ""
+    assert captured["reload_path"] == ""
+    assert captured["reload_watch_interval"] == 0
     assert captured["app"] == "app-object"
     assert captured["host"] == "localhost"
     assert captured["port"] == 8181
@@ -142,16 +306,8 @@ def test_run_invokes_uvicorn(monkeypatch):
 def test_run_passes_language_remove_stop_words_verbose(monkeypatch):
     captured = {}
 
-    def fake_create_app(
-        auth_token: str = "",
-        language: str = "english",
-        remove_stop_words: bool = False,
-        verbose: bool = False,
-    ):
-        captured["auth_token"] = auth_token
-        captured["language"] = language
-        captured["remove_stop_words"] = remove_stop_words
-        captured["verbose"] = verbose
+    def fake_create_app(**kwargs):
+        captured.update(kwargs)
         return "app-object"
 
     monkeypatch.setattr(cli, "create_app", fake_create_app)
@@ -165,9 +321,173 @@ def test_run_passes_language_remove_stop_words_verbose(monkeypatch):
             "spanish",
             "--remove-stop-words",
             "--verbose",
+            "--ngrams",
+            "2",
+            "--ngram-hash-buckets",
+            "4096",
+            "--disable-metrics",
+            "--classify-batch-window-ms",
+            "2",
+            "--classify-batch-max",
+            "16",
         ]
     )
 
     assert captured["language"] == "spanish"
     assert captured["remove_stop_words"] is True
     assert captured["verbose"] is True
+    assert captured["ngrams"] == 2
+    assert captured["ngram_hash_buckets"] == 4096
+    assert captured["metrics"] is False
+    assert captured["classify_batch_window"] == 0.002
+    assert captured["classify_batch_max"] == 16
+
+
+def test_run_passes_snapshot_and_wal_options(monkeypatch):
+    captured = {}
+
+    def fake_create_app(**kwargs):
+        captured.update(kwargs)
+        return "app-object"
+
+    monkeypatch.setattr(cli, "create_app", fake_create_app)
+    monkeypatch.setattr(cli.uvicorn, "run", lambda *a, **k: None)
+    monkeypatch.setenv("SIMPLEBAYES_WAL_COMMIT_INTERVAL_MS", "5")
+
+    cli.run(
+        [
+            "--snapshot-path", "/data/model.sbm",
+            "--snapshot-interval", "30",
+            "--wal-path", "/data/model.wal",
+            "--sqlite-path", "/data/model.db",
+        ]
+    )
+
+    assert captured["snapshot_path"] == "/data/model.sbm"
+    assert captured["snapshot_interval"] == 30
+    assert captured["wal_path"] == "/data/model.wal"
+    assert captured["sqlite_path"] == "/data/model.db"
+    assert captured["wal_commit_interval"] == 0.005
+
+
+def test_run_passes_reload_options(monkeypatch):
+    captured = {}
+
+    def fake_create_app(**kwargs):
+        captured.update(kwargs)
+        return "app-object"
+
+    monkeypatch.setattr(cli, "create_app", fake_create_app)
+    monkeypatch.setattr(cli.uvicorn, "run", lambda *a, **k: None)
+    monkeypatch.setenv("SIMPLEBAYES_RELOAD_PATH", "/data/model.sbm")
+
+    cli.run(["--reload-watch-interval", "2.5"])
+
+    assert captured["reload_path"] == "/data/model.sbm"
+    assert captured["reload_watch_interval"] == 2.5
+
+
+def test_run_serves_workers(monkeypatch):
+    captured = {}
+
+    def fake_serve_workers(options, **kwargs):
+        captured.update(kwargs, options=options)
+
+    monkeypatch.setattr(cli, "serve_workers", fake_serve_workers)
+    monkeypatch.setattr(cli, "create_app", lambda **kwargs: pytest.fail("the primary is created by serve_workers"))
+
+    cli.run(["--workers", "4", "--port", "8181", "--auth-token", "x"])
+
+    assert captured["workers"] == 4
+    assert captured["port"] == 8181
+    assert captured["options"]["auth_token"] == "x"
+
+
+def test_run_rejects_zero_workers(monkeypatch, capsys):
+    monkeypatch.setattr(cli, "serve_workers", lambda *a, **k: pytest.fail("workers must be >= 1"))
+    with pytest.raises(SystemExit) as raised:
+        cli.run(["--workers", "0"])
+    assert raised.value.code == 2
+    assert "argument --workers: must be >= 1, got 0" in capsys.readouterr().err
+
+
+def test_run_passes_named_model_options(monkeypatch):
+    captured = {}
+
+    def fake_create_app(**kwargs):
+        captured.update(kwargs)
+        return "app-object"
+
+    monkeypatch.setattr(cli, "create_app", fake_create_app)
+    monkeypatch.setattr(cli.uvicorn, "run", lambda *a, **k: None)
+
+    cli.run(["--model-directory", "/data/models", "--max-model-tokens", "5000", "--model-idle-seconds", "60"])
+
+    assert captured["model_directory"] == "/data/models"
+    assert captured["max_model_tokens"] == 5000
+    assert captured["model_idle_seconds"] == 60
+
+
+def test_run_passes_mapped_model(monkeypatch):
+    captured = {}
+    monkeypatch.setenv("SIMPLEBAYES_MAPPED_MODEL", "/data/model.sbm")
+    monkeypatch.setattr(cli, "serve_workers", lambda options, **kwargs: captured.update(options))
+
+    cli.run(["--workers", "2"])
+
+    assert captured["mapped_model_path"] == "/data/model.sbm"
+
+
+def test_parse_args_rejects_negative_wal_commit_interval(capsys):
+    with pytest.raises(SystemExit):
+        cli.parse_args(["--wal-commit-interval-ms", "-1"])
+    assert "argument --wal-commit-interval-ms: must be >= 0, got -1" in capsys.readouterr().err
+
+
+def test_parse_args_rejects_negative_snapshot_interval(capsys):
+    with pytest.raises(SystemExit):
+        cli.parse_args(["--snapshot-interval", "-5"])
+    assert "argument --snapshot-interval: must be >= 0, got -5" in capsys.readouterr().err
+
+
+def test_parse_args_rejects_negative_reload_watch_interval(capsys):
+    with pytest.raises(SystemExit):
+        cli.parse_args(["--reload-watch-interval", "-1"])
+    assert "argument --reload-watch-interval: must be >= 0, got -1" in capsys.readouterr().err
+
+
+def test_parse_args_rejects_negative_max_loaded_tokens(capsys):
+    with pytest.raises(SystemExit):
+        cli.parse_args(["--max-loaded-tokens", "-1"])
+    assert "argument --max-loaded-tokens: must be >= 0, got -1" in capsys.readouterr().err
+
+
+def test_parse_args_rejects_negative_max_batch_size(capsys):
+    with pytest.raises(SystemExit):
+        cli.parse_args(["--max-batch-size", "-1"])
+    assert "argument --max-batch-size: must be >= 0, got -1" in capsys.readouterr().err
+
+
+def test_parse_args_rejects_negative_max_body_bytes(monkeypatch, capsys):
+    monkeypatch.setenv("SIMPLEBAYES_MAX_BODY_BYTES", "-1")
+    with pytest.raises(SystemExit):
+        cli.parse_args([])
+    assert "argument --max-body-bytes: must be >= 0, got -1" in capsys.readouterr().err
+
+
+def test_parse_args_rejects_invalid_classify_batching(capsys):
+    with pytest.raises(SystemExit):
+        cli.parse_args(["--classify-batch-window-ms", "-0.5"])
+    assert "argument --classify-batch-window-ms: must be >= 0, got -0.5" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        cli.parse_args(["--classify-batch-max", "0"])
+    assert "argument --classify-batch-max: must be >= 1, got 0" in capsys.readouterr().err
+
+
+def test_parse_args_rejects_negative_named_model_limits(capsys):
+    with pytest.raises(SystemExit):
+        cli.parse_args(["--max-model-tokens", "-1"])
+    assert "argument --max-model-tokens: must be >= 0, got -1" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        cli.parse_args(["--model-idle-seconds", "-30"])
+    assert "argument --model-idle-seconds: must be >= 0, got -30" in capsys.readouterr().err
@@ -0,0 +1,121 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+import pytest
+
+from simplebayes import SimpleBayes
+from simplebayes.api.app import create_app
+from simplebayes.api.coalesce import ClassifyCoalescer
+from simplebayes.models import ClassificationResult
+
+
+def _trained():
+    classifier = SimpleBayes()
+    classifier.train("spam", "buy cheap pills now")
+    classifier.train("ham", "lunch meeting agenda notes")
+    return classifier
+
+
+def _counting(classifier):
+    batches = []
+
+    def classify_result_batch(texts, *, categories=None):
+        batches.append((list(texts), categories))
+        return classifier.classify_result_batch(texts, categories=categories)
+
+    return SimpleNamespace(batches=batches, classify_result_batch=classify_result_batch)
+
+
+def test_concurrent_requests_are_scored_together():
+    classifier = _counting(_trained())
+    coalescer = ClassifyCoalescer(classifier, window=0.05)
+
+    async def classify_all():
+        return await asyncio.gather(
+            coalescer.classify("cheap pills"),
+            coalescer.classify("meeting notes"),
+            coalescer.classify("buy now", ["ham"]),
+        )
+
+    results = asyncio.run(classify_all())
+    assert [result.category for result in results] == ["spam", "ham", None]
+    assert classifier.batches == [
+        (["cheap pills", "meeting notes"], None),
+        (["buy now"], frozenset({"ham"})),
+    ]
+
+
+def test_full_batches_do_not_wait_for_the_window():
+    classifier = _counting(_trained())
+    coalescer = ClassifyCoalescer(classifier, window=60, max_batch=2)
+
+    async def classify_all():
+        return await asyncio.wait_for(
+            asyncio.gather(coalescer.classify("cheap"), coalescer.classify("lunch")), timeout=5,
+        )
+
+    assert [result.category for result in asyncio.run(classify_all())] == ["spam", "ham"]
+    assert len(classifier.batches) == 1
+
+    unbatched = ClassifyCoalescer(classifier, window=60, max_batch=1)
+    assert asyncio.run(asyncio.wait_for(unbatched.classify("cheap"), timeout=5)).category == "spam"
+    assert len(classifier.batches) == 2
+
+
+def test_errors_reach_every_request_of_the_batch():
+    def classify_result_batch(texts, *, categories=None):
+        raise RuntimeError(f"scoring {len(texts)} texts for {categories} failed")
+
+    coalescer = ClassifyCoalescer(SimpleNamespace(classify_result_batch=classify_result_batch), window=0)
+
+    async def classify_all():
+        return await asyncio.gather(coalescer.classify("a"), coalescer.classify("b"), return_exceptions=True)
+
+    assert [str(error) for error in asyncio.run(classify_all())] == ["scoring 2 texts for None failed"] * 2
+
+
+def test_requests_whose_client_left_are_skipped():
+    release = threading.Event()
+
+    def slow(texts, *, categories=None):
+        release.wait(5)
+        return [ClassificationResult(category=text, score=1.0) for text in texts if categories is None]
+
+    def failing(texts, *, categories=None):
+        slow(texts, categories=categories)
+        raise RuntimeError("scoring failed")
+
+    async def abandon(coalescer):
+        left = asyncio.ensure_future(coalescer.classify("left"))
+        stayed = asyncio.ensure_future(coalescer.classify("stayed"))
+        await asyncio.sleep(0.05)
+        left.cancel()
+        release.set()
+        return await asyncio.gather(stayed, return_exceptions=True)
+
+    coalescer = ClassifyCoalescer(SimpleNamespace(classify_result_batch=slow), window=0)
+    assert asyncio.run(abandon(coalescer))[0].category == "stayed"
+    release.clear()
+    coalescer = ClassifyCoalescer(SimpleNamespace(classify_result_batch=failing), window=0)
+    assert str(asyncio.run(abandon(coalescer))[0]) == "scoring failed"
+
+
+def test_coalescer_validation():
+    with pytest.raises(ValueError, match="window"):
+        ClassifyCoalescer(SimpleBayes(), window=-1)
+    with pytest.raises(ValueError, match="max_batch"):
+        ClassifyCoalescer(SimpleBayes(), window=0.001, max_batch=0)
+
+
+def test_classify_endpoint_coalesces_when_configured():
+    app = create_app(classify_batch_window=0.001, classify_batch_max=8, verbose=True)
+    assert app.state.classify_coalescer.max_batch == 8
+    with TestClient(app) as client:
+        client.post("/train/spam", content="buy cheap pills now")
+        client.post("/train/ham", content="lunch meeting agenda")
+        response = client.post("/classify?categories=spam,ham", content="cheap pills")
+        assert response.json()["category"] == "spam"
+        assert client.post("/classify", content="lunch").json()["category"] == "ham"
+    assert create_app().state.classify_coalescer is None
@@ -0,0 +1,231 @@
+import gzip
+import io
+import lzma
+import os
+import tempfile
+import zlib
+
+import pytest
+
+from simplebayes import SimpleBayes
+from simplebayes.binary_model import BINARY_MODEL_MAGIC
+from simplebayes.compression import (
+    COMPRESSION_GZIP,
+    COMPRESSION_LZMA,
+    COMPRESSION_NONE,
+    COMPRESSION_ZLIB,
+    _ZlibWriter,
+    detect_compression,
+    open_compressor,
+    open_decompressor,
+)
+from simplebayes.errors import InvalidModelStateError, UnsupportedModelFormatError
+from simplebayes.persistence import (
+    MODEL_FORMAT_BINARY,
+    PERSISTED_MODEL_VERSION,
+    dump_model_state_to_stream,
+    load_model_state_from_stream,
+    resolve_model_compression,
+    resolve_model_format,
+)
+
+CODECS = (COMPRESSION_GZIP, COMPRESSION_LZMA, COMPRESSION_ZLIB)
+STATE = {
+    "version": PERSISTED_MODEL_VERSION,
+    "categories": {
+        "spam": {"tally": 3, "tokens": {"buy": 2, "café": 1}},
+        "ham": {"tally": 1, "tokens": {"meeting": 1}},
+    },
+}
+
+
+class _Unseekable(io.RawIOBase):
+    """Forward-only binary stream, like a socket or pipe."""
+
+    def __init__(self, data):
+        super().__init__()
+        self._source = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._source.read(min(len(buffer), 3))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def _trained():
+    classifier = SimpleBayes()
+    classifier.train("spam", "buy now limited offer")
+    classifier.train("ham", "team schedule meeting")
+    return classifier
+
+
+def _dump(compression, model_format="json", level=None):
+    destination = io.BytesIO()
+    dump_model_state_to_stream(
+        destination, STATE, model_format, compression=compression, compression_level=level,
+    )
+    return destination.getvalue()
+
+
+@pytest.mark.parametrize("compression", CODECS)
+@pytest.mark.parametrize("model_format", ("json", MODEL_FORMAT_BINARY))
+def test_compressed_stream_round_trip(compression, model_format):
+    payload = _dump(compression, model_format)
+
+    assert detect_compression(payload) == compression
+    assert load_model_state_from_stream(io.BytesIO(payload)) == STATE
+    assert load_model_state_from_stream(_Unseekable(payload)) == STATE
+
+
+def test_uncompressed_binary_streams_are_detected():
+    assert detect_compression(_dump(COMPRESSION_NONE)) == COMPRESSION_NONE
+    assert load_model_state_from_stream(io.BytesIO(_dump(COMPRESSION_NONE))) == STATE
+    binary = _dump(COMPRESSION_NONE, MODEL_FORMAT_BINARY)
+    assert detect_compression(binary) == COMPRESSION_NONE
+    assert load_model_state_from_stream(_Unseekable(binary)) == STATE
+
+
+def test_payloads_match_stdlib_codecs():
+    plain = _dump(COMPRESSION_NONE)
+    assert gzip.decompress(_dump(COMPRESSION_GZIP)) == plain
+    assert lzma.decompress(_dump(COMPRESSION_LZMA)) == plain
+    assert zlib.decompress(_dump(COMPRESSION_ZLIB)) == plain
+    assert _dump(COMPRESSION_GZIP) == _dump(COMPRESSION_GZIP)
+
+
+def test_compression_level_is_tunable():
+    state = {
+        "version": PERSISTED_MODEL_VERSION,
+        "categories": {"spam": {"tally": 2000, "tokens": {f"token{i}": 1 for i in range(2000)}}},
+    }
+    sizes = []
+    for level in (0, 9):
+        destination = io.BytesIO()
+        dump_model_state_to_stream(destination, state, compression=COMPRESSION_ZLIB, compression_level=level)
+        sizes.append(len(destination.getvalue()))
+    assert sizes[1] < sizes[0]
+
+    with pytest.raises(ValueError):
+        _dump(COMPRESSION_GZIP, level=10)
+
+
+def test_invalid_compression_arguments():
+    with pytest.raises(UnsupportedModelFormatError):
+        _dump("brotli")
+    with pytest.raises(UnsupportedModelFormatError):
+        _dump(COMPRESSION_GZIP, "yaml")
+    with pytest.raises(InvalidModelStateError):
+        dump_model_state_to_stream(None, STATE)  # type: ignore[arg-type]
+    with pytest.raises(InvalidModelStateError):
+        load_model_state_from_stream(None)  # type: ignore[arg-type]
+    with pytest.raises(UnsupportedModelFormatError):
+        open_compressor(io.BytesIO(), COMPRESSION_NONE)
+    with pytest.raises(UnsupportedModelFormatError):
+        open_decompressor(io.BytesIO(), COMPRESSION_NONE)
+
+
+@pytest.mark.parametrize("compression", CODECS)
+def test_truncated_compressed_stream_is_rejected(compression):
+    payload = _dump(compression)
+    with pytest.raises(InvalidModelStateError, match=f"unable to decompress {compression}"):
+        load_model_state_from_stream(io.BytesIO(payload[:len(payload) - 6]))
+
+
+def test_corrupt_zlib_stream_is_rejected():
+    payload = bytearray(_dump(COMPRESSION_ZLIB))
+    payload[5] ^= 0xFF
+    with pytest.raises(InvalidModelStateError, match="unable to decompress"):
+        load_model_state_from_stream(io.BytesIO(bytes(payload)))
+
+
+def test_zlib_reader_reads_in_small_pieces():
+    with open_decompressor(io.BytesIO(_dump(COMPRESSION_ZLIB)), COMPRESSION_ZLIB) as reader:
+        first = reader.read(4)
+        rest = reader.read()
+    assert first + rest == _dump(COMPRESSION_NONE)
+
+    data = os.urandom(1 << 18)
+    with open_decompressor(_Unseekable(zlib.compress(data)), COMPRESSION_ZLIB) as reader:
+        assert reader.read() == data
+
+
+def test_zlib_writer_close_is_idempotent():
+    destination = io.BytesIO()
+    writer = _ZlibWriter(destination, 6)
+    writer.write(b"payload")
+    writer.close()
+    writer.close()
+    assert zlib.decompress(destination.getvalue()) == b"payload"
+
+
+def test_short_streams_are_read_without_detection_errors():
+    with pytest.raises(InvalidModelStateError):
+        load_model_state_from_stream(io.BytesIO(b"[]"))
+
+
+def test_resolve_model_compression_and_format_from_extension():
+    assert resolve_model_compression("/tmp/model.json") == COMPRESSION_NONE
+    assert resolve_model_compression("/tmp/model.json.gz") == COMPRESSION_GZIP
+    assert resolve_model_compression("/tmp/model.sbm.XZ") == COMPRESSION_LZMA
+    assert resolve_model_compression("/tmp/model.json.zz") == COMPRESSION_ZLIB
+    assert resolve_model_compression("/tmp/model.json.gz", COMPRESSION_NONE) == COMPRESSION_NONE
+    with pytest.raises(UnsupportedModelFormatError):
+        resolve_model_compression("/tmp/model.json", "brotli")
+
+    assert resolve_model_format("/tmp/model.sbm.gz") == MODEL_FORMAT_BINARY
+    assert resolve_model_format("/tmp/model.json.gz") == "json"
+
+
+def test_save_to_file_with_compression_round_trips():
+    classifier = _trained()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = {
+            os.path.join(temp_dir, "model.json.gz"): COMPRESSION_GZIP,
+            os.path.join(temp_dir, "model.sbm.xz"): COMPRESSION_LZMA,
+            os.path.join(temp_dir, "model.data"): COMPRESSION_ZLIB,
+        }
+        classifier.save_to_file(os.path.join(temp_dir, "model.json.gz"))
+        classifier.save_to_file(os.path.join(temp_dir, "model.sbm.xz"))
+        classifier.save_to_file(
+            os.path.join(temp_dir, "model.data"),
+            compression=COMPRESSION_ZLIB,
+            compression_level=1,
+        )
+
+        for path, compression in paths.items():
+            with open(path, "rb") as source:
+                assert detect_compression(source.read(8)) == compression
+            loaded = SimpleBayes()
+            loaded.load_from_file(path)
+            assert loaded.score("limited offer") == classifier.score("limited offer")
+
+        with open(os.path.join(temp_dir, "model.sbm.xz"), "rb") as source:
+            assert lzma.decompress(source.read()).startswith(BINARY_MODEL_MAGIC)
+
+
+def test_stream_save_and_load_with_compression():
+    classifier = _trained()
+    destination = io.BytesIO()
+    classifier.save(destination, compression=COMPRESSION_GZIP, compression_level=9)
+
+    destination.seek(0)
+    loaded = SimpleBayes()
+    loaded.load(destination)
+
+    assert not destination.closed
+    assert loaded.score("limited offer") == classifier.score("limited offer")
+
+
+def test_load_accepts_uncompressed_binary_streams():
+    classifier = _trained()
+    text = io.StringIO()
+    classifier.save(text)
+
+    loaded = SimpleBayes()
+    loaded.load(io.BytesIO(text.getvalue().encode("utf-8")))
+
+    assert loaded.get_summaries() == classifier.get_summaries()
@@ -1,5 +1,7 @@
+import threading
 from concurrent.futures import ThreadPoolExecutor
 
+import simplebayes
 from simplebayes import SimpleBayes
 
 
@@ -47,3 +49,27 @@ def test_parallel_classify_during_mutation():
     assert summaries["alpha"].token_tally == 103
     assert summaries["beta"].token_tally == 3
     assert abs((summaries["alpha"].prob_in_cat + summaries["alpha"].prob_not_in_cat) - 1.0) < 1e-12
+
+
+def test_save_does_not_block_classification(monkeypatch):
+    classifier = SimpleBayes()
+    classifier.train("alpha", "one two three")
+    writing = threading.Event()
+    release = threading.Event()
+
+    def slow_save(_path, state, *_args, **_kwargs):
+        writing.set()
+        release.wait(5)
+        assert state["categories"]["alpha"]["tokens"] == {"one": 1, "two": 1, "three": 1}
+
+    monkeypatch.setattr(simplebayes, "save_model_state_to_file", slow_save)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        saving = pool.submit(classifier.save_to_file, "/tmp/unused.json")
+        assert writing.wait(5)
+        # The snapshot is being written; the model stays usable and its copy stays fixed
+        classifier.train("alpha", "one four")
+        assert classifier.classify("four") == "alpha"
+        release.set()
+        saving.result()
+
+    assert classifier.tally("alpha") == 5
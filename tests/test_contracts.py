@@ -3,7 +3,9 @@ from simplebayes.errors import (
     InvalidModelStateError,
     PayloadTooLargeError,
     PersistencePathError,
+    ReadOnlyModelError,
     SimpleBayesError,
+    UnsupportedModelFormatError,
     UnsupportedModelVersionError,
 )
 from simplebayes.models import CategorySummary, ClassificationResult
@@ -26,5 +28,7 @@ def test_error_hierarchy():
     assert issubclass(InvalidCategoryError, SimpleBayesError)
     assert issubclass(PersistencePathError, SimpleBayesError)
     assert issubclass(UnsupportedModelVersionError, SimpleBayesError)
+    assert issubclass(UnsupportedModelFormatError, SimpleBayesError)
     assert issubclass(InvalidModelStateError, SimpleBayesError)
     assert issubclass(PayloadTooLargeError, SimpleBayesError)
+    assert issubclass(ReadOnlyModelError, SimpleBayesError)
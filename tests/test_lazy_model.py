@@ -0,0 +1,243 @@
+import io
+import struct
+
+import pytest
+
+from simplebayes import SimpleBayes
+from simplebayes.errors import InvalidModelStateError
+from simplebayes.lazy_model import LazyCategories, LazyCategory
+
+
+DOCUMENTS = {
+    "spam": "buy now limited offer café offer",
+    "ham": "team schedule meeting now",
+    "news": "limited election results today",
+}
+
+
+def _trained():
+    classifier = SimpleBayes()
+    for category, text in DOCUMENTS.items():
+        classifier.train(category, text)
+    return classifier
+
+
+@pytest.fixture(name="model_path")
+def _model_path(tmp_path):
+    path = str(tmp_path / "model.sbm")
+    _trained().save_to_file(path)
+    return path
+
+
+def _lazy(model_path, max_loaded_tokens=1000):
+    classifier = SimpleBayes(max_loaded_tokens=max_loaded_tokens)
+    classifier.load_from_file(model_path)
+    return classifier
+
+
+def test_lazy_load_reads_only_category_metadata(model_path):
+    classifier = _lazy(model_path)
+    loaded = SimpleBayes()
+    loaded.load_from_file(model_path)
+
+    assert isinstance(classifier.categories, LazyCategories)
+    assert classifier.get_summaries() == loaded.get_summaries()
+    assert classifier.tally("spam") == loaded.tally("spam")
+    assert not any(category.is_loaded for category in classifier.categories.get_categories().values())
+
+    for text in ("limited offer now", "meeting today", "café", "nothing known", ""):
+        assert classifier.score(text) == loaded.score(text)
+        assert classifier.classify_result(text) == loaded.classify_result(text)
+    assert classifier.categories.loaded_tokens == sum(len(c.tokens) for c in loaded.categories.categories.values())
+
+
+def test_scoring_a_subset_only_loads_those_categories(model_path):
+    classifier = _lazy(model_path)
+    loaded = SimpleBayes()
+    loaded.load_from_file(model_path)
+
+    scores = classifier.score("limited offer now", categories=["spam", "ham", "spam", "missing"])
+    assert scores == loaded.score("limited offer now", categories=["ham", "spam"])
+    assert set(scores) == {"spam", "ham"}
+    assert classifier.classify("limited offer", categories=["news"]) == "news"
+    assert classifier.classify_result_stream(["limited of", "fer"], categories=["spam"]).category == "spam"
+
+    loaded_categories = classifier.categories.get_categories()
+    assert loaded_categories["spam"].is_loaded and loaded_categories["ham"].is_loaded
+    assert not classifier.score("limited", categories=[])
+
+
+def test_least_recently_used_categories_are_evicted(model_path):
+    classifier = _lazy(model_path, max_loaded_tokens=5)
+    categories = classifier.categories.get_categories()
+
+    classifier.score("meeting", categories=["ham"])
+    classifier.score("limited", categories=["news"])
+    assert not categories["ham"].is_loaded
+    assert categories["news"].is_loaded
+    assert classifier.categories.loaded_tokens == 4
+
+    # A category larger than the budget is still kept while it is the only one
+    classifier.score("offer", categories=["spam"])
+    assert categories["spam"].is_loaded and not categories["news"].is_loaded
+    assert classifier.categories.loaded_tokens == 5
+
+    classifier.score("limited", categories=["news", "spam"])
+    classifier.score("offer", categories=["spam"])
+    assert classifier.categories.loaded_tokens == 5
+
+
+def test_categories_are_decoded_once_per_call_over_budget(model_path):
+    # Every category holds more tokens than the budget, so each decode evicts the previous one
+    classifier = _lazy(model_path, max_loaded_tokens=1)
+    loaded = SimpleBayes()
+    loaded.load_from_file(model_path)
+    lazy_categories = classifier.categories
+    text = "buy now limited offer team schedule meeting election results today"
+
+    assert classifier.score(text) == loaded.score(text)
+    assert (lazy_categories.cache_misses, lazy_categories.cache_hits) == (3, 0)
+    assert classifier.score_batch([text, text]) == loaded.score_batch([text, text])
+    assert (lazy_categories.cache_misses, lazy_categories.cache_hits) == (6, 0)
+    assert classifier.score(text, categories=["spam", "ham"]) == loaded.score(text, categories=["spam", "ham"])
+    assert lazy_categories.cache_misses == 8
+
+
+def test_trained_categories_are_pinned_and_saved(model_path):
+    classifier = _lazy(model_path, max_loaded_tokens=1)
+    reference = SimpleBayes()
+    reference.load_from_file(model_path)
+    for model in (classifier, reference):
+        model.score("offer", categories=["spam"])
+        model.save_to_file(model_path + ".before.json")
+        model.train("spam", "offer again")
+        model.untrain("ham", "meeting")
+        model.untrain("news", "limited election results today")
+        model.train("fresh", "brand new")
+
+    categories = classifier.categories.get_categories()
+    assert "news" not in categories
+    assert not isinstance(categories["fresh"], LazyCategory)
+    classifier.score("anything", categories=["ham", "spam"])
+    assert categories["spam"].get_token_count("offer") == 3
+    assert classifier.get_summaries() == reference.get_summaries()
+    assert classifier.score("offer meeting team") == reference.score("offer meeting team")
+
+    saved_path = model_path + ".json"
+    classifier.save_to_file(saved_path)
+    restored = SimpleBayes()
+    restored.load_from_file(saved_path)
+    assert restored.get_summaries() == reference.get_summaries()
+
+
+def test_snapshot_taken_before_training_is_unchanged(model_path):
+    classifier = _lazy(model_path)
+    classifier.score("offer", categories=["spam"])
+    state = classifier._export_model_state()  # pylint: disable=protected-access
+    classifier.train("spam", "offer")
+    assert state["categories"]["spam"]["tokens"]["offer"] == 2
+    assert classifier.categories.get_category("spam").get_token_count("offer") == 3
+
+
+def test_untrained_category_drops_from_cache(model_path):
+    classifier = _lazy(model_path)
+    classifier.score("limited")
+    classifier.categories.delete_category("news")
+    classifier.categories.delete_category("missing")
+    assert classifier.categories.loaded_tokens == 9
+
+
+def test_other_formats_and_zero_budget_load_fully(model_path):
+    json_path = model_path + ".json"
+    _trained().save_to_file(json_path)
+    assert not isinstance(_lazy(json_path).categories, LazyCategories)
+
+    eager = SimpleBayes()
+    eager.load_from_file(model_path)
+    assert not isinstance(eager.categories, LazyCategories)
+
+    with pytest.raises(ValueError):
+        SimpleBayes(max_loaded_tokens=-1)
+    with pytest.raises(ValueError):
+        LazyCategories(model_path, 0)
+
+
+def test_replaced_lazy_models_are_unmapped(model_path):
+    classifier = _lazy(model_path)
+    classifier.score("offer")
+    previous = classifier.categories
+    assert previous.loaded_tokens
+
+    classifier.load_from_file(model_path)
+    assert previous._buffer.closed  # pylint: disable=protected-access
+    assert previous.loaded_tokens == 0
+    assert classifier.classify("offer") == "spam"
+
+    current = classifier.categories
+    stream = io.StringIO()
+    _trained().save(stream)
+    stream.seek(0)
+    classifier.load(stream)
+    assert current._buffer.closed  # pylint: disable=protected-access
+    assert classifier.classify("offer") == "spam"
+
+
+def test_lazy_model_keeps_sequence_for_journals(model_path):
+    classifier = SimpleBayes()
+    classifier.categories.sequence = 7
+    classifier.train("spam", "buy now")
+    classifier.save_to_file(model_path)
+    assert _lazy(model_path).categories.sequence == 7
+
+
+def _corrupt(model_path, position, data):
+    with open(model_path, "r+b") as model_file:
+        model_file.seek(position)
+        model_file.write(data)
+
+
+def _first_record(model_path):
+    categories = LazyCategories(model_path, 10)
+    return next(iter(categories.get_categories().values())).record
+
+
+def test_invalid_category_names_are_rejected_on_open(model_path):
+    name_pos = _first_record(model_path)[0]
+    _corrupt(model_path, name_pos, b"\xff")
+    with pytest.raises(InvalidModelStateError, match="category name"):
+        _lazy(model_path)
+    _corrupt(model_path, name_pos, b"!")
+    with pytest.raises(InvalidModelStateError, match="category name"):
+        _lazy(model_path)
+
+
+def test_corrupt_postings_are_rejected_when_read(model_path):
+    record = _first_record(model_path)
+    classifier = _lazy(model_path)
+    _corrupt(model_path, record[5], struct.pack("<I", 99))
+    with pytest.raises(InvalidModelStateError, match="tally mismatch"):
+        classifier.score("offer")
+
+    classifier = _lazy(model_path)
+    _corrupt(model_path, record[4], struct.pack("<I", 10 ** 6))
+    category = classifier.categories.get_category("spam")
+    assert isinstance(category, LazyCategory)
+    with pytest.raises(InvalidModelStateError, match="token id"):
+        category.train_token("offer", 1)
+
+
+def test_duplicates_are_rejected(model_path):
+    records = LazyCategories(model_path, 10).get_categories()
+    spam, news = records["spam"].record, records["news"].record
+    with open(model_path, "rb") as model_file:
+        model = model_file.read()
+    # Both names are four bytes long, so only the copied name changes
+    _corrupt(model_path, news[0], b"spam")
+    with pytest.raises(InvalidModelStateError, match="duplicate category name"):
+        _lazy(model_path)
+
+    _corrupt(model_path, news[0], b"news")
+    classifier = _lazy(model_path)
+    _corrupt(model_path, spam[4] + 4, model[spam[4]:spam[4] + 4])
+    with pytest.raises(InvalidModelStateError, match="duplicate token id"):
+        classifier.score("offer")
@@ -0,0 +1,138 @@
+import io
+
+import pytest
+from fastapi.testclient import TestClient
+
+from simplebayes import SimpleBayes
+from simplebayes.api.app import create_app
+from simplebayes.models import TokenLimits
+from simplebayes.tokenization import (
+    count_stream_tokens,
+    create_tokenizer,
+    get_tokenizer,
+    iter_tokens,
+    limit_tokens,
+)
+
+
+def test_tokenizer_max_tokens_keeps_first_tokens():
+    tokenize = create_tokenizer(max_tokens=3)
+    assert tokenize("one two three four five") == ["one", "two", "three"]
+    assert tokenize("one two") == ["one", "two"]
+
+
+def test_tokenizer_max_tokens_counts_tokens_after_stop_words():
+    tokenize = create_tokenizer(remove_stop_words=True, max_tokens=3)
+    assert tokenize("the cat and the hat with a bat and rat") == ["cat", "hat", "bat"]
+    assert tokenize("the a an") == []
+
+
+def test_tokenizer_max_token_length_drops_long_words():
+    tokenize = create_tokenizer(max_token_length=5)
+    assert tokenize("short " + "x" * 6 + " tiny") == ["short", "tini"]
+    assert tokenize("x" * 50) == []
+
+
+def test_tokenizer_limits_apply_before_ngrams():
+    tokenize = create_tokenizer(ngrams=2, max_tokens=2)
+    assert tokenize("alpha beta gamma") == ["alpha", "beta", "alpha beta"]
+
+
+def test_tokenizer_rejects_negative_limits():
+    with pytest.raises(ValueError):
+        create_tokenizer(max_tokens=-1)
+    with pytest.raises(ValueError):
+        create_tokenizer(max_token_length=-1)
+
+
+def test_get_tokenizer_caches_limits():
+    assert get_tokenizer(max_tokens=5) is get_tokenizer(max_tokens=5)
+    assert get_tokenizer(max_tokens=5) is not get_tokenizer()
+
+
+def test_limit_tokens():
+    assert limit_tokens(["a", "bbb", "c", "d"], max_tokens=2) == ["a", "bbb"]
+    assert limit_tokens(["a", "bbb", "c", "d"], max_token_length=1) == ["a", "c", "d"]
+    assert limit_tokens(["a", "bbb", "c"], max_tokens=2, max_token_length=1) == ["a", "c"]
+    tokens = ["a"]
+    assert limit_tokens(tokens) is tokens
+
+
+def test_iter_tokens_stops_reading_at_max_tokens():
+    reads = []
+
+    def chunks():
+        for index in range(1000):
+            reads.append(index)
+            yield f"word{index} "
+
+    tokens = list(iter_tokens(get_tokenizer(), chunks(), max_tokens=3))
+    assert tokens == ["word0", "word1", "word2"]
+    assert len(reads) < 10
+
+
+def test_stream_limits_match_text_limits():
+    text = "the cat and the hat with a " + "z" * 40 + " bat and rat " * 10
+    tokenize = create_tokenizer(remove_stop_words=True, max_tokens=4, max_token_length=10)
+    expected = SimpleBayes.count_token_occurrences(tokenize(text))
+    assert count_stream_tokens(tokenize, io.StringIO(text), chunk_size=3, max_tokens=4) == expected
+
+
+def test_stream_limits_with_ngrams_match_text_limits():
+    text = "alpha beta " + "q" * 30 + " gamma delta epsilon zeta"
+    tokenize = create_tokenizer(ngrams=2, max_tokens=4, max_token_length=10)
+    expected = SimpleBayes.count_token_occurrences(tokenize(text))
+    chunks = ["alpha ", "beta " + "q" * 30, " gamma delta", " epsilon zeta"]
+    assert count_stream_tokens(tokenize, chunks, max_tokens=4, max_token_length=10) == expected
+
+
+def test_stream_max_token_length_for_plain_tokenizer():
+    assert count_stream_tokens(str.split, ["ab abcdef", " abc"], max_token_length=3) == {"ab": 1, "abc": 1}
+
+
+def test_classifier_limits_default_to_unlimited():
+    assert SimpleBayes().limits == TokenLimits()
+
+
+def test_classifier_rejects_negative_limits():
+    with pytest.raises(ValueError):
+        SimpleBayes(max_new_tokens_per_train=-1)
+
+
+def test_classifier_max_tokens_per_document():
+    classifier = SimpleBayes(max_tokens_per_document=2)
+    classifier.train("spam", "one two three four")
+    assert classifier.tally("spam") == 2
+    assert not classifier.score("three four")
+
+
+def test_classifier_limits_apply_to_custom_tokenizer():
+    classifier = SimpleBayes(tokenizer=str.split, max_tokens_per_document=3, max_token_length=4)
+    classifier.train("spam", "aa bbbbbbbb cc dd ee")
+    assert classifier.categories.get_category("spam").tokens == {"aa": 1, "cc": 1, "dd": 1}
+    classifier.train_stream("ham", ["aa bbbbbbbb", " cc dd ee"])
+    assert classifier.categories.get_category("ham").tokens == {"aa": 1, "cc": 1, "dd": 1}
+    classifier.untrain("spam", "aa bbbbbbbb cc dd ee")
+    assert classifier.tally("spam") == 0
+
+
+def test_classifier_max_new_tokens_per_train():
+    classifier = SimpleBayes(tokenizer=str.split, max_new_tokens_per_train=2)
+    classifier.train("spam", "a b c d")
+    assert classifier.categories.get_category("spam").tokens == {"a": 1, "b": 1}
+    classifier.train("spam", "a b c d e")
+    assert classifier.categories.get_category("spam").tokens == {"a": 2, "b": 2, "c": 1, "d": 1}
+    classifier.train("ham", "x y z")
+    assert classifier.tally("ham") == 2
+
+
+def test_api_enforces_limits():
+    app = create_app(max_tokens_per_document=100, max_token_length=32, max_new_tokens_per_train=10)
+    limits = app.state.classifier.limits
+    assert limits == TokenLimits(100, 32, 10)
+
+    client = TestClient(app)
+    body = " ".join(f"unique{i}" for i in range(5000))
+    response = client.post("/train/spam", content=body, headers={"Content-Type": "text/plain"})
+    assert response.status_code == 200
+    assert response.json()["categories"]["spam"]["tokenTally"] == 10
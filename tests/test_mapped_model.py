@@ -0,0 +1,167 @@
+import io
+import os
+import tempfile
+
+from fastapi.testclient import TestClient
+import pytest
+
+from simplebayes import SimpleBayes
+from simplebayes.api.app import create_app
+from simplebayes.errors import (
+    InvalidModelStateError,
+    ReadOnlyModelError,
+    UnsupportedModelVersionError,
+)
+from simplebayes.mapped_model import MappedCategories, MappedModel
+
+
+def _trained():
+    classifier = SimpleBayes()
+    classifier.train("spam", "buy now limited offer café offer")
+    classifier.train("ham", "team schedule meeting now")
+    classifier.train("news", "limited election results today")
+    return classifier
+
+
+@pytest.fixture(name="model_path")
+def _model_path():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "model.sbm")
+        _trained().save_to_file(path)
+        yield path
+
+
+def test_mapped_model_scores_match_loaded_classifier(model_path):
+    loaded = SimpleBayes()
+    loaded.load_from_file(model_path)
+
+    with MappedModel(model_path) as mapped:
+        for text in ("limited offer now", "meeting today", "café", "nothing known", ""):
+            assert mapped.score(text) == loaded.score(text)
+            assert mapped.classify(text) == loaded.classify(text)
+            assert mapped.classify_result(text) == loaded.classify_result(text)
+        assert mapped.score_stream(["limited of", "fer"]) == loaded.score("limited offer")
+        assert mapped.tally("spam") == loaded.tally("spam")
+        assert mapped.tally("missing") == 0
+        assert mapped.get_summaries() == loaded.get_summaries()
+        assert mapped.categories.get_category("spam").get_token_count("offer") == 2
+        assert mapped.categories.get_category("spam").get_token_count("meet") == 0
+
+
+def test_mapped_model_accepts_classifier_options(model_path):
+    loaded = SimpleBayes(alpha=0.5)
+    loaded.load_from_file(model_path)
+
+    with MappedModel(model_path, alpha=0.5, verify_checksum=True) as mapped:
+        assert mapped.alpha == 0.5
+        assert mapped.score("limited offer") == loaded.score("limited offer")
+
+
+def test_mapped_model_is_read_only(model_path):
+    with MappedModel(model_path) as mapped:
+        with pytest.raises(ReadOnlyModelError):
+            mapped.train("spam", "more text")
+        with pytest.raises(ReadOnlyModelError):
+            mapped.untrain("spam", "offer")
+        with pytest.raises(ReadOnlyModelError):
+            mapped.train_stream("spam", ["more text"])
+        with pytest.raises(ReadOnlyModelError):
+            mapped.train_batch([("spam", "more text")])
+        with pytest.raises(ReadOnlyModelError):
+            mapped.flush()
+        with pytest.raises(ReadOnlyModelError):
+            mapped.load_from_file(model_path)
+        with pytest.raises(ReadOnlyModelError):
+            mapped.categories.add_category("other")
+        with pytest.raises(ReadOnlyModelError):
+            mapped.categories.delete_category("spam")
+        assert mapped.tally("spam") == 6
+
+
+def test_mapped_model_can_be_saved_as_json(model_path):
+    with MappedModel(model_path) as mapped:
+        destination = io.StringIO()
+        mapped.save(destination)
+
+    destination.seek(0)
+    restored = SimpleBayes()
+    restored.load(destination)
+    assert restored.score("limited offer") == _trained().score("limited offer")
+
+
+def test_mapped_model_shares_one_vocabulary_lookup():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "model.bin")
+        SimpleBayes().save_to_file(path)
+        with MappedModel(path) as mapped:
+            assert len(mapped.categories.vocabulary) == 0
+            assert mapped.categories.vocabulary.find("anything") is None
+            assert not mapped.score("anything")
+
+
+def test_mapped_categories_reject_invalid_files(model_path):
+    with open(model_path, "rb") as source:
+        payload = source.read()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        def _write(name, data):
+            path = os.path.join(temp_dir, name)
+            with open(path, "wb") as destination:
+                destination.write(data)
+            return path
+
+        with pytest.raises(InvalidModelStateError, match="truncated"):
+            MappedCategories(_write("empty.sbm", b""))
+        with pytest.raises(InvalidModelStateError, match="not a binary"):
+            MappedModel(_write("model.json", b'{"version": 1, "categories": {}}' + b" " * 128))
+        with pytest.raises(UnsupportedModelVersionError):
+            MappedCategories(_write("future.sbm", payload[:8] + b"\x63" + payload[9:]))
+        with pytest.raises(InvalidModelStateError, match="truncated"):
+            MappedCategories(_write("short.sbm", payload[:len(payload) // 2]))
+        huge_vocabulary = payload[:16] + (1 << 40).to_bytes(8, "little") + payload[24:]
+        with pytest.raises(InvalidModelStateError, match="truncated"):
+            MappedCategories(_write("huge.sbm", huge_vocabulary))
+
+        corrupt = bytearray(payload)
+        corrupt[-8] ^= 0xFF
+        MappedCategories(_write("corrupt.sbm", bytes(corrupt))).close()
+        with pytest.raises(InvalidModelStateError, match="checksum"):
+            MappedCategories(_write("corrupt.sbm", bytes(corrupt)), verify_checksum=True)
+
+        name_pos = payload.index(b"spam")
+        bad_name = payload[:name_pos] + b"\xff" + payload[name_pos + 1:]
+        with pytest.raises(InvalidModelStateError, match="category name"):
+            MappedCategories(_write("bad-name.sbm", bad_name))
+        assert payload.count(b"news") == 1
+        with pytest.raises(InvalidModelStateError, match="duplicate category name"):
+            MappedCategories(_write("duplicate-name.sbm", payload.replace(b"news", b"spam")))
+
+
+def test_server_serves_a_mapped_model(model_path):
+    loaded = SimpleBayes()
+    loaded.load_from_file(model_path)
+    app = create_app(mapped_model_path=model_path, classify_batch_window=0.001)
+    assert isinstance(app.state.classifier, MappedModel)
+    with TestClient(app) as client:
+        assert client.post("/score", content="limited offer now").json() == loaded.score("limited offer now")
+        assert client.post("/classify/batch", json=["meeting today"]).json()[0]["category"] == "ham"
+        assert client.post("/classify", content="limited offer").json()["category"] == "spam"
+        assert 'simplebayes_model_vocabulary_tokens' in client.get("/metrics").text
+
+        for path in ("/train/spam", "/untrain/spam", "/flush"):
+            response = client.post(path, content="buy")
+            assert response.status_code == 409
+            assert "memory-mapped" in response.json()["error"]
+        response = client.post("/train/batch", json=[{"category": "spam", "text": "buy"}])
+        assert response.status_code == 409
+        assert client.post("/reload").status_code == 404
+    with pytest.raises(ValueError):
+        app.state.classifier.score("offer")
+
+
+def test_server_rejects_writable_options_for_mapped_models(model_path):
+    for option in ("snapshot_path", "wal_path", "sqlite_path", "reload_path", "primary_socket"):
+        with pytest.raises(ValueError, match="mapped model is read-only"):
+            create_app(mapped_model_path=model_path, **{option: "/data/model"})
+    with pytest.raises(ValueError, match="mapped model is read-only"):
+        create_app(mapped_model_path=model_path, max_loaded_tokens=10)
@@ -0,0 +1,233 @@
+import asyncio
+import threading
+
+from fastapi.testclient import TestClient
+import pytest
+
+from simplebayes import SimpleBayes
+from simplebayes.api.app import create_app
+from simplebayes.api.metrics import METRICS_MEDIA_TYPE, MetricsMiddleware, ServerMetrics
+from simplebayes.mapped_model import MappedModel
+from simplebayes.metrics import ClassifierMetrics, Counter, Histogram, render_gauges
+from simplebayes.models import ModelSize
+
+
+def _samples(text):
+    """Maps each sample line (name and labels) of an exposition to its value."""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, _, value = line.rpartition(" ")
+            samples[name] = float(value)
+    return samples
+
+
+def test_counters_and_histograms_merge_every_threads_shard():
+    counter = Counter("jobs_total", "Jobs.")
+    histogram = Histogram("job_seconds", "Job time.", buckets=(0.1, 1.0))
+
+    def work():
+        for _ in range(1000):
+            counter.inc(labels=(("kind", "a"),))
+            histogram.observe(0.5)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    histogram.observe(0.05)
+    histogram.observe(2)
+
+    assert counter.value((("kind", "a"),)) == 4000
+    assert counter.value() == 0
+    assert histogram.count() == 4002
+    assert not histogram.count((("kind", "b"),))
+    assert histogram.render() == [
+        "# HELP job_seconds Job time.",
+        "# TYPE job_seconds histogram",
+        'job_seconds_bucket{le="0.1"} 1',
+        'job_seconds_bucket{le="1.0"} 4001',
+        'job_seconds_bucket{le="+Inf"} 4002',
+        "job_seconds_sum 2002.05",
+        "job_seconds_count 4002",
+    ]
+    assert counter.render()[2] == 'jobs_total{kind="a"} 4000'
+
+
+def test_label_values_are_escaped():
+    lines = render_gauges("size", "Size.", [((("path", 'a"b\\c\nd'),), 1)])
+    assert lines[2] == 'size{path="a\\"b\\\\c\\nd"} 1'
+
+
+def test_timed_lock_records_outermost_acquisitions():
+    classifier = SimpleBayes()
+    metrics = ClassifierMetrics()
+    classifier.attach_metrics(metrics)
+    classifier.attach_metrics(metrics)
+    # Attaching again wraps the original lock, not the previous wrapper
+    assert isinstance(classifier._lock.lock, type(threading.RLock()))  # pylint: disable=protected-access
+
+    classifier.train("spam", "buy now")
+    classifier.classify_result("buy")
+    classifier.classify_result_batch(["buy now", "now buy", "later"])
+
+    # The second attach, train, classify (score nested inside), and one batch
+    assert metrics.lock_hold_seconds.count() == 4
+    assert metrics.lock_wait_seconds.count() == 4
+    assert metrics.tokenize_seconds.count() == 5
+    assert metrics.score_seconds.count() == 2
+    assert metrics.token_cache_misses.value() == 3
+    assert metrics.token_cache_hits.value() == 2
+
+
+def test_model_size():
+    classifier = SimpleBayes()
+    assert classifier.model_size() == ModelSize(categories=0, vocabulary=0, tally=0)
+    classifier.train("spam", "buy now buy")
+    classifier.train("ham", "meet now")
+    assert classifier.model_size() == ModelSize(categories=2, vocabulary=3, tally=5)
+
+
+def test_model_size_keeps_the_vocabulary_current(tmp_path):
+    classifier = SimpleBayes()
+    classifier.train("spam", "buy now buy")
+    assert classifier.model_size().vocabulary == 2
+
+    classifier.train("ham", "meet now")
+    classifier.train("news", "vote")
+    assert classifier.model_size() == ModelSize(categories=3, vocabulary=4, tally=6)
+    classifier.untrain("spam", "now")
+    assert classifier.model_size().vocabulary == 4
+    classifier.untrain("ham", "meet now")
+    assert classifier.model_size() == ModelSize(categories=2, vocabulary=2, tally=3)
+    classifier.train("ham", "buy lunch")
+    assert classifier.model_size().vocabulary == 3
+
+    path = str(tmp_path / "model.json")
+    classifier.save_to_file(path)
+    classifier.flush()
+    assert classifier.model_size() == ModelSize(categories=0, vocabulary=0, tally=0)
+    classifier.load_from_file(path)
+    assert classifier.model_size() == ModelSize(categories=3, vocabulary=3, tally=5)
+
+
+def test_scrapes_do_not_make_training_copy_the_tokens():
+    app = create_app()
+    classifier = app.state.classifier
+    with TestClient(app) as client:
+        client.post("/train/spam", content="buy now")
+        tokens = classifier.categories.get_category("spam").tokens
+        assert _samples(client.get("/metrics").text)["simplebayes_model_vocabulary_tokens"] == 2
+        client.post("/train/spam", content="cheap")
+        assert classifier.categories.get_category("spam").tokens is tokens
+        assert _samples(client.get("/metrics").text)["simplebayes_model_vocabulary_tokens"] == 3
+
+
+def test_binary_models_report_the_file_vocabulary(tmp_path):
+    path = str(tmp_path / "model.sbm")
+    trained = SimpleBayes()
+    trained.train("spam", "buy now buy")
+    trained.train("ham", "meet now")
+    trained.save_to_file(path)
+
+    lazy = SimpleBayes(max_loaded_tokens=100)
+    lazy.load_from_file(path)
+    assert lazy.model_size() == trained.model_size()
+    assert not lazy.categories.cache_misses
+    lazy.score("buy")
+    lazy.score("buy")
+    assert (lazy.categories.cache_hits, lazy.categories.cache_misses) == (2, 2)
+
+    with MappedModel(path) as mapped:
+        assert mapped.model_size() == trained.model_size()
+
+
+def test_metrics_endpoint_reports_requests_and_model():
+    client = TestClient(create_app())
+    client.post("/train/spam", content="buy now")
+    client.post("/train/ham", content="meet now")
+    client.post("/classify", content="buy")
+    client.post("/classify/batch", json=["buy now", "meet"])
+    client.get("/missing")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == METRICS_MEDIA_TYPE
+    samples = _samples(response.text)
+    assert samples['simplebayes_requests_total{route="/train/{category}",method="POST",status="200"}'] == 2
+    assert samples['simplebayes_requests_total{route="unrouted",method="GET",status="404"}'] == 1
+    duration = 'simplebayes_request_duration_seconds_count{route="/classify",method="POST"}'
+    assert samples[duration] == 1
+    assert samples["simplebayes_model_categories"] == 2
+    assert samples["simplebayes_model_vocabulary_tokens"] == 3
+    assert samples["simplebayes_model_tally_tokens"] == 4
+    assert samples["simplebayes_token_probability_cache_misses_total"] == 3
+    assert samples["simplebayes_lock_hold_seconds_count"] >= 4
+    assert "simplebayes_category_cache_hits_total" not in samples
+
+
+def test_model_size_is_recounted_only_after_changes(monkeypatch):
+    classifier = SimpleBayes()
+    calls = []
+    real_model_size = classifier.model_size
+    monkeypatch.setattr(classifier, "model_size", lambda: calls.append(1) or real_model_size())
+
+    metrics = ServerMetrics()
+    metrics.render(classifier)
+    metrics.render(classifier)
+    classifier.train("spam", "buy")
+    assert _samples(metrics.render(classifier))["simplebayes_model_categories"] == 1
+    assert len(calls) == 2
+
+
+def test_lazy_models_report_category_cache_counts(tmp_path):
+    path = str(tmp_path / "model.sbm")
+    trained = SimpleBayes()
+    trained.train("spam", "buy now")
+    trained.save_to_file(path)
+
+    client = TestClient(create_app(snapshot_path=path, max_loaded_tokens=100))
+    client.post("/classify", content="buy")
+    client.post("/classify", content="buy")
+    samples = _samples(client.get("/metrics").text)
+    assert samples["simplebayes_category_cache_hits_total"] == 1
+    assert samples["simplebayes_category_cache_misses_total"] == 1
+
+
+def test_metrics_follow_auth_and_can_be_disabled():
+    client = TestClient(create_app(auth_token="secret"))
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer secret"}).status_code == 200
+
+    app = create_app(metrics=False)
+    assert app.state.classifier.metrics is None
+    response = TestClient(app).get("/metrics")
+    assert response.status_code == 404
+    assert response.json() == {"error": "metrics are disabled"}
+
+
+def test_failed_requests_are_counted_as_errors():
+    metrics = ServerMetrics()
+
+    async def app(_scope, _receive, _send):
+        raise RuntimeError("boom")
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(_message):
+        pass
+
+    middleware = MetricsMiddleware(app, metrics)
+    with pytest.raises(RuntimeError):
+        asyncio.run(middleware({"type": "http", "method": "GET", "path": "/info"}, receive, send))
+    assert metrics.requests.value((("route", "unrouted"), ("method", "GET"), ("status", "500"))) == 1
+
+    calls = []
+
+    async def lifespan_app(scope, _receive, _send):
+        calls.append(scope["type"])
+
+    asyncio.run(MetricsMiddleware(lifespan_app, metrics)({"type": "lifespan"}, receive, send))
+    assert calls == ["lifespan"]
@@ -0,0 +1,103 @@
+import io
+
+import pytest
+
+from simplebayes import SimpleBayes
+from simplebayes.tokenization import (
+    NgramTokenizer,
+    count_stream_tokens,
+    create_tokenizer,
+    get_tokenizer,
+    iter_tokens,
+)
+
+
+def test_create_tokenizer_default_has_no_ngrams():
+    assert create_tokenizer()("buy now offer") == ["buy", "now", "offer"]
+
+
+def test_bigrams_follow_unigrams():
+    tokenize = create_tokenizer(ngrams=2)
+    assert tokenize("buy now limited offer") == [
+        "buy", "now", "limit", "offer",
+        "buy now", "now limit", "limit offer",
+    ]
+
+
+def test_trigrams_include_bigrams():
+    tokenize = create_tokenizer(ngrams=3)
+    tokens = tokenize("a b c d")
+    assert tokens == ["a", "b", "c", "d", "a b", "b c", "c d", "a b c", "b c d"]
+
+
+def test_ngrams_use_tokens_after_stop_word_removal():
+    tokenize = create_tokenizer(remove_stop_words=True, ngrams=2)
+    assert tokenize("cat in the hat") == ["cat", "hat", "cat hat"]
+
+
+def test_ngrams_short_inputs():
+    tokenize = create_tokenizer(ngrams=3)
+    assert not tokenize("")
+    assert tokenize("single") == ["singl"]
+    assert tokenize("two words") == ["two", "word", "two word"]
+
+
+def test_hashed_ngrams_are_bounded_and_stable():
+    tokenize = create_tokenizer(ngrams=3, ngram_hash_buckets=8)
+    text = " ".join(f"word{i}" for i in range(200))
+    tokens = tokenize(text)
+    hashed = [token for token in tokens if token.startswith("#")]
+    assert len(hashed) == 199 + 198
+    assert {int(token[1:]) for token in hashed} <= set(range(8))
+    assert tokens == create_tokenizer(ngrams=3, ngram_hash_buckets=8)(text)
+
+
+def test_hashed_bigrams_and_trigrams_differ():
+    tokenize = create_tokenizer(ngrams=3, ngram_hash_buckets=1 << 20)
+    tokens = tokenize("alpha beta gamma")
+    assert len(set(tokens[3:])) == 3
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"ngrams": 0}, {"ngrams": 4}, {"ngrams": 2, "ngram_hash_buckets": -1}],
+)
+def test_invalid_ngram_settings_raise(kwargs):
+    with pytest.raises(ValueError):
+        create_tokenizer(**kwargs)
+
+
+def test_ngram_tokenizer_rejects_invalid_size():
+    with pytest.raises(ValueError):
+        NgramTokenizer(create_tokenizer(), max_n=1)
+
+
+def test_get_tokenizer_caches_ngram_settings():
+    assert get_tokenizer(ngrams=2) is get_tokenizer(ngrams=2)
+    assert get_tokenizer(ngrams=2) is not get_tokenizer(ngrams=2, ngram_hash_buckets=64)
+    assert get_tokenizer(ngrams=1, ngram_hash_buckets=64) is get_tokenizer()
+
+
+@pytest.mark.parametrize("hash_buckets", [0, 1024])
+def test_streaming_ngrams_span_segments(hash_buckets):
+    tokenize = get_tokenizer(ngrams=3, ngram_hash_buckets=hash_buckets)
+    text = "buy now limited offer click here today only " * 5
+    chunks = ["buy no", "w lim", "ited", " ", "offer click here today only " * 5, "buy now limited offer"]
+    chunked_text = "".join(chunks)
+
+    expected = SimpleBayes.count_token_occurrences(tokenize(chunked_text))
+    assert count_stream_tokens(tokenize, chunks) == expected
+    assert sorted(iter_tokens(tokenize, io.StringIO(text), chunk_size=3)) == sorted(tokenize(text))
+
+
+def test_streaming_ngrams_skip_empty_segments():
+    tokenize = get_tokenizer(ngrams=2)
+    assert count_stream_tokens(tokenize, ["alpha ", "!!! ", "beta"]) == {"alpha": 1, "beta": 1, "alpha beta": 1}
+
+
+def test_simplebayes_with_bigrams_scores_phrases():
+    classifier = SimpleBayes(ngrams=2)
+    classifier.train("spam", "limited offer")
+    classifier.train("ham", "limited edition offer")
+    assert classifier.categories.get_category("spam").get_token_count("limit offer") == 1
+    assert classifier.classify("limited offer") == "spam"
@@ -1,6 +1,8 @@
 import io
 import json
 import os
+import subprocess
+import sys
 import tempfile
 
 import pytest
@@ -14,6 +16,7 @@ from simplebayes.errors import (
 )
 from simplebayes.persistence import (
     PERSISTED_MODEL_VERSION,
+    build_model_categories,
     dump_model_state,
     load_model_state_from_file,
     load_model_state,
@@ -80,6 +83,9 @@ def test_validate_model_state_errors():
     with pytest.raises(UnsupportedModelVersionError):
         validate_model_state({"version": 999, "categories": {}})
 
+    with pytest.raises(InvalidModelStateError, match="sequence"):
+        validate_model_state({"version": PERSISTED_MODEL_VERSION, "sequence": -1, "categories": {}})
+
     with pytest.raises(InvalidModelStateError):
         validate_model_state({"version": PERSISTED_MODEL_VERSION, "categories": []})
 
@@ -143,6 +149,60 @@ def test_load_rejects_invalid_payload():
         classifier.load(payload)
 
 
+def test_build_model_categories_adopts_validated_token_maps():
+    tokens = {"one": 2, "two": 1}
+    state = {
+        "version": PERSISTED_MODEL_VERSION,
+        "categories": {"alpha": {"tally": 3, "tokens": tokens}, "beta": {"tally": 0, "tokens": {}}},
+    }
+
+    categories = build_model_categories(state)
+
+    assert list(categories.get_categories()) == ["alpha", "beta"]
+    assert categories.get_category("alpha").tokens is tokens
+    assert categories.get_category("alpha").get_tally() == 3
+    assert categories.get_category("alpha").get_token_count("one") == 2
+    assert categories.get_category("beta").get_tally() == 0
+
+
+def test_failed_load_keeps_current_model():
+    classifier = SimpleBayes()
+    classifier.train("spam", "buy now limited offer")
+    before = classifier.score("limited offer")
+    state = {
+        "version": PERSISTED_MODEL_VERSION,
+        "categories": {
+            "ham": {"tally": 1, "tokens": {"meeting": 1}},
+            "alpha": {"tally": 2, "tokens": {"token": 1}},
+        },
+    }
+
+    with pytest.raises(InvalidModelStateError, match="tally mismatch"):
+        classifier.load(io.StringIO(json.dumps(state)))
+
+    assert classifier.tally("ham") == 0
+    assert classifier.score("limited offer") == before
+
+
+def test_loaded_model_trains_like_a_fresh_one():
+    classifier = SimpleBayes()
+    classifier.train("spam", "buy now limited offer")
+    destination = io.StringIO()
+    classifier.save(destination)
+    destination.seek(0)
+
+    loaded = SimpleBayes()
+    loaded.load(destination)
+    loaded.train("spam", "offer")
+    loaded.untrain("spam", "buy")
+    classifier.train("spam", "offer")
+    classifier.untrain("spam", "buy")
+
+    assert loaded.categories.get_category("spam").tokens == classifier.categories.get_category("spam").tokens
+    assert loaded.tally("spam") == classifier.tally("spam")
+    assert loaded.get_summaries() == classifier.get_summaries()
+
+
 def test_category_validation_consistent_between_runtime_and_persistence():
     for category in ["alpha-1", "A_B", "x" * 64]:
         assert SimpleBayes.normalize_category(category) == category
@@ -181,3 +241,17 @@ def test_save_model_state_cleanup_on_replace_failure(monkeypatch):
 def test_load_model_state_from_file_not_found():
     with pytest.raises(FileNotFoundError):
         load_model_state_from_file("/tmp/simplebayes-missing-model.json")
+
+
+def test_import_simplebayes_loads_only_what_every_classifier_needs():
+    deferred = (
+        "sqlite3", "_sqlite3", "gzip", "lzma", "_lzma", "mmap",
+        "simplebayes.binary_model", "simplebayes.lazy_model", "simplebayes.metrics", "simplebayes.wal",
+    )
+    # Modules the interpreter had already loaded before the import do not count
+    code = (
+        "import sys; before = set(sys.modules); import simplebayes; "
+        f"print(*set({deferred!r}) & (set(sys.modules) - before))"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], text=True, timeout=30)
+    assert output.split() == []
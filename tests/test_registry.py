@@ -0,0 +1,251 @@
+import os
+import threading
+import time
+
+from fastapi.testclient import TestClient
+import pytest
+
+from simplebayes import SimpleBayes
+from simplebayes.api.app import create_app
+from simplebayes.errors import InvalidModelNameError, UnsupportedModelVersionError
+from simplebayes.runtime.registry import ModelRegistry
+
+
+def _saved_model(path, category, text):
+    classifier = SimpleBayes()
+    classifier.train(category, text)
+    classifier.save_to_file(str(path))
+
+
+def test_model_names_are_checked(tmp_path):
+    registry = ModelRegistry(str(tmp_path))
+    assert registry.path_for("tenant-1.v2_a") == str(tmp_path / "tenant-1.v2_a.sbm")
+    for name in ("", "..", ".hidden", "a/b", "x" * 129):
+        with pytest.raises(InvalidModelNameError):
+            registry.path_for(name)
+
+
+def test_registry_validation(tmp_path):
+    with pytest.raises(ValueError, match="max_tokens"):
+        ModelRegistry(str(tmp_path), max_tokens=-1)
+    with pytest.raises(ValueError, match="sweep_interval"):
+        ModelRegistry(str(tmp_path), sweep_interval=0)
+
+
+def test_models_are_loaded_on_first_use_and_saved_when_changed(tmp_path):
+    _saved_model(tmp_path / "acme.sbm", "spam", "buy cheap")
+    (tmp_path / "notes.txt").write_text("not a model")
+    registry = ModelRegistry(str(tmp_path))
+    assert registry.stored() == ["acme"]
+    assert not registry.loaded()
+
+    with registry.use("acme") as acme:
+        assert acme.classify("cheap") == "spam"
+    with registry.use("globex") as globex:
+        assert not globex.categories.get_categories()
+        globex.train("ham", "lunch")
+    with registry.use("acme") as again:
+        assert again is acme
+    assert registry.loaded() == ["globex", "acme"]
+    assert registry.acquire_loaded("initech") is None
+    assert registry.acquire_loaded("globex") is globex
+    registry.release("globex")
+    assert registry.loaded() == ["acme", "globex"]
+
+    acme_saved_at = os.path.getmtime(tmp_path / "acme.sbm")
+    registry.stop()
+    assert registry.stored() == ["acme", "globex"]
+    assert os.path.getmtime(tmp_path / "acme.sbm") == acme_saved_at
+    with ModelRegistry(str(tmp_path)).use("globex") as reloaded:
+        assert reloaded.classify("lunch") == "ham"
+
+
+def test_missing_directories_are_created_on_save(tmp_path):
+    registry = ModelRegistry(str(tmp_path / "models"))
+    assert registry.stored() == []
+    with registry.use("acme") as acme:
+        acme.train("spam", "buy")
+    registry.save_all()
+    assert registry.stored() == ["acme"]
+
+
+def test_idle_models_are_evicted_to_disk(tmp_path):
+    registry = ModelRegistry(str(tmp_path), idle_seconds=0.01)
+    with registry.use("acme") as acme:
+        acme.train("spam", "buy cheap")
+    leased = registry.acquire("globex")
+    time.sleep(0.02)
+
+    assert registry.sweep() == 1
+    assert registry.loaded() == ["globex"]
+    registry.release("globex")
+    assert leased.revision == 0
+    with registry.use("acme") as reloaded:
+        assert reloaded is not acme
+        assert reloaded.classify("cheap") == "spam"
+
+
+def test_least_recently_used_models_are_evicted_over_budget(tmp_path):
+    for name in ("a", "b", "c"):
+        _saved_model(tmp_path / f"{name}.sbm", "spam", f"{name}1 {name}2 {name}3")
+    registry = ModelRegistry(str(tmp_path), max_tokens=7)
+
+    with registry.use("a"):
+        with registry.use("b"):
+            pass
+        with registry.use("c"):
+            # a is in use, so b goes
+            assert registry.loaded() == ["a", "c"]
+    assert registry.sweep() == 0
+
+    with registry.use("c") as model_c:
+        model_c.train("spam", "c4 c5")
+    assert registry.sweep() == 1
+    assert registry.loaded() == ["c"]
+
+    # Models in use stay loaded even over budget
+    with registry.use("c"), registry.use("a"):
+        assert registry.sweep() == 0
+        assert registry.loaded() == ["c", "a"]
+    assert registry.sweep() == 1
+    assert registry.loaded() == ["a"]
+
+
+def test_budget_checks_do_not_make_writes_copy_the_tokens(tmp_path):
+    registry = ModelRegistry(str(tmp_path), max_tokens=1000)
+    with registry.use("acme") as acme:
+        acme.train("spam", "buy cheap")
+        tokens = acme.categories.get_category("spam").tokens
+    for text in ("pills", "now"):
+        assert registry.sweep() == 0
+        with registry.use("acme"):
+            acme.train("spam", text)
+    assert acme.categories.get_category("spam").tokens is tokens
+    assert registry.sweep() == 0
+
+
+def test_models_in_use_or_changed_are_not_evicted(tmp_path, monkeypatch):
+    registry = ModelRegistry(str(tmp_path), idle_seconds=0.01)
+    with registry.use("acme") as acme:
+        acme.train("spam", "buy")
+    time.sleep(0.02)
+
+    saved = []
+
+    def save_then_change(absolute_path):
+        saved.append(absolute_path)
+        acme.train("spam", "more")
+
+    monkeypatch.setattr(acme, "save_to_file", save_then_change)
+    assert registry.sweep() == 0
+    assert registry.loaded() == ["acme"]
+    assert saved == [registry.path_for("acme")]
+
+
+def test_failed_loads_are_retried(tmp_path):
+    (tmp_path / "broken.sbm").write_bytes(b'{"version": 99}')
+    registry = ModelRegistry(str(tmp_path))
+    with pytest.raises(UnsupportedModelVersionError):
+        registry.acquire("broken")
+    assert not registry.loaded()
+
+    _saved_model(tmp_path / "broken.sbm", "spam", "buy")
+    with registry.use("broken") as fixed:
+        assert fixed.classify("buy") == "spam"
+
+
+def test_failed_evictions_are_reported(tmp_path, capsys):
+    (tmp_path / "models").write_text("a file where the directory should be")
+    registry = ModelRegistry(str(tmp_path / "models"), max_tokens=1, sweep_interval=0.01)
+    with registry.use("acme") as acme:
+        acme.train("spam", "buy cheap")
+    with registry.use("globex"):
+        pass
+    assert "saving an evicted model failed" in capsys.readouterr().err
+
+    registry.start()
+    time.sleep(0.05)
+    registry._stopped.set()  # pylint: disable=protected-access
+    registry._thread.join()  # pylint: disable=protected-access
+    assert "saving an evicted model failed" in capsys.readouterr().err
+    assert registry.loaded() == ["acme", "globex"]
+
+
+def test_background_sweeps_evict_idle_models(tmp_path):
+    registry = ModelRegistry(str(tmp_path), idle_seconds=0.01, sweep_interval=0.01)
+    registry.start()
+    with registry.use("acme") as acme:
+        acme.train("spam", "buy")
+    deadline = time.monotonic() + 5
+    while registry.loaded():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    registry.stop()
+    assert registry.stored() == ["acme"]
+
+
+def test_concurrent_first_uses_load_once(tmp_path):
+    _saved_model(tmp_path / "acme.sbm", "spam", "buy")
+    registry = ModelRegistry(str(tmp_path))
+    models = []
+
+    def use():
+        with registry.use("acme") as model:
+            models.append(model)
+
+    threads = [threading.Thread(target=use) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(model) for model in models}) == 1
+
+
+def test_named_model_routes(tmp_path):
+    _saved_model(tmp_path / "acme.sbm", "spam", "buy cheap")
+    app = create_app(auth_token="secret", model_directory=str(tmp_path), classify_batch_window=0.001)
+    headers = {"Authorization": "Bearer secret"}
+    with TestClient(app) as client:
+        assert client.post("/models/acme/classify", content="cheap").status_code == 401
+        assert client.post("/models/acme/classify", content="cheap", headers=headers).json() == {
+            "category": "spam",
+            "score": 1.0,
+        }
+        client.post("/models/globex/train/ham", content="lunch meeting", headers=headers)
+        client.post("/models/globex/train/batch", json=[{"category": "spam", "text": "pills"}], headers=headers)
+        assert client.post("/models/globex/classify/batch", json=["lunch"], headers=headers).json()[0] == {
+            "category": "ham",
+            "score": 1.0,
+        }
+        assert set(client.get("/models/globex/info", headers=headers).json()["categories"]) == {"ham", "spam"}
+        assert client.post("/models/globex/untrain/spam", content="pills", headers=headers).status_code == 200
+        assert client.post("/models/acme/flush", headers=headers).json()["success"] is True
+
+        # The default model is separate
+        assert client.get("/info", headers=headers).json() == {"categories": {}}
+        assert client.get("/models", headers=headers).json() == {"loaded": ["acme", "globex"], "stored": ["acme"]}
+        assert client.post("/models/acme/reload", headers=headers).status_code == 404
+
+        response = client.post("/models/.hidden/classify", content="cheap", headers=headers)
+        assert response.status_code == 400
+        assert response.json() == {"error": "invalid model name: '.hidden'"}
+
+    assert app.state.models.stored() == ["acme", "globex"]
+    with ModelRegistry(str(tmp_path)).use("acme") as acme:
+        assert not acme.categories.get_categories()
+
+
+def test_named_models_without_metrics(tmp_path):
+    with TestClient(create_app(model_directory=str(tmp_path), metrics=False)) as client:
+        client.post("/models/acme/train/spam", content="buy")
+        assert client.post("/models/acme/score", content="buy").json() == {"spam": 1.0}
+
+
+def test_named_models_require_a_directory(tmp_path):
+    with TestClient(create_app()) as client:
+        assert client.get("/models").json() == {"error": "named models are not configured"}
+        assert client.post("/models/acme/classify", content="cheap").status_code == 404
+    with pytest.raises(ValueError, match="model_directory"):
+        create_app(max_model_tokens=10)
+    with pytest.raises(ValueError, match="primary_socket"):
+        create_app(primary_socket="primary.sock", model_directory=str(tmp_path))
@@ -0,0 +1,425 @@
+import asyncio
+import io
+import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+
+from fastapi.testclient import TestClient
+import pytest
+import uvicorn
+
+from simplebayes import CHANGE_LOAD, SimpleBayes
+from simplebayes.api import replication, workers
+from simplebayes.api.app import create_app
+from simplebayes.runtime.replication import REVISION_HEADER, ChangeFeed, ReplicaFollower
+from simplebayes.wal import WAL_FLUSH, WAL_TRAIN, WAL_UNTRAIN
+
+
+class _Primary:
+    """A primary app served on a unix socket from a background thread."""
+
+    def __init__(self, **options) -> None:
+        self.directory = tempfile.mkdtemp(prefix="sb-")
+        self.socket_path = os.path.join(self.directory, "primary.sock")
+        self.app = create_app(change_feed=True, **options)
+        self.server = None
+        self.thread = None
+
+    def start(self) -> "_Primary":
+        self.server = uvicorn.Server(uvicorn.Config(
+            self.app, uds=self.socket_path, log_level="warning", timeout_graceful_shutdown=0.1,
+        ))
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+        self.thread.start()
+        deadline = time.monotonic() + 10
+        while not self.server.started:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        return self
+
+    def stop(self) -> None:
+        self.server.should_exit = True
+        self.thread.join()
+
+
+@pytest.fixture(name="primary")
+def primary_fixture():
+    primary = _Primary(auth_token="secret").start()
+    yield primary
+    primary.stop()
+    shutil.rmtree(primary.directory, ignore_errors=True)
+
+
+def _auth():
+    return {"Authorization": "Bearer secret"}
+
+
+def test_apply_change_replays_train_untrain_and_flush():
+    classifier = SimpleBayes()
+    classifier.apply_change(WAL_TRAIN, "spam", {"buy": 2, "now": 1})
+    assert classifier.categories.get_category("spam").get_tally() == 3
+    classifier.apply_change(WAL_UNTRAIN, "spam", {"buy": 1})
+    assert classifier.categories.get_category("spam").get_tally() == 2
+    classifier.apply_change(WAL_FLUSH)
+    assert not classifier.categories.get_categories()
+    assert classifier.revision == 3
+
+
+def test_export_state_matches_the_revision():
+    classifier = SimpleBayes()
+    classifier.train("spam", "buy now")
+    revision, state = classifier.export_state()
+    assert revision == classifier.revision == 1
+    assert state["categories"]["spam"]["tally"] == 2
+
+
+def test_change_feed_returns_changes_in_order():
+    classifier = SimpleBayes()
+    feed = ChangeFeed(classifier)
+    assert classifier.change_feed is feed
+    assert not feed.changes_after(0, timeout=0.01)
+
+    classifier.train("spam", "buy now")
+    classifier.untrain("spam", "now")
+    changes = feed.changes_after(0, timeout=0.01)
+    assert [(revision, operation, category) for revision, operation, category, _ in changes] == [
+        (1, WAL_TRAIN, "spam"),
+        (2, WAL_UNTRAIN, "spam"),
+    ]
+    assert changes[0][3] == {"buy": 1, "now": 1}
+    assert [change[0] for change in feed.changes_after(1, timeout=0.01)] == [2]
+
+
+def test_change_feed_wakes_waiting_followers():
+    classifier = SimpleBayes()
+    feed = ChangeFeed(classifier)
+    timer = threading.Timer(0.05, classifier.train, ("spam", "buy"))
+    timer.start()
+    assert [change[0] for change in feed.changes_after(0, timeout=5)] == [1]
+    timer.join()
+
+
+def test_change_feed_sends_the_model_when_changes_cannot_be_replayed():
+    classifier = SimpleBayes()
+    feed = ChangeFeed(classifier, max_pending=2)
+    for _ in range(3):
+        classifier.train("spam", "buy")
+    assert feed.changes_after(0, timeout=0.01) is None
+    assert [change[0] for change in feed.changes_after(1, timeout=0.01)] == [2, 3]
+
+    state = classifier.export_state()[1]
+    classifier.load(io.BytesIO(json.dumps(state).encode("utf-8")))
+    assert feed.changes_after(3, timeout=0.01) is None
+    assert feed.changes_after(0, timeout=0.01) is None
+
+
+def test_change_feed_drops_changes_every_follower_has():
+    classifier = SimpleBayes()
+    feed = ChangeFeed(classifier)
+    fast = feed.add_follower(0)
+    slow = feed.add_follower(0)
+    for _ in range(3):
+        classifier.train("spam", "buy")
+    assert [change[0] for change in feed.changes_after(0, timeout=0.01, follower=fast)] == [1, 2, 3]
+    assert not feed.changes_after(3, timeout=0.01, follower=fast)
+    # The slow follower has not been sent them yet
+    assert feed.pending == 3
+    assert [change[0] for change in feed.changes_after(1, timeout=0.01, follower=slow)] == [2, 3]
+    assert feed.pending == 2
+    assert not feed.changes_after(3, timeout=0.01, follower=slow)
+    assert feed.pending == 0
+
+    classifier.train("spam", "now")
+    feed.remove_follower(slow)
+    assert [change[0] for change in feed.changes_after(3, timeout=0.01, follower=fast)] == [4]
+    assert feed.pending == 1
+    assert not feed.changes_after(4, timeout=0.01, follower=fast)
+    assert feed.pending == 0
+    # A follower reconnecting after its changes were dropped gets the whole model
+    assert feed.changes_after(3, timeout=0.01, follower=feed.add_follower(3)) is None
+
+
+def test_change_feed_validation():
+    with pytest.raises(ValueError, match="max_pending"):
+        ChangeFeed(SimpleBayes(), max_pending=0)
+
+
+def test_change_lines_stream_the_model_then_changes(monkeypatch):
+    monkeypatch.setattr(replication, "FEED_HEARTBEAT_SECONDS", 0.01)
+    app = create_app(change_feed=True)
+    classifier = app.state.classifier
+    with TestClient(app) as client:
+        client.post("/train/spam", content="buy now")
+        response = client.post("/train/ham", content="lunch")
+    assert response.headers[REVISION_HEADER] == "2"
+
+    async def collect():
+        stream = replication.change_lines(app.state.change_feed, -1)
+        lines = [await anext(stream)]
+        classifier.train("spam", "cheap")
+        lines.append(await anext(stream))
+        lines.append(await anext(stream))
+        await stream.aclose()
+        return lines
+
+    lines = asyncio.run(collect())
+    header, model = lines[0].splitlines()
+    assert json.loads(header) == {"revision": 2, "operation": CHANGE_LOAD}
+    assert set(json.loads(model)["categories"]) == {"spam", "ham"}
+    assert json.loads(lines[1]) == {"revision": 3, "operation": WAL_TRAIN, "category": "spam", "counts": {"cheap": 1}}
+    assert lines[2] == "\n"
+    # Every change was sent to the only follower, which has disconnected since
+    assert app.state.change_feed.pending == 0
+
+
+def test_change_feed_endpoint_requires_a_primary():
+    with TestClient(create_app(auth_token="secret")) as client:
+        assert client.get("/replication/changes").status_code == 401
+        response = client.get("/replication/changes", headers=_auth())
+    assert response.status_code == 404
+    assert response.json() == {"error": "replication is not configured"}
+
+
+def test_replicas_keep_no_model_of_their_own(tmp_path):
+    with pytest.raises(ValueError, match="primary_socket"):
+        create_app(primary_socket="primary.sock", snapshot_path=str(tmp_path / "model.json"))
+    with pytest.raises(ValueError, match="primary_socket"):
+        create_app(primary_socket="primary.sock", change_feed=True)
+
+
+def test_workers_read_their_own_forwarded_writes(primary):
+    with TestClient(create_app(auth_token="secret", primary_socket=primary.socket_path)) as client:
+        assert client.post("/train/spam", content="buy now").status_code == 401
+        response = client.post("/train/spam", content="buy now cheap", headers=_auth())
+        assert response.status_code == 200
+        assert response.json()["success"] is True
+        assert REVISION_HEADER not in response.headers
+        client.post("/train/ham?summaries=none", content="lunch meeting", headers=_auth())
+
+        response = client.post("/classify", content="cheap", headers=_auth())
+        assert response.json()["category"] == "spam"
+        assert primary.app.state.classifier.categories.get_category("spam").get_tally() == 3
+
+        client.post("/untrain/spam", content="cheap", headers=_auth())
+        assert client.get("/info", headers=_auth()).json()["categories"]["spam"]["tokenTally"] == 2
+        client.post("/flush", headers=_auth())
+        assert client.get("/info", headers=_auth()).json()["categories"] == {}
+        assert client.post("/reload", headers=_auth()).status_code == 404
+
+
+def test_workers_follow_changes_made_elsewhere(primary):
+    with TestClient(create_app(auth_token="secret", primary_socket=primary.socket_path)) as client:
+        primary.app.state.classifier.train("spam", "buy now")
+        deadline = time.monotonic() + 10
+        while "spam" not in client.get("/info", headers=_auth()).json()["categories"]:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+
+def test_workers_answer_503_without_a_primary(primary):
+    app = create_app(auth_token="secret", primary_socket=primary.socket_path)
+    with TestClient(app) as client:
+        primary.stop()
+        response = client.post("/train/spam", content="buy", headers=_auth())
+        assert response.status_code == 503
+        assert response.json() == {"error": "primary unavailable"}
+        assert client.post("/classify", content="buy", headers=_auth()).status_code == 200
+    primary.start()
+
+
+def test_workers_fail_to_start_without_a_model(monkeypatch, tmp_path):
+    monkeypatch.setattr("simplebayes.api.app.REPLICA_STARTUP_SECONDS", 0.05)
+    app = create_app(primary_socket=str(tmp_path / "missing.sock"))
+    with pytest.raises(RuntimeError, match="no model received"):
+        with TestClient(app):
+            pass  # pragma: no cover
+
+
+def test_followers_resync_after_losing_the_primary(primary):
+    replica = SimpleBayes()
+    follower = ReplicaFollower(replica, primary.socket_path, auth_token="secret", retry_interval=0.01)
+    follower.start()
+    assert follower.wait_for(0, timeout=10)
+    primary.stop()
+    primary.app.state.classifier.train("spam", "buy now")
+    primary.start()
+    assert follower.wait_for(1, timeout=10)
+    follower.stop()
+    assert replica.categories.get_category("spam").get_tally() == 2
+
+
+def test_followers_report_rejected_feeds(primary, capsys):
+    follower = ReplicaFollower(SimpleBayes(), primary.socket_path, auth_token="wrong", retry_interval=0.01)
+    follower.start()
+    assert not follower.wait_for(0, timeout=0.1)
+    follower.stop()
+    assert "change feed answered 401" in capsys.readouterr().err
+
+
+def test_followers_reject_gaps_in_the_feed():
+    follower = ReplicaFollower(SimpleBayes(), "unused.sock")
+    follower.revision = 4
+    with pytest.raises(ValueError, match="skipped from revision 4 to 6"):
+        follower._apply({"revision": 6, "operation": WAL_TRAIN}, None)  # pylint: disable=protected-access
+    assert follower.revision == -1
+
+
+def test_forward_reports_protocol_errors_as_os_errors(tmp_path):
+    socket_path = str(tmp_path / "s")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(socket_path)
+        server.listen()
+
+        def answer():
+            connection, _ = server.accept()
+            connection.recv(65536)
+            connection.sendall(b"garbage\r\n\r\n")
+            connection.close()
+
+        thread = threading.Thread(target=answer)
+        thread.start()
+        with pytest.raises(OSError, match="primary request failed"):
+            ReplicaFollower(SimpleBayes(), socket_path).forward("POST", "/flush", {}, b"")
+        thread.join()
+
+
+def test_serve_workers_runs_the_primary_beside_the_workers(monkeypatch):
+    calls = {}
+
+    def fake_run(app, **kwargs):
+        calls.update(kwargs, app=app)
+        options = json.loads(os.environ[workers.WORKER_OPTIONS_ENV])
+        calls["options"] = options
+        calls["worker"] = workers.create_worker_app()
+        follower = ReplicaFollower(SimpleBayes(), options["primary_socket"])
+        follower.start()
+        calls["synced"] = follower.wait_for(0, timeout=10)
+        follower.stop()
+
+    monkeypatch.setattr(workers.uvicorn, "run", fake_run)
+    monkeypatch.delenv(workers.WORKER_OPTIONS_ENV, raising=False)
+    workers.serve_workers({"auth_token": "", "snapshot_interval": 0.0}, host="127.0.0.1", port=8001, workers=3)
+
+    assert calls["app"] == "simplebayes.api.workers:create_worker_app"
+    assert calls["factory"] is True
+    assert (calls["host"], calls["port"], calls["workers"]) == ("127.0.0.1", 8001, 3)
+    assert set(calls["options"]) == {"auth_token", "primary_socket"}
+    assert calls["synced"]
+    assert not os.path.exists(calls["options"]["primary_socket"])
+
+
+def test_serve_workers_maps_read_only_models_in_every_worker(monkeypatch, tmp_path):
+    model_path = str(tmp_path / "model.sbm")
+    classifier = SimpleBayes()
+    classifier.train("spam", "buy now")
+    classifier.save_to_file(model_path)
+    calls = {}
+
+    def fake_run(app, **kwargs):
+        calls.update(kwargs, app=app, options=json.loads(os.environ[workers.WORKER_OPTIONS_ENV]))
+        with TestClient(workers.create_worker_app()) as client:
+            calls["category"] = client.post("/classify", content="buy").json()["category"]
+
+    monkeypatch.setattr(workers.uvicorn, "run", fake_run)
+    monkeypatch.setattr(workers.uvicorn, "Server", lambda config: pytest.fail("mapped models need no primary"))
+    monkeypatch.delenv(workers.WORKER_OPTIONS_ENV, raising=False)
+    workers.serve_workers({"mapped_model_path": model_path}, host="127.0.0.1", port=8001, workers=2)
+
+    assert calls["options"] == {"mapped_model_path": model_path}
+    assert calls["workers"] == 2
+    assert calls["category"] == "spam"
+
+    with pytest.raises(ValueError, match="named models"):
+        workers.serve_workers(
+            {"mapped_model_path": model_path, "model_directory": str(tmp_path)}, host="127.0.0.1", port=8001, workers=2,
+        )
+
+
+def test_serve_workers_fails_when_the_primary_does_not_start(monkeypatch):
+    monkeypatch.setattr(workers.uvicorn.Server, "run", lambda self: None)
+    with pytest.raises(RuntimeError, match="primary failed to start"):
+        workers.serve_workers({}, host="127.0.0.1", port=8001, workers=2)
+
+
+class _FakeFollower:
+    def __init__(self, response_headers) -> None:
+        self.response_headers = response_headers
+        self.forwarded = []
+
+    def forward(self, method, target, headers, body):
+        self.forwarded.append((method, target, headers, body))
+        return 200, self.response_headers, b"{}"
+
+    def wait_for(self, revision, timeout):  # pragma: no cover
+        raise AssertionError("waited without a revision")
+
+
+def _call_forwarding(follower, messages):
+    sent = []
+
+    async def app(_scope, _receive, _send):  # pragma: no cover
+        raise AssertionError("writes are not served locally")
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/train/spam",
+        "query_string": b"",
+        "headers": [(b"content-type", b"text/plain"), (b"cookie", b"x")],
+    }
+    asyncio.run(replication.ForwardWritesMiddleware(app, follower)(scope, receive, send))
+    return sent
+
+
+def test_forwarding_joins_chunked_bodies_and_filters_headers():
+    follower = _FakeFollower([("Content-Type", "application/json"), ("Server", "uvicorn")])
+    sent = _call_forwarding(follower, [
+        {"type": "http.request", "body": b"buy ", "more_body": True},
+        {"type": "http.request", "more_body": True},
+        {"type": "http.request", "body": b"now"},
+    ])
+    assert follower.forwarded == [("POST", "/train/spam", {"content-type": "text/plain"}, b"buy now")]
+    assert sent[0]["headers"] == [(b"content-type", b"application/json"), (b"content-length", b"2")]
+    assert sent[1]["body"] == b"{}"
+
+
+def test_forwarding_stops_when_the_client_leaves():
+    follower = _FakeFollower([])
+    assert not _call_forwarding(follower, [{"type": "http.disconnect"}])
+    assert not follower.forwarded
+
+
+def test_followers_stop_quietly(capsys):
+    follower = ReplicaFollower(SimpleBayes(), "unused.sock")
+
+    def fail():
+        follower._stopped.set()  # pylint: disable=protected-access
+        raise OSError("closed")
+
+    follower._follow = fail  # pylint: disable=protected-access
+    follower._run()  # pylint: disable=protected-access
+    follower.stop()
+    assert not capsys.readouterr().err
+
+
+def test_workers_forward_named_model_requests(tmp_path):
+    primary = _Primary(auth_token="secret", model_directory=str(tmp_path)).start()
+    try:
+        with TestClient(create_app(auth_token="secret", primary_socket=primary.socket_path)) as client:
+            client.post("/models/acme/train/spam", content="buy now", headers=_auth())
+            response = client.get("/models/acme/info", headers=_auth())
+            assert set(response.json()["categories"]) == {"spam"}
+            assert client.get("/models", headers=_auth()).json() == {"loaded": ["acme"], "stored": []}
+    finally:
+        primary.stop()
+        shutil.rmtree(primary.directory, ignore_errors=True)
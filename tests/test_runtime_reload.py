@@ -0,0 +1,116 @@
+import os
+import signal
+import tempfile
+import time
+
+import pytest
+
+from simplebayes import SimpleBayes
+from simplebayes.errors import InvalidModelStateError
+from simplebayes.persistence import load_model_state_from_file
+from simplebayes.runtime.reload import ModelReloader
+from simplebayes.wal import WriteAheadLog
+
+
+def _write_model(path, category, text):
+    classifier = SimpleBayes()
+    classifier.train(category, text)
+    classifier.save_to_file(path)
+    # Distinct mtimes even on coarse-grained filesystems
+    stamp = os.stat(path).st_mtime_ns + 1_000_000_000 * (1 + len(text))
+    os.utime(path, ns=(stamp, stamp))
+
+
+@pytest.fixture(name="temp_dir")
+def _temp_dir():
+    with tempfile.TemporaryDirectory() as path:
+        yield path
+
+
+def test_reload_swaps_model_and_tracks_changes(temp_dir):
+    path = os.path.join(temp_dir, "model.json")
+    classifier = SimpleBayes()
+    reloader = ModelReloader(classifier, path)
+    assert reloader.changed() is False
+
+    _write_model(path, "spam", "buy now")
+    assert reloader.changed() is True
+    reloader.reload()
+    assert reloader.changed() is False
+    assert classifier.classify("buy") == "spam"
+
+    with open(path, "w", encoding="utf-8") as model_file:
+        model_file.write("{broken")
+    with pytest.raises(InvalidModelStateError):
+        reloader.reload()
+    assert classifier.classify("buy") == "spam"
+
+
+def test_reload_compacts_journaled_model(temp_dir):
+    path = os.path.join(temp_dir, "model.json")
+    snapshot_path = os.path.join(temp_dir, "snapshot.sbm")
+    classifier = SimpleBayes()
+    journal = WriteAheadLog(os.path.join(temp_dir, "model.wal"))
+    classifier.attach_journal(journal)
+    classifier.train("ham", "team meeting")
+
+    _write_model(path, "spam", "buy now")
+    ModelReloader(classifier, path, journal=journal, snapshot_path=snapshot_path).reload()
+    classifier.train("spam", "offer")
+    journal.close()
+
+    state = load_model_state_from_file(snapshot_path)
+    assert state["sequence"] == 1
+    assert list(state["categories"]) == ["spam"]
+
+    recovered = SimpleBayes()
+    recovered.load_from_file(snapshot_path)
+    recovered_journal = WriteAheadLog(os.path.join(temp_dir, "model.wal"))
+    assert recovered.attach_journal(recovered_journal) == 1
+    assert recovered.get_summaries() == classifier.get_summaries()
+    recovered_journal.close()
+
+
+def test_watcher_and_requests_reload_in_background(temp_dir, capsys):
+    path = os.path.join(temp_dir, "model.json")
+    classifier = SimpleBayes()
+    reloader = ModelReloader(classifier, path, watch_interval=0.01)
+    reloader.start()
+    # A few idle checks while the file does not exist yet
+    time.sleep(0.05)
+
+    _write_model(path, "spam", "buy now")
+    while classifier.classify("buy") != "spam":
+        reloader._requested.wait(0.01)  # pylint: disable=protected-access
+
+    os.remove(path)
+    reloader.request()
+    while "reload failed" not in capsys.readouterr().err:
+        reloader._requested.wait(0.01)  # pylint: disable=protected-access
+    reloader.stop()
+    reloader.stop()
+    assert classifier.classify("buy") == "spam"
+
+
+def test_sighup_requests_reload(temp_dir):
+    path = os.path.join(temp_dir, "model.json")
+    _write_model(path, "spam", "buy now")
+    classifier = SimpleBayes()
+    reloader = ModelReloader(classifier, path)
+    previous = signal.getsignal(signal.SIGHUP)
+
+    reloader.install_signal_handler()
+    reloader.start()
+    os.kill(os.getpid(), signal.SIGHUP)
+    while classifier.classify("buy") != "spam":
+        reloader._requested.wait(0.01)  # pylint: disable=protected-access
+    reloader.stop()
+    reloader.restore_signal_handler()
+    reloader.restore_signal_handler()
+
+    assert signal.getsignal(signal.SIGHUP) is previous
+
+
+def test_invalid_reloader_options():
+    with pytest.raises(ValueError):
+        ModelReloader(SimpleBayes(), "/tmp/model.json", watch_interval=-1)
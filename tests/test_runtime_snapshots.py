@@ -0,0 +1,96 @@
+import os
+import tempfile
+
+import pytest
+
+from simplebayes import SimpleBayes
+from simplebayes.errors import InvalidModelStateError
+from simplebayes.persistence import load_model_state_from_file
+from simplebayes.runtime.snapshots import BackgroundSnapshotter
+from simplebayes.wal import WriteAheadLog
+
+
+def test_snapshot_skips_unchanged_models():
+    classifier = SimpleBayes()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "model.json")
+        snapshotter = BackgroundSnapshotter(classifier, path, 60)
+
+        assert snapshotter.snapshot() is False
+        assert not os.path.exists(path)
+
+        classifier.train("spam", "buy now")
+        assert snapshotter.snapshot() is True
+        assert snapshotter.snapshot() is False
+        assert load_model_state_from_file(path)["categories"]["spam"]["tally"] == 2
+
+        classifier.flush()
+        assert snapshotter.snapshot() is True
+        classifier.load_from_file(path)
+        assert snapshotter.snapshot() is True
+
+
+def test_snapshot_compacts_journal():
+    classifier = SimpleBayes()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "model.sbm")
+        journal = WriteAheadLog(os.path.join(temp_dir, "model.wal"))
+        classifier.attach_journal(journal)
+        snapshotter = BackgroundSnapshotter(classifier, path, 60, journal=journal)
+        classifier.train("spam", "buy now")
+
+        assert snapshotter.snapshot() is True
+        assert load_model_state_from_file(path)["sequence"] == 1
+        assert not list(journal.read_records())
+        journal.close()
+
+
+def test_background_thread_saves_and_reports_errors(capsys):
+    classifier = SimpleBayes()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "model.json")
+        snapshotter = BackgroundSnapshotter(classifier, path, 0.01)
+        classifier.train("spam", "buy now")
+        snapshotter.start()
+        while not os.path.exists(path):
+            snapshotter._stopped.wait(0.01)  # pylint: disable=protected-access
+        snapshotter.stop()
+        snapshotter.stop()
+
+        blocked = BackgroundSnapshotter(classifier, os.path.join(path, "nested.json"), 0.01)
+        classifier.train("spam", "again")
+        blocked.start()
+        while "snapshot failed" not in capsys.readouterr().err:
+            blocked._stopped.wait(0.01)  # pylint: disable=protected-access
+        blocked.stop()
+
+
+def test_background_thread_survives_failed_saves(monkeypatch, capsys):
+    classifier = SimpleBayes()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "model.json")
+        snapshotter = BackgroundSnapshotter(classifier, path, 0.01)
+        save_to_file = classifier.save_to_file
+        failures = []
+
+        def fail_once(absolute_path):
+            if not failures:
+                failures.append(absolute_path)
+                raise InvalidModelStateError("cannot serialize")
+            save_to_file(absolute_path)
+
+        monkeypatch.setattr(classifier, "save_to_file", fail_once)
+        classifier.train("spam", "buy now")
+        snapshotter.start()
+        while not os.path.exists(path):
+            snapshotter._stopped.wait(0.01)  # pylint: disable=protected-access
+        snapshotter.stop()
+
+        assert failures == [path]
+        assert "snapshot failed: cannot serialize" in capsys.readouterr().err
+        assert load_model_state_from_file(path)["categories"]["spam"]["tally"] == 2
+
+
+def test_interval_must_be_positive():
+    with pytest.raises(ValueError):
+        BackgroundSnapshotter(SimpleBayes(), "/tmp/model.json", 0)
@@ -0,0 +1,218 @@
+import io
+import os
+import sqlite3
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from simplebayes import SimpleBayes
+from simplebayes.errors import (
+    InvalidModelStateError,
+    UnsupportedModelFormatError,
+    UnsupportedModelVersionError,
+)
+from simplebayes.persistence import (
+    MODEL_FORMAT_SQLITE,
+    PERSISTED_MODEL_VERSION,
+    dump_model_state_to_stream,
+    load_model_state_from_file,
+    resolve_model_format,
+    save_model_state_to_file,
+)
+from simplebayes.sqlite_model import connect_model_database, load_sqlite_model_state
+from simplebayes.sqlite_store import SQLiteModelStore
+from simplebayes.wal import WAL_TRAIN
+
+STATE = {
+    "version": PERSISTED_MODEL_VERSION,
+    "categories": {
+        "spam": {"tally": 4, "tokens": {"buy": 3, "café": 1}},
+        "ham": {"tally": 1, "tokens": {"meeting": 1}},
+        "empty": {"tally": 0, "tokens": {}},
+    },
+    "sequence": 9,
+}
+
+
+@pytest.fixture(name="temp_dir")
+def _temp_dir():
+    with tempfile.TemporaryDirectory() as path:
+        yield path
+
+
+def _stored(temp_dir):
+    path = os.path.join(temp_dir, "model.db")
+    classifier = SimpleBayes()
+    store = SQLiteModelStore(path)
+    classifier.attach_journal(store)
+    return classifier, store, path
+
+
+def test_sqlite_file_round_trip(temp_dir):
+    path = os.path.join(temp_dir, "model.sqlite")
+    save_model_state_to_file(path, STATE)
+
+    loaded = load_model_state_from_file(path)
+    assert loaded == STATE
+    assert list(loaded["categories"]) == ["spam", "ham", "empty"]
+
+    other = os.path.join(temp_dir, "model.data")
+    save_model_state_to_file(other, {"version": PERSISTED_MODEL_VERSION, "categories": {}}, MODEL_FORMAT_SQLITE)
+    assert load_model_state_from_file(other) == {"version": PERSISTED_MODEL_VERSION, "categories": {}}
+
+
+def test_classifier_save_and_load_sqlite(temp_dir):
+    classifier = SimpleBayes()
+    classifier.train("spam", "buy now limited offer")
+    classifier.train("ham", "team schedule meeting")
+    path = os.path.join(temp_dir, "model.db")
+    classifier.save_to_file(path)
+
+    loaded = SimpleBayes()
+    loaded.load_from_file(path)
+    assert loaded.score("limited meeting") == classifier.score("limited meeting")
+
+    with sqlite3.connect(path) as connection:
+        rows = connection.execute("SELECT token, count FROM tokens WHERE category = 'spam' ORDER BY token").fetchall()
+    assert ("buy", 1) in rows
+
+
+def test_sqlite_format_resolution_and_limits(temp_dir):
+    assert resolve_model_format("/tmp/model.db") == MODEL_FORMAT_SQLITE
+    assert resolve_model_format("/tmp/model.SQLITE3") == MODEL_FORMAT_SQLITE
+    with pytest.raises(UnsupportedModelFormatError):
+        dump_model_state_to_stream(io.BytesIO(), STATE, MODEL_FORMAT_SQLITE)
+    with pytest.raises(UnsupportedModelFormatError):
+        save_model_state_to_file(os.path.join(temp_dir, "model.db.gz"), STATE)
+    assert not os.listdir(temp_dir)
+
+
+def test_invalid_sqlite_models_are_rejected(temp_dir):
+    def _database(name, *statements):
+        path = os.path.join(temp_dir, name)
+        with sqlite3.connect(path) as connection:
+            for statement in statements:
+                connection.execute(statement)
+        connection.close()
+        return path
+
+    with pytest.raises(InvalidModelStateError, match="not a simplebayes"):
+        load_model_state_from_file(_database("other.db", "CREATE TABLE other (x)"))
+
+    future = _database("future.db", "CREATE TABLE model_meta (key TEXT PRIMARY KEY, value INTEGER)")
+    with sqlite3.connect(future) as connection:
+        connection.execute("INSERT INTO model_meta VALUES ('version', 99)")
+    connection.close()
+    with pytest.raises(UnsupportedModelVersionError):
+        load_sqlite_model_state(future)
+    with pytest.raises(UnsupportedModelVersionError):
+        SQLiteModelStore(future)
+
+    orphan = os.path.join(temp_dir, "orphan.db")
+    save_model_state_to_file(orphan, STATE)
+    with sqlite3.connect(orphan) as connection:
+        connection.execute("DELETE FROM categories WHERE name = 'ham'")
+    connection.close()
+    with pytest.raises(InvalidModelStateError, match="unknown category"):
+        load_model_state_from_file(orphan)
+
+    garbage = os.path.join(temp_dir, "garbage.db")
+    with open(garbage, "wb") as model_file:
+        model_file.write(b"SQLite format 3\x00" + b"\xff" * 200)
+    with pytest.raises(InvalidModelStateError):
+        load_model_state_from_file(garbage)
+    with pytest.raises(InvalidModelStateError):
+        connect_model_database(garbage)
+
+
+def test_store_mirrors_classifier_operations(temp_dir):
+    classifier, store, path = _stored(temp_dir)
+    classifier.train("spam", "buy now limited offer offer")
+    classifier.train("ham", "team schedule meeting")
+    classifier.train("empty", "")
+    classifier.untrain("spam", "offer offer offer limited unknown")
+    classifier.untrain("ham", "team schedule meeting")
+    classifier.train("spam", "buy buy buy")
+    classifier.untrain("spam", "buy")
+    store.close()
+    store.close()
+
+    loaded = SimpleBayes()
+    loaded.load_from_file(path)
+    assert loaded.get_summaries() == classifier.get_summaries()
+    assert loaded.categories.sequence == 7
+
+    reopened = SQLiteModelStore(path)
+    assert reopened.last_sequence == 7
+    loaded.attach_journal(reopened)
+    loaded.flush()
+    reopened.close()
+    assert load_model_state_from_file(path)["categories"] == {}
+
+
+def test_concurrent_writers_share_batches(temp_dir):
+    classifier, store, path = _stored(temp_dir)
+
+    def _train(index):
+        for _ in range(20):
+            classifier.train(f"category{index}", "shared words here")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_train, range(4)))
+    store.close()
+
+    assert load_model_state_from_file(path)["categories"]["category3"]["tally"] == 60
+
+
+def test_store_rejects_classifiers_not_loaded_from_it(temp_dir):
+    classifier, store, path = _stored(temp_dir)
+    classifier.train("spam", "buy now")
+    store.close()
+
+    with pytest.raises(InvalidModelStateError, match="load the model"):
+        SimpleBayes().attach_journal(SQLiteModelStore(path))
+    with pytest.raises(InvalidModelStateError, match="closed"):
+        classifier.train("spam", "again")
+
+
+def test_failed_batch_stays_queued(temp_dir, monkeypatch):
+    classifier, store, path = _stored(temp_dir)
+
+    def _fail(*_args):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    with monkeypatch.context() as patch:
+        patch.setattr("simplebayes.sqlite_store._apply_record", _fail)
+        with pytest.raises(sqlite3.OperationalError):
+            classifier.train("spam", "buy now")
+
+    classifier.train("spam", "again")
+    store.close()
+    assert load_model_state_from_file(path)["categories"]["spam"]["tally"] == 3
+
+
+def test_compact_rewrites_store_and_snapshot(temp_dir):
+    classifier, store, path = _stored(temp_dir)
+    classifier.train("spam", "buy now")
+    replacement = os.path.join(temp_dir, "replacement.json")
+    other = SimpleBayes()
+    other.train("ham", "team meeting")
+    other.save_to_file(replacement)
+
+    classifier.load_from_file(replacement)
+    # Applied but not yet committed: already part of the compacted state
+    classifier._train_counts("ham", {"late": 1})  # pylint: disable=protected-access
+    snapshot_path = os.path.join(temp_dir, "snapshot.sbm")
+    store.compact(classifier, snapshot_path)
+    store.compact(classifier)
+    store.append(WAL_TRAIN, "ham", {"later": 1})
+    store.close()
+
+    state = load_model_state_from_file(path)
+    assert state["sequence"] == 3
+    assert state["categories"] == {"ham": {"tally": 4, "tokens": {"team": 1, "meet": 1, "late": 1, "later": 1}}}
+    assert load_model_state_from_file(snapshot_path)["categories"]["ham"]["tally"] == 3
+
+    with pytest.raises(ValueError):
+        SQLiteModelStore(os.path.join(temp_dir, "other.db")).compact(SimpleBayes())
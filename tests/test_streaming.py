@@ -0,0 +1,111 @@
+import io
+import random
+
+from simplebayes import SimpleBayes
+from simplebayes.tokenization import (
+    count_stream_tokens,
+    default_tokenize_text,
+    get_tokenizer,
+    iter_text_chunks,
+    iter_text_segments,
+    iter_tokens,
+)
+
+SAMPLE_TEXT = (
+    "Running runners ran across Café fields;\nthe ΟΔΟΣ ΟΔΟΣ\tlimited-offer "
+    "alpha\u200bbeta Cafe\u0301 x\u00a0y Ｆｏｏ bar 12345 connection connected "
+) * 20
+
+
+def _random_chunks(text: str, seed: int) -> list:
+    rng = random.Random(seed)
+    chunks = []
+    index = 0
+    while index < len(text):
+        size = rng.randint(1, 17)
+        chunks.append(text[index:index + size])
+        index += size
+    return chunks
+
+
+def test_iter_text_chunks_accepts_str_stream_and_iterable():
+    assert not list(iter_text_chunks(""))
+    assert list(iter_text_chunks("abc")) == ["abc"]
+    assert list(iter_text_chunks(io.StringIO("abcdef"), chunk_size=4)) == ["abcd", "ef"]
+    assert list(iter_text_chunks(["ab", "", "cd"])) == ["ab", "cd"]
+    assert list(iter_text_chunks(chunk for chunk in ["x", "y"])) == ["x", "y"]
+
+
+def test_iter_text_segments_only_cuts_at_whitespace():
+    segments = list(iter_text_segments(["hel", "lo wo", "rld", " again"]))
+    assert "".join(segments) == "hello world again"
+    assert segments == ["hello ", "world ", "again"]
+
+
+def test_iter_text_segments_carries_text_without_whitespace():
+    assert list(iter_text_segments(["abc", "def", "ghi"])) == ["abcdefghi"]
+
+
+def test_iter_text_segments_joins_a_long_unbroken_run_once():
+    # 10 MB without whitespace: recopying the carried text per chunk would copy about 50 GB
+    chunks = ["x" * 1000] * 10000
+    segments = list(iter_text_segments(chunks + [" end"]))
+    assert [len(segment) for segment in segments] == [10000001, 3]
+    assert segments[1] == "end"
+
+
+def test_iter_tokens_matches_whole_text_for_any_chunking():
+    tokenize = get_tokenizer()
+    expected = tokenize(SAMPLE_TEXT)
+    for seed in range(20):
+        assert list(iter_tokens(tokenize, _random_chunks(SAMPLE_TEXT, seed))) == expected
+
+
+def test_iter_tokens_handles_small_stream_reads():
+    tokenize = get_tokenizer()
+    tokens = list(iter_tokens(tokenize, io.StringIO(SAMPLE_TEXT), chunk_size=7))
+    assert tokens == tokenize(SAMPLE_TEXT)
+
+
+def test_count_stream_tokens_matches_counter_of_whole_text():
+    tokenize = get_tokenizer(remove_stop_words=True)
+    counts = count_stream_tokens(tokenize, io.StringIO(SAMPLE_TEXT), chunk_size=11)
+    assert counts == SimpleBayes.count_token_occurrences(tokenize(SAMPLE_TEXT))
+
+
+def test_count_stream_tokens_empty_source():
+    assert not count_stream_tokens(default_tokenize_text, io.StringIO(""))
+
+
+def test_train_stream_matches_train():
+    streamed = SimpleBayes()
+    streamed.train_stream("spam", io.StringIO(SAMPLE_TEXT), chunk_size=13)
+    whole = SimpleBayes()
+    whole.train("spam", SAMPLE_TEXT)
+
+    assert streamed.categories.get_category("spam").tokens == whole.categories.get_category("spam").tokens
+    assert streamed.tally("spam") == whole.tally("spam")
+    assert streamed.probabilities == whole.probabilities
+
+
+def test_untrain_stream_matches_untrain():
+    classifier = SimpleBayes()
+    classifier.train("spam", "buy now limited offer buy")
+    classifier.train("ham", "team meeting")
+    classifier.untrain_stream("spam", ["buy no", "w"])
+    assert classifier.tally("spam") == 3
+    classifier.untrain_stream("spam", iter(["limited offer buy"]))
+    assert "spam" not in classifier.get_summaries()
+    classifier.untrain_stream("missing", io.StringIO("buy"))
+    assert classifier.tally("ham") == 2
+
+
+def test_score_and_classify_stream_match_text_apis():
+    classifier = SimpleBayes()
+    classifier.train("spam", "buy now limited offer click here")
+    classifier.train("ham", "team meeting schedule for tomorrow")
+    text = "limited offer for the team meeting buy now"
+
+    assert classifier.score_stream(_random_chunks(text, 1)) == classifier.score(text)
+    assert classifier.classify_result_stream(io.StringIO(text), chunk_size=5) == classifier.classify_result(text)
+    assert classifier.classify_result_stream(io.StringIO("")).category is None
@@ -1,7 +1,16 @@
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from simplebayes import SimpleBayes, stopwords_data
+from simplebayes.stopwords import LANGUAGE_MODULES, load_stop_words
 from simplebayes.tokenization import (
     _get_stop_words,
     create_tokenizer,
     default_tokenize_text,
+    get_tokenizer,
 )
 
 
@@ -99,3 +108,105 @@ def test_get_stop_words_caches_result():
     second = _get_stop_words("english")
     assert first is second
     assert "the" in first
+
+
+def test_load_stop_words_covers_every_language():
+    for language in LANGUAGE_MODULES:
+        words = load_stop_words(language)
+        assert isinstance(words, frozenset)
+        assert words
+
+
+def test_load_stop_words_aliases_share_lists():
+    assert load_stop_words("porter") is load_stop_words("english")
+    assert load_stop_words("dutch_porter") is load_stop_words("dutch")
+
+
+def test_load_stop_words_unknown_language_returns_empty():
+    assert load_stop_words("nonexistentlangxyz123") == frozenset()
+
+
+def test_import_simplebayes_does_not_load_stop_words():
+    code = (
+        "import sys, simplebayes; "
+        "print(sorted(m for m in sys.modules if m.startswith('simplebayes.stopwords.')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=30,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_get_stop_words_loads_only_requested_language():
+    code = (
+        "import sys; "
+        "from simplebayes.tokenization import _get_stop_words; "
+        "_get_stop_words('german'); "
+        "print(sorted(m for m in sys.modules if m.startswith('simplebayes.stopwords.')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=30,
+        check=True,
+    )
+    assert result.stdout.strip() == "['simplebayes.stopwords.german']"
+
+
+def test_stopwords_data_constants_load_only_their_language():
+    code = (
+        "import sys; "
+        "from simplebayes.stopwords_data import ENGLISH; "
+        "from simplebayes.stopwords import load_stop_words; "
+        "assert ENGLISH is load_stop_words('english') and 'the' in ENGLISH; "
+        "print(*sorted(m for m in sys.modules if m.startswith('simplebayes.stopwords.')))"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], text=True, timeout=30)
+    assert output.split() == ["simplebayes.stopwords.english"]
+
+    assert len(stopwords_data.__all__) == 30
+    assert stopwords_data.DUTCH is load_stop_words("dutch_porter")
+    with pytest.raises(AttributeError, match="PORTER"):
+        stopwords_data.PORTER  # pylint: disable=pointless-statement
+
+
+def test_get_tokenizer_returns_shared_instance_per_settings():
+    assert get_tokenizer() is get_tokenizer("english", False)
+    assert get_tokenizer("english", True) is get_tokenizer("english", True)
+    assert get_tokenizer("english", True) is not get_tokenizer("english", False)
+    assert get_tokenizer("spanish") is not get_tokenizer("english")
+
+
+def test_simplebayes_instances_share_default_tokenizer():
+    first = SimpleBayes()
+    second = SimpleBayes()
+    assert first.tokenizer is second.tokenizer
+    assert SimpleBayes(remove_stop_words=True).tokenizer is get_tokenizer("english", True)
+
+
+def test_default_tokenize_text_uses_shared_tokenizer(monkeypatch):
+    calls = []
+
+    def fake_get_tokenizer(language="english", remove_stop_words=False):
+        calls.append((language, remove_stop_words))
+        return lambda text: [text]
+
+    monkeypatch.setattr("simplebayes.tokenization.get_tokenizer", fake_get_tokenizer)
+    assert default_tokenize_text("abc", language="french", remove_stop_words=True) == ["abc"]
+    assert calls == [("french", True)]
+
+
+def test_shared_tokenizer_is_thread_safe():
+    tokenize = get_tokenizer()
+    samples = [f"running jumped happily cats{i} connection" for i in range(200)]
+    expected = [tokenize(sample) for sample in samples]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(tokenize, samples))
+
+    assert results == expected
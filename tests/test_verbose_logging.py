@@ -0,0 +1,100 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+import pytest
+
+from simplebayes.api.app import create_app
+from simplebayes.api.verbose import PREVIEW_BYTES, VerboseLoggingMiddleware
+from simplebayes.runtime.log_queue import QueuedLog
+
+
+def test_queued_log_writes_from_a_background_thread(capsys):
+    log = QueuedLog()
+    log.flush()
+    log.log("train:", "category=", "spam")
+    # A second start, as when two threads log the first line at once, keeps the one writer
+    log._start()  # pylint: disable=protected-access
+    log.flush()
+    assert capsys.readouterr().err == "[simplebayes] train: category= spam\n"
+    log.close()
+    log.close()
+
+    with pytest.raises(ValueError):
+        QueuedLog(max_pending=0)
+
+
+def test_queued_log_drops_lines_instead_of_blocking(monkeypatch):
+    writing = threading.Event()
+    release = threading.Event()
+    written = []
+
+    class SlowStream:
+        """stderr stand-in that blocks the writer thread until released."""
+
+        def write(self, text):
+            writing.set()
+            release.wait()
+            written.append(text)
+
+        def flush(self):
+            pass
+
+    monkeypatch.setattr("sys.stderr", SlowStream())
+    log = QueuedLog(max_pending=1)
+    log.log("first")
+    assert writing.wait(5)
+    log.log("second")
+    log.log("third")
+    assert log.dropped == 1
+
+    release.set()
+    log.close()
+    assert "".join(written) == "[simplebayes] first\n[simplebayes] second\n"
+
+
+def _run_middleware(app, scope):
+    lines = []
+    sent = []
+    log = SimpleNamespace(log=lambda *parts: lines.append(" ".join(parts)))
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = dict({"type": "http", "method": "POST", "path": "/classify/stream", "headers": []}, **scope)
+    asyncio.run(VerboseLoggingMiddleware(app, log)(scope, receive, send))
+    return lines, sent
+
+
+def test_middleware_passes_chunks_through_and_logs_a_bounded_preview():
+    async def app(_scope, _receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        for _ in range(3):
+            await send({"type": "http.response.body", "body": b"x" * 400, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+        await send({"type": "http.response.trailers", "headers": []})
+
+    verbose_app = SimpleNamespace(state=SimpleNamespace(verbose=True))
+    lines, sent = _run_middleware(app, {"app": verbose_app, "headers": [(b"content-length", b"12")]})
+    assert [len(message.get("body", b"")) for message in sent] == [0, 400, 400, 400, 0, 0]
+    assert lines == [
+        "POST /classify/stream (Content-Length: 12)",
+        f"-> 200 {'x' * PREVIEW_BYTES + '...'!r}",
+    ]
+
+    lines, sent = _run_middleware(app, {"app": SimpleNamespace(state=SimpleNamespace(verbose=False))})
+    assert not lines
+    assert len(sent) == 6
+    lines, _ = _run_middleware(app, {"type": "websocket", "app": verbose_app})
+    assert not lines
+
+
+def test_lifespan_shutdown_writes_pending_lines(capsys):
+    app = create_app(verbose=True)
+    with TestClient(app) as client:
+        client.post("/classify", content="offer")
+    assert "/classify" in capsys.readouterr().err
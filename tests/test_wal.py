@@ -0,0 +1,253 @@
+import json
+import os
+import tempfile
+import threading
+
+import pytest
+
+from simplebayes import SimpleBayes
+from simplebayes.errors import InvalidModelStateError
+from simplebayes.persistence import load_model_state_from_file
+from simplebayes.wal import WAL_FLUSH, WAL_MAGIC, WAL_TRAIN, WAL_UNTRAIN, WriteAheadLog
+
+
+@pytest.fixture(name="temp_dir")
+def _temp_dir():
+    with tempfile.TemporaryDirectory() as path:
+        yield path
+
+
+def _journaled(temp_dir, **log_options):
+    classifier = SimpleBayes()
+    journal = WriteAheadLog(os.path.join(temp_dir, "model.wal"), **log_options)
+    classifier.attach_journal(journal)
+    return classifier, journal
+
+
+def _recover(temp_dir, snapshot_path=""):
+    classifier = SimpleBayes()
+    if snapshot_path:
+        classifier.load_from_file(snapshot_path)
+    journal = WriteAheadLog(os.path.join(temp_dir, "model.wal"))
+    replayed = classifier.attach_journal(journal)
+    return classifier, journal, replayed
+
+
+def test_operations_are_logged_and_replayed(temp_dir):
+    classifier, journal = _journaled(temp_dir)
+    classifier.train("spam", "buy now limited offer")
+    classifier.flush()
+    classifier.train("spam", "buy now limited offer")
+    classifier.train_stream("ham", ["team sched", "ule meeting"])
+    classifier.untrain("spam", "limited")
+    classifier.untrain_stream("ham", ["meeting"])
+    classifier.untrain("missing", "anything")
+    journal.close()
+
+    assert [record[:3] for record in journal.read_records()] == [
+        (1, WAL_TRAIN, "spam"),
+        (2, WAL_FLUSH, ""),
+        (3, WAL_TRAIN, "spam"),
+        (4, WAL_TRAIN, "ham"),
+        (5, WAL_UNTRAIN, "spam"),
+        (6, WAL_UNTRAIN, "ham"),
+    ]
+    assert list(journal.read_records(after_sequence=5))[0][3] == {"meet": 1}
+
+    recovered, recovered_journal, replayed = _recover(temp_dir)
+    assert replayed == 6
+    assert recovered.get_summaries() == classifier.get_summaries()
+    assert recovered.score("buy offer schedule") == classifier.score("buy offer schedule")
+
+    recovered.train("ham", "another meeting")
+    recovered_journal.close()
+    assert list(recovered_journal.read_records())[-1][0] == 7
+
+
+def test_torn_tail_is_dropped_on_open(temp_dir):
+    classifier, journal = _journaled(temp_dir)
+    classifier.train("spam", "buy now")
+    classifier.train("ham", "team meeting")
+    journal.close()
+
+    log_path = os.path.join(temp_dir, "model.wal")
+    intact_size = os.path.getsize(log_path)
+    with open(log_path, "ab") as log_file:
+        log_file.write(b"\x10\x00\x00\x00torn")
+
+    recovered, recovered_journal, replayed = _recover(temp_dir)
+    assert replayed == 2
+    assert os.path.getsize(log_path) == intact_size
+    assert recovered.tally("ham") == 2
+    recovered_journal.close()
+
+
+def test_corrupt_record_ends_replay(temp_dir):
+    classifier, journal = _journaled(temp_dir)
+    classifier.train("spam", "buy now")
+    classifier.train("ham", "team meeting")
+    journal.close()
+
+    log_path = os.path.join(temp_dir, "model.wal")
+    with open(log_path, "r+b") as log_file:
+        log_file.seek(-2, os.SEEK_END)
+        log_file.write(b"##")
+
+    recovered, recovered_journal, replayed = _recover(temp_dir)
+    assert replayed == 1
+    assert recovered.tally("ham") == 0
+    recovered_journal.close()
+
+
+def test_invalid_log_files_are_rejected(temp_dir):
+    def _write(name, data):
+        path = os.path.join(temp_dir, name)
+        with open(path, "wb") as log_file:
+            log_file.write(data)
+        return path
+
+    with pytest.raises(InvalidModelStateError, match="truncated"):
+        WriteAheadLog(_write("short.wal", b"SBAY"))
+    with pytest.raises(InvalidModelStateError, match="not a simplebayes"):
+        WriteAheadLog(_write("other.wal", b"NOTAWAL!" + bytes(8)))
+    with pytest.raises(InvalidModelStateError, match="version"):
+        WriteAheadLog(_write("future.wal", WAL_MAGIC + b"\x63\x00" + bytes(6)))
+    with pytest.raises(ValueError):
+        WriteAheadLog(os.path.join(temp_dir, "model.wal"), commit_interval=-1)
+
+    empty = WriteAheadLog(_write("empty.wal", b""))
+    assert empty.last_sequence == 0
+    empty.close()
+
+
+def test_compaction_writes_snapshot_and_drops_covered_records(temp_dir):
+    snapshot_path = os.path.join(temp_dir, "model.sbm")
+    classifier, journal = _journaled(temp_dir)
+    classifier.train("spam", "buy now limited offer")
+    classifier.train("ham", "team schedule meeting")
+
+    journal.compact(classifier, snapshot_path)
+    classifier.train("ham", "late meeting")
+    journal.close()
+
+    assert load_model_state_from_file(snapshot_path)["sequence"] == 2
+    assert [record[0] for record in journal.read_records()] == [3]
+
+    recovered, recovered_journal, replayed = _recover(temp_dir, snapshot_path)
+    assert replayed == 1
+    assert recovered.get_summaries() == classifier.get_summaries()
+    recovered.train("spam", "more")
+    assert recovered_journal.last_sequence == 4
+    recovered_journal.close()
+
+
+def test_crash_between_snapshot_and_truncate_does_not_double_apply(temp_dir):
+    snapshot_path = os.path.join(temp_dir, "model.json")
+    classifier, journal = _journaled(temp_dir)
+    classifier.train("spam", "buy now")
+    classifier.train("spam", "buy later")
+    classifier.save_to_file(snapshot_path)
+    journal.close()
+
+    recovered, recovered_journal, replayed = _recover(temp_dir, snapshot_path)
+    assert replayed == 0
+    assert recovered.get_summaries() == classifier.get_summaries()
+    recovered_journal.close()
+
+    with open(snapshot_path, encoding="utf-8") as snapshot:
+        assert json.load(snapshot)["sequence"] == 2
+
+
+def test_snapshot_newer_than_log_advances_sequence(temp_dir):
+    snapshot_path = os.path.join(temp_dir, "model.sbm")
+    classifier, journal = _journaled(temp_dir)
+    classifier.train("spam", "buy now")
+    journal.compact(classifier, snapshot_path)
+    journal.close()
+    os.remove(os.path.join(temp_dir, "model.wal"))
+
+    recovered, recovered_journal, replayed = _recover(temp_dir, snapshot_path)
+    assert replayed == 0
+    recovered.train("spam", "again")
+    assert recovered_journal.last_sequence == 2
+    recovered_journal.close()
+
+
+def test_budget_limited_training_logs_accepted_counts(temp_dir):
+    classifier = SimpleBayes(max_new_tokens_per_train=2)
+    journal = WriteAheadLog(os.path.join(temp_dir, "model.wal"))
+    classifier.attach_journal(journal)
+    classifier.train("spam", "alpha beta gamma delta")
+    journal.close()
+
+    assert list(journal.read_records())[0][3] == {"alpha": 1, "beta": 1}
+
+
+def test_group_commit_with_background_flusher(temp_dir):
+    classifier, journal = _journaled(temp_dir, commit_interval=0.001)
+
+    def _train(index):
+        for _ in range(10):
+            classifier.train(f"category{index}", "shared words here")
+
+    workers = [threading.Thread(target=_train, args=(index,)) for index in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    journal.close()
+    journal.close()
+
+    assert [record[0] for record in journal.read_records()] == list(range(1, 41))
+    recovered, recovered_journal, _ = _recover(temp_dir)
+    assert recovered.get_summaries() == classifier.get_summaries()
+    recovered_journal.close()
+
+
+def test_concurrent_commits_share_syncs(temp_dir):
+    classifier, journal = _journaled(temp_dir)
+
+    def _train(index):
+        for _ in range(10):
+            classifier.train(f"category{index}", "shared words here")
+
+    workers = [threading.Thread(target=_train, args=(index,)) for index in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    journal.close()
+
+    assert journal.last_sequence == 40
+
+
+def test_flusher_stops_when_closed_during_gather(temp_dir):
+    journal = WriteAheadLog(os.path.join(temp_dir, "model.wal"), commit_interval=30)
+    journal.append(WAL_FLUSH)
+    journal.close()
+    assert [record[1] for record in journal.read_records()] == [WAL_FLUSH]
+
+
+def test_closed_log_rejects_appends(temp_dir):
+    classifier, journal = _journaled(temp_dir)
+    journal.close()
+    with pytest.raises(InvalidModelStateError, match="closed"):
+        classifier.train("spam", "buy now")
+
+
+def test_compact_requires_attached_classifier(temp_dir):
+    journal = WriteAheadLog(os.path.join(temp_dir, "model.wal"))
+    with pytest.raises(ValueError):
+        journal.compact(SimpleBayes(), os.path.join(temp_dir, "model.sbm"))
+    journal.close()
+
+
+def test_truncate_keeps_newer_records(temp_dir):
+    classifier, journal = _journaled(temp_dir)
+    classifier.train("spam", "buy now")
+    classifier.train("ham", "team meeting")
+    journal.truncate(1)
+    classifier.train("ham", "late")
+    journal.close()
+
+    assert [record[0] for record in journal.read_records()] == [2, 3]